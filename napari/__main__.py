@@ -57,6 +57,28 @@ class CitationAction(argparse.Action):
         sys.exit()
 
 
+class ImportProfileAction(argparse.Action):
+    def __call__(self, *args, **kwargs):
+        from napari.utils._import_time import (
+            IMPORT_TARGETS,
+            exceeded_budgets,
+            format_import_profile,
+            parse_budgets,
+            profile_import,
+        )
+
+        budgets = parse_budgets()
+        profiles = {
+            target: profile_import(statement)
+            for target, statement in IMPORT_TARGETS.items()
+        }
+        print(format_import_profile(profiles, budgets))  # noqa: T201
+        exceeded = any(
+            exceeded_budgets(costs, budgets) for costs in profiles.values()
+        )
+        sys.exit(1 if exceeded else 0)
+
+
 def validate_unknown_args(unknown: list[str]) -> dict[str, Any]:
     """Convert a list of strings into a dict of valid kwargs for add_* methods.
 
@@ -167,6 +189,17 @@ def parse_sys_argv():
         nargs=0,
         help='show citation information and exit',
     )
+    parser.add_argument(
+        '--import-profile',
+        action=ImportProfileAction,
+        nargs=0,
+        help=(
+            'show the import time of napari by subpackage and exit. '
+            'Budgets in seconds can be set with NAPARI_IMPORT_BUDGETS, '
+            'e.g. "napari.layers=0.5,pandas=0.3", to exit with an error '
+            'when exceeded.'
+        ),
+    )
     # Allow multiple --stack options to be provided.
     # Each stack option will result in its own stack
     parser.add_argument(
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Hashable
 from functools import lru_cache
+from typing import Any
 from warnings import warn
 
 from app_model import Application
+from app_model.registries import CommandsRegistry, MenusRegistry
 
 from napari._app_model.actions._layerlist_context_actions import (
     LAYERLIST_CONTEXT_ACTIONS,
@@ -14,6 +17,50 @@ from napari.utils.translations import trans
 APP_NAME = 'napari'
 
 
+class _PendingMenusRegistry(MenusRegistry):
+    """Menus registry that adds pending registrations before being read."""
+
+    _flush_pending: Callable[[], None] = staticmethod(lambda: None)
+
+    def __contains__(self, id: object) -> bool:  # noqa: A002
+        self._flush_pending()
+        return super().__contains__(id)
+
+    def __iter__(self) -> Any:
+        self._flush_pending()
+        return super().__iter__()
+
+    def get_menu(self, menu_id: str) -> Any:
+        self._flush_pending()
+        return super().get_menu(menu_id)
+
+    def iter_menu_groups(self, menu_id: str) -> Any:
+        self._flush_pending()
+        return super().iter_menu_groups(menu_id)
+
+
+class _PendingCommandsRegistry(CommandsRegistry):
+    """Commands registry that adds pending registrations before being read."""
+
+    _flush_pending: Callable[[], None] = staticmethod(lambda: None)
+
+    def __iter__(self) -> Any:
+        self._flush_pending()
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        self._flush_pending()
+        return super().__len__()
+
+    def __contains__(self, id: object) -> bool:  # noqa: A002
+        self._flush_pending()
+        return super().__contains__(id)
+
+    def __getitem__(self, id: str) -> Any:  # noqa: A002
+        self._flush_pending()
+        return super().__getitem__(id)
+
+
 class NapariApplication(Application):
     def __init__(self, app_name=APP_NAME) -> None:
         # raise_synchronous_exceptions means that commands triggered via
@@ -23,13 +70,54 @@ class NapariApplication(Application):
         # exceptions with `.result()`, for now, raising immediately should
         # prevent any unexpected silent errors.  We can turn it off later if we
         # adopt asynchronous command execution.
-        super().__init__(app_name, raise_synchronous_exceptions=True)
+        super().__init__(
+            app_name,
+            raise_synchronous_exceptions=True,
+            commands_reg_class=_PendingCommandsRegistry,
+            menus_reg_class=_PendingMenusRegistry,
+        )
 
         self.injection_store.namespace = _napari_names  # type: ignore [assignment]
 
+        # registrations (e.g. of plugin contributions) deferred until the
+        # menus or commands are first read, after which there is no point
+        # in deferring them
+        self._pending_registrations: (
+            dict[Hashable, Callable[[], None]] | None
+        ) = {}
+        self.menus._flush_pending = self._flush_pending_registrations  # type: ignore[attr-defined]
+        self.commands._flush_pending = self._flush_pending_registrations  # type: ignore[attr-defined]
+
         self.register_actions(LAYERLIST_CONTEXT_ACTIONS)
         self.menus.append_menu_items(LAYERLIST_CONTEXT_SUBMENUS)
 
+    def defer_registration(
+        self, key: Hashable, register: Callable[[], None]
+    ) -> None:
+        """Call ``register`` once the menus or commands are first read.
+
+        Once they have been read, ``register`` is called immediately.
+        A registration deferred with the same ``key`` replaces the pending
+        one.
+        """
+        if self._pending_registrations is None:
+            register()
+        else:
+            self._pending_registrations[key] = register
+
+    def cancel_registration(self, key: Hashable) -> None:
+        """Drop the pending registration for ``key``, if any."""
+        if self._pending_registrations is not None:
+            self._pending_registrations.pop(key, None)
+
+    def _flush_pending_registrations(self) -> None:
+        if self._pending_registrations is None:
+            return
+        pending = self._pending_registrations.values()
+        self._pending_registrations = None
+        for register in pending:
+            register()
+
     @classmethod
     def get_app_model(cls, app_name: str = APP_NAME) -> NapariApplication:
         return Application.get_app(app_name) or cls()  # type: ignore[return-value]
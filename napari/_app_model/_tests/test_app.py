@@ -34,3 +34,26 @@ def test_app_injection(mock_app_model):
     with app.injection_store.register(providers=[(provide_points,)]):
         injected = app.injection_store.inject(use_points)
         assert injected() is p
+
+
+def test_app_deferred_registration(mock_app_model):
+    """Deferred registrations happen when the registries are first read."""
+    from app_model.types import Action
+
+    app = get_app_model()
+    app._pending_registrations = {}
+
+    def _register(id_):
+        app.register_action(Action(id=id_, title=id_, callback=lambda: None))
+
+    app.defer_registration('first', lambda: _register('test.first'))
+    app.defer_registration('second', lambda: _register('test.second'))
+    app.cancel_registration('second')
+    assert 'test.first' not in app.commands._commands
+
+    assert 'test.first' in app.commands
+    assert 'test.second' not in app.commands
+
+    # once read, registrations are no longer deferred
+    app.defer_registration('third', lambda: _register('test.third'))
+    assert 'test.third' in app.commands._commands
@@ -25,14 +25,24 @@ def rng() -> np.random.Generator:
 
 
 @pytest.fixture
-def _enable_async(_fresh_settings, make_napari_viewer):
+def _enable_async(
+    _fresh_settings, make_napari_viewer, _dangling_qtimers, qtbot
+):
     """
     This fixture depends on _fresh_settings and make_napari_viewer
     to enforce proper order of fixture execution.
+
+    It also depends on _dangling_qtimers so that, before the check for
+    dangling timers, it waits for the thumbnails of the sliced layers to be
+    updated.
     """
     from napari import settings
 
     settings.get_settings().experimental.async_ = True
+    yield
+    for viewer in list(Viewer._instances):
+        timer = viewer.window._qt_viewer._thumbnail_timer
+        qtbot.waitUntil(lambda timer=timer: not timer.isActive())
 
 
 @pytest.mark.usefixtures('_enable_async')
@@ -226,6 +236,36 @@ def test_async_slice_vectors_on_current_step_change(make_napari_viewer, qtbot):
     )
 
 
+@pytest.mark.usefixtures('_enable_async')
+def test_async_slice_updates_thumbnail_once(
+    make_napari_viewer, qtbot, rng, monkeypatch
+):
+    viewer = make_napari_viewer()
+    data = rng.random((3, 4, 5))
+    image = Image(data)
+    vispy_image = setup_viewer_for_async_slicing(viewer, image)
+    qt_viewer = viewer.window._qt_viewer
+    # keep the thumbnail timer from firing while slicing
+    qt_viewer._thumbnail_timer.setInterval(60_000)
+    calls = []
+    monkeypatch.setattr(
+        image, '_update_thumbnail', lambda: calls.append(image._slice.image)
+    )
+
+    viewer.dims.current_step = (1, 0, 0)
+    wait_until_vispy_image_data_equal(qtbot, vispy_image, data[1])
+    viewer.dims.current_step = (2, 0, 0)
+    wait_until_vispy_image_data_equal(qtbot, vispy_image, data[2])
+
+    assert calls == []
+    assert image in qt_viewer._pending_thumbnails
+    qt_viewer._thumbnail_timer.stop()
+    qt_viewer._update_pending_thumbnails()
+    assert len(calls) == 1
+    np.testing.assert_allclose(calls[0].view, data[2])
+    assert not qt_viewer._pending_thumbnails
+
+
 @pytest.mark.usefixtures('_enable_async')
 def test_async_slice_two_layers_shutdown(make_napari_viewer):
     """See https://github.com/napari/napari/issues/6685"""
@@ -15,7 +15,7 @@ from typing import (
 from weakref import WeakSet, ref
 
 import numpy as np
-from qtpy.QtCore import QCoreApplication, QObject, Qt, QUrl
+from qtpy.QtCore import QCoreApplication, QObject, Qt, QTimer, QUrl
 from qtpy.QtGui import QGuiApplication
 from qtpy.QtWidgets import QFileDialog, QSplitter, QVBoxLayout, QWidget
 from superqt import ensure_main_thread
@@ -65,6 +65,9 @@ if TYPE_CHECKING:
     from napari.components import ViewerModel
     from napari.utils.events import Event
 
+# Minimum time between two updates of the thumbnails of sliced layers.
+THUMBNAIL_UPDATE_INTERVAL_MS = 100
+
 
 def _npe2_decode_selected_filter(
     ext_str: str, selected_filter: str, writers: Sequence[WriterContribution]
@@ -229,6 +232,14 @@ class QtViewer(QSplitter):
         self.setOrientation(Qt.Orientation.Vertical)
         self.addWidget(main_widget)
 
+        # Thumbnails of the layers sliced asynchronously are updated at most
+        # once per interval of this timer, so that they do not delay drawing
+        # new slices during playback.
+        self._pending_thumbnails: WeakSet[Layer] = WeakSet()
+        self._thumbnail_timer = QTimer(self)
+        self._thumbnail_timer.setSingleShot(True)
+        self._thumbnail_timer.setInterval(THUMBNAIL_UPDATE_INTERVAL_MS)
+        self._thumbnail_timer.timeout.connect(self._update_pending_thumbnails)
         self.viewer._layer_slicer.events.ready.connect(self._on_slice_ready)
 
         self._on_active_change()
@@ -637,8 +648,21 @@ class QtViewer(QSplitter):
                 # `set_data` notifies the corresponding vispy layer of the new
                 # slice.
                 layer.events.set_data()
-                layer._update_thumbnail()
                 layer._set_highlight(force=True)
+                self._pending_thumbnails.add(layer)
+        if self._pending_thumbnails and not self._thumbnail_timer.isActive():
+            self._thumbnail_timer.start()
+
+    def _update_pending_thumbnails(self):
+        """Update the thumbnails of the layers sliced since the last update.
+
+        The thumbnail of each layer is updated once, from its latest slice,
+        however many slices it received in the meantime.
+        """
+        layers = list(self._pending_thumbnails)
+        self._pending_thumbnails.clear()
+        for layer in layers:
+            layer._update_thumbnail()
 
     def _on_active_change(self):
         """When active layer changes change keymap handler."""
@@ -1220,6 +1244,8 @@ class QtViewer(QSplitter):
         # or Abort trap. (calling stop() when no animation is occurring is also
         # not a problem)
         self.dims.stop()
+        self._thumbnail_timer.stop()
+        self._pending_thumbnails.clear()
         self.canvas.delete()
         if self._console is not None:
             self.console.close()
@@ -175,3 +175,27 @@ def test_cli_retains_viewer_ref(mock_run, monkeypatch, make_napari_viewer):
                 __main__._run()
             mock_viewer.assert_called_once()
             mock_viewer_open.assert_called_once()
+
+
+def test_cli_import_profile(monkeypatch, capsys):
+    """Test the cli --import-profile shows import costs and budgets"""
+    from napari.utils import _import_time
+
+    costs = {
+        'napari.layers': _import_time.ImportCost(0.1, 0.4),
+        'pandas': _import_time.ImportCost(0.2, 0.3),
+    }
+    monkeypatch.setattr(_import_time, 'profile_import', lambda _: costs)
+    monkeypatch.setattr(sys, 'argv', ['napari', '--import-profile'])
+    with pytest.raises(SystemExit) as exc_info:
+        __main__._run()
+    assert exc_info.value.code == 0
+    out = capsys.readouterr().out
+    assert 'Viewer:' in out
+    assert 'napari.layers' in out
+
+    monkeypatch.setenv('NAPARI_IMPORT_BUDGETS', 'napari.layers=0.2')
+    with pytest.raises(SystemExit) as exc_info:
+        __main__._run()
+    assert exc_info.value.code == 1
+    assert 'budget of 200.0' in capsys.readouterr().out
@@ -1,5 +1,6 @@
 from itertools import permutations
 
+import dask.array as da
 import numpy as np
 import numpy.testing as npt
 import pytest
@@ -8,6 +9,7 @@ from napari._vispy._tests.utils import vispy_image_scene_size
 from napari._vispy.layers.image import VispyImageLayer
 from napari.components.dims import Dims
 from napari.layers import Image
+from napari.settings import get_settings
 
 
 @pytest.mark.parametrize('order', permutations((0, 1, 2)))
@@ -236,3 +238,15 @@ def test_node_origin_is_consistent_with_multiscale(
     # full high and low resolution slices should always map to the same
     # scene origin, since this defines the start of the visible extent.
     np.testing.assert_array_equal(high_res_origin, low_res_origin)
+
+
+def test_data_range_estimate_applied_when_done(qtbot):
+    get_settings().experimental.async_ = True
+    data = np.zeros((4, 10, 10))
+    data[3, 5, 5] = 7
+    image = Image(da.from_array(data, chunks=(1, 10, 10)))
+    VispyImageLayer(image)
+
+    # applied on the main thread without slicing the layer again
+    qtbot.waitUntil(lambda: image.contrast_limits_range == [0, 7])
+    assert image._data_range_future is None
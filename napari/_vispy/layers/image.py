@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from concurrent.futures import Future
+
 import numpy as np
+from superqt.utils import ensure_main_thread
 from vispy.color import Colormap as VispyColormap
 from vispy.scene import Node
 
@@ -101,6 +104,10 @@ class VispyImageLayer(VispyScalarFieldBaseLayer):
         self.layer.events.gamma.connect(self._on_gamma_change)
         self.layer.events.iso_threshold.connect(self._on_iso_threshold_change)
         self.layer.events.attenuation.connect(self._on_attenuation_change)
+        if self.layer._data_range_future is not None:
+            self.layer._data_range_future.add_done_callback(
+                self._on_data_range_estimated
+            )
 
         # display_change is special (like data_change) because it requires a
         # self.reset(). This means that we have to call it manually. Also,
@@ -110,6 +117,11 @@ class VispyImageLayer(VispyScalarFieldBaseLayer):
         self.reset()
         self._on_data_change()
 
+    @ensure_main_thread
+    def _on_data_range_estimated(self, future: Future) -> None:
+        """Apply the range estimated in the background on the main thread."""
+        self.layer._apply_data_range_estimate()
+
     def _on_interpolation_change(self) -> None:
         self.node.interpolation = (
             self.layer.interpolation2d
@@ -31,6 +31,7 @@ class VispyPointsLayer(VispyBaseLayer):
         self.layer._face.events.color_properties.connect(self._on_data_change)
         self.layer.events.highlight.connect(self._on_highlight_change)
         self.layer.text.events.connect(self._on_text_change)
+        self.layer.events._view_text.connect(self._on_text_change)
         self.layer.events.shading.connect(self._on_shading_change)
         self.layer.events.antialiasing.connect(self._on_antialiasing_change)
         self.layer.events.canvas_size_limits.connect(
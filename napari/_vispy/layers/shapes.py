@@ -26,6 +26,7 @@ class VispyShapesLayer(VispyBaseLayer):
         self.layer.events.face_color.connect(self._on_data_change)
         self.layer.events.highlight.connect(self._on_highlight_change)
         self.layer.text.events.connect(self._on_text_change)
+        self.layer.events._view_text.connect(self._on_text_change)
 
         # TODO: move to overlays
         self.node.highlight_vertices.symbol = 'square'
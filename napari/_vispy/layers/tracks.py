@@ -68,7 +68,7 @@ class VispyTracksLayer(VispyBaseLayer):
         # set the width of the track tails
         self.node._subvisuals[0].set_data(
             width=self.layer.tail_width,
-            color=self.layer.track_colors,
+            color=self.layer._view_track_colors,
         )
         self.node._subvisuals[2].set_data(
             width=self.layer.tail_width,
@@ -79,14 +79,15 @@ class VispyTracksLayer(VispyBaseLayer):
 
         self.node.tracks_filter.use_fade = self.layer.use_fade
         self.node.tracks_filter.tail_length = self.layer.tail_length
-        self.node.tracks_filter.vertex_time = self.layer.track_times
+        # only the vertices in the time window of the layer are sent
+        self.node.tracks_filter.vertex_time = self.layer._view_track_times
 
         # change the data to the vispy line visual
         self.node._subvisuals[0].set_data(
-            pos=self.layer._view_data,
-            connect=self.layer.track_connex,
+            pos=self.layer._view_track_vertices,
+            connect=self.layer._view_track_connex,
             width=self.layer.tail_width,
-            color=self.layer.track_colors,
+            color=self.layer._view_track_colors,
         )
 
         # Call to update order of translation values with new dims:
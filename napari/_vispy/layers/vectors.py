@@ -10,20 +10,50 @@ class VispyVectorsLayer(VispyBaseLayer):
         node = VectorsVisual()
         super().__init__(layer, node)
 
+        # Meshes of the vectors in view at each decimation level, which are
+        # reused when zooming back and forth until the vectors change.
+        self._meshes: dict[int | None, tuple[np.ndarray, ...]] = {}
+
         self.layer.events.edge_color.connect(self._on_data_change)
+        self.layer.events._decimation_level.connect(
+            self._on_decimation_level_change
+        )
 
         self.reset()
         self._on_data_change()
 
     def _on_data_change(self):
-        # Make meshes
+        self._meshes.clear()
+        self._on_decimation_level_change()
+
+    def _on_decimation_level_change(self):
+        level = self.layer._decimation_level
+        if level not in self._meshes:
+            self._meshes[level] = self._make_mesh(level)
+        vertices, faces, face_color = self._meshes[level]
+
+        self.node.set_data(
+            vertices=vertices,
+            faces=faces,
+            face_colors=face_color,
+        )
+
+        self.node.update()
+        # Call to update order of translation values with new dims:
+        self._on_matrix_change()
+
+    def _make_mesh(
+        self, level: int | None
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Make the mesh of the vectors in view at a decimation level."""
+        view_data, vector_color = self.layer._decimated_view(level)
         vertices, faces = generate_vector_meshes(
-            self.layer._view_data,
+            view_data,
             self.layer.edge_width,
             self.layer.length,
             self.layer.vector_style,
         )
-        face_color = self.layer._view_face_color
+        face_color = self.layer._triangle_colors(vector_color)
         ndisplay = self.layer._slice_input.ndisplay
         ndim = self.layer.ndim
 
@@ -37,15 +67,7 @@ class VispyVectorsLayer(VispyBaseLayer):
         if ndisplay == 3 and ndim == 2:
             vertices = np.pad(vertices, ((0, 0), (0, 1)), mode='constant')
 
-        self.node.set_data(
-            vertices=vertices,
-            faces=faces,
-            face_colors=face_color,
-        )
-
-        self.node.update()
-        # Call to update order of translation values with new dims:
-        self._on_matrix_change()
+        return vertices, faces, face_color
 
 
 def generate_vector_meshes(vectors, width, length, vector_style):
@@ -26,9 +26,10 @@ def update_text(
     # effectively has no visible text then return single dummy data.
     # This also acts as a minor optimization.
     if _has_visible_text(layer):
-        text_values = layer._view_text
-        colors = layer._view_text_color
-        coords, anchor_x, anchor_y = layer._view_text_coords
+        with layer._text_positions_cached():
+            text_values = layer._view_text
+            colors = layer._view_text_color
+            coords, anchor_x, anchor_y = layer._view_text_coords
     else:
         text_values = np.array([''])
         colors = np.zeros((4,), np.float32)
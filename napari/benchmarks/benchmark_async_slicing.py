@@ -0,0 +1,204 @@
+# See "Writing benchmarks" in the asv docs for more information.
+# https://asv.readthedocs.io/en/latest/writing_benchmarks.html
+# or the napari documentation on benchmarking
+# https://github.com/napari/napari/blob/main/docs/BENCHMARKS.md
+import asyncio
+import shutil
+import tempfile
+import threading
+import time
+import weakref
+
+import dask.array as da
+import numpy as np
+import zarr
+
+from napari.components import Dims
+from napari.components._layer_slicer import _LayerSlicer
+from napari.layers import Image
+from napari.layers.base._slice_cache import invalidate_layer
+
+from .utils import Skip
+
+# Number of steps of the sliced dimension, which are each sliced once.
+N_STEPS = 32
+SHAPE = (N_STEPS, 512, 512)
+CHUNKS = (1, 256, 256)
+LEVELS = 3
+
+if hasattr(zarr.storage, 'LocalStore'):
+    # zarr >= 3 reads chunks with coroutines
+
+    class SlowDirectoryStore(zarr.storage.LocalStore):
+        def __init__(self, root, *, load_delay=0.0, **kwargs) -> None:
+            super().__init__(root, **kwargs)
+            self.load_delay = load_delay
+
+        async def get(self, key, prototype, byte_range=None):
+            await asyncio.sleep(self.load_delay)
+            return await super().get(key, prototype, byte_range)
+
+else:
+
+    class SlowDirectoryStore(zarr.storage.DirectoryStore):  # type: ignore[no-redef]
+        def __init__(self, root, *, load_delay=0.0, **kwargs) -> None:
+            super().__init__(root, **kwargs)
+            self.load_delay = load_delay
+
+        def __getitem__(self, key):
+            time.sleep(self.load_delay)
+            return super().__getitem__(key)
+
+
+def _write_slow_zarr(path, data, load_delay):
+    """Write data to a local zarr array and open it with a read delay."""
+    array = zarr.open_array(
+        path, mode='w', shape=data.shape, chunks=CHUNKS, dtype=data.dtype
+    )
+    array[:] = data
+    return zarr.open_array(
+        store=SlowDirectoryStore(path, load_delay=load_delay), mode='r'
+    )
+
+
+def _skip_numpy_latency(backend, latency):
+    return backend == 'numpy' and latency > 0
+
+
+class AsyncSlicingSuite:
+    """Benchmarks for slicing an image asynchronously from a dims change
+    until the slice is ready, for in-memory and lazy data.
+
+    The latency is the delay to read each chunk of the lazy arrays.
+    """
+
+    params = (['numpy', 'dask', 'zarr', 'multiscale'], [0, 0.005, 0.05])
+    param_names = ['backend', 'latency']
+    skip_params = Skip(
+        always=_skip_numpy_latency,
+        if_in_pr=lambda backend, latency: latency > 0.005,
+    )
+    timeout = 300
+
+    def setup(self, backend, latency):
+        np.random.seed(0)
+        data = np.random.randint(0, 2**16, size=SHAPE, dtype=np.uint16)
+        self.path = tempfile.mkdtemp()
+        if backend == 'numpy':
+            self.data = data
+        elif backend == 'dask':
+            self.data = da.from_zarr(
+                _write_slow_zarr(self.path, data, latency)
+            )
+        elif backend == 'zarr':
+            self.data = _write_slow_zarr(self.path, data, latency)
+        else:
+            self.data = [
+                _write_slow_zarr(
+                    f'{self.path}/{level}',
+                    data[:, :: 2**level, :: 2**level],
+                    latency,
+                )
+                for level in range(LEVELS)
+            ]
+        self.layer = Image(
+            self.data,
+            contrast_limits=(0, 2**16 - 1),
+            multiscale=backend == 'multiscale',
+        )
+        self.dims = Dims(
+            ndim=3,
+            range=tuple((0, s - 1, 1) for s in SHAPE),
+            ndisplay=2,
+        )
+
+        self.slicer = _LayerSlicer(max_workers=1)
+        self.slicer._force_sync = False
+        self.slicer.events.ready.connect(self._on_ready)
+        self.dims.events.current_step.connect(self._on_current_step)
+        self._ready = threading.Event()
+        self._ready_request_id = None
+
+    def teardown(self, *args):
+        self.slicer.shutdown()
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def _on_current_step(self):
+        self.slicer.submit(layers=[self.layer], dims=self.dims)
+
+    def _on_ready(self, event):
+        response = event.value.get(weakref.ref(self.layer))
+        if response is None:
+            return
+        self.layer._update_slice_response(response)
+        self.layer._update_loaded_slice_id(response.request_id)
+        self._ready_request_id = response.request_id
+        self._ready.set()
+
+    def _wait_for_last_request(self):
+        """Wait until the slice of the last submitted request is ready.
+
+        Slices of earlier steps may be ready in between, e.g. when one is
+        done before the next step is submitted.
+        """
+        # submitting a request sets its id on the layer
+        request_id = self.layer._last_slice_id
+        while self._ready_request_id != request_id:
+            if not self._ready.wait(timeout=60):
+                raise TimeoutError(
+                    f'slice request {request_id} was not ready after 60s'
+                )
+            self._ready.clear()
+
+    def _reset(self):
+        """Clear the cached slices and move the dims away from the first
+        step, without slicing, so that stepping to it submits a slice."""
+        invalidate_layer(self.layer)
+        with self.dims.events.current_step.blocker():
+            self.dims.current_step = (N_STEPS - 1, 0, 0)
+
+    def _step_latencies(self):
+        """Latencies from each step of the dims to its slice being ready."""
+        self._reset()
+        latencies = []
+        for step in range(N_STEPS):
+            start = time.perf_counter()
+            self.dims.current_step = (step, 0, 0)
+            self._wait_for_last_request()
+            latencies.append(time.perf_counter() - start)
+        return np.array(latencies)
+
+    def track_latency_p50(self, *args):
+        """Median latency from a dims step until its slice is ready."""
+        return np.percentile(self._step_latencies(), 50)
+
+    track_latency_p50.unit = 'seconds'  # type: ignore[attr-defined]
+
+    def track_latency_p95(self, *args):
+        """95th percentile latency from a dims step until its slice is
+        ready."""
+        return np.percentile(self._step_latencies(), 95)
+
+    track_latency_p95.unit = 'seconds'  # type: ignore[attr-defined]
+
+    def track_throughput(self, *args):
+        """Steps per second when scrubbing through all the steps as fast as
+        possible until the last one is ready."""
+        self._reset()
+        start = time.perf_counter()
+        for step in range(N_STEPS):
+            self.dims.current_step = (step, 0, 0)
+        self._wait_for_last_request()
+        return N_STEPS / (time.perf_counter() - start)
+
+    track_throughput.unit = 'steps/second'  # type: ignore[attr-defined]
+
+    def peakmem_step_through(self, *args):
+        """Peak memory used to slice each step."""
+        self._step_latencies()
+
+
+if __name__ == '__main__':
+    from utils import run_benchmark
+
+    run_benchmark()
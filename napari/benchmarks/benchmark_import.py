@@ -1,6 +1,24 @@
 import subprocess
 import sys
 
+from napari.utils._import_time import (
+    DEPENDENCIES,
+    IMPORT_TARGETS,
+    exceeded_budgets,
+    parse_budgets,
+    profile_import,
+)
+
+# Subpackages of napari whose import time is tracked, next to DEPENDENCIES
+SUBPACKAGES = (
+    'napari',
+    'napari.components',
+    'napari.layers',
+    'napari.plugins',
+    'napari.settings',
+    'napari.utils',
+)
+
 
 class ImportTimeSuite:
     def time_import(self):
@@ -8,6 +26,39 @@ class ImportTimeSuite:
         subprocess.run(cmd, stderr=subprocess.PIPE)
 
 
+class ImportProfileSuite:
+    """Cumulative import time of each subpackage of napari and of its heavy
+    dependencies, when importing napari, the viewer or a layer type.
+
+    Budgets, in seconds, can be set with the ``NAPARI_IMPORT_BUDGETS``
+    environment variable (e.g. ``napari.layers=0.5,pandas=0.3``), in which
+    case the benchmarks of the packages exceeding them fail.
+    """
+
+    params = (list(IMPORT_TARGETS), [*SUBPACKAGES, *DEPENDENCIES])
+    param_names = ['target', 'package']
+    timeout = 600
+
+    def setup_cache(self):
+        return {
+            target: profile_import(statement)
+            for target, statement in IMPORT_TARGETS.items()
+        }
+
+    def track_cumulative_import_time(self, profiles, target, package):
+        costs = profiles[target]
+        exceeded = exceeded_budgets(costs, parse_budgets())
+        if package in exceeded:
+            raise AssertionError(
+                f'importing {package} for {target} took '
+                f'{exceeded[package]:.3f}s, over its budget'
+            )
+        cost = costs.get(package)
+        return cost.cumulative if cost is not None else 0.0
+
+    track_cumulative_import_time.unit = 'seconds'  # type: ignore[attr-defined]
+
+
 if __name__ == '__main__':
     from utils import run_benchmark
 
@@ -0,0 +1,34 @@
+import subprocess
+import sys
+
+from napari.plugins._manifest_cache import manifest_cache_path
+
+VIEWER_CMD = [
+    sys.executable,
+    '-c',
+    'import napari; napari.Viewer(show=False).close()',
+]
+
+
+class ViewerStartupSuite:
+    """Benchmarks for creating the first viewer in a new process, with a
+    cold or warm cache of the discovered plugin manifests."""
+
+    params = ['cold', 'warm']
+    param_names = ['cache']
+    timeout = 300
+
+    def setup(self, cache):
+        if cache == 'warm':
+            subprocess.run(VIEWER_CMD, stderr=subprocess.PIPE)
+
+    def time_create_viewer(self, cache):
+        if cache == 'cold':
+            manifest_cache_path().unlink(missing_ok=True)
+        subprocess.run(VIEWER_CMD, stderr=subprocess.PIPE)
+
+
+if __name__ == '__main__':
+    from utils import run_benchmark
+
+    run_benchmark()
@@ -11,6 +11,7 @@ from functools import cache, wraps
 import numpy as np
 
 from napari.layers import Shapes
+from napari.layers.shapes._shape_list import ShapeList
 from napari.layers.shapes._shapes_constants import shape_classes
 from napari.layers.shapes._shapes_models import Path, Polygon
 from napari.settings import get_settings
@@ -516,6 +517,49 @@ class MeshTriangulationSuite(_BackendSelection):
             )
 
 
+class ShapeBatchTriangulationSuite(_BackendSelection):
+    """Benchmarks for adding many polygons to a Shapes layer at once."""
+
+    data: list[np.ndarray]
+    shapes: list[Polygon]
+    prev_workers: int
+
+    param_names = [
+        'n_shapes',
+        'triangulation_workers',
+        'compiled_triangulation',
+    ]
+    params = [(10_000, 100_000), (1, 4), (True, False)]
+    timeout = 600
+
+    skip_params = Skip(
+        if_in_pr=lambda n_shapes,
+        triangulation_workers,
+        compiled_triangulation: n_shapes > 10_000
+    )
+
+    def setup(self, n_shapes, triangulation_workers, compiled_triangulation):
+        self.data = convex_polygons(n_shapes, 8)
+        self.select_backend(compiled_triangulation)
+        self.prev_workers = get_settings().experimental.triangulation_workers
+        get_settings().experimental.triangulation_workers = (
+            triangulation_workers
+        )
+        self.shapes = [Polygon(x) for x in self.data[:10_000]]
+
+    def teardown(self, *_):
+        super().teardown()
+        get_settings().experimental.triangulation_workers = self.prev_workers
+
+    def time_create_layer(self, *_):
+        """Time to triangulate the polygons and add them to a layer."""
+        Shapes(self.data, shape_type='polygon')
+
+    def time_add_to_shape_list(self, *_):
+        """Time to assemble the meshes of triangulated polygons."""
+        ShapeList().add(self.shapes, z_refresh=False)
+
+
 @cache
 def non_convex_no_self_intersection_polygons(
     n_shapes=5_000, n_points=32
@@ -7,10 +7,11 @@ from __future__ import annotations
 
 import logging
 import weakref
-from collections.abc import Iterable
+from collections.abc import Hashable, Iterable
 from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait
 from contextlib import contextmanager
 from threading import RLock
+from time import perf_counter
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -18,9 +19,21 @@ from typing import (
     runtime_checkable,
 )
 
+from napari.components._slice_prefetch import (
+    _dims_at_step,
+    _SlicePrefetcher,
+)
 from napari.layers import Layer
+from napari.layers.base._slice_cache import (
+    cache_response,
+    get_cached_response,
+    get_slice_cache,
+    invalidate_layer,
+    slice_cache_key,
+)
 from napari.settings import get_settings
 from napari.utils.events.event import EmitterGroup, Event
+from napari.utils.perf import USE_PERFMON, add_counter_event
 
 if TYPE_CHECKING:
     from napari.components import Dims
@@ -32,7 +45,7 @@ logger = logging.getLogger('napari.components._layer_slicer')
 # a slice request that can be called and will produce a slice
 # response. The request and response types are coupled but will
 # vary per layer type, which means that the values of the dictionary
-# result of ``_slice_layers`` cannot be fixed to a single type.
+# result of a slicing task cannot be fixed to a single type.
 
 
 class _SliceRequest(Protocol):
@@ -76,12 +89,116 @@ class _AsyncSliceable(Protocol):
         """
 
 
+class _SliceTask:
+    """Gathers the per-layer slicing futures of one call to submit.
+
+    Each layer of a submitted request is sliced in its own future so that
+    layers can be sliced concurrently and cancelled independently.
+    This combines them into one future whose result maps from each layer
+    to its slice response. That future starts running when the first layer
+    starts being sliced, and is cancelled if all of the per-layer futures
+    were cancelled before starting.
+
+    Attributes
+    ----------
+    future : concurrent.futures.Future
+        The combined future, returned by ``_LayerSlicer.submit``.
+    layer_futures : dict of layer weakrefs to futures
+        The futures slicing each individual layer.
+    """
+
+    def __init__(self, on_ready: Any) -> None:
+        self.future: Future[dict] = Future()
+        self.layer_futures: dict[weakref.ReferenceType[Layer], Future] = {}
+        self._on_ready = on_ready
+        self._lock = RLock()
+        self._remaining = 0
+        self._started = False
+        self._results: dict[weakref.ReferenceType[Layer], Any] = {}
+        self._error: BaseException | None = None
+        self.future.add_done_callback(self._on_future_done)
+
+    def add(self, weak_layer: weakref.ReferenceType[Layer], future: Future):
+        with self._lock:
+            self._remaining += 1
+            self.layer_futures[weak_layer] = future
+
+    def watch(self) -> None:
+        """Start gathering results, once all layer futures were added."""
+        for weak_layer, future in list(self.layer_futures.items()):
+            future.add_done_callback(
+                lambda f, w=weak_layer: self._on_layer_done(w, f)
+            )
+
+    def set_running(self) -> bool:
+        """Mark this as running, returning False if it was cancelled."""
+        with self._lock:
+            if self._started:
+                return not self.future.cancelled()
+            self._started = True
+            return self.future.set_running_or_notify_cancel()
+
+    def _on_layer_done(
+        self, weak_layer: weakref.ReferenceType[Layer], future: Future
+    ) -> None:
+        with self._lock:
+            self._remaining -= 1
+            if not future.cancelled():
+                if (error := future.exception()) is not None:
+                    self._error = error
+                elif (response := future.result()) is not None:
+                    self._results[weak_layer] = response
+            if self._remaining > 0 or self.future.done():
+                return
+            if not self._started:
+                self.future.cancel()
+                return
+        if self._error is not None:
+            self.future.set_exception(self._error)
+            return
+        if self._results:
+            self._on_ready(self._results)
+        self.future.set_result(self._results)
+
+    def _on_future_done(self, future: Future) -> None:
+        # If the combined future is cancelled by the caller, cancel any
+        # layer slicing that has not yet started.
+        if future.cancelled():
+            for layer_future in self.layer_futures.values():
+                layer_future.cancel()
+
+
 class _LayerSlicer:
     """
     High level class to control the creation of a slice (via a slice request),
     submit it (synchronously or asynchronously) to a thread pool, and emit the
     results when complete.
 
+    Each layer of a request is sliced in its own task, so that a pool with
+    more than one worker slices layers concurrently. Submitting a new request
+    for a layer cancels any slicing of that layer that has not started yet,
+    even if it was submitted together with other layers.
+
+    When the ``slice_prefetch_steps`` and ``slice_cache_size`` experimental
+    settings are both positive, the changes of the dims current step are used
+    to predict the next steps, which are sliced ahead of time and cancelled
+    by the next submit if they have not started yet. Both settings are 0 by
+    default, so prefetching is opt-in.
+
+    The responses of both submitted and prefetched requests are kept in the
+    napari-wide slice cache (see ``napari.layers.base._slice_cache``), from
+    which later requests are served without slicing.
+
+    When perfmon is enabled, the number of queued slice tasks and the latency
+    of the slicing of each layer are recorded as counter events named
+    ``'slice_queue: <layer name>'`` and ``'slice_latency: <layer name>'``.
+
+    Parameters
+    ----------
+    max_workers : int or None
+        The number of threads used to slice layers. If None, this is
+        given by the ``async_slicing_workers`` experimental setting.
+
     Events
     ------
     ready
@@ -93,7 +210,7 @@ class _LayerSlicer:
         with `@ensure_main_thread`).
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_workers: int | None = None) -> None:
         """
         Attributes
         ----------
@@ -103,17 +220,42 @@ class _LayerSlicer:
             if true, forces slicing to execute synchronously
         _layers_to_task : dict of tuples of layer weakrefs to futures
             task storage for cancellation logic
+        _layer_to_future : dict of layer weakrefs to futures
+            the latest slicing future of each layer, which is cancelled
+            when a newer request for that layer is submitted
+        _layer_to_request_id : dict of layer weakrefs to ints
+            the id of the latest slice request of each layer, used to drop
+            stale requests
+        _layer_to_queue_depth : dict of layer weakrefs to ints
+            the number of slicing futures of each layer that are not done
         _lock_layers_to_task : threading.RLock
             lock to guard against changes to `_layers_to_task` when finding,
-            adding, or removing tasks.
+            adding, or removing tasks, and to the other per-layer
+            dictionaries and `_prefetch_futures`.
+        _prefetcher : _SlicePrefetcher
+            predicts the dims steps to prefetch
+        _prefetch_futures : dict of cache keys to futures
+            the prefetch tasks that are not done
         """
+        settings = get_settings()
+        if max_workers is None:
+            max_workers = settings.experimental.async_slicing_workers
         self.events = EmitterGroup(source=self, ready=Event)
-        self._executor: Executor = ThreadPoolExecutor(max_workers=1)
-        self._force_sync = not get_settings().experimental.async_
+        self._executor: Executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='napari_slicer'
+        )
+        self._force_sync = not settings.experimental.async_
         self._layers_to_task: dict[
             tuple[weakref.ReferenceType[Layer], ...], Future
         ] = {}
+        self._layer_to_future: dict[weakref.ReferenceType[Layer], Future] = {}
+        self._layer_to_request_id: dict[weakref.ReferenceType[Layer], int] = {}
+        self._layer_to_queue_depth: dict[
+            weakref.ReferenceType[Layer], int
+        ] = {}
         self._lock_layers_to_task = RLock()
+        self._prefetcher = _SlicePrefetcher()
+        self._prefetch_futures: dict[Hashable, Future] = {}
 
     @contextmanager
     def force_sync(self):
@@ -161,17 +303,16 @@ class _LayerSlicer:
         layers: Iterable[Layer],
         dims: Dims,
         force: bool = False,
+        invalidate: bool = True,
     ) -> Future[dict] | None:
         """Slices the given layers with the given dims.
 
-        Submitting multiple layers at one generates multiple requests, but only ONE task.
+        Submitting multiple layers at one generates multiple requests, which
+        are sliced concurrently, but only ONE future is returned.
 
-        This will attempt to cancel all pending slicing tasks that can be entirely
-        replaced the new ones. If multiple layers are sliced, any task that contains
-        only one of those layers can safely be cancelled. If a single layer is sliced,
-        it will wait for any existing tasks that include that layer AND another layer,
-        In other words, it will only cancel if the new task will replace the
-        slices of all the layers in the pending task.
+        This will cancel the pending slicing of each of the given layers,
+        regardless of which other layers were submitted with it. A pending task
+        is only cancelled as a whole if all of its layers have been cancelled.
 
         This should only be called from the main thread.
 
@@ -184,6 +325,11 @@ class _LayerSlicer:
         force : bool
             True if slicing should be forced to occur, even when some cache thinks
             it already has a valid slice ready. False otherwise.
+        invalidate : bool
+            True if forcing slicing should also remove the cached slices of the
+            layers. False if only the view of the layers changed (e.g. after a
+            pan or zoom of a multiscale layer), so that their cached slices are
+            still valid.
 
         Returns
         -------
@@ -192,14 +338,17 @@ class _LayerSlicer:
             slice response. Or none if no async slicing tasks were submitted.
         """
         logger.debug(
-            '_LayerSlicer.submit: layers=%s, dims=%s, force=%s',
+            '_LayerSlicer.submit: layers=%s, dims=%s, force=%s, invalidate=%s',
             layers,
             dims,
             force,
+            invalidate,
         )
-        if existing_task := self._find_existing_task(layers):
-            logger.debug('Cancelling task %s', id(existing_task))
-            existing_task.cancel()
+        # Pending prefetches should not delay the slicing of these layers.
+        self._cancel_prefetch()
+        if force and invalidate:
+            for layer in layers:
+                invalidate_layer(layer)
 
         # Not all layer types will initially be asynchronously sliceable.
         # The following logic gives us a way to handle those in the short
@@ -232,13 +381,9 @@ class _LayerSlicer:
         # First maybe submit an async slicing task to start it ASAP.
         task = None
         if len(requests) > 0:
-            logger.debug('Submitting task %s', id(task))
-            task = self._executor.submit(self._slice_layers, requests)
-            # Store task before adding done callback to ensure there is always
-            # a task to remove in the done callback.
-            with self._lock_layers_to_task:
-                self._layers_to_task[tuple(requests)] = task
-            task.add_done_callback(self._on_slice_done)
+            task = self._submit_requests(requests)
+            logger.debug('Submitted task %s', id(task))
+            self._prefetch(requests, dims)
 
         # Then execute sync slicing tasks to run concurrent with async ones.
         for layer in sync_layers:
@@ -261,24 +406,178 @@ class _LayerSlicer:
         self.events.disconnect()
         self.events.ready.disconnect()
 
-    def _slice_layers(self, requests: dict) -> dict:
+    def _submit_requests(
+        self, requests: dict[weakref.ReferenceType[Layer], _SliceRequest]
+    ) -> Future[dict]:
+        """Submits one slicing future per layer and returns their combination.
+
+        This should only be called from the main thread.
+        """
+        slice_task = _SliceTask(on_ready=self._emit_ready)
+        with self._lock_layers_to_task:
+            for weak_layer, request in requests.items():
+                if stale := self._layer_to_future.get(weak_layer):
+                    logger.debug('Cancelling stale slice of %s', weak_layer)
+                    stale.cancel()
+                self._layer_to_request_id[weak_layer] = request.id
+            for weak_layer, request in requests.items():
+                key = None
+                if (layer := weak_layer()) is not None:
+                    key = slice_cache_key(layer, request)
+                if (cached := get_cached_response(key, request)) is not None:
+                    logger.debug('Using cached slice of %s', weak_layer)
+                    future = Future()
+                    slice_task.set_running()
+                    future.set_running_or_notify_cancel()
+                    future.set_result(cached)
+                else:
+                    future = self._executor.submit(
+                        self._slice_layer,
+                        weak_layer,
+                        request,
+                        key,
+                        slice_task,
+                        perf_counter(),
+                    )
+                slice_task.add(weak_layer, future)
+                self._layer_to_future[weak_layer] = future
+                self._update_queue_depth(weak_layer, 1)
+                future.add_done_callback(
+                    lambda _, w=weak_layer: self._update_queue_depth(w, -1)
+                )
+            # Store task before adding done callback to ensure there is always
+            # a task to remove in the done callback.
+            self._layers_to_task[tuple(requests)] = slice_task.future
+        slice_task.future.add_done_callback(self._on_slice_done)
+        slice_task.watch()
+        return slice_task.future
+
+    def _slice_layer(
+        self,
+        weak_layer: weakref.ReferenceType[Layer],
+        request: _SliceRequest,
+        key: Hashable | None,
+        slice_task: _SliceTask,
+        submit_time: float,
+    ) -> Any:
+        """Calls the slice request of one layer on a slicing thread.
+
+        The response is added to the slice cache with the given key. Returns
+        None without slicing if a newer request for the same layer was
+        submitted after this one was picked up by a worker.
         """
-        Iterates through a dictionary of request objects and call the slice
-        on each individual layer. Can be called from the main or slicing thread.
+        if not slice_task.set_running():
+            return None
+        if self._layer_to_request_id.get(weak_layer) != request.id:
+            logger.debug('Skipping stale slice request %s', request.id)
+            return None
+        logger.debug('_LayerSlicer._slice_layer: %s', request)
+        response = request()
+        if (layer := weak_layer()) is not None:
+            cache_response(key, layer, response)
+            if USE_PERFMON:
+                add_counter_event(
+                    f'slice_latency: {layer}',
+                    latency_ms=(perf_counter() - submit_time) * 1e3,
+                )
+        return response
+
+    def _prefetch(
+        self,
+        requests: dict[weakref.ReferenceType[Layer], _SliceRequest],
+        dims: Dims,
+    ) -> None:
+        """Slices the layers of the given requests at the predicted next steps
+        of dims.
 
-        Attributes
-        ----------
-        requests: dict[Layer, SliceRequest]
-            Dictionary of request objects to be used for constructing the slice
+        Only the layers whose requests support caching are prefetched, and
+        the prefetched requests are made here, like all requests, so that
+        only calling them happens on the slicing threads.
 
-        Returns
-        -------
-        dict[Layer, SliceResponse]: which contains the results of the slice
+        This should only be called from the main thread.
         """
-        logger.debug('_LayerSlicer._slice_layers: %s', requests)
-        result = {layer: request() for layer, request in requests.items()}
+        settings = get_settings().experimental
+        cache = get_slice_cache()
+        # prefetched slices would be evicted before being used
+        if cache.max_bytes == 0:
+            return
+        steps = self._prefetcher.predict(dims, settings.slice_prefetch_steps)
+        if not steps:
+            return
+        weak_layers = [
+            weak_layer
+            for weak_layer, request in requests.items()
+            if getattr(type(request), 'cache_key', None) is not None
+        ]
+        if not weak_layers:
+            return
+        state = dims.dict()
+        for step in steps:
+            step_dims = _dims_at_step(state, step)
+            for weak_layer in weak_layers:
+                if (layer := weak_layer()) is None:
+                    continue
+                request = layer._make_slice_request(step_dims)
+                key = slice_cache_key(layer, request)
+                if key is None or key in cache:
+                    continue
+                with self._lock_layers_to_task:
+                    if key in self._prefetch_futures:
+                        continue
+                    logger.debug('Prefetching %s at step %s', layer, step)
+                    future = self._executor.submit(
+                        self._prefetch_layer, weak_layer, key, request
+                    )
+                    self._prefetch_futures[key] = future
+                future.add_done_callback(
+                    lambda _, k=key: self._pop_prefetch_future(k)
+                )
+
+    def _prefetch_layer(
+        self,
+        weak_layer: weakref.ReferenceType[Layer],
+        key: Hashable,
+        request: _SliceRequest,
+    ) -> None:
+        """Calls a slice request and caches its response on a slicing thread."""
+        response = request()
+        if (layer := weak_layer()) is not None:
+            cache_response(key, layer, response)
+
+    def _pop_prefetch_future(self, key: Hashable) -> None:
+        """Forgets a prefetch task once it is done."""
+        with self._lock_layers_to_task:
+            self._prefetch_futures.pop(key, None)
+
+    def _cancel_prefetch(self) -> None:
+        """Cancels the prefetch tasks that have not started yet."""
+        with self._lock_layers_to_task:
+            futures = list(self._prefetch_futures.values())
+        for future in futures:
+            future.cancel()
+
+    def _update_queue_depth(
+        self, weak_layer: weakref.ReferenceType[Layer], change: int
+    ) -> None:
+        """Tracks the number of slicing futures of a layer that are not done."""
+        with self._lock_layers_to_task:
+            depth = self._layer_to_queue_depth.get(weak_layer, 0) + change
+            if depth > 0:
+                self._layer_to_queue_depth[weak_layer] = depth
+            else:
+                self._layer_to_queue_depth.pop(weak_layer, None)
+                if (future := self._layer_to_future.get(weak_layer)) and (
+                    future.done()
+                ):
+                    del self._layer_to_future[weak_layer]
+                    self._layer_to_request_id.pop(weak_layer, None)
+        if USE_PERFMON and (layer := weak_layer()) is not None:
+            add_counter_event(f'slice_queue: {layer}', depth=depth)
+
+    def _emit_ready(self, result: dict) -> None:
+        """Emits the ready event. Can be called from the main or slicing thread."""
+        logger.debug('_LayerSlicer._emit_ready: %s', result)
         self.events.ready(value=result)
-        return result
 
     def _on_slice_done(self, task: Future[dict]) -> None:
         """
@@ -307,22 +606,3 @@ class _LayerSlicer:
                     del self._layers_to_task[k_layers]
                     return True
         return False
-
-    def _find_existing_task(
-        self, layers: Iterable[Layer]
-    ) -> Future[dict] | None:
-        """Find the task associated with a list of layers. Returns the first
-        task found for which the layers of the task are a subset of the input
-        layers.
-
-        This function provides a lock to ensure that the layers_to_task dict
-        is unmodified during this process.
-        """
-        with self._lock_layers_to_task:
-            layer_set = set(layers)
-            for weak_task_layers, task in self._layers_to_task.items():
-                task_layers = {w() for w in weak_task_layers} - {None}
-                if task_layers.issubset(layer_set):
-                    logger.debug('Found existing task for %s', task_layers)
-                    return task
-        return None
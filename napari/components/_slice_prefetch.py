@@ -0,0 +1,79 @@
+"""Prediction of the dims steps to slice ahead of time during playback."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from napari.components.dims import Dims
+
+
+class _SlicePrefetcher:
+    """Predicts the next steps of dims from how its current step changes.
+
+    Each call to ``predict`` compares the current step of the given dims to
+    the one of the previous call. If exactly one non-displayed dimension
+    changed, the change is taken as the velocity along that dimension (in
+    steps per update, with its sign giving the direction) and the next steps
+    are predicted by repeating it, which matches both playback and scrubbing
+    a dims slider.
+    """
+
+    def __init__(self) -> None:
+        self._last_step: tuple[int, ...] | None = None
+        self._axis: int | None = None
+        self._velocity: int = 0
+
+    def predict(self, dims: Dims, n_steps: int) -> list[tuple[int, ...]]:
+        """Record the current step of dims and predict the next ones.
+
+        Parameters
+        ----------
+        dims : Dims
+            The dims that are about to be sliced.
+        n_steps : int
+            The maximum number of steps to predict.
+
+        Returns
+        -------
+        list of tuple of int
+            The predicted current steps, nearest first. This is empty if the
+            step did not change along exactly one non-displayed dimension.
+        """
+        step = tuple(dims.current_step)
+        last, self._last_step = self._last_step, step
+        if last is None or len(last) != len(step) or last == step:
+            return []
+        changed = [
+            axis
+            for axis, (before, after) in enumerate(
+                zip(last, step, strict=True)
+            )
+            if before != after
+        ]
+        if len(changed) != 1 or changed[0] in dims.displayed:
+            self._axis = None
+            self._velocity = 0
+            return []
+        self._axis = axis = changed[0]
+        self._velocity = velocity = step[axis] - last[axis]
+        nsteps = dims.nsteps[axis]
+        predicted = []
+        for k in range(1, n_steps + 1):
+            position = step[axis] + k * velocity
+            if not 0 <= position < nsteps:
+                break
+            predicted.append(step[:axis] + (position,) + step[axis + 1 :])
+        return predicted
+
+
+def _dims_at_step(state: dict[str, Any], step: tuple[int, ...]) -> Dims:
+    """Makes a new dims from the state of another one, at another step.
+
+    The state is the result of ``Dims.dict()``, so that it only needs to be
+    taken once for all the predicted steps.
+    """
+    point = tuple(
+        rng.start + s * rng.step
+        for s, rng in zip(step, state['range'], strict=True)
+    )
+    return Dims(**{**state, 'point': point})
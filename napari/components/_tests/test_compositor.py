@@ -0,0 +1,155 @@
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from napari.components import ViewerModel
+from napari.components.compositor import render_view, render_views
+
+
+def make_viewer(shape=(10, 10)):
+    viewer = ViewerModel()
+    viewer._canvas_size = shape
+    return viewer
+
+
+def test_render_image_with_contrast_limits():
+    viewer = make_viewer()
+    viewer.add_image(
+        np.array([[0.0, 1.0], [2.0, 4.0]]), contrast_limits=(0, 2)
+    )
+    viewer.reset_view(margin=0)
+
+    image = render_view(viewer)
+
+    assert image.shape == (10, 10, 4)
+    assert image.dtype == np.uint8
+    npt.assert_array_equal(image[2, 2], [0, 0, 0, 255])
+    npt.assert_array_equal(image[2, 7], [128, 128, 128, 255])
+    npt.assert_array_equal(image[7, 2], [255, 255, 255, 255])
+    npt.assert_array_equal(image[7, 7], [255, 255, 255, 255])
+
+
+@pytest.mark.parametrize(
+    ('blending', 'expected'),
+    [
+        ('translucent', [153, 0, 102, 255]),
+        ('additive', [255, 0, 102, 255]),
+        ('minimum', [0, 0, 0, 255]),
+        ('opaque', [0, 0, 255, 255]),
+    ],
+)
+def test_render_blending(blending, expected):
+    viewer = make_viewer()
+    viewer.add_image(np.ones((2, 2)), colormap='red', contrast_limits=(0, 1))
+    viewer.add_image(
+        np.ones((2, 2)),
+        colormap='blue',
+        contrast_limits=(0, 1),
+        blending=blending,
+        opacity=0.4,
+    )
+    viewer.reset_view(margin=0)
+
+    image = render_view(viewer)
+
+    npt.assert_array_equal(image[5, 5], expected)
+
+
+def test_render_points_shapes_and_vectors():
+    viewer = make_viewer((20, 20))
+    viewer.add_image(np.zeros((10, 10)))
+    viewer.add_points([[7, 7]], size=2, face_color='red', border_width=0)
+    viewer.add_shapes(
+        [[[0, 0], [0, 3], [3, 3], [3, 0]]],
+        face_color='blue',
+        edge_width=0,
+        opacity=1,
+    )
+    viewer.add_vectors(
+        np.array([[[8, 1], [0, 3]]]),
+        edge_width=1,
+        edge_color='lime',
+        opacity=1,
+    )
+    viewer.reset_view(margin=0)
+
+    image = render_view(viewer)
+
+    # the canvas shows the world from -0.5 to 9.5 at 2 pixels per unit
+    npt.assert_array_equal(image[15, 15], [255, 0, 0, 255])
+    npt.assert_array_equal(image[11, 11], [0, 0, 0, 255])
+    npt.assert_array_equal(image[3, 3], [0, 0, 255, 255])
+    npt.assert_array_equal(image[9, 9], [0, 0, 0, 255])
+    npt.assert_array_equal(image[17, 5], [0, 255, 0, 255])
+    npt.assert_array_equal(image[17, 12], [0, 0, 0, 255])
+
+
+def test_render_roi_and_orientation():
+    viewer = make_viewer()
+    viewer.add_image(np.arange(16.0).reshape(4, 4), contrast_limits=(0, 15))
+    roi = np.array([[-0.5, 1.5], [-0.5, 3.5], [1.5, 3.5], [1.5, 1.5]])
+
+    image = render_view(viewer, roi=roi, scale=1)
+    npt.assert_array_equal(image[..., 0], [[34, 51], [102, 119]])
+
+    image = render_view(viewer, roi=roi, size=(4, 4))
+    assert image.shape == (4, 4, 4)
+
+    viewer.camera.orientation2d = ('up', 'left')
+    image = render_view(viewer, roi=roi, scale=1)
+    npt.assert_array_equal(image[..., 0], [[119, 102], [51, 34]])
+
+
+def test_render_views_of_time_points_in_processes():
+    viewer = make_viewer()
+    data = np.arange(3)[:, np.newaxis, np.newaxis] * np.ones((3, 4, 4))
+    viewer.add_image(data, contrast_limits=(0, 2))
+    viewer.add_points([[0, 1, 1], [2, 2, 2]], size=1, face_color='red')
+    viewer.reset_view(margin=0)
+    points = [(t, 0, 0) for t in range(3)]
+
+    serial = render_views(viewer, points=points, processes=1)
+    parallel = render_views(viewer, points=points, processes=2)
+
+    assert len(serial) == 3
+    for expected, image in zip(serial, parallel, strict=True):
+        npt.assert_array_equal(image, expected)
+    npt.assert_array_equal(serial[1][0, 0], [128, 128, 128, 255])
+    # the dims of the viewer are not changed
+    assert viewer.dims.point[0] == 1
+
+
+def test_render_multiscale_uses_view_resolution():
+    viewer = make_viewer()
+    base = np.zeros((64, 64))
+    base[:32] = 1
+    data = [base, base[::2, ::2], base[::4, ::4]]
+    viewer.add_image(data, contrast_limits=(0, 1))
+    viewer.reset_view(margin=0)
+
+    image = render_view(viewer)
+
+    npt.assert_array_equal(image[2, 5, 0], 255)
+    npt.assert_array_equal(image[7, 5, 0], 0)
+
+
+def test_render_grid():
+    viewer = make_viewer((4, 8))
+    viewer.add_image(np.zeros((4, 4)), contrast_limits=(0, 1))
+    viewer.add_image(np.ones((4, 4)), contrast_limits=(0, 1))
+    viewer.grid.enabled = True
+    viewer.reset_view(margin=0)
+
+    image = render_view(viewer)
+
+    # the last layer is in the first cell of the grid
+    npt.assert_array_equal(image[:, :4, 0], 255)
+    npt.assert_array_equal(image[:, 4:, 0], 0)
+
+
+def test_render_3d_raises():
+    viewer = make_viewer()
+    viewer.add_image(np.zeros((2, 2, 2)))
+    viewer.dims.ndisplay = 3
+    with pytest.raises(ValueError, match='2D'):
+        render_view(viewer)
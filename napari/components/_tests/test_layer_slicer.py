@@ -2,7 +2,7 @@ import time
 import weakref
 from concurrent.futures import Future, wait
 from dataclasses import dataclass
-from threading import RLock, current_thread, main_thread
+from threading import Barrier, RLock, current_thread, main_thread
 from typing import Any
 
 import numpy as np
@@ -11,7 +11,9 @@ import pytest
 from napari._tests.utils import DEFAULT_TIMEOUT_SECS, LockableData
 from napari.components import Dims
 from napari.components._layer_slicer import _LayerSlicer
-from napari.layers import Image, Labels, Points
+from napari.layers import Image, Labels, Points, Shapes, Surface, Tracks
+from napari.layers.base._slice_cache import get_slice_cache
+from napari.settings import get_settings
 
 # The following fakes are used to control execution of slicing across
 # multiple threads, while also allowing us to mimic real classes
@@ -380,6 +382,171 @@ def test_submit_with_one_3d_points(layer_slicer):
         assert not future.done()
 
 
+def test_submit_with_shapes_surface_and_tracks(layer_slicer):
+    """ensure that shapes, surfaces and tracks are sliced asynchronously"""
+    square = np.array([[0, 0], [0, 2], [2, 2], [2, 0]])
+    shapes = Shapes(
+        [np.insert(square, 0, z, axis=1) for z in (0, 1)],
+        shape_type='polygon',
+    )
+    vertices = np.array(
+        [[0, 0, 0], [0, 0, 1], [0, 1, 0], [1, 0, 0], [1, 0, 1], [1, 1, 0]]
+    )
+    faces = np.array([[0, 1, 2], [3, 4, 5]])
+    surface = Surface((vertices, faces))
+    tracks = Tracks(np.array([[0, 0, 0, 0], [0, 1, 1, 1], [1, 1, 2, 2]]))
+    dims = Dims(
+        ndim=3,
+        ndisplay=2,
+        range=((0, 2, 1), (0, 3, 1), (0, 3, 1)),
+        point=(1, 0, 0),
+    )
+
+    future = layer_slicer.submit(layers=[shapes, surface, tracks], dims=dims)
+    result = _wait_for_response(future)
+
+    np.testing.assert_array_equal(result[shapes].view.displayed, [False, True])
+    np.testing.assert_array_equal(result[surface].faces, [[3, 4, 5]])
+    assert result[tracks].labels == ['ID:0', 'ID:1']
+
+
+def test_submit_slices_layers_concurrently():
+    """ensure that layers of one request are sliced on different threads
+    when more than one worker is available"""
+    layer_slicer = _LayerSlicer(max_workers=2)
+    layer_slicer._force_sync = False
+    barrier = Barrier(2, timeout=DEFAULT_TIMEOUT_SECS)
+
+    @dataclass(frozen=True)
+    class FakeSliceRequestBarrier(FakeSliceRequest):
+        def __call__(self) -> FakeSliceResponse:
+            barrier.wait()
+            return super().__call__()
+
+    class FakeAsyncLayerBarrier(FakeAsyncLayer):
+        def _make_slice_request(self, dims: Dims) -> FakeSliceRequestBarrier:
+            self._slice_request_count += 1
+            return FakeSliceRequestBarrier(
+                id=self._slice_request_count, lock=self.lock
+            )
+
+    layer1 = FakeAsyncLayerBarrier()
+    layer2 = FakeAsyncLayerBarrier()
+    try:
+        future = layer_slicer.submit(layers=[layer1, layer2], dims=Dims())
+        result = _wait_for_response(future)
+    finally:
+        layer_slicer.shutdown()
+
+    assert result[layer1].id == 1
+    assert result[layer2].id == 1
+
+
+def test_submit_cancels_pending_layer_of_other_task(layer_slicer):
+    """ensure that a new request for one layer cancels the pending slicing
+    of that layer, even when it is part of a task with other layers"""
+    dims = Dims()
+    blocking_layer = FakeAsyncLayer()
+    layer1 = FakeAsyncLayer()
+    layer2 = FakeAsyncLayer()
+
+    with blocking_layer.lock:
+        blocked = layer_slicer.submit(layers=[blocking_layer], dims=dims)
+        _wait_until_running(blocked)
+        pending = layer_slicer.submit(layers=[layer1, layer2], dims=dims)
+        assert layer_slicer._layer_to_queue_depth[weakref.ref(layer1)] == 1
+        newer = layer_slicer.submit(layers=[layer1], dims=dims)
+
+    pending_result = _wait_for_response(pending)
+    assert layer1 not in pending_result
+    assert pending_result[layer2].id == 1
+    assert _wait_for_response(newer)[layer1].id == 2
+    layer_slicer.wait_until_idle(timeout=DEFAULT_TIMEOUT_SECS)
+    assert len(layer_slicer._layer_to_queue_depth) == 0
+
+
+def test_submit_prefetches_next_steps(layer_slicer):
+    get_settings().experimental.slice_cache_size = 512
+    get_settings().experimental.slice_prefetch_steps = 2
+    np.random.seed(0)
+    data = np.random.rand(8, 7, 6)
+    lockable_data = LockableData(data)
+    layer = Image(data=lockable_data, multiscale=False)
+    dims = Dims(
+        ndim=3,
+        ndisplay=2,
+        range=((0, 8, 1), (0, 7, 1), (0, 6, 1)),
+        point=(0, 0, 0),
+    )
+
+    _wait_for_response(layer_slicer.submit(layers=[layer], dims=dims))
+    dims.current_step = (1, 0, 0)
+    _wait_for_response(layer_slicer.submit(layers=[layer], dims=dims))
+    for future in list(layer_slicer._prefetch_futures.values()):
+        future.result(timeout=DEFAULT_TIMEOUT_SECS)
+    # submitted steps 0 and 1, then prefetched steps 2 and 3
+    cache_keys = [k for k in get_slice_cache() if k[0]() is layer]
+    assert len(cache_keys) == 4
+
+    # prefetched steps are served from the cache without reading the data
+    dims.current_step = (3, 0, 0)
+    with lockable_data.lock:
+        future = layer_slicer.submit(layers=[layer], dims=dims)
+        assert future.done()
+    response = _wait_for_response(future)[layer]
+    np.testing.assert_equal(response.image.view, data[3])
+    assert response.request_id == layer._last_slice_id
+
+
+def test_submit_does_not_prefetch_uncacheable_layers(layer_slicer):
+    get_settings().experimental.slice_cache_size = 512
+    get_settings().experimental.slice_prefetch_steps = 2
+    layer = FakeAsyncLayer()
+    dims = Dims(ndim=3, range=((0, 8, 1), (0, 7, 1), (0, 6, 1)))
+
+    _wait_for_response(layer_slicer.submit(layers=[layer], dims=dims))
+    dims.current_step = (1, 0, 0)
+    _wait_for_response(layer_slicer.submit(layers=[layer], dims=dims))
+
+    # the fake requests have no cache key, so only the submitted steps
+    # made requests
+    assert layer._slice_request_count == 2
+    assert not layer_slicer._prefetch_futures
+
+
+def test_submit_reuses_cached_slice(layer_slicer):
+    get_settings().experimental.slice_cache_size = 512
+    data = np.random.rand(3, 7, 6)
+    lockable_data = LockableData(data)
+    layer = Image(data=lockable_data, multiscale=False)
+    dims = Dims(ndim=3, ndisplay=2, range=((0, 3, 1), (0, 7, 1), (0, 6, 1)))
+    _wait_for_response(layer_slicer.submit(layers=[layer], dims=dims))
+    dims.current_step = (1, 0, 0)
+    _wait_for_response(layer_slicer.submit(layers=[layer], dims=dims))
+
+    dims.current_step = (0, 0, 0)
+    with lockable_data.lock:
+        future = layer_slicer.submit(layers=[layer], dims=dims)
+        assert future.done()
+    response = _wait_for_response(future)[layer]
+    np.testing.assert_equal(response.image.view, data[0])
+
+    # forcing a slice, as on a layer reload, does not use the cache
+    dims.current_step = (1, 0, 0)
+    with lockable_data.lock:
+        future = layer_slicer.submit(layers=[layer], dims=dims, force=True)
+        assert not future.done()
+    _wait_for_response(future)
+
+    # forcing a slice after a change of view only keeps the cache
+    with lockable_data.lock:
+        future = layer_slicer.submit(
+            layers=[layer], dims=dims, force=True, invalidate=False
+        )
+        assert future.done()
+    _wait_for_response(future)
+
+
 def test_submit_after_shutdown_raises():
     layer_slicer = _LayerSlicer()
     layer_slicer._force_sync = False
@@ -0,0 +1,45 @@
+from napari.components import Dims
+from napari.components._slice_prefetch import (
+    _dims_at_step,
+    _SlicePrefetcher,
+)
+
+
+def _dims(point):
+    return Dims(
+        ndim=3,
+        range=((0, 10, 1), (0, 5, 1), (0, 5, 1)),
+        point=point,
+    )
+
+
+def test_predict_follows_direction_and_stride():
+    prefetcher = _SlicePrefetcher()
+    assert prefetcher.predict(_dims((4, 0, 0)), 3) == []
+    assert prefetcher.predict(_dims((6, 0, 0)), 3) == [
+        (8, 0, 0),
+        (10, 0, 0),
+    ]
+    assert prefetcher.predict(_dims((5, 0, 0)), 2) == [(4, 0, 0), (3, 0, 0)]
+
+
+def test_predict_nothing_when_not_a_single_slider_change():
+    prefetcher = _SlicePrefetcher()
+    prefetcher.predict(_dims((4, 0, 0)), 3)
+    # unchanged step
+    assert prefetcher.predict(_dims((4, 0, 0)), 3) == []
+    # displayed dimension changed
+    assert prefetcher.predict(_dims((4, 0, 2)), 3) == []
+    # more than one dimension changed
+    dims = Dims(ndim=4, range=((0, 10, 1),) * 4, point=(0, 0, 0, 0))
+    prefetcher.predict(dims, 3)
+    dims.current_step = (1, 1, 0, 0)
+    assert prefetcher.predict(dims, 3) == []
+
+
+def test_dims_at_step():
+    dims = Dims(ndim=3, range=((0, 20, 2), (0, 5, 1), (0, 5, 1)))
+    step_dims = _dims_at_step(dims.dict(), (3, 0, 0))
+    assert step_dims.current_step == (3, 0, 0)
+    assert step_dims.point == (6, 0, 0)
+    assert dims.current_step == (0, 0, 0)
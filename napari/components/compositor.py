@@ -0,0 +1,731 @@
+"""Render 2D views of a viewer model to RGBA arrays without a GPU.
+
+This is a pure NumPy compositor: it needs neither Qt nor vispy, so it can
+render views of a `ViewerModel` in a headless process, or many views in
+parallel worker processes. Each layer is sliced with the same slice
+requests that the viewer uses, then the sliced images, points, shapes and
+vectors are rasterized and composited from the bottom layer to the top one
+according to each layer's ``blending`` and ``opacity``.
+
+In grid mode, the layers are drawn at their place in the grid, since the
+grid is part of their transforms, so the camera view matches the canvas
+and regions of interest are in the coordinates of the grid.
+
+The result approximates what the canvas shows. In particular, images are
+sampled with nearest neighbor interpolation, points are drawn as discs,
+vectors are drawn as lines, and the pixels drawn by one layer are not
+blended with each other, the last one drawn winning.
+
+Examples
+--------
+>>> viewer = ViewerModel()
+>>> layer = viewer.add_image(np.random.random((5, 64, 64)))
+>>> frame = render_view(viewer)
+>>> frames = render_views(viewer, points=[(t, 32, 32) for t in range(5)])
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import itertools
+import os
+import warnings
+from collections import deque
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import get_context
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import numpy.typing as npt
+
+from napari.components.dims import Dims
+from napari.layers import Image, Labels, Layer, Points, Shapes, Vectors
+from napari.layers.base._base_constants import Blending
+from napari.layers.utils.layer_utils import (
+    compute_multiscale_level_and_corners,
+)
+from napari.utils.colormaps.standardize_color import transform_color
+from napari.utils.translations import trans
+
+if TYPE_CHECKING:
+    from napari.components.viewer_model import ViewerModel
+
+__all__ = ['render_view', 'render_views']
+
+# Number of colors sampled from continuous colormaps.
+_LUT_SIZE = 1024
+# Maximum number of candidate pixels rasterized at once, to bound memory.
+_MAX_BATCH_PIXELS = 2**22
+
+
+@dataclass(frozen=True)
+class _View:
+    """The canvas on which a 2D view is rendered.
+
+    Attributes
+    ----------
+    shape : tuple of int
+        Height and width of the canvas in pixels.
+    center : (2,) array
+        World coordinates of the displayed dimensions at the canvas center.
+    zoom : float
+        Number of canvas pixels per world unit.
+    flip : (2,) array
+        1 or -1 for each displayed dimension, -1 when it points up or left.
+    """
+
+    shape: tuple[int, int]
+    center: np.ndarray
+    zoom: float
+    flip: np.ndarray
+
+    @property
+    def world_to_canvas(self) -> np.ndarray:
+        """(3, 3) affine matrix from displayed world to canvas coordinates."""
+        linear = self.zoom * self.flip
+        matrix = np.eye(3)
+        matrix[[0, 1], [0, 1]] = linear
+        matrix[:2, 2] = np.array(self.shape) / 2 - linear * self.center
+        return matrix
+
+    def canvas_corners(self) -> np.ndarray:
+        """(4, 2) array of the world coordinates of the canvas corners."""
+        h, w = self.shape
+        corners = np.array([[0, 0], [0, w], [h, 0], [h, w]], dtype=float)
+        return _apply(np.linalg.inv(self.world_to_canvas), corners)
+
+
+@dataclass(frozen=True)
+class _ImageItem:
+    """A sliced image to sample on the canvas.
+
+    If ``contrast_limits`` is None, ``values`` are indices into ``lut``.
+    Otherwise they are scaled by the contrast limits and gamma, then mapped
+    by ``lut``, or used directly as color channels if ``lut`` is None.
+    """
+
+    values: np.ndarray
+    canvas_to_data: np.ndarray
+    lut: np.ndarray | None
+    contrast_limits: tuple[float, float] | None
+    gamma: float
+    opacity: float
+    blending: str
+
+
+@dataclass(frozen=True)
+class _PointsItem:
+    """Discs with a border, in canvas coordinates."""
+
+    centers: np.ndarray
+    radii: np.ndarray
+    face_radii: np.ndarray
+    face_colors: np.ndarray
+    border_colors: np.ndarray
+    opacity: float
+    blending: str
+
+
+@dataclass(frozen=True)
+class _MeshItem:
+    """Colored triangles, in canvas coordinates."""
+
+    vertices: np.ndarray
+    triangles: np.ndarray
+    colors: np.ndarray
+    opacity: float
+    blending: str
+
+
+@dataclass(frozen=True)
+class _Scene:
+    """Everything needed to rasterize a view, without reference to layers."""
+
+    shape: tuple[int, int]
+    background: np.ndarray
+    items: tuple[_ImageItem | _PointsItem | _MeshItem, ...]
+
+
+def render_view(
+    viewer: ViewerModel,
+    *,
+    point: Sequence[float] | None = None,
+    roi: npt.ArrayLike | None = None,
+    size: tuple[int, int] | None = None,
+    scale: float | None = None,
+    background: Any = 'black',
+) -> np.ndarray:
+    """Render a 2D view of a viewer model to an RGBA array.
+
+    Parameters
+    ----------
+    viewer : ViewerModel
+        The viewer model to render. Its dims must display two dimensions.
+    point : sequence of float, optional
+        World coordinates at which to slice the layers. By default, the
+        current point of the viewer dims is used.
+    roi : (N, 2) array, optional
+        Corners of a region of interest, in world coordinates of the
+        displayed dimensions, to render instead of the camera view.
+    size : tuple of int, optional
+        Height and width of the output. By default, the size of the canvas,
+        or the size of the region of interest at the given scale.
+    scale : float, optional
+        Canvas pixels per world unit used to render a region of interest.
+        By default, the camera zoom.
+    background : color, optional
+        Color of the canvas behind the layers.
+
+    Returns
+    -------
+    image : (H, W, 4) array of uint8
+        The rendered view.
+    """
+    return render_views(
+        viewer,
+        points=None if point is None else [point],
+        rois=None if roi is None else [roi],
+        size=size,
+        scale=scale,
+        background=background,
+        processes=1,
+    )[0]
+
+
+def render_views(
+    viewer: ViewerModel,
+    *,
+    points: Sequence[Sequence[float]] | None = None,
+    rois: Sequence[npt.ArrayLike] | None = None,
+    size: tuple[int, int] | None = None,
+    scale: float | None = None,
+    background: Any = 'black',
+    processes: int | None = None,
+) -> list[np.ndarray]:
+    """Render many 2D views of a viewer model, e.g. time points or ROIs.
+
+    The layers are sliced in the calling process, and the views are
+    rasterized in a pool of worker processes. The slices are not added to
+    the slice cache of the layers, since each point is usually rendered
+    only once.
+
+    Parameters
+    ----------
+    viewer : ViewerModel
+        The viewer model to render. Its dims must display two dimensions.
+    points : sequence of sequence of float, optional
+        World coordinates at which to slice the layers. By default, the
+        current point of the viewer dims is used.
+    rois : sequence of (N, 2) arrays, optional
+        Corners of regions of interest, in world coordinates of the
+        displayed dimensions, to render instead of the camera view.
+    size, scale, background
+        See `render_view`.
+    processes : int, optional
+        Number of worker processes. By default, the number of CPUs. If 1,
+        the views are rasterized in the calling process.
+
+    Returns
+    -------
+    list of (H, W, 4) arrays of uint8
+        The rendered views, for each region of interest of each point.
+    """
+    if viewer.dims.ndisplay != 2:
+        raise ValueError(
+            trans._(
+                'Only 2D views can be rendered, but {ndisplay} dimensions are displayed.',
+                deferred=True,
+                ndisplay=viewer.dims.ndisplay,
+            )
+        )
+    scenes = _iter_scenes(viewer, points, rois, size, scale, background)
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes <= 1:
+        return [_rasterize(scene) for scene in scenes]
+
+    images = []
+    # Forking a process that runs a GUI or slicing threads is unsafe.
+    with ProcessPoolExecutor(
+        max_workers=processes, mp_context=get_context('spawn')
+    ) as executor:
+        # Only keep a few scenes in flight, as each holds the sliced data.
+        pending: deque[Future[np.ndarray]] = deque()
+        for scene in scenes:
+            pending.append(executor.submit(_rasterize, scene))
+            if len(pending) >= 2 * processes:
+                images.append(pending.popleft().result())
+        images.extend(future.result() for future in pending)
+    return images
+
+
+def _iter_scenes(
+    viewer: ViewerModel,
+    points: Sequence[Sequence[float]] | None,
+    rois: Sequence[npt.ArrayLike] | None,
+    size: tuple[int, int] | None,
+    scale: float | None,
+    background: Any,
+) -> Iterator[_Scene]:
+    """Slice the layers at each point and describe each view to rasterize."""
+    views = [
+        _make_view(viewer, roi, size, scale)
+        for roi in ([None] if rois is None else rois)
+    ]
+    background = transform_color(background)[0]
+    layers = [layer for layer in viewer.layers if layer.visible]
+    for layer in layers:
+        if not isinstance(layer, Image | Labels | Points | Shapes | Vectors):
+            warnings.warn(
+                trans._(
+                    '{layer_type} layers cannot be rendered and are skipped.',
+                    deferred=True,
+                    layer_type=type(layer).__name__,
+                ),
+                category=UserWarning,
+                stacklevel=3,
+            )
+    layers = [
+        layer
+        for layer in layers
+        if isinstance(layer, Image | Labels | Points | Shapes | Vectors)
+    ]
+    for point in [None] if points is None else points:
+        dims = Dims(**viewer.dims.dict())
+        if point is not None:
+            dims.point = point
+        requests = [layer._make_slice_request(dims) for layer in layers]
+        # Multiscale images are sliced for each view, at its resolution.
+        responses = [
+            None if _is_multiscale(layer) else request()
+            for layer, request in zip(layers, requests, strict=True)
+        ]
+        for view in views:
+            items = []
+            for layer, request, response in zip(
+                layers, requests, responses, strict=True
+            ):
+                if response is None:
+                    request = _multiscale_request(layer, request, view)
+                    response = request()
+                item = _make_item(layer, response, view)
+                if item is not None:
+                    items.append(item)
+            yield _Scene(view.shape, background, tuple(items))
+
+
+def _make_view(
+    viewer: ViewerModel,
+    roi: npt.ArrayLike | None,
+    size: tuple[int, int] | None,
+    scale: float | None,
+) -> _View:
+    """Describe the canvas of the camera view or a region of interest."""
+    flip = np.array(
+        [
+            -1 if viewer.camera.orientation2d[0] == 'up' else 1,
+            -1 if viewer.camera.orientation2d[1] == 'left' else 1,
+        ]
+    )
+    if roi is None:
+        shape = tuple(size) if size is not None else viewer._canvas_size
+        return _View(
+            shape=(int(shape[0]), int(shape[1])),
+            center=np.array(viewer.camera.center[-2:], dtype=float),
+            zoom=float(viewer.camera.zoom),
+            flip=flip,
+        )
+    roi = np.asarray(roi, dtype=float)[:, -2:]
+    low, high = np.min(roi, axis=0), np.max(roi, axis=0)
+    extent = np.maximum(high - low, np.finfo(float).eps)
+    if size is not None:
+        shape = (int(size[0]), int(size[1]))
+        zoom = float(np.min(np.array(shape) / extent))
+    else:
+        zoom = float(viewer.camera.zoom if scale is None else scale)
+        rows, cols = np.maximum(np.round(extent * zoom), 1).astype(int)
+        shape = (int(rows), int(cols))
+    return _View(shape=shape, center=(low + high) / 2, zoom=zoom, flip=flip)
+
+
+def _is_multiscale(layer: Layer) -> bool:
+    return isinstance(layer, Image | Labels) and layer.multiscale
+
+
+def _multiscale_request(
+    layer: Image | Labels, request: Any, view: _View
+) -> Any:
+    """Change a multiscale slice request to cover a view at its resolution.
+
+    This follows `Layer._update_draw`, using the canvas of the view rather
+    than the one of the viewer.
+    """
+    displayed = list(request.slice_input.displayed)
+    data_corners = (
+        layer._transforms[1:]
+        .simplified.set_slice(displayed)
+        .inverse(view.canvas_corners())
+    )
+    data_bbox = np.stack(
+        [
+            np.floor(np.min(data_corners, axis=0)),
+            np.ceil(np.max(data_corners, axis=0)),
+        ]
+    ).astype(int)
+    level, scaled_corners = compute_multiscale_level_and_corners(
+        data_bbox, view.shape, layer.downsample_factors[:, displayed]
+    )
+    corners = np.zeros((2, layer.ndim), dtype=int)
+    max_coords = np.take(layer.level_shapes[level], displayed) - 1
+    corners[:, displayed] = np.clip(scaled_corners, 0, max_coords)
+    return dataclasses.replace(
+        request, data_level=level, corner_pixels=corners, tile_cache=None
+    )
+
+
+def _data_to_canvas(layer: Layer, response: Any, view: _View) -> np.ndarray:
+    """(3, 3) affine matrix from the displayed data coordinates of a slice
+    response to canvas coordinates.
+    """
+    displayed = list(response.slice_input.displayed)
+    data_to_world = layer._transforms[1:].simplified
+    if isinstance(layer, Image | Labels):
+        data_to_world = data_to_world.compose(response.tile_to_data)
+    data_to_world = data_to_world.set_slice(displayed)
+    return view.world_to_canvas @ data_to_world.affine_matrix
+
+
+def _make_item(
+    layer: Layer, response: Any, view: _View
+) -> _ImageItem | _PointsItem | _MeshItem | None:
+    """Describe what a layer draws from one of its slice responses."""
+    data_to_canvas = _data_to_canvas(layer, response, view)
+    opacity = float(layer.opacity)
+    blending = str(layer.blending)
+    if isinstance(layer, Labels):
+        if response.empty:
+            return None
+        labels, indices = np.unique(response.image.raw, return_inverse=True)
+        colors = np.array(layer.colormap.map(labels), dtype=np.float32)
+        if layer.show_selected_label:
+            colors[labels != layer.selected_label] = 0
+        return _ImageItem(
+            values=indices.reshape(response.image.raw.shape),
+            canvas_to_data=np.linalg.inv(data_to_canvas),
+            lut=colors,
+            contrast_limits=None,
+            gamma=1.0,
+            opacity=opacity,
+            blending=blending,
+        )
+    if isinstance(layer, Image):
+        if response.empty:
+            return None
+        lut = None
+        if not layer.rgb:
+            lut = np.array(
+                layer.colormap.map(np.linspace(0, 1, _LUT_SIZE)),
+                dtype=np.float32,
+            )
+        return _ImageItem(
+            values=np.asarray(response.image.raw),
+            canvas_to_data=np.linalg.inv(data_to_canvas),
+            lut=lut,
+            contrast_limits=tuple(map(float, layer.contrast_limits)),
+            gamma=float(layer.gamma),
+            opacity=opacity,
+            blending=blending,
+        )
+
+    zoom = view.zoom * np.sqrt(abs(np.linalg.det(data_to_canvas[:2, :2])))
+    if isinstance(layer, Points):
+        indices = np.asarray(response.indices, dtype=int)
+        size_scale = response.scale
+        if len(indices) > 0:
+            shown = layer.shown[indices]
+            indices = indices[shown]
+            if isinstance(size_scale, np.ndarray):
+                size_scale = size_scale[shown]
+        if len(indices) == 0:
+            return None
+        displayed = list(response.slice_input.displayed)
+        centers = _apply(
+            data_to_canvas, layer.data[np.ix_(indices, displayed)]
+        )
+        # Sizes are in data units along the last dimension, see the vispy
+        # points layer.
+        sizes = layer.size[indices] * size_scale * layer.scale[-1]
+        border_widths = layer.border_width[indices]
+        if layer.border_width_is_relative:
+            border_widths = border_widths * sizes
+        else:
+            border_widths = border_widths * layer.scale[-1]
+        return _PointsItem(
+            centers=centers,
+            radii=(sizes + border_widths) * view.zoom / 2,
+            face_radii=(sizes - border_widths) * view.zoom / 2,
+            face_colors=layer.face_color[indices],
+            border_colors=layer.border_color[indices],
+            opacity=opacity,
+            blending=blending,
+        )
+    if isinstance(layer, Shapes):
+        mesh = layer._data_view._mesh
+        if response.data_view is not None:
+            mesh = response.data_view._mesh
+            triangles = mesh.displayed_triangles
+            colors = mesh.displayed_triangles_colors
+        elif response.version == layer._data_view.version:
+            triangles = response.view.displayed_triangles
+            colors = response.view.displayed_triangles_colors
+        else:
+            triangles = mesh.displayed_triangles
+            colors = mesh.displayed_triangles_colors
+        if len(triangles) == 0:
+            return None
+        return _MeshItem(
+            vertices=_apply(data_to_canvas, mesh.vertices),
+            triangles=np.asarray(triangles, dtype=np.intp),
+            colors=np.asarray(colors, dtype=np.float32),
+            opacity=opacity,
+            blending=blending,
+        )
+    # Vectors
+    indices = np.asarray(response.indices, dtype=int)
+    if len(indices) == 0:
+        return None
+    displayed = list(response.slice_input.displayed)
+    data = layer.data[np.ix_(indices, [0, 1], displayed)]
+    starts = _apply(data_to_canvas, data[:, 0])
+    ends = _apply(data_to_canvas, data[:, 0] + layer.length * data[:, 1])
+    colors = np.array(layer.edge_color[indices], dtype=np.float32)
+    colors[:, 3] *= response.alphas
+    # Lines are at least one canvas pixel wide so that they stay visible.
+    width = max(layer.edge_width * zoom / view.zoom, 1.0)
+    vertices, triangles = _line_mesh(starts, ends, width)
+    return _MeshItem(
+        vertices=vertices,
+        triangles=triangles,
+        colors=np.repeat(colors, 2, axis=0),
+        opacity=opacity,
+        blending=blending,
+    )
+
+
+def _apply(matrix: np.ndarray, coords: npt.ArrayLike) -> np.ndarray:
+    """Apply a (3, 3) affine matrix to (N, 2) coordinates."""
+    coords = np.asarray(coords, dtype=float)
+    return coords @ matrix[:2, :2].T + matrix[:2, 2]
+
+
+def _line_mesh(
+    starts: np.ndarray, ends: np.ndarray, width: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Triangulate lines of a given width as two triangles each."""
+    direction = ends - starts
+    length = np.linalg.norm(direction, axis=1, keepdims=True)
+    length[length == 0] = 1
+    normal = direction[:, ::-1] * [-1, 1] / length * width / 2
+    vertices = np.stack(
+        [starts - normal, starts + normal, ends + normal, ends - normal],
+        axis=1,
+    ).reshape(-1, 2)
+    quads = 4 * np.arange(len(starts))[:, np.newaxis]
+    triangles = np.stack(
+        [quads + [0, 1, 2], quads + [0, 2, 3]], axis=1
+    ).reshape(-1, 3)
+    return vertices, triangles
+
+
+def _rasterize(scene: _Scene) -> np.ndarray:
+    """Rasterize and composite the items of a scene into an RGBA image."""
+    canvas = np.empty((*scene.shape, 4), dtype=np.float32)
+    canvas[:] = scene.background
+    for item in scene.items:
+        colors = np.zeros_like(canvas)
+        drawn = np.zeros(scene.shape, dtype=bool)
+        if isinstance(item, _ImageItem):
+            _draw_image(colors, drawn, item)
+        elif isinstance(item, _PointsItem):
+            _draw_discs(colors, drawn, item)
+        else:
+            _draw_triangles(colors, drawn, item)
+        _composite(canvas, colors, drawn, item.opacity, item.blending)
+    return np.round(np.clip(canvas, 0, 1) * 255).astype(np.uint8)
+
+
+def _composite(
+    canvas: np.ndarray,
+    colors: np.ndarray,
+    drawn: np.ndarray,
+    opacity: float,
+    blending: str,
+) -> None:
+    """Blend the colors drawn by a layer into the canvas, like vispy does."""
+    dst = canvas[drawn]
+    src = colors[drawn]
+    alpha = src[:, 3:] * opacity
+    if blending == Blending.OPAQUE:
+        dst[:, :3] = src[:, :3]
+        dst[:, 3:] = 1
+    elif blending == Blending.ADDITIVE:
+        dst[:, :3] += src[:, :3] * alpha
+        dst[:, 3:] += alpha
+    elif blending == Blending.MINIMUM:
+        dst[:, :3] = np.minimum(dst[:, :3], src[:, :3])
+    else:
+        dst[:, :3] = src[:, :3] * alpha + dst[:, :3] * (1 - alpha)
+        dst[:, 3:] = alpha + dst[:, 3:] * (1 - alpha)
+    canvas[drawn] = np.clip(dst, 0, 1)
+
+
+def _draw_image(
+    colors: np.ndarray, drawn: np.ndarray, item: _ImageItem
+) -> None:
+    """Sample an image at the canvas pixel centers (nearest neighbor)."""
+    h, w = drawn.shape
+    rows = np.arange(h)[:, np.newaxis] + 0.5
+    cols = np.arange(w)[np.newaxis, :] + 0.5
+    m = item.canvas_to_data
+    # Data pixels are centered on integer coordinates.
+    data_rows = np.floor(m[0, 0] * rows + m[0, 1] * cols + m[0, 2] + 0.5)
+    data_cols = np.floor(m[1, 0] * rows + m[1, 1] * cols + m[1, 2] + 0.5)
+    inside = (
+        (data_rows >= 0)
+        & (data_rows < item.values.shape[0])
+        & (data_cols >= 0)
+        & (data_cols < item.values.shape[1])
+    )
+    values = item.values[
+        data_rows[inside].astype(np.intp), data_cols[inside].astype(np.intp)
+    ]
+    colors[inside] = _map_colors(item, values)
+    drawn[inside] = True
+
+
+def _map_colors(item: _ImageItem, values: np.ndarray) -> np.ndarray:
+    """Map sampled image values to RGBA colors."""
+    if item.contrast_limits is None:
+        return item.lut[values]
+    low, high = item.contrast_limits
+    values = np.asarray(values, dtype=np.float32)
+    missing = np.isnan(values)
+    values = (values - low) / (high - low) if high > low else values * 0
+    values = np.clip(np.nan_to_num(values), 0, 1) ** item.gamma
+    if item.lut is None:
+        rgba = np.ones((*values.shape[:-1], 4), dtype=np.float32)
+        rgba[:, : values.shape[-1]] = values[:, :4]
+        rgba[np.any(missing, axis=-1), 3] = 0
+        return rgba
+    rgba = item.lut[np.round(values * (len(item.lut) - 1)).astype(np.intp)]
+    rgba[missing, 3] = 0
+    return rgba
+
+
+def _iter_box_pixels(
+    low: np.ndarray, high: np.ndarray
+) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Iterate over the pixels of many boxes, in batches.
+
+    Parameters
+    ----------
+    low, high : (K, 2) arrays of int
+        First and last row and column of each box.
+
+    Yields
+    ------
+    owners, rows, cols : arrays of int
+        The box, row and column of each pixel, in order of the boxes.
+    """
+    sizes = np.maximum(high - low + 1, 0)
+    counts = sizes[:, 0] * sizes[:, 1]
+    ends = np.cumsum(counts)
+    start = 0
+    while start < len(counts):
+        offset = ends[start - 1] if start > 0 else 0
+        stop = np.searchsorted(ends, offset + _MAX_BATCH_PIXELS, side='right')
+        stop = max(int(stop), start + 1)
+        batch_counts = counts[start:stop]
+        owners = np.repeat(np.arange(start, stop), batch_counts)
+        firsts = np.repeat(
+            ends[start:stop] - batch_counts - offset, batch_counts
+        )
+        local = np.arange(len(owners)) - firsts
+        widths = sizes[owners, 1]
+        rows = low[owners, 0] + local // widths
+        cols = low[owners, 1] + local % widths
+        yield owners, rows, cols
+        start = stop
+
+
+def _pixel_boxes(
+    low: np.ndarray, high: np.ndarray, shape: tuple[int, int]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Pixels whose centers are within bounds in canvas coordinates."""
+    max_index = np.array(shape) - 1
+    return (
+        np.clip(np.ceil(low - 0.5), 0, max_index).astype(np.intp),
+        np.clip(np.floor(high - 0.5), -1, max_index).astype(np.intp),
+    )
+
+
+def _draw_discs(
+    colors: np.ndarray, drawn: np.ndarray, item: _PointsItem
+) -> None:
+    """Draw discs with their border, the later ones on top."""
+    radii = item.radii[:, np.newaxis]
+    low, high = _pixel_boxes(
+        item.centers - np.maximum(radii, 0.5),
+        item.centers + np.maximum(radii, 0.5),
+        drawn.shape,
+    )
+    # Tiny discs still cover the pixel containing their center.
+    center_pixels = np.floor(item.centers).astype(np.intp)
+    for owners, rows, cols in _iter_box_pixels(low, high):
+        d2 = (rows + 0.5 - item.centers[owners, 0]) ** 2 + (
+            cols + 0.5 - item.centers[owners, 1]
+        ) ** 2
+        inside = (d2 <= item.radii[owners] ** 2) | (
+            (rows == center_pixels[owners, 0])
+            & (cols == center_pixels[owners, 1])
+        )
+        face = d2 <= item.face_radii[owners] ** 2
+        rgba = np.where(
+            face[:, np.newaxis],
+            item.face_colors[owners],
+            item.border_colors[owners],
+        )
+        colors[rows[inside], cols[inside]] = rgba[inside]
+        drawn[rows[inside], cols[inside]] = True
+
+
+def _draw_triangles(
+    colors: np.ndarray, drawn: np.ndarray, item: _MeshItem
+) -> None:
+    """Draw triangles whose interiors contain pixel centers, in order."""
+    corners = item.vertices[item.triangles]
+    a, b, c = corners[:, 0], corners[:, 1], corners[:, 2]
+    area = _cross(b - a, c - a)
+    keep = np.flatnonzero(area != 0)
+    low, high = _pixel_boxes(
+        np.min(corners[keep], axis=1),
+        np.max(corners[keep], axis=1),
+        drawn.shape,
+    )
+    for owners, rows, cols in _iter_box_pixels(low, high):
+        tri = keep[owners]
+        points = np.stack([rows + 0.5, cols + 0.5], axis=1)
+        # Edge functions have the sign of the area for interior points.
+        sign = np.sign(area[tri])
+        inside = np.ones(len(tri), dtype=bool)
+        for p, q in itertools.pairwise((a, b, c, a)):
+            inside &= sign * _cross(q[tri] - p[tri], points - p[tri]) >= 0
+        colors[rows[inside], cols[inside]] = item.colors[tri[inside]]
+        drawn[rows[inside], cols[inside]] = True
+
+
+def _cross(u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """2D cross product of (N, 2) arrays."""
+    return u[:, 0] * v[:, 1] - u[:, 1] * v[:, 0]
@@ -472,8 +472,12 @@ class ViewerModel(KeymapProvider, MousemapProvider, EventedModel):
         # We define `add_labels` dynamically, so mypy doesn't know about it.
 
     def _on_layer_reload(self, event: Event) -> None:
+        # reloads after a pan or zoom keep the cached slices of the layer
         self._layer_slicer.submit(
-            layers=[event.layer], dims=self.dims, force=True
+            layers=[event.layer],
+            dims=self.dims,
+            force=True,
+            invalidate=not getattr(event, 'view_only', False),
         )
 
     def _update_layers(self, *, layers=None):
@@ -12,6 +12,7 @@ from numpy import typing as npt
 from napari.layers import Layer
 from napari.layers._data_protocols import LayerDataProtocol
 from napari.layers._multiscale_data import MultiScaleData
+from napari.layers.base._slice_cache import call_cached
 from napari.layers.image._image_constants import Interpolation, VolumeDepiction
 from napari.layers.image._image_mouse_bindings import (
     move_plane_along_normal as plane_drag_callback,
@@ -19,8 +20,10 @@ from napari.layers.image._image_mouse_bindings import (
 )
 from napari.layers.image._image_utils import guess_multiscale
 from napari.layers.image._slice import _ImageSliceRequest, _ImageSliceResponse
+from napari.layers.image._tiles import _TileCache
 from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
 from napari.layers.utils.plane import SlicingPlane
+from napari.settings import get_settings
 from napari.utils._dask_utils import DaskIndexer
 from napari.utils.colormaps import AVAILABLE_COLORMAPS
 from napari.utils.events import Event
@@ -291,6 +294,9 @@ class ScalarFieldBase(Layer, ABC):
             rgb=len(self.data.shape) != self.ndim,
             dtype=self.dtype,
         )
+        # Tiles of multiscale levels that were already read, used when
+        # tiled multiscale rendering is enabled in the settings.
+        self._tile_cache = _TileCache()
 
         self._plane = SlicingPlane(thickness=1)
         # Whether to calculate clims on the next set_view_slice
@@ -488,7 +494,7 @@ class ScalarFieldBase(Layer, ABC):
             data_slice=self._data_slice,
             dask_indexer=nullcontext,
         )
-        response = request()
+        response = call_cached(self, request)
         self._update_slice_response(response)
 
     def _make_slice_request(self, dims: Dims) -> _ImageSliceRequest:
@@ -533,6 +539,13 @@ class ScalarFieldBase(Layer, ABC):
             thumbnail_level=self._thumbnail_level,
             level_shapes=self.level_shapes,
             downsample_factors=self.downsample_factors,
+            tile_cache=(
+                self._tile_cache
+                if get_settings().experimental.tiled_multiscale
+                else None
+            ),
+            data_version=self._data_version,
+            thumbnail_shape=self._thumbnail_shape[:2],
         )
 
     def _update_slice_response(self, response: _ImageSliceResponse) -> None:
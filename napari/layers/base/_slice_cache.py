@@ -0,0 +1,146 @@
+"""A napari-wide cache of layer slice responses.
+
+Slicing a layer at a dims position it was already sliced at can reuse the
+previous response instead of reading the data again, which makes toggling
+between timepoints or planes instant even for lazy arrays (zarr,
+tensorstore, xarray, dask...).
+
+Responses are keyed by layer, by the layer's ``_data_version`` and by the
+``cache_key`` of the slice request. Slice requests that support caching
+define that property such that two requests from the same layer with
+equal keys make the same response, apart from its slice input and request
+id. The data version of a layer is incremented whenever the layer is
+refreshed or its data is edited in place, which invalidates all of its
+cached responses, including after changes to its data or transforms.
+
+The total size of the cached responses is bounded by the
+``slice_cache_size`` experimental setting, with the least recently used
+responses being evicted first. The cache is disabled by default, since
+cached slices are not updated when lazy data is written to in place.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import weakref
+from collections.abc import Hashable
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from napari.settings import get_settings
+from napari.utils._lru_cache import SizedLRUCache
+
+if TYPE_CHECKING:
+    from napari.layers.base.base import Layer
+
+_SLICE_CACHE: SizedLRUCache[Hashable, Any] | None = None
+
+# Layers whose responses are removed from the cache when they are deleted.
+_FINALIZED_LAYERS: weakref.WeakSet[Layer] = weakref.WeakSet()
+
+
+def _response_nbytes(response: Any) -> int:
+    """Estimates the memory used by a slice response from its arrays.
+
+    This sums the sizes of the numpy arrays held by the response, including
+    those held in nested dataclasses, counting shared arrays only once.
+    """
+    seen: set[int] = set()
+
+    def nbytes(value: Any) -> int:
+        if id(value) in seen:
+            return 0
+        seen.add(id(value))
+        if isinstance(value, np.ndarray):
+            return value.nbytes
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            return sum(
+                nbytes(getattr(value, f.name))
+                for f in dataclasses.fields(value)
+            )
+        return 0
+
+    return nbytes(response)
+
+
+def get_slice_cache() -> SizedLRUCache[Hashable, Any]:
+    """Get the slice cache, resized to the current settings."""
+    global _SLICE_CACHE
+    max_bytes = get_settings().experimental.slice_cache_size * 1024**2
+    if _SLICE_CACHE is None:
+        _SLICE_CACHE = SizedLRUCache(max_bytes, nbytes=_response_nbytes)
+    elif _SLICE_CACHE.max_bytes != max_bytes:
+        _SLICE_CACHE.max_bytes = max_bytes
+    return _SLICE_CACHE
+
+
+def slice_cache_key(layer: Layer, request: Any) -> Hashable | None:
+    """Get the cache key of a slice request of a layer.
+
+    This should be called on the main thread, when the request is made.
+
+    Returns
+    -------
+    hashable or None
+        The key, or None if the request does not support caching or if
+        caching is disabled for the layer (e.g. ``Image(..., cache=False)``).
+    """
+    if not getattr(layer, 'cache', True):
+        return None
+    request_key = getattr(request, 'cache_key', None)
+    if request_key is None:
+        return None
+    return (weakref.ref(layer), layer._data_version, request_key)
+
+
+def get_cached_response(key: Hashable | None, request: Any) -> Any:
+    """Get the cached response for a slice request with the given key.
+
+    Returns
+    -------
+    response or None
+        The cached response, updated with the slice input and id of the
+        given request, or None if there is no such response.
+    """
+    if key is None:
+        return None
+    response = get_slice_cache().get(key)
+    if response is None:
+        return None
+    return dataclasses.replace(
+        response, slice_input=request.slice_input, request_id=request.id
+    )
+
+
+def cache_response(key: Hashable | None, layer: Layer, response: Any) -> None:
+    """Add the response of a slice request with the given key to the cache."""
+    if key is None:
+        return
+    if layer not in _FINALIZED_LAYERS:
+        _FINALIZED_LAYERS.add(layer)
+        weakref.finalize(layer, _remove_layer, key[0])
+    get_slice_cache().put(key, response)
+
+
+def call_cached(layer: Layer, request: Any) -> Any:
+    """Call a slice request of a layer, or get its response from the cache."""
+    key = slice_cache_key(layer, request)
+    if (response := get_cached_response(key, request)) is not None:
+        return response
+    response = request()
+    cache_response(key, layer, response)
+    return response
+
+
+def invalidate_layer(layer: Layer) -> None:
+    """Remove all the cached responses of a layer."""
+    _remove_layer(weakref.ref(layer))
+
+
+def _remove_layer(weak_layer: weakref.ReferenceType[Layer]) -> None:
+    if _SLICE_CACHE is None:
+        return
+    for key in _SLICE_CACHE:
+        if key[0] == weak_layer:
+            _SLICE_CACHE.pop(key)
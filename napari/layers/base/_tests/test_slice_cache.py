@@ -0,0 +1,170 @@
+import gc
+
+import numpy as np
+import pytest
+import zarr
+
+from napari._tests.utils import LockableData
+from napari.components import Dims
+from napari.layers import Image, Labels, Points
+from napari.layers.base._slice_cache import (
+    _response_nbytes,
+    get_slice_cache,
+    invalidate_layer,
+)
+from napari.layers.image._slice import _ImageSliceResponse, _ImageView
+from napari.settings import get_settings
+from napari.settings._experimental import ExperimentalSettings
+from napari.utils.transforms import Affine
+
+
+class CountingData(LockableData):
+    """Layer data that counts how many times it is read."""
+
+    def __init__(self, data) -> None:
+        super().__init__(data)
+        self.reads = 0
+
+    def __getitem__(self, key):
+        self.reads += 1
+        return super().__getitem__(key)
+
+
+@pytest.fixture(autouse=True)
+def _enable_slice_cache():
+    get_settings().experimental.slice_cache_size = 512
+
+
+def _layer_keys(layer):
+    return [key for key in get_slice_cache() if key[0]() is layer]
+
+
+def test_sync_slicing_reuses_cached_slice():
+    data = CountingData(np.random.random((3, 8, 8)))
+    layer = Image(data, contrast_limits=(0, 1))
+    layer._slice_dims(Dims(ndim=3, point=(1, 0, 0)))
+    layer._slice_dims(Dims(ndim=3, point=(2, 0, 0)))
+    reads = data.reads
+
+    layer._slice_dims(Dims(ndim=3, point=(1, 0, 0)))
+
+    assert data.reads == reads
+    np.testing.assert_array_equal(layer._slice.image.raw, data.data[1])
+
+
+def test_refresh_invalidates_cached_slices():
+    data = CountingData(np.zeros((3, 8, 8)))
+    layer = Image(data, contrast_limits=(0, 1))
+    layer._slice_dims(Dims(ndim=3, point=(1, 0, 0)))
+    layer._slice_dims(Dims(ndim=3, point=(2, 0, 0)))
+    data.data[1] = 1
+    layer.refresh()
+    reads = data.reads
+
+    layer._slice_dims(Dims(ndim=3, point=(1, 0, 0)))
+
+    assert data.reads > reads
+    np.testing.assert_array_equal(layer._slice.image.raw, 1)
+
+
+def test_labels_data_setitem_invalidates_cached_slices():
+    data = zarr.zeros((3, 8, 8), dtype=np.uint8)
+    layer = Labels(data)
+    layer._slice_dims(Dims(ndim=3, point=(1, 0, 0)))
+    layer._slice_dims(Dims(ndim=3, point=(2, 0, 0)))
+
+    layer.data_setitem((np.array([1]), np.array([2]), np.array([3])), 5)
+    layer._slice_dims(Dims(ndim=3, point=(1, 0, 0)))
+
+    assert layer._slice.image.raw[2, 3] == 5
+
+
+def test_points_slices_are_cached():
+    data = np.array([[0, 1, 1], [1, 2, 2], [1, 3, 3]])
+    layer = Points(data)
+    layer._slice_dims(Dims(ndim=3, point=(1, 0, 0)))
+    layer._slice_dims(Dims(ndim=3, point=(0, 0, 0)))
+    assert len(_layer_keys(layer)) >= 2
+
+    layer._slice_dims(Dims(ndim=3, point=(1, 0, 0)))
+    np.testing.assert_array_equal(layer._indices_view, [1, 2])
+
+    layer.data = data[::-1]
+    np.testing.assert_array_equal(layer._indices_view, [0, 1])
+
+
+def test_cached_slices_are_removed_with_layer():
+    layer = Image(np.zeros((3, 8, 8)))
+    layer._slice_dims(Dims(ndim=3, point=(1, 0, 0)))
+    assert _layer_keys(layer)
+    n_items = len(get_slice_cache())
+
+    del layer
+    gc.collect()
+
+    assert len(get_slice_cache()) < n_items
+
+
+def test_invalidate_layer():
+    layer = Image(np.zeros((3, 8, 8)))
+    layer._slice_dims(Dims(ndim=3, point=(1, 0, 0)))
+    assert _layer_keys(layer)
+
+    invalidate_layer(layer)
+
+    assert not _layer_keys(layer)
+
+
+def test_slice_cache_size_setting():
+    get_settings().experimental.slice_cache_size = 0
+    data = CountingData(np.zeros((3, 8, 8)))
+    layer = Image(data, contrast_limits=(0, 1))
+    layer._slice_dims(Dims(ndim=3, point=(1, 0, 0)))
+    layer._slice_dims(Dims(ndim=3, point=(2, 0, 0)))
+    reads = data.reads
+
+    layer._slice_dims(Dims(ndim=3, point=(1, 0, 0)))
+
+    assert data.reads > reads
+    assert get_slice_cache().max_bytes == 0
+
+
+def test_new_data_invalidates_cached_slices():
+    layer = Image(np.zeros((3, 8, 8)), contrast_limits=(0, 1))
+    layer._slice_dims(Dims(ndim=3, point=(1, 0, 0)))
+    layer._slice_dims(Dims(ndim=3, point=(2, 0, 0)))
+
+    layer.data = np.ones((3, 8, 8))
+    layer._slice_dims(Dims(ndim=3, point=(1, 0, 0)))
+
+    np.testing.assert_array_equal(layer._slice.image.raw, 1)
+
+
+def test_response_nbytes_counts_shared_arrays_once():
+    data = np.zeros((10, 10), dtype=np.uint8)
+    image = _ImageView.from_view(data)
+    response = _ImageSliceResponse(
+        image=image,
+        thumbnail=image,
+        tile_to_data=Affine(ndim=2),
+        slice_input=None,
+        request_id=0,
+    )
+    assert _response_nbytes(response) == data.nbytes
+
+
+def test_layer_cache_disabled():
+    data = CountingData(np.zeros((3, 8, 8)))
+    layer = Image(data, contrast_limits=(0, 1), cache=False)
+    layer._slice_dims(Dims(ndim=3, point=(1, 0, 0)))
+    layer._slice_dims(Dims(ndim=3, point=(2, 0, 0)))
+    reads = data.reads
+
+    layer._slice_dims(Dims(ndim=3, point=(1, 0, 0)))
+
+    assert data.reads > reads
+    assert not _layer_keys(layer)
+
+
+def test_slice_cache_disabled_by_default():
+    assert ExperimentalSettings().slice_cache_size == 0
@@ -363,6 +363,7 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
         self._highlight_visible = True
         self._unique_id = None
         self._source = current_source()
+        self.cache = cache
         self.dask_optimized_slicing = configure_dask(data, cache)
         self._metadata = dict(metadata or {})
         self._opacity = opacity
@@ -392,6 +393,9 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
         )
         self._loaded: bool = True
         self._last_slice_id: int = -1
+        # Incremented whenever the displayed data may have changed, which
+        # invalidates the cached slice responses of this layer.
+        self._data_version: int = 0
 
         # Create a transform chain consisting of four transforms:
         # 1. `tile2data`: An initial transform only needed to display tiles
@@ -1552,6 +1556,8 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
         force: bool = False,
     ) -> None:
         """Refresh all layer data based on current view slice."""
+        if data_displayed:
+            self._data_version += 1
         if self._refresh_blocked:
             logger.debug('Layer.refresh blocked: %s', self)
             return
@@ -1569,6 +1575,22 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
                 force=force,
             )
 
+    def _refresh_view(self) -> None:
+        """Refresh the displayed slice after a change of the view only.
+
+        Unlike ``refresh``, this keeps the data version of the layer, so that
+        the slices and tiles cached for it stay valid after panning or
+        zooming.
+        """
+        if self._refresh_blocked:
+            logger.debug('Layer._refresh_view blocked: %s', self)
+            return
+        logger.debug('Layer._refresh_view: %s', self)
+        if get_settings().experimental.async_:
+            self.events.reload(layer=self, view_only=True)
+        else:
+            self._refresh_sync(data_displayed=True, highlight=True)
+
     def _refresh_sync(
         self,
         *,
@@ -2099,7 +2121,7 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
             ):
                 self._data_level = level
                 self.corner_pixels = corners
-                self.refresh(extent=False, thumbnail=False)
+                self._refresh_view()
         else:
             # set the data_level so that it is the lowest resolution in 3d view
             if self.multiscale is True:
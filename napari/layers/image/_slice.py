@@ -1,4 +1,4 @@
-from collections.abc import Callable
+from collections.abc import Callable, Hashable, Sequence
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -7,6 +7,12 @@ import numpy as np
 from napari.layers.base._slice import _next_request_id
 from napari.layers.image._image_constants import ImageProjectionMode
 from napari.layers.image._image_utils import project_slice
+from napari.layers.image._tiles import (
+    _TileCache,
+    align_to_tiles,
+    get_tile_shape,
+    read_tiled,
+)
 from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
 from napari.types import ArrayLike
 from napari.utils._dask_utils import DaskIndexer
@@ -68,8 +74,10 @@ class _ImageSliceResponse:
     image : _ImageView
         The sliced image data.
     thumbnail: _ImageView
-        The thumbnail image data. This may come from a different resolution to the sliced image
-        data for multi-scale images. Otherwise, it's the same instance as data.
+        The thumbnail image data, downsampled to at most the thumbnail shape
+        and projected to 2D when the slice is 3D. This comes from a coarser
+        resolution than the sliced image data for multi-scale images.
+        Otherwise, it's a strided view of the 2D sliced image data.
     tile_to_data: Affine
         The affine transform from the sliced data to the full data at the highest resolution.
         For single-scale images, this will be the identity matrix.
@@ -122,6 +130,10 @@ class _ImageSliceResponse:
             shape = shape + (3,)
         data = np.zeros(shape, dtype=normalize_dtype(dtype))
         image = _ImageView.from_view(data)
+        # thumbnails are always 2D, with 3D slices projected along depth
+        thumbnail = image if slice_input.ndisplay == 2 else image.raw[0]
+        if thumbnail is not image:
+            thumbnail = _ImageView.from_view(thumbnail)
         ndim = slice_input.ndim
         tile_to_data = Affine(
             name='tile2data', linear_matrix=np.eye(ndim), ndim=ndim
@@ -130,7 +142,7 @@ class _ImageSliceResponse:
             request_id = _next_request_id()
         return _ImageSliceResponse(
             image=image,
-            thumbnail=image,
+            thumbnail=thumbnail,
             tile_to_data=tile_to_data,
             slice_input=slice_input,
             request_id=request_id,
@@ -191,6 +203,16 @@ class _ImageSliceRequest:
         The slicing coordinates and margins in data space.
     others
         See the corresponding attributes in `Layer` and `Image`.
+    tile_cache : _TileCache or None
+        If not None, 2D multiscale slicing is tiled: the field of view is
+        expanded to the chunk grid of the level and assembled from tiles,
+        only reading those that are not already in this cache.
+    data_version : int
+        The data version of the layer when the request was made. Tiles are
+        only reused by requests made at the same version, so that they are
+        read again after the layer is refreshed.
+    thumbnail_shape : tuple of int
+        The largest shape of the thumbnail, in rows and columns.
     id : int
         The identifier of this slice request.
     """
@@ -207,6 +229,9 @@ class _ImageSliceRequest:
     thumbnail_level: int = field(repr=False)
     level_shapes: np.ndarray = field(repr=False)
     downsample_factors: np.ndarray = field(repr=False)
+    tile_cache: _TileCache | None = field(default=None, repr=False)
+    data_version: int = field(default=0, repr=False)
+    thumbnail_shape: tuple[int, int] = field(default=(32, 32), repr=False)
     id: int = field(default_factory=_next_request_id)
 
     def __call__(self) -> _ImageSliceResponse:
@@ -224,6 +249,34 @@ class _ImageSliceRequest:
                 else self._call_single_scale()
             )
 
+    @property
+    def cache_key(self) -> Hashable:
+        """Hashable description of the response made by this request.
+
+        Two requests from the same layer with equal keys make the same
+        response, apart from its slice input and request id, as long as
+        the layer's data version did not change in between (see
+        ``napari.layers.base._slice_cache``).
+        """
+        level = 0
+        corners = None
+        if self.multiscale:
+            if self.slice_input.ndisplay == 3:
+                level = len(self.data) - 1
+            else:
+                level = self.data_level
+                corners = tuple(map(tuple, self.corner_pixels.tolist()))
+        return (
+            self.slice_input.ndisplay,
+            self.slice_input.order,
+            self.rgb,
+            level,
+            corners,
+            self.thumbnail_level,
+            self.tile_cache is not None,
+            self._not_displayed_key(self.data_slice),
+        )
+
     def _call_single_scale(self) -> _ImageSliceResponse:
         order = self._get_order()
         data = self._project_thick_slice(self.data, self.data_slice)
@@ -237,7 +290,7 @@ class _ImageSliceRequest:
         )
         return _ImageSliceResponse(
             image=image,
-            thumbnail=image,
+            thumbnail=_ImageView.from_view(self._downsample_thumbnail(data)),
             tile_to_data=tile_to_data,
             slice_input=self.slice_input,
             request_id=self.id,
@@ -255,17 +308,48 @@ class _ImageSliceRequest:
             scale[d] = self.downsample_factors[level][d]
 
         data = self.data[level]
+        data_slice = self._thick_slice_at_level(level)
 
         translate = np.zeros(self.slice_input.ndim)
-        disp_slice = [slice(None) for _ in data.shape]
-        if self.slice_input.ndisplay == 2:
-            for d in self.slice_input.displayed:
-                disp_slice[d] = slice(
-                    self.corner_pixels[0, d],
-                    self.corner_pixels[1, d] + 1,
-                    1,
-                )
-            translate = self.corner_pixels[0] * scale
+        if self.slice_input.ndisplay == 2 and self.tile_cache is not None:
+            level_data = data
+            displayed = sorted(self.slice_input.displayed)
+            tile_shape = get_tile_shape(level_data, displayed)
+            corners = align_to_tiles(
+                self.corner_pixels, level_data.shape, displayed, tile_shape
+            )
+            translate = corners[0] * scale
+            data = read_tiled(
+                corners=corners,
+                axes=displayed,
+                tile_shape=tile_shape,
+                read_tile=lambda tile_slices: self._project_thick_slice(
+                    level_data[self._displayed_slices(tile_slices)],
+                    data_slice,
+                ),
+                cache=self.tile_cache,
+                key=(
+                    self.data_version,
+                    level,
+                    self._not_displayed_key(data_slice),
+                ),
+            )
+        else:
+            disp_slice = [slice(None) for _ in data.shape]
+            if self.slice_input.ndisplay == 2:
+                for d in self.slice_input.displayed:
+                    disp_slice[d] = slice(
+                        self.corner_pixels[0, d],
+                        self.corner_pixels[1, d] + 1,
+                        1,
+                    )
+                translate = self.corner_pixels[0] * scale
+
+            # slice displayed dimensions to get the right tile data
+            data = data[tuple(disp_slice)]
+
+            # project the thick slice
+            data = self._project_thick_slice(data, data_slice)
 
         # This only needs to be a ScaleTranslate but different types
         # of transforms in a chain don't play nicely together right now.
@@ -276,23 +360,29 @@ class _ImageSliceRequest:
             ndim=self.slice_input.ndim,
         )
 
-        # slice displayed dimensions to get the right tile data
-        data = data[tuple(disp_slice)]
-
-        # project the thick slice
-        data_slice = self._thick_slice_at_level(level)
-        data = self._project_thick_slice(data, data_slice)
-
         order = self._get_order()
         data = np.transpose(data, order)
         image = _ImageView.from_view(data)
 
+        # Only read the pixels of the thumbnail level that end up in the
+        # thumbnail, rather than reading all of it and downsampling after.
+        thumbnail_level_data = self.data[self.thumbnail_level]
         thumbnail_data_slice = self._thick_slice_at_level(self.thumbnail_level)
+        thumbnail_step = self._thumbnail_step(
+            [
+                thumbnail_level_data.shape[d]
+                for d in self.slice_input.displayed[-2:]
+            ]
+        )
         thumbnail_data = self._project_thick_slice(
-            self.data[self.thumbnail_level], thumbnail_data_slice
+            thumbnail_level_data,
+            thumbnail_data_slice,
+            step=thumbnail_step,
         )
         thumbnail_data = np.transpose(thumbnail_data, order)
-        thumbnail = _ImageView.from_view(thumbnail_data)
+        thumbnail = _ImageView.from_view(
+            self._downsample_thumbnail(thumbnail_data)
+        )
 
         return _ImageSliceResponse(
             image=image,
@@ -302,6 +392,35 @@ class _ImageSliceRequest:
             request_id=self.id,
         )
 
+    def _displayed_slices(
+        self, tile_slices: tuple[slice, ...]
+    ) -> tuple[slice, ...]:
+        """Expand slices along the sorted displayed dimensions to all dimensions."""
+        slices = [slice(None)] * self.slice_input.ndim
+        for d, s in zip(
+            sorted(self.slice_input.displayed), tile_slices, strict=True
+        ):
+            slices[d] = s
+        return tuple(slices)
+
+    def _not_displayed_key(self, data_slice: _ThickNDSlice) -> tuple:
+        """Hashable description of how the non-displayed dimensions are sliced.
+
+        Points and margins may contain NaN, which never compares equal, so the
+        integer indices or bounds actually used for slicing are used instead.
+        """
+        not_displayed = self.slice_input.not_displayed
+        if self.projection_mode == 'none':
+            indices = self._point_to_slices(data_slice.point)
+            return tuple(indices[d] for d in not_displayed)
+        slices = self._data_slice_to_slices(
+            data_slice, self.slice_input.displayed
+        )
+        return (
+            self.projection_mode,
+            *((slices[d].start, slices[d].stop) for d in not_displayed),
+        )
+
     def _thick_slice_at_level(self, level: int) -> _ThickNDSlice:
         """
         Get the data_slice rescaled for a specific level.
@@ -313,23 +432,25 @@ class _ImageSliceRequest:
         return _ThickNDSlice.from_array(slice_arr)
 
     def _project_thick_slice(
-        self, data: ArrayLike, data_slice: _ThickNDSlice
+        self, data: ArrayLike, data_slice: _ThickNDSlice, step: int = 1
     ) -> np.ndarray:
         """
         Slice the given data with the given data slice and project the extra dims.
 
         This is also responsible for materializing the data if it is backed
-        by a lazy store or compute graph (e.g. dask).
+        by a lazy store or compute graph (e.g. dask). If given, only every
+        `step`-th pixel is read along the last two displayed dimensions.
         """
 
         if self.projection_mode == 'none':
             # early return with only the dims point being used
             slices = self._point_to_slices(data_slice.point)
-            return np.asarray(data[slices])
+            return np.asarray(data[self._with_step(slices, step)])
 
         slices = self._data_slice_to_slices(
             data_slice, self.slice_input.displayed
         )
+        slices = self._with_step(slices, step)
 
         return project_slice(
             data=np.asarray(data[slices]),
@@ -337,6 +458,47 @@ class _ImageSliceRequest:
             mode=self.projection_mode,
         )
 
+    def _with_step(
+        self, slices: tuple[slice | int, ...], step: int
+    ) -> tuple[slice | int, ...]:
+        """Stride the slices of the last two displayed dimensions."""
+        if step == 1:
+            return slices
+        strided = list(slices)
+        for d in self.slice_input.displayed[-2:]:
+            strided[d] = slice(None, None, step)
+        return tuple(strided)
+
+    def _thumbnail_step(self, shape: Sequence[int]) -> int:
+        """Get the stride that downsamples a 2D shape to the thumbnail shape.
+
+        The same stride is used along both dimensions to keep the aspect
+        ratio of the image.
+        """
+        return max(
+            1,
+            *(
+                -(-size // max_size)
+                for size, max_size in zip(
+                    shape, self.thumbnail_shape, strict=True
+                )
+            ),
+        )
+
+    def _downsample_thumbnail(self, data: np.ndarray) -> np.ndarray:
+        """Downsample sliced data, with its displayed dimensions in order, for
+        the thumbnail.
+
+        The result is a 2D (or 2D RGB) view of the data, strided to at most
+        the thumbnail shape, so that in place edits of 2D sliced data also
+        show in the thumbnail. 3D data are projected along their depth.
+        """
+        if self.slice_input.ndisplay == 3 and self.slice_input.ndim > 2:
+            step = self._thumbnail_step(data.shape[1:3])
+            return np.max(data[:, ::step, ::step], axis=0)
+        step = self._thumbnail_step(data.shape[:2])
+        return data[::step, ::step]
+
     def _get_order(self) -> tuple[int, ...]:
         """Return the ordered displayed dimensions, but reduced to fit in the slice space."""
         order = reorder_after_dim_reduction(self.slice_input.displayed)
@@ -9,6 +9,7 @@ from napari.components.dims import Dims
 from napari.layers import Image
 from napari.layers.image._image_constants import ImageRendering
 from napari.layers.utils.plane import ClippingPlaneList, SlicingPlane
+from napari.settings import get_settings
 from napari.utils import Colormap
 from napari.utils._test_utils import (
     validate_all_params_in_docstring,
@@ -652,6 +653,91 @@ def test_narrow_thumbnail():
     assert np.mean(thumbnail[middle_row - 1 : middle_row + 1]) > 0
 
 
+@pytest.mark.parametrize('dtype', [np.uint8, np.int16, np.float32])
+def test_map_intensities_lut(dtype):
+    """Test that intensities are mapped with a cached lookup table."""
+    # tables are only built to map at least as many values as they have
+    data = np.tile(np.array([[0, 50], [100, 120]], dtype=dtype), (128, 256))
+    layer = Image(data, contrast_limits=(0, 100), colormap='gray')
+    npt.assert_array_equal(
+        layer._map_intensities(data)[:2, :2, 0], [[0, 128], [255, 255]]
+    )
+    lut = layer._lut_cache[np.dtype(dtype)]
+    layer._map_intensities(data)
+    assert layer._lut_cache[np.dtype(dtype)] is lut
+
+    layer.gamma = 2
+    npt.assert_array_equal(layer._map_intensities(data)[0, 1, 0], 64)
+    layer.contrast_limits = (50, 100)
+    npt.assert_array_equal(layer._map_intensities(data)[0, 1, 0], 0)
+    layer.colormap = 'red'
+    npt.assert_array_equal(
+        layer._map_intensities(data)[1, 1], [255, 0, 0, 255]
+    )
+
+
+@pytest.mark.parametrize('dtype', [np.uint16, np.float32])
+def test_map_few_intensities_without_lut(dtype):
+    """Test that mapping fewer values than a table has does not build it."""
+    data = np.array([[0, 50], [100, 120]], dtype=dtype)
+    layer = Image(data, contrast_limits=(0, 100), colormap='gray')
+    npt.assert_array_equal(
+        layer._map_intensities(data)[..., 0], [[0, 128], [255, 255]]
+    )
+    assert not layer._lut_cache
+
+    layer._map_intensities(np.tile(data, (256, 256)))
+    assert np.dtype(dtype) in layer._lut_cache
+
+
+def test_colormap_edited_in_place_clears_lut():
+    data = np.tile(np.array([[0, 100]], dtype=np.uint8), (1, 256))
+    layer = Image(data, contrast_limits=(0, 100), colormap='gray')
+    layer._map_intensities(data)
+    assert layer._lut_cache
+
+    layer.colormap.colors = [[0, 0, 0, 1], [1, 0, 0, 1]]
+
+    assert not layer._lut_cache
+    npt.assert_array_equal(
+        layer._map_intensities(data)[0, 1], [255, 0, 0, 255]
+    )
+
+
+def test_thumbnail_downsampled_when_slicing():
+    """Test that slicing keeps a strided view of the data for the thumbnail."""
+    data = np.random.random((1000, 500))
+    layer = Image(data)
+    thumbnail = layer._slice.thumbnail.raw
+    npt.assert_array_equal(thumbnail, data[::32, ::32])
+    assert np.shares_memory(thumbnail, layer._slice.image.raw)
+    layer._update_thumbnail()
+    assert layer.thumbnail.shape == layer._thumbnail_shape
+
+
+def test_thumbnail_projected_when_slicing_3d():
+    """Test that 3D slices are projected to 2D for the thumbnail."""
+    data = np.random.random((10, 64, 64))
+    layer = Image(data)
+    layer._slice_dims(Dims(ndim=3, ndisplay=3))
+    npt.assert_array_equal(
+        layer._slice.thumbnail.raw, data[:, ::2, ::2].max(axis=0)
+    )
+
+
+def test_multiscale_thumbnail_read_strided():
+    """Test that only the thumbnail pixels of the thumbnail level are read."""
+    shapes = [(4, 1024, 1024), (4, 512, 512), (4, 256, 256)]
+    data = [np.random.random(shape) for shape in shapes]
+    layer = Image(data, multiscale=True)
+    layer._slice_dims(Dims(ndim=3, point=(2, 0, 0)))
+    level = layer._thumbnail_level
+    step = shapes[level][-1] // 32
+    npt.assert_array_equal(
+        layer._slice.thumbnail.raw, data[level][2, ::step, ::step]
+    )
+
+
 @pytest.mark.parametrize('dtype', [np.float32, np.float64])
 def test_out_of_range_image(dtype):
     data = -1.7 - 0.001 * np.random.random((10, 15)).astype(dtype)
@@ -1056,6 +1142,25 @@ def test_contrast_outside_range():
     Image(data, contrast_limits=(0, 1000))
 
 
+def test_data_range_estimated_in_background():
+    get_settings().experimental.async_ = True
+    data = np.zeros((4, 10, 10))
+    data[0, 0, 0] = 0.5
+    data[3, 5, 5] = 7
+    layer = Image(da.from_array(data, chunks=(1, 10, 10)))
+    assert layer.contrast_limits_range == [0, 1]
+
+    assert layer._data_range_future.result() == (0, 7)
+    layer._slice_dims(Dims(ndim=3, point=(1, 0, 0)))
+
+    assert layer.contrast_limits_range == [0, 7]
+    assert layer._data_range_future is None
+
+    # integer data use the range of their dtype
+    layer = Image(da.from_array(data.astype(np.uint16), chunks=(1, 10, 10)))
+    assert layer._data_range_future is None
+
+
 def test_docstring():
     validate_all_params_in_docstring(Image)
     validate_kwargs_sorted(Image)
@@ -1,10 +1,14 @@
+import dask.array as da
 import numpy as np
 import pytest
 import skimage
 from skimage.transform import pyramid_gaussian
 
 from napari._tests.utils import check_layer_world_data_extent
+from napari.components import Dims
 from napari.layers import Image
+from napari.layers.image._tiles import _TileCache, read_tiled
+from napari.settings import get_settings
 from napari.utils import Colormap
 
 
@@ -505,3 +509,109 @@ def test_update_draw_variable_canvas_size_fixed_fov(
 
     assert layer.data_level == exp_level
     np.testing.assert_equal(layer.corner_pixels, exp_corner_pixels_data)
+
+
+def test_tiled_multiscale_matches_data():
+    """Tiled slicing expands the view to the chunk grid and reads the same values."""
+    get_settings().experimental.tiled_multiscale = True
+    shapes = [(40, 40), (20, 20)]
+    data = [
+        da.from_array(np.arange(np.prod(s)).reshape(s), chunks=8)
+        for s in shapes
+    ]
+    layer = Image(data, multiscale=True)
+    layer._update_draw(
+        scale_factor=1,
+        corner_pixels_displayed=np.array([[10, 13], [20, 27]]),
+        shape_threshold=(20, 20),
+    )
+
+    assert layer.data_level == 0
+    np.testing.assert_array_equal(
+        layer._transforms['tile2data'].translate, [8, 8]
+    )
+    np.testing.assert_array_equal(
+        layer._slice.image.raw, np.asarray(data[0][8:24, 8:32])
+    )
+
+
+def test_tiled_multiscale_reads_only_new_tiles():
+    get_settings().experimental.tiled_multiscale = True
+    shape = (2, 64, 64)
+    data = [
+        da.zeros(shape, chunks=(1, 16, 16)),
+        da.zeros((2, 32, 32), chunks=(1, 16, 16)),
+    ]
+    layer = Image(data, multiscale=True)
+    # the initial slice reads the whole lowest resolution level
+    assert len(layer._tile_cache) == 4
+    canvas = (16, 16)
+    layer._update_draw(1, np.array([[0, 0], [31, 31]]), canvas)
+    assert layer.data_level == 0
+    assert len(layer._tile_cache) == 8
+
+    # panning by one tile only reads the newly exposed column of tiles
+    layer._update_draw(1, np.array([[0, 16], [31, 47]]), canvas)
+    assert len(layer._tile_cache) == 10
+
+    # going back is served entirely from the cache
+    layer._update_draw(1, np.array([[0, 0], [31, 31]]), canvas)
+    assert len(layer._tile_cache) == 10
+
+    # tiles are keyed by the slice in the non-displayed dimensions
+    layer._slice_dims(Dims(ndim=3, point=(1, 0, 0)))
+    assert len(layer._tile_cache) == 14
+
+    # new data must not be read from tiles of the old data
+    layer.data = [da.ones_like(level) for level in data]
+    assert len(layer._tile_cache) == 4
+    np.testing.assert_array_equal(layer._slice.image.raw, 1)
+
+
+def test_tiled_multiscale_refresh_reads_tiles_again():
+    get_settings().experimental.tiled_multiscale = True
+    data = [np.zeros((64, 64)), np.zeros((32, 32))]
+    layer = Image(data, multiscale=True)
+    canvas = (16, 16)
+    layer._update_draw(1, np.array([[0, 0], [31, 31]]), canvas)
+    assert layer.data_level == 0
+
+    # edits in place are shown once the layer is refreshed
+    data[0][:] = 1
+    layer.refresh()
+    np.testing.assert_array_equal(layer._slice.image.raw, 1)
+
+
+def test_multiscale_pan_keeps_data_version():
+    data = [np.zeros((64, 64)), np.zeros((32, 32))]
+    layer = Image(data, multiscale=True)
+    version = layer._data_version
+    canvas = (16, 16)
+    layer._update_draw(1, np.array([[0, 0], [31, 31]]), canvas)
+    layer._update_draw(1, np.array([[0, 16], [31, 47]]), canvas)
+    assert layer.data_level == 0
+    assert layer._data_version == version
+
+
+def test_read_tiled_rejects_empty_corners():
+    with pytest.raises(ValueError, match='do not span any pixel'):
+        read_tiled(
+            corners=np.array([[4, 0], [3, 7]]),
+            axes=(0, 1),
+            tile_shape=(4, 4),
+            read_tile=lambda slices: np.zeros((4, 4)),
+            cache=_TileCache(max_bytes=1024),
+            key=None,
+        )
+
+
+def test_tile_cache_evicts_least_recently_used():
+    tile = np.zeros((4, 4), dtype=np.uint8)
+    cache = _TileCache(max_bytes=2 * tile.nbytes)
+    cache.put('a', tile)
+    cache.put('b', tile)
+    assert cache.get('a') is tile
+    cache.put('c', tile)
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert cache.nbytes == 2 * tile.nbytes
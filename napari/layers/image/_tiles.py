@@ -0,0 +1,180 @@
+"""Chunk-aligned tiling of multiscale image levels.
+
+When tiled multiscale rendering is enabled, the 2D field of view of a
+multiscale level is split into fixed-size tiles aligned to the chunk grid
+of the backing array. Tiles that have already been read are kept in a
+per-layer ``_TileCache``, so panning or zooming only reads the tiles that
+have newly come into view.
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Callable, Hashable, Sequence
+from typing import Any
+
+import numpy as np
+
+from napari.utils._lru_cache import SizedLRUCache
+
+# Used when the backing array does not expose a chunk shape (e.g. numpy).
+DEFAULT_TILE_SIZE = 512
+
+# Default byte budget for the tiles kept resident per layer.
+DEFAULT_TILE_CACHE_BYTES = 256 * 1024**2
+
+
+def get_tile_shape(
+    data: Any, axes: Sequence[int], default: int = DEFAULT_TILE_SIZE
+) -> tuple[int, ...]:
+    """Get the tile shape along the given axes of an array.
+
+    The shape follows the chunk grid of the array when one is exposed, as
+    by dask (``chunksize``) or zarr and tensorstore-like arrays
+    (``chunks`` as a tuple of ints), so that each tile maps onto whole
+    chunks of the backing store.
+
+    Parameters
+    ----------
+    data : array-like
+        The array of one multiscale level.
+    axes : sequence of int
+        The axes to tile, typically the displayed ones.
+    default : int
+        The tile size used along axes without chunk information.
+
+    Returns
+    -------
+    tuple of int
+        The tile size along each of the given axes.
+    """
+    chunks = getattr(data, 'chunksize', None)
+    if chunks is None:
+        chunks = getattr(data, 'chunks', None)
+    if (
+        not isinstance(chunks, tuple)
+        or len(chunks) != len(data.shape)
+        or not all(isinstance(c, int | np.integer) for c in chunks)
+    ):
+        return tuple(default for _ in axes)
+    return tuple(max(int(chunks[ax]), 1) for ax in axes)
+
+
+def align_to_tiles(
+    corners: np.ndarray,
+    shape: Sequence[int],
+    axes: Sequence[int],
+    tile_shape: Sequence[int],
+) -> np.ndarray:
+    """Expand inclusive corner pixels outwards to the tile grid.
+
+    Parameters
+    ----------
+    corners : np.ndarray
+        (2, D) inclusive corner pixels in the data space of a level.
+    shape : sequence of int
+        Shape of that level.
+    axes : sequence of int
+        Axes along which to align, typically the displayed ones.
+    tile_shape : sequence of int
+        The tile size along each of the given axes.
+
+    Returns
+    -------
+    np.ndarray
+        (2, D) inclusive corner pixels whose start is a multiple of the tile
+        size and whose end is the end of a tile or of the array.
+    """
+    aligned = np.array(corners, dtype=int)
+    for ax, size in zip(axes, tile_shape, strict=True):
+        start = (aligned[0, ax] // size) * size
+        stop = min((aligned[1, ax] // size + 1) * size, shape[ax])
+        aligned[0, ax] = start
+        aligned[1, ax] = stop - 1
+    return aligned
+
+
+class _TileCache(SizedLRUCache[Hashable, np.ndarray]):
+    """A thread-safe LRU cache of image tiles bounded by a byte budget.
+
+    Keys are opaque hashables that identify a tile (level, tile origin and
+    the slice along non-displayed dimensions). Values are numpy arrays.
+
+    Parameters
+    ----------
+    max_bytes : int
+        The maximum number of bytes of tile data kept resident.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_TILE_CACHE_BYTES) -> None:
+        super().__init__(max_bytes)
+
+
+def read_tiled(
+    *,
+    corners: np.ndarray,
+    axes: Sequence[int],
+    tile_shape: Sequence[int],
+    read_tile: Callable[[tuple[slice, ...]], np.ndarray],
+    cache: _TileCache,
+    key: Hashable,
+) -> np.ndarray:
+    """Assemble the region between tile-aligned corners from cached tiles.
+
+    Tiles missing from the cache are read with ``read_tile`` and added to it.
+
+    Parameters
+    ----------
+    corners : np.ndarray
+        (2, D) inclusive, tile-aligned corner pixels, as returned by
+        ``align_to_tiles``.
+    axes : sequence of int
+        The tiled axes, in increasing order. These must be the leading axes
+        of the arrays returned by ``read_tile``, in that order.
+    tile_shape : sequence of int
+        The tile size along each of the tiled axes.
+    read_tile : callable
+        Reads one tile given a tuple of slices, one per tiled axis.
+    cache : _TileCache
+        The cache holding previously read tiles.
+    key : hashable
+        Identifies everything but the tile position (e.g. the level and the
+        slice along non-displayed dimensions), and is combined with the tile
+        origin to make the cache key.
+
+    Returns
+    -------
+    np.ndarray
+        The assembled region.
+    """
+    starts = [
+        range(corners[0, ax], corners[1, ax] + 1, size)
+        for ax, size in zip(axes, tile_shape, strict=True)
+    ]
+    out = None
+    for origin in itertools.product(*starts):
+        tile_key = (key, origin)
+        tile = cache.get(tile_key)
+        if tile is None:
+            slices = tuple(
+                slice(o, min(o + size, corners[1, ax] + 1))
+                for o, size, ax in zip(origin, tile_shape, axes, strict=True)
+            )
+            tile = np.asarray(read_tile(slices))
+            cache.put(tile_key, tile)
+        if out is None:
+            region_shape = tuple(
+                corners[1, ax] - corners[0, ax] + 1 for ax in axes
+            )
+            out = np.empty(region_shape + tile.shape[len(axes) :], tile.dtype)
+        dest = tuple(
+            slice(o - corners[0, ax], o - corners[0, ax] + n)
+            for o, ax, n in zip(origin, axes, tile.shape, strict=False)
+        )
+        out[dest] = tile
+    if out is None:
+        raise ValueError(
+            f'corners {corners.tolist()} do not span any pixel along the '
+            f'tiled axes {tuple(axes)}'
+        )
+    return out
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import typing
 import warnings
+from concurrent.futures import Future
 from typing import Any, Literal, cast
 
 import numpy as np
@@ -21,7 +22,11 @@ from napari.layers.image._image_constants import (
 from napari.layers.image._image_utils import guess_rgb
 from napari.layers.image._slice import _ImageSliceResponse
 from napari.layers.intensity_mixin import IntensityVisualizationMixin
-from napari.layers.utils.layer_utils import calc_data_range
+from napari.layers.utils.layer_utils import (
+    calc_data_range,
+    submit_data_range_estimate,
+)
+from napari.settings import get_settings
 from napari.utils._dtype import get_dtype_limits, normalize_dtype
 from napari.utils.colormaps import ensure_colormap
 from napari.utils.colormaps.colormap_utils import _coerce_contrast_limits
@@ -301,6 +306,7 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
 
         self.rgb = rgb
         self._colormap = ensure_colormap(colormap)
+        self._colormap.events.connect(self._on_colormap_edited)
         self._gamma = gamma
         self._interpolation2d = Interpolation.NEAREST
         self._interpolation3d = Interpolation.NEAREST
@@ -309,6 +315,7 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         self._attenuation = attenuation
 
         # Set contrast limits, colormaps and plane parameters
+        self._data_range_future: Future[tuple[float, float]] | None = None
         if contrast_limits is None:
             if not isinstance(data, np.ndarray):
                 dtype = normalize_dtype(getattr(data, 'dtype', np.float32))
@@ -317,6 +324,18 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
                 else:
                     self.contrast_limits_range = (0, 1)
                 self._should_calc_clims = dtype != np.uint8
+                if (
+                    self._should_calc_clims
+                    and np.issubdtype(dtype, np.floating)
+                    and get_settings().experimental.async_
+                ):
+                    # The first slice gives provisional contrast limits
+                    # while the range of the whole data is estimated.
+                    # Integer data already use the range of their dtype.
+                    self._data_range_future = submit_data_range_estimate(
+                        self.data[-1] if self.multiscale else self.data,
+                        rgb=self.rgb,
+                    )
             else:
                 self.contrast_limits_range = self._calc_data_range()
         else:
@@ -413,6 +432,31 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
             self._should_calc_clims = False
         elif self._keep_auto_contrast:
             self.reset_contrast_limits()
+        self._apply_data_range_estimate()
+
+    def _apply_data_range_estimate(self) -> None:
+        """Extend the contrast limits range to the estimated range of the
+        whole data, once its background estimate is done.
+
+        This must be called on the main thread. The vispy layer calls it
+        when the estimate is done, and it is also called whenever a slice
+        is applied, so that it applies without a canvas too.
+        """
+        future = self._data_range_future
+        if future is None or not future.done():
+            return
+        self._data_range_future = None
+        if future.exception() is not None or np.issubdtype(
+            normalize_dtype(self.dtype), np.integer
+        ):
+            # integer data already use the range of their dtype
+            return
+        low, high = future.result()
+        range_low, range_high = self.contrast_limits_range
+        self.contrast_limits_range = (
+            min(low, range_low),
+            max(high, range_high),
+        )
 
     @property
     def attenuation(self) -> float:
@@ -435,6 +479,8 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         self._data_raw = data
         # note, we don't support changing multiscale in an Image instance
         self._data = MultiScaleData(data) if self.multiscale else data  # type: ignore
+        self._tile_cache.clear()
+        self._data_range_future = None
         self._update_dims()
         if self._keep_auto_contrast:
             self.reset_contrast_limits()
@@ -567,11 +613,9 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         if self._slice.empty:
             return
 
+        # the thumbnail is already projected and downsampled when slicing
         image = self._slice.thumbnail.raw
 
-        if self._slice_input.ndisplay == 3 and self.ndim > 2:
-            image = np.max(image, axis=0)
-
         # float16 not supported by ndi.zoom
         dtype = np.dtype(image.dtype)
         if dtype in [np.dtype(np.float16)]:
@@ -609,18 +653,8 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
             downsampled = ndi.zoom(
                 image, zoom_factor, prefilter=False, order=0
             )
-            low, high = self.contrast_limits
-            if np.issubdtype(downsampled.dtype, np.integer):
-                low = max(low, np.iinfo(downsampled.dtype).min)
-                high = min(high, np.iinfo(downsampled.dtype).max)
-            downsampled = np.clip(downsampled, low, high)
-            color_range = high - low
-            if color_range != 0:
-                downsampled = (downsampled - low) / color_range
-            downsampled = downsampled**self.gamma
-            color_array = self.colormap.map(downsampled.ravel())
-            colormapped = color_array.reshape((*downsampled.shape, 4))
-            colormapped[..., 3] *= self.opacity
+            colormapped = self._map_intensities(downsampled)
+            colormapped[..., 3] = np.rint(colormapped[..., 3] * self.opacity)
         self.thumbnail = colormapped
 
     def _calc_data_range(
@@ -4,6 +4,10 @@ import numpy as np
 
 from napari.utils._dtype import normalize_dtype
 from napari.utils.colormaps import ensure_colormap
+from napari.utils.colormaps.colormap import (
+    _intensity_lut_size,
+    _map_with_lut,
+)
 from napari.utils.events import Event
 from napari.utils.status_messages import format_float
 from napari.utils.validators import _validate_increasing, validate_n_seq
@@ -49,6 +53,29 @@ class IntensityVisualizationMixin:
         )
         self._auto_contrast_source = 'slice'
         self._keep_auto_contrast = False
+        # colormap lookup tables of each dtype, for the current colormap,
+        # contrast limits and gamma
+        self._lut_cache: dict[np.dtype, tuple[np.ndarray, tuple]] = {}
+
+    def _map_intensities(self, values: np.ndarray) -> np.ndarray:
+        """Map intensities to uint8 RGBA colors on the CPU.
+
+        This uses a lookup table of the colormap for the dtype of the values,
+        which is cached until the colormap, contrast limits or gamma change.
+        The table is only built to map at least as many values as it has
+        colors, e.g. not for the thumbnail of uint16 data.
+        """
+        dtype = np.dtype(values.dtype)
+        if dtype not in self._lut_cache:
+            if values.size < _intensity_lut_size(dtype):
+                return self.colormap._map_intensities(
+                    values, self.contrast_limits, self.gamma
+                )
+            self._lut_cache[dtype] = self.colormap._intensity_lut(
+                self.contrast_limits, self.gamma, dtype
+            )
+        lut, contrast_limits = self._lut_cache[dtype]
+        return _map_with_lut(values, lut, contrast_limits)
 
     def reset_contrast_limits(self: 'ScalarFieldBase', mode=None):
         """Scale contrast limits to data range"""
@@ -80,10 +107,19 @@ class IntensityVisualizationMixin:
         self._set_colormap(colormap)
 
     def _set_colormap(self, colormap):
+        if hasattr(self, '_colormap'):
+            self._colormap.events.disconnect(self._on_colormap_edited)
         self._colormap = ensure_colormap(colormap)
+        # the colormap may be edited in place, e.g. its colors
+        self._colormap.events.connect(self._on_colormap_edited)
+        self._lut_cache = {}
         self._update_thumbnail()
         self.events.colormap()
 
+    def _on_colormap_edited(self) -> None:
+        self._lut_cache = {}
+        self._update_thumbnail()
+
     @property
     def colormaps(self):
         """tuple of str: names of available colormaps."""
@@ -104,6 +140,7 @@ class IntensityVisualizationMixin:
             + format_float(contrast_limits[1])
         )
         self._contrast_limits = contrast_limits
+        self._lut_cache = {}
         # make sure range slider is big enough to fit range
         newrange = list(self.contrast_limits_range)
         newrange[0] = min(newrange[0], contrast_limits[0])
@@ -157,5 +194,6 @@ class IntensityVisualizationMixin:
     @gamma.setter
     def gamma(self, value):
         self._gamma = float(value)
+        self._lut_cache = {}
         self._update_thumbnail()
         self.events.gamma()
@@ -0,0 +1,235 @@
+"""Compressed, memory-bounded undo and redo history of a labels layer.
+
+Each history atom records the indices of the changed pixels as one integer
+array per dimension, together with the values before and after the change.
+For a large fill or a 3D brush stroke these arrays take many times the memory
+of the pixels themselves, so atoms are stored encoded instead:
+
+- indices are made relative to the bounding box of the atom, raveled to flat
+  offsets into that box, and run-length encoded. Pixels changed by painting
+  and filling mostly come in runs along the last axis, so this keeps little
+  more than the surface of the edited region;
+- the arrays of runs and of values are then compressed, with Blosc (zstd)
+  when numcodecs is installed, or with zlib otherwise.
+
+``_LabelsHistory`` keeps encoded items in a deque limited both in number of
+items and in bytes, evicting the oldest items first. Items are decoded back
+to the exact atoms that were saved, so undoing and redoing from it behaves as
+with the atoms kept in memory.
+"""
+
+from __future__ import annotations
+
+import zlib
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+try:
+    from numcodecs import Blosc
+except ImportError:
+    Blosc = None
+
+
+if Blosc is not None:
+    _blosc = Blosc(cname='zstd', clevel=1, shuffle=Blosc.SHUFFLE)
+
+    def _compress(array: npt.NDArray) -> bytes:
+        return _blosc.encode(np.ascontiguousarray(array))
+
+    def _decompress(buffer: bytes) -> bytes:
+        return _blosc.decode(buffer)
+
+else:
+
+    def _compress(array: npt.NDArray) -> bytes:
+        return zlib.compress(np.ascontiguousarray(array).tobytes(), 1)
+
+    def _decompress(buffer: bytes) -> bytes:
+        return zlib.decompress(buffer)
+
+
+@dataclass(frozen=True)
+class _EncodedArray:
+    """A compressed 1D array."""
+
+    buffer: bytes
+    dtype: np.dtype
+
+    @classmethod
+    def encode(cls, array: npt.NDArray) -> _EncodedArray:
+        array = np.asarray(array).ravel()
+        buffer = _compress(array) if array.size else b''
+        return cls(buffer, array.dtype)
+
+    def decode(self) -> npt.NDArray:
+        if not self.buffer:
+            return np.empty(0, self.dtype)
+        # frombuffer gives a read-only view of the buffer, copy to own it
+        return np.frombuffer(_decompress(self.buffer), self.dtype).copy()
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.buffer)
+
+
+@dataclass(frozen=True)
+class _EncodedAtom:
+    """A history atom with its indices and values encoded.
+
+    Attributes
+    ----------
+    origin : tuple of int
+        The lower corner of the bounding box of the indices.
+    shape : tuple of int
+        The shape of the bounding box of the indices.
+    run_starts, run_lengths : _EncodedArray
+        Runs of consecutive flat offsets into the bounding box, which
+        concatenated give the offsets of the indices in their original order.
+    index_dtype : np.dtype
+        The dtype of the original index arrays.
+    before : _EncodedArray
+        The values before the change.
+    after : scalar or _EncodedArray
+        The value(s) after the change.
+    """
+
+    origin: tuple[int, ...]
+    shape: tuple[int, ...]
+    run_starts: _EncodedArray
+    run_lengths: _EncodedArray
+    index_dtype: np.dtype
+    before: _EncodedArray
+    after: Any
+
+    @classmethod
+    def encode(
+        cls, indices: tuple[npt.NDArray, ...], before: npt.NDArray, after: Any
+    ) -> _EncodedAtom:
+        indices = tuple(np.asarray(axis_indices) for axis_indices in indices)
+        if indices[0].size == 0:
+            origin = (0,) * len(indices)
+            shape = (1,) * len(indices)
+        else:
+            origin = tuple(int(axis_indices.min()) for axis_indices in indices)
+            shape = tuple(
+                int(axis_indices.max()) - low + 1
+                for axis_indices, low in zip(indices, origin, strict=True)
+            )
+        offsets = np.ravel_multi_index(
+            tuple(
+                axis_indices - low
+                for axis_indices, low in zip(indices, origin, strict=True)
+            ),
+            shape,
+        )
+        # a run ends wherever the next offset is not the following one
+        breaks = np.flatnonzero(np.diff(offsets) != 1) + 1
+        run_first = np.concatenate(([0], breaks))[: len(offsets)]
+        run_lengths = np.diff(np.append(run_first, len(offsets)))
+        offset_dtype = np.min_scalar_type(int(np.prod(shape)))
+        return cls(
+            origin=origin,
+            shape=shape,
+            run_starts=_EncodedArray.encode(
+                offsets[run_first].astype(offset_dtype)
+            ),
+            run_lengths=_EncodedArray.encode(
+                run_lengths.astype(
+                    np.min_scalar_type(run_lengths.max(initial=0))
+                )
+            ),
+            index_dtype=indices[0].dtype,
+            before=_EncodedArray.encode(before),
+            after=(
+                _EncodedArray.encode(after)
+                if isinstance(after, np.ndarray)
+                else after
+            ),
+        )
+
+    def decode(self) -> tuple[tuple[npt.NDArray, ...], npt.NDArray, Any]:
+        run_starts = self.run_starts.decode().astype(np.intp)
+        run_lengths = self.run_lengths.decode().astype(np.intp)
+        n_offsets = int(run_lengths.sum())
+        # the offsets of a run are its start plus their position in the run
+        run_first = np.cumsum(run_lengths) - run_lengths
+        offsets = np.repeat(run_starts - run_first, run_lengths) + np.arange(
+            n_offsets
+        )
+        indices = tuple(
+            (axis_indices + low).astype(self.index_dtype, copy=False)
+            for axis_indices, low in zip(
+                np.unravel_index(offsets, self.shape),
+                self.origin,
+                strict=True,
+            )
+        )
+        after = (
+            self.after.decode()
+            if isinstance(self.after, _EncodedArray)
+            else self.after
+        )
+        return indices, self.before.decode(), after
+
+    @property
+    def nbytes(self) -> int:
+        nbytes = (
+            self.run_starts.nbytes
+            + self.run_lengths.nbytes
+            + self.before.nbytes
+        )
+        if isinstance(self.after, _EncodedArray):
+            nbytes += self.after.nbytes
+        return nbytes
+
+
+class _LabelsHistory:
+    """Queue of history items of a labels layer, stored encoded.
+
+    Items are lists of atoms, each a 3-tuple of a multi-index, the values
+    before the change and the value(s) after it, as saved by
+    ``Labels._save_history``.
+
+    Parameters
+    ----------
+    maxlen : int
+        Maximum number of items to keep.
+    max_bytes : int
+        Maximum size of the encoded items. When exceeded, the oldest items are
+        evicted, except for the newest item which is always kept.
+    """
+
+    def __init__(self, maxlen: int, max_bytes: int) -> None:
+        self.maxlen = maxlen
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._items: deque[tuple[list[_EncodedAtom], int]] = deque()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index: int) -> list:
+        return [atom.decode() for atom in self._items[index][0]]
+
+    def append(self, item: list) -> None:
+        encoded = [_EncodedAtom.encode(*atom) for atom in item]
+        nbytes = sum(atom.nbytes for atom in encoded)
+        self._items.append((encoded, nbytes))
+        self.nbytes += nbytes
+        while len(self._items) > self.maxlen or (
+            self.nbytes > self.max_bytes and len(self._items) > 1
+        ):
+            self.nbytes -= self._items.popleft()[1]
+
+    def pop(self) -> list:
+        item = self[-1]
+        self.nbytes -= self._items.pop()[1]
+        return item
+
+    def clear(self) -> None:
+        self._items.clear()
+        self.nbytes = 0
@@ -1,3 +1,5 @@
+from collections import deque
+from collections.abc import Callable, Iterator
 from functools import lru_cache
 
 import numpy as np
@@ -115,6 +117,146 @@ def indices_in_shape(idxs, shape):
     return filtered
 
 
+def get_chunk_boundaries(data):
+    """Return the boundaries of the chunks of an array along each axis.
+
+    Parameters
+    ----------
+    data : array
+        An array stored in chunks, such as a zarr or dask array. Chunks are
+        given either as one chunk size per axis (zarr), or as the sizes of all
+        chunks along each axis (dask).
+
+    Returns
+    -------
+    boundaries : list of array of int, or None
+        For each axis, the start of each chunk followed by the size of the
+        axis. None if the array is not chunked.
+
+    Examples
+    --------
+    >>> import dask.array as da
+    >>> get_chunk_boundaries(da.zeros((5, 4), chunks=(2, 4)))
+    [array([0, 2, 4, 5]), array([0, 4])]
+    """
+    chunks = getattr(data, 'chunks', None)
+    if not chunks or len(chunks) != len(data.shape):
+        return None
+    boundaries = []
+    for axis_chunks, size in zip(chunks, data.shape, strict=True):
+        if isinstance(axis_chunks, int | np.integer):
+            axis_boundaries = np.append(
+                np.arange(0, size, max(int(axis_chunks), 1)), size
+            )
+        else:
+            axis_boundaries = np.concatenate(([0], np.cumsum(axis_chunks)))
+        boundaries.append(axis_boundaries.astype(int))
+    return boundaries
+
+
+def chunked_flood_fill(
+    read: Callable[[tuple[slice, ...]], np.ndarray],
+    boundaries: list[np.ndarray],
+    seed: tuple[int, ...],
+    old_label: int,
+) -> Iterator[tuple[np.ndarray, ...]]:
+    """Find the connected component of a label, one chunk at a time.
+
+    The component is grown from chunk to chunk across the faces of the
+    chunks it reaches, so that only the chunks it touches are read. Within a
+    chunk, pixels are connected through their faces as with ``ndi.label``.
+
+    Parameters
+    ----------
+    read : callable
+        Function returning, as a NumPy array, the labels in a region given as
+        a tuple of slices.
+    boundaries : list of array of int
+        The boundaries of the chunks along each axis, as returned by
+        ``get_chunk_boundaries``.
+    seed : tuple of int
+        The coordinates of a pixel of the component.
+    old_label : int
+        The label of the component, which must be the label at ``seed``.
+
+    Yields
+    ------
+    indices : tuple of array of int
+        The indices of pixels of the component, which are found in turn in
+        each chunk. Each pixel is yielded once.
+    """
+    ndim = len(boundaries)
+    n_chunks = tuple(len(b) - 1 for b in boundaries)
+    start = tuple(
+        int(np.searchsorted(b, x, side='right')) - 1
+        for b, x in zip(boundaries, seed, strict=True)
+    )
+    origin = np.array([b[i] for b, i in zip(boundaries, start, strict=True)])
+    # seeds of each chunk to visit, in the local coordinates of the chunk
+    pending = {start: [np.array([seed]) - origin]}
+    queue = deque([start])
+    # connected components in each read chunk, and those already filled
+    chunk_labels: dict[tuple[int, ...], np.ndarray] = {}
+    chunk_filled: dict[tuple[int, ...], set] = {}
+    while queue:
+        chunk = queue.popleft()
+        seeds = np.concatenate(pending.pop(chunk))
+        origin = np.array(
+            [b[i] for b, i in zip(boundaries, chunk, strict=True)]
+        )
+        if chunk not in chunk_labels:
+            region = tuple(
+                slice(b[i], b[i + 1])
+                for b, i in zip(boundaries, chunk, strict=True)
+            )
+            chunk_labels[chunk], _ = ndi.label(
+                np.asarray(read(region)) == old_label
+            )
+            chunk_filled[chunk] = set()
+        labels = chunk_labels[chunk]
+        new_labels = [
+            label
+            for label in np.unique(labels[tuple(seeds.T)])
+            if label != 0 and label not in chunk_filled[chunk]
+        ]
+        if not new_labels:
+            continue
+        chunk_filled[chunk].update(new_labels)
+        new = np.isin(labels, new_labels)
+        yield tuple(
+            axis_indices + low
+            for axis_indices, low in zip(np.nonzero(new), origin, strict=True)
+        )
+
+        # continue into the neighboring chunks through the pixels of the
+        # component on the faces of this chunk
+        for axis in range(ndim):
+            for step in (-1, 1):
+                neighbor = list(chunk)
+                neighbor[axis] += step
+                if not 0 <= neighbor[axis] < n_chunks[axis]:
+                    continue
+                on_face = np.nonzero(
+                    new.take(0 if step < 0 else -1, axis=axis)
+                )
+                if len(on_face[0]) == 0:
+                    continue
+                neighbor_low, neighbor_high = boundaries[axis][
+                    neighbor[axis] : neighbor[axis] + 2
+                ]
+                face_coord = (
+                    neighbor_high - neighbor_low - 1 if step < 0 else 0
+                )
+                neighbor_seeds = np.insert(
+                    np.stack(on_face, axis=1), axis, face_coord, axis=1
+                )
+                neighbor = tuple(neighbor)
+                if neighbor not in pending:
+                    pending[neighbor] = []
+                    queue.append(neighbor)
+                pending[neighbor].append(neighbor_seeds)
+
+
 def get_dtype(layer):
     """Returns dtype of layer data
 
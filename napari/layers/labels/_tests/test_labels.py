@@ -991,6 +991,14 @@ def test_thumbnail():
     assert layer.thumbnail.shape == layer._thumbnail_shape
 
 
+def test_thumbnail_shows_painting():
+    """Test that the thumbnail reflects labels painted after slicing."""
+    layer = Labels(np.zeros((64, 64), dtype=np.uint8), opacity=1)
+    layer.paint((32, 32), 3, refresh=True)
+    layer._update_thumbnail()
+    npt.assert_array_equal(layer.thumbnail[16, 16], layer.get_color(3) * 255)
+
+
 @pytest.mark.parametrize('value', [1, 10, 50, -2, -10])
 @pytest.mark.parametrize('dtype', [np.int8, np.int32])
 def test_thumbnail_single_color(value, dtype):
@@ -1164,6 +1172,32 @@ def test_fill_tensorstore(tmp_path, zarr_version, zarr_driver):
     np.testing.assert_array_equal(modified_labels, np.asarray(data))
 
 
+@pytest.mark.parametrize('n_edit_dimensions', [2, 3])
+@pytest.mark.parametrize('contiguous', [True, False])
+def test_fill_chunked(n_edit_dimensions, contiguous):
+    blobs = sk_data.binary_blobs(length=32, volume_fraction=0.3, n_dim=3)
+    labels = blobs.astype(np.uint8)
+    data = zarr.zeros(labels.shape, chunks=(8, 8, 8), dtype=np.uint8)
+    data[:] = labels
+    layer = Labels(data)
+    layer.n_edit_dimensions = n_edit_dimensions
+    layer.contiguous = contiguous
+    expected = Labels(labels.copy())
+    expected.n_edit_dimensions = n_edit_dimensions
+    expected.contiguous = contiguous
+    coord = tuple(np.argwhere(labels)[len(labels) // 2])
+
+    layer.fill(coord, 2)
+    expected.fill(coord, 2)
+
+    np.testing.assert_array_equal(data[:], expected.data)
+    # the fill is a single history item
+    layer.undo()
+    np.testing.assert_array_equal(data[:], labels)
+    layer.redo()
+    np.testing.assert_array_equal(data[:], expected.data)
+
+
 def test_fill_with_xarray():
     """See https://github.com/napari/napari/issues/2374"""
     data = xr.DataArray(np.zeros((5, 4, 4), dtype=int))
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from napari.layers import Labels
+from napari.layers.labels._labels_history import _EncodedAtom, _LabelsHistory
+from napari.settings import get_settings
+
+
+def _assert_atoms_equal(atom, expected):
+    for indices, expected_indices in zip(atom[0], expected[0], strict=True):
+        np.testing.assert_array_equal(indices, expected_indices)
+        assert indices.dtype == expected_indices.dtype
+    np.testing.assert_array_equal(atom[1], expected[1])
+    assert atom[1].dtype == expected[1].dtype
+    np.testing.assert_array_equal(atom[2], expected[2])
+
+
+@pytest.mark.parametrize(
+    'indices',
+    [
+        # a filled blob, in C order
+        np.nonzero(np.random.default_rng(0).random((10, 20, 30)) > 0.5),
+        # unordered, repeated and negative indices
+        (np.array([4, 2, 2, 9, 0]), np.array([-1, 3, 3, 0, 7])),
+        (np.array([], dtype=int), np.array([], dtype=int)),
+    ],
+)
+@pytest.mark.parametrize('array_after', [True, False])
+def test_encoded_atom_roundtrip(indices, array_after):
+    rng = np.random.default_rng(1)
+    before = rng.integers(0, 10, len(indices[0])).astype(np.uint16)
+    after = before[::-1] + 1 if array_after else np.uint16(7)
+
+    atom = _EncodedAtom.encode(indices, before, after)
+
+    _assert_atoms_equal(atom.decode(), (indices, before, after))
+
+
+def test_encoded_atom_is_compact():
+    indices = np.nonzero(np.ones((64, 64, 64), dtype=bool))
+    before = np.zeros(len(indices[0]), dtype=np.uint32)
+
+    atom = _EncodedAtom.encode(indices, before, np.uint32(1))
+
+    assert atom.nbytes < before.nbytes // 100
+
+
+def test_history_evicts_oldest_items_over_budget():
+    indices = (np.arange(1000),)
+    history = _LabelsHistory(maxlen=10, max_bytes=0)
+
+    history.append([(indices, np.arange(1000), 1)])
+    history.append([(indices, np.arange(1000) * 3, 2)])
+
+    # the newest item is kept even if it exceeds the budget
+    assert len(history) == 1
+    assert history.nbytes > 0
+    np.testing.assert_array_equal(history[0][0][1], np.arange(1000) * 3)
+    history.pop()
+    assert len(history) == 0
+    assert history.nbytes == 0
+
+
+def test_history_maxlen():
+    history = _LabelsHistory(maxlen=2, max_bytes=2**20)
+    for value in range(3):
+        history.append([((np.array([value]),), np.array([0]), value)])
+
+    assert len(history) == 2
+    assert [history.pop()[0][2] for _ in range(2)] == [2, 1]
+
+
+def test_labels_undo_over_history_size():
+    get_settings().experimental.labels_history_size = 0
+    data = np.zeros((10, 10), dtype=np.uint8)
+    layer = Labels(data)
+
+    layer.paint((2, 2), 1)
+    layer.paint((7, 7), 2)
+    painted = data.copy()
+    layer.undo()
+    layer.undo()
+
+    # only the last edit could be kept
+    assert data[2, 2] == 1
+    assert data[7, 7] == 0
+    layer.redo()
+    np.testing.assert_array_equal(data, painted)
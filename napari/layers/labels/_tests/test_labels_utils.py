@@ -1,9 +1,14 @@
+import dask.array as da
 import numpy as np
+import zarr
+from scipy import ndimage as ndi
 
 from napari.components.dims import Dims
 from napari.layers.labels import Labels
 from napari.layers.labels._labels_utils import (
+    chunked_flood_fill,
     first_nonzero_coordinate,
+    get_chunk_boundaries,
     get_dtype,
     interpolate_coordinates,
     mouse_event_to_labels_coordinate,
@@ -153,3 +158,43 @@ def test_mouse_event_to_labels_coordinate_3d(MouseEvent):
 
     coord = mouse_event_to_labels_coordinate(layer, event)
     assert coord is None
+
+
+def test_get_chunk_boundaries():
+    assert get_chunk_boundaries(np.zeros((4, 4))) is None
+    boundaries = get_chunk_boundaries(zarr.zeros((5, 4), chunks=(2, 3)))
+    np.testing.assert_array_equal(boundaries[0], [0, 2, 4, 5])
+    np.testing.assert_array_equal(boundaries[1], [0, 3, 4])
+    boundaries = get_chunk_boundaries(da.zeros((5, 4), chunks=((1, 4), 4)))
+    np.testing.assert_array_equal(boundaries[0], [0, 1, 5])
+    np.testing.assert_array_equal(boundaries[1], [0, 4])
+
+
+def test_chunked_flood_fill():
+    labels = np.zeros((12, 12), dtype=np.uint8)
+    # a spiral-like component that leaves and reenters the first chunk
+    labels[1, 1:11] = 1
+    labels[1:11, 10] = 1
+    labels[10, 0:11] = 1
+    labels[2:11, 0] = 1
+    # another component of the same label, in chunks not touched by the first
+    labels[6:8, 5:7] = 1
+    boundaries = [np.array([0, 3, 6, 9, 12])] * 2
+    reads = []
+
+    def read(region):
+        reads.append(region)
+        return labels[region]
+
+    indices = list(chunked_flood_fill(read, boundaries, (1, 1), 1))
+
+    filled = np.zeros_like(labels, dtype=bool)
+    for chunk_indices in indices:
+        assert not np.any(filled[chunk_indices])
+        filled[chunk_indices] = True
+    components, _ = ndi.label(labels == 1)
+    np.testing.assert_array_equal(filled, components == components[1, 1])
+    # each chunk is read at most once, and the middle chunks never
+    assert len(reads) == len(set(map(str, reads)))
+    assert (slice(3, 6), slice(3, 6)) not in reads
+    assert (slice(6, 9), slice(6, 9)) not in reads
@@ -1,8 +1,7 @@
 import typing
 import warnings
-from collections import deque
 from collections.abc import Callable, Sequence
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from typing import (
     Any,
     ClassVar,
@@ -30,19 +29,23 @@ from napari.layers.labels._labels_constants import (
     LabelsRendering,
     Mode,
 )
+from napari.layers.labels._labels_history import _LabelsHistory
 from napari.layers.labels._labels_mouse_bindings import (
     BrushSizeOnMouseMove,
     draw,
     pick,
 )
 from napari.layers.labels._labels_utils import (
+    chunked_flood_fill,
     expand_slice,
+    get_chunk_boundaries,
     get_contours,
     indices_in_shape,
     interpolate_coordinates,
     sphere_indices,
 )
 from napari.layers.utils.layer_utils import _FeatureTable
+from napari.settings import get_settings
 from napari.utils._dtype import normalize_dtype, vispy_texture_dtype
 from napari.utils._indexing import elements_in_slice, index_in_slice
 from napari.utils.colormaps import (
@@ -572,6 +575,7 @@ class Labels(ScalarFieldBase):
     def data(self, data: LayerDataProtocol | MultiScaleData):
         data = self._ensure_int_labels(data)
         self._data = data
+        self._tile_cache.clear()
         self._ndim = len(self._data.shape)
         self._update_dims()
         self.events.data(value=self.data)
@@ -948,13 +952,11 @@ class Labels(ScalarFieldBase):
             # Is there a nicer way to prevent this from getting called?
             return
 
+        # The thumbnail is already downsampled when slicing, and projected
+        # with max projection if the slice is 3D. For labels, ideally we
+        # would use "first nonzero projection", but we leave that for a
+        # future PR. (TODO)
         image = self._slice.thumbnail.raw
-        if self._slice_input.ndisplay == 3 and self.ndim > 2:
-            # we are only using the current slice so `image` will never be
-            # bigger than 3. If we are in this clause, it is exactly 3, so we
-            # use max projection. For labels, ideally we would use "first
-            # nonzero projection", but we leave that for a future PR. (TODO)
-            image = np.max(image, axis=0)
         imshape = np.array(image.shape[:2])
         thumbshape = np.array(self._thumbnail_shape[:2])
 
@@ -983,8 +985,9 @@ class Labels(ScalarFieldBase):
         return col
 
     def _reset_history(self, event=None):
-        self._undo_history = deque(maxlen=self._history_limit)
-        self._redo_history = deque(maxlen=self._history_limit)
+        max_bytes = get_settings().experimental.labels_history_size * 2**20
+        self._undo_history = _LabelsHistory(self._history_limit, max_bytes)
+        self._redo_history = _LabelsHistory(self._history_limit, max_bytes)
         self._staged_history = []
         self._block_history = False
 
@@ -1126,9 +1129,25 @@ class Labels(ScalarFieldBase):
         for dim in dims_to_fill:
             data_slice_list[dim] = slice(None)
         data_slice = tuple(data_slice_list)
-        labels = np.asarray(self.data[data_slice])
         slice_coord = tuple(int_coord[d] for d in dims_to_fill)
 
+        if self.contiguous:
+            boundaries = get_chunk_boundaries(self.data)
+            if boundaries is not None and any(
+                len(boundaries[d]) > 2 for d in dims_to_fill
+            ):
+                self._fill_chunked(
+                    data_slice,
+                    [boundaries[d] for d in dims_to_fill],
+                    slice_coord,
+                    old_label,
+                    new_label,
+                    refresh,
+                )
+                return
+
+        labels = np.asarray(self.data[data_slice])
+
         matches = labels == old_label
         if self.contiguous:
             # if contiguous replace only selected connected component
@@ -1159,6 +1178,74 @@ class Labels(ScalarFieldBase):
 
         self.data_setitem(match_indices, new_label, refresh)
 
+    def _fill_chunked(
+        self,
+        data_slice,
+        boundaries,
+        slice_coord,
+        old_label,
+        new_label,
+        refresh,
+    ):
+        """Fill the connected component of a label in chunked data.
+
+        Instead of reading the whole slab of data to fill, the component is
+        grown chunk by chunk from the filled coordinate, reading only the
+        chunks it touches. The pixels found in each chunk are written with
+        `data_setitem` as they are found, as a single history item.
+
+        Parameters
+        ----------
+        data_slice : tuple of int or slice
+            The slab of data to fill, with a slice along each filled dimension
+            and an int along the other dimensions.
+        boundaries : list of array of int
+            The boundaries of the chunks of data along each filled dimension.
+        slice_coord : tuple of int
+            The filled coordinate along the filled dimensions.
+        old_label : int
+            The label at the filled coordinate.
+        new_label : int
+            Value of the new label to be filled in.
+        refresh : bool
+            Whether to refresh view slice or not.
+        """
+        fill_dims = [
+            i for i, d in enumerate(data_slice) if isinstance(d, slice)
+        ]
+
+        def read(region):
+            index = list(data_slice)
+            for dim, dim_slice in zip(fill_dims, region, strict=True):
+                index[dim] = dim_slice
+            return self.data[tuple(index)]
+
+        history = (
+            nullcontext() if self._block_history else self.block_history()
+        )
+        with history:
+            for local_indices in chunked_flood_fill(
+                read, boundaries, slice_coord, old_label
+            ):
+                n_idx = len(local_indices[0])
+                match_indices = []
+                j = 0
+                for d in data_slice:
+                    if isinstance(d, slice):
+                        match_indices.append(local_indices[j])
+                        j += 1
+                    else:
+                        match_indices.append(np.full(n_idx, d, dtype=np.intp))
+                self.data_setitem(
+                    _coerce_indices_for_vectorization(
+                        self.data, match_indices
+                    ),
+                    new_label,
+                    refresh=False,
+                )
+        if refresh:
+            self._partial_labels_refresh()
+
     def _draw(self, new_label, last_cursor_coord, coordinates):
         """Paint into coordinates, accounting for mode and cursor movement.
 
@@ -1387,6 +1474,7 @@ class Labels(ScalarFieldBase):
 
         # update the labels image
         self.data[indices] = value
+        self._data_version += 1
 
         pt_not_disp = self._get_pt_not_disp()
         displayed_indices = index_in_slice(
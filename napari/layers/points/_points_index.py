@@ -0,0 +1,178 @@
+"""A spatial index over the coordinates of a points layer.
+
+Slicing, hover picking and box selection of a points layer only concern the
+points inside an axis-aligned box (the slab around the current slice, or a
+neighborhood of the cursor or drag box), which is typically a small fraction
+of all the points. ``_PointsIndex`` keeps, for each queried axis, the point
+indices sorted by their coordinate along that axis, so that such a box query
+only visits the points within the bounds along its most selective axis.
+
+Indices are immutable: adding, removing or moving points returns a new index,
+which is updated incrementally instead of being sorted again. This lets slice
+requests use an index on a slicing thread while the layer is being edited on
+the main thread.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from threading import Lock
+
+import numpy as np
+import numpy.typing as npt
+
+
+class _PointsIndex:
+    """Per-axis sorted index of point coordinates.
+
+    The sorting along an axis is computed the first time that axis is
+    queried, so that creating an index is cheap and axes that are never
+    queried (e.g. displayed axes when only slicing) cost nothing.
+
+    Parameters
+    ----------
+    data : (N, D) array
+        The coordinates of the points.
+    """
+
+    def __init__(self, data: npt.NDArray) -> None:
+        self._data = data
+        # Maps from axis to the point indices sorted by their coordinate along
+        # that axis and those sorted coordinates.
+        self._sorted: dict[int, tuple[npt.NDArray, npt.NDArray]] = {}
+        self._lock = Lock()
+
+    @property
+    def data(self) -> npt.NDArray:
+        """(N, D) array: the indexed coordinates."""
+        return self._data
+
+    def query_box(
+        self,
+        axes: Sequence[int],
+        low: npt.ArrayLike,
+        high: npt.ArrayLike,
+    ) -> npt.NDArray:
+        """Find the points inside an axis-aligned box.
+
+        Parameters
+        ----------
+        axes : sequence of int
+            The axes along which the box is bounded. Points are not
+            constrained along other axes.
+        low, high : array-like
+            The inclusive lower and upper bounds of the box along each of the
+            given axes.
+
+        Returns
+        -------
+        (M,) array of int
+            The indices of the points inside the box, in increasing order.
+        """
+        axes = list(axes)
+        low = np.asarray(low, dtype=float)
+        high = np.asarray(high, dtype=float)
+        if len(axes) == 0:
+            return np.arange(len(self._data))
+        # Only visit the points within the bounds of the most selective axis.
+        best = None
+        for i, axis in enumerate(axes):
+            order, values = self._get_sorted(axis)
+            start = np.searchsorted(values, low[i], side='left')
+            stop = np.searchsorted(values, high[i], side='right')
+            if best is None or stop - start < best[2] - best[1]:
+                best = (order, start, stop, i)
+        order, start, stop, i = best
+        candidates = order[start:stop]
+        others = [j for j in range(len(axes)) if j != i]
+        if others:
+            coords = self._data[np.ix_(candidates, [axes[j] for j in others])]
+            inside = np.all(
+                (coords >= low[others]) & (coords <= high[others]), axis=1
+            )
+            candidates = candidates[inside]
+        return np.sort(candidates)
+
+    def inserted(self, data: npt.NDArray) -> _PointsIndex:
+        """Get the index of the given data with points appended to these.
+
+        Parameters
+        ----------
+        data : (N + K, D) array
+            The coordinates of the points, whose first N rows are the indexed
+            points and last K rows are the new points.
+        """
+        n_points = len(self._data)
+        new_ids = np.arange(n_points, len(data))
+        index = _PointsIndex(data)
+        for axis, (order, values) in self._sorted_items():
+            new_values = data[n_points:, axis]
+            positions = np.searchsorted(values, new_values, side='right')
+            index._sorted[axis] = (
+                np.insert(order, positions, new_ids),
+                np.insert(values, positions, new_values),
+            )
+        return index
+
+    def removed(
+        self, indices: npt.ArrayLike, data: npt.NDArray
+    ) -> _PointsIndex:
+        """Get the index of the given data with some of these points removed.
+
+        Parameters
+        ----------
+        indices : array-like of int
+            The indices of the removed points.
+        data : (N - K, D) array
+            The coordinates of the remaining points, in their original order.
+        """
+        removed = np.unique(np.asarray(indices, dtype=int))
+        is_removed = np.zeros(len(self._data), dtype=bool)
+        is_removed[removed] = True
+        index = _PointsIndex(data)
+        for axis, (order, values) in self._sorted_items():
+            keep = ~is_removed[order]
+            kept_order = order[keep]
+            # Shift each index down by the number of removed points before it.
+            kept_order = kept_order - np.searchsorted(removed, kept_order)
+            index._sorted[axis] = (kept_order, values[keep])
+        return index
+
+    def updated(
+        self, indices: npt.ArrayLike, data: npt.NDArray
+    ) -> _PointsIndex:
+        """Get the index of the given data where some of these points moved.
+
+        Parameters
+        ----------
+        indices : array-like of int
+            The indices of the moved points.
+        data : (N, D) array
+            The coordinates of the points, including the moved ones.
+        """
+        moved = np.unique(np.asarray(indices, dtype=int))
+        is_moved = np.zeros(len(self._data), dtype=bool)
+        is_moved[moved] = True
+        index = _PointsIndex(data)
+        for axis, (order, values) in self._sorted_items():
+            keep = ~is_moved[order]
+            order, values = order[keep], values[keep]
+            new_values = data[moved, axis]
+            positions = np.searchsorted(values, new_values, side='right')
+            index._sorted[axis] = (
+                np.insert(order, positions, moved),
+                np.insert(values, positions, new_values),
+            )
+        return index
+
+    def _sorted_items(self) -> list[tuple[int, tuple[np.ndarray, np.ndarray]]]:
+        with self._lock:
+            return list(self._sorted.items())
+
+    def _get_sorted(self, axis: int) -> tuple[npt.NDArray, npt.NDArray]:
+        with self._lock:
+            if axis not in self._sorted:
+                values = self._data[:, axis]
+                order = np.argsort(values, kind='stable')
+                self._sorted[axis] = (order, values[order])
+            return self._sorted[axis]
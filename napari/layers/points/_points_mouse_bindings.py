@@ -3,7 +3,7 @@ from typing import TypeVar
 import numpy as np
 
 from napari.layers.base import ActionType
-from napari.layers.points._points_utils import _points_in_box_3d, points_in_box
+from napari.layers.points._points_utils import _points_in_box_3d
 
 
 def select(layer, event):
@@ -231,9 +231,7 @@ def _select_points_from_drag(layer, modify_selection: bool, n_display: int):
 
     # if there is data in view, find the points in the drag box
     if n_display == 2:
-        selection = points_in_box(
-            layer._drag_box, layer._view_data, layer._view_size
-        )
+        selection = layer._points_in_drag_box()
     else:
         selection = _points_in_box_3d(
             layer._drag_box,
@@ -1,3 +1,4 @@
+from collections.abc import Hashable
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -6,6 +7,7 @@ import numpy.typing as npt
 
 from napari.layers.base._slice import _next_request_id
 from napari.layers.points._points_constants import PointsProjectionMode
+from napari.layers.points._points_index import _PointsIndex
 from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
 
 
@@ -53,6 +55,12 @@ class _PointSliceRequest:
         The slicing coordinates and margins in data space.
     size : array like
         Size of each point. This is used in calculating visibility.
+    max_size : float
+        Size of the largest point, by which the slab is padded when
+        querying the points index for out of slice display.
+    points_index : _PointsIndex or None
+        A spatial index of the data. If given, only the points near the
+        slice are visited.
     others
         See the corresponding attributes in `Layer` and `Points`.
     """
@@ -63,8 +71,32 @@ class _PointSliceRequest:
     projection_mode: PointsProjectionMode
     size: Any = field(repr=False)
     out_of_slice_display: bool = field(repr=False)
+    max_size: float = field(default=0.0, repr=False)
+    points_index: _PointsIndex | None = field(default=None, repr=False)
     id: int = field(default_factory=_next_request_id)
 
+    @property
+    def cache_key(self) -> Hashable:
+        """Hashable description of the response made by this request.
+
+        Two requests from the same layer with equal keys make the same
+        response, apart from its slice input and request id, as long as
+        the layer's data version did not change in between (see
+        ``napari.layers.base._slice_cache``).
+        """
+        # Bytes are used because points and margins may contain NaN, which
+        # never compares equal.
+        slice_arr = self.data_slice.as_array()[
+            :, list(self.slice_input.not_displayed)
+        ]
+        return (
+            self.projection_mode,
+            self.out_of_slice_display,
+            self.slice_input.ndisplay,
+            self.slice_input.order,
+            slice_arr.tobytes(),
+        )
+
     def __call__(self) -> _PointSliceResponse:
         # Return early if no data
         if len(self.data) == 0:
@@ -96,7 +128,6 @@ class _PointSliceRequest:
         )
 
     def _get_slice_data(self, not_disp: list[int]) -> tuple[npt.NDArray, int]:
-        data = self.data[:, not_disp]
         scale = 1
 
         point, m_left, m_right = self.data_slice[not_disp].as_array()
@@ -114,11 +145,26 @@ class _PointSliceRequest:
         low[too_thin_slice] -= 0.5
         high[too_thin_slice] += 0.5
 
+        out_of_slice = self.out_of_slice_display and self.slice_input.ndim > 2
+        # Only visit the candidate points that the index finds in the slab,
+        # expanded by the largest radius for points spilling into it.
+        candidates = None
+        if self.points_index is not None:
+            pad = self.max_size / 2 if out_of_slice else 0
+            candidates = self.points_index.query_box(
+                not_disp, low - pad, high + pad
+            )
+            data = self.data[np.ix_(candidates, not_disp)]
+        else:
+            data = self.data[:, not_disp]
+
         inside_slice = np.all((data >= low) & (data <= high), axis=1)
         slice_indices = np.where(inside_slice)[0].astype(int)
 
-        if self.out_of_slice_display and self.slice_input.ndim > 2:
+        if out_of_slice:
             sizes = self.size[:, np.newaxis] / 2
+            if candidates is not None:
+                sizes = sizes[candidates]
 
             # add out of slice points with progressively lower sizes
             dist_from_low = np.abs(data - low)
@@ -137,4 +183,6 @@ class _PointSliceRequest:
             scale = np.prod(scale_per_dim, axis=1)
             slice_indices = np.where(matches)[0].astype(int)
 
+        if candidates is not None:
+            slice_indices = candidates[slice_indices].astype(int)
         return slice_indices, scale
@@ -23,6 +23,8 @@ from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
 from napari.layers.utils._text_constants import Anchor
 from napari.layers.utils.color_encoding import ConstantColorEncoding
 from napari.layers.utils.color_manager import ColorProperties
+from napari.layers.utils.text_manager import TextManager
+from napari.settings import get_settings
 from napari.utils._test_utils import (
     validate_all_params_in_docstring,
     validate_docstring_parent_class_consistency,
@@ -975,6 +977,64 @@ def test_refresh_text():
     np.testing.assert_equal(layer.text.values, new_properties['point_type'])
 
 
+def test_text_culled_to_canvas_and_max_count():
+    """Test that only the text of the points near the canvas is displayed"""
+    data = np.stack([np.arange(100), np.arange(100)], axis=1)
+    features = {'score': np.arange(100) % 7}
+    layer = Points(
+        data,
+        features=features,
+        text={'string': '{score}', 'max_count': 3, 'priority': 'score'},
+    )
+    assert len(layer._view_text) == 3
+    np.testing.assert_array_equal(layer._view_text, ['6', '6', '6'])
+
+    layer.text.max_count = None
+    layer._update_draw(1, np.array([[10, 10], [19, 19]]), (100, 100))
+    # the window has a margin of half the visible region
+    coords = layer._view_text_coords[0]
+    np.testing.assert_array_equal(coords[:, 0], range(5, 25))
+    assert len(layer._view_text) == 20
+
+    # moving within the margin keeps the window
+    window = layer._text_window
+    layer._update_draw(1, np.array([[12, 12], [21, 21]]), (100, 100))
+    assert layer._text_window is window
+    layer._update_draw(1, np.array([[50, 50], [59, 59]]), (100, 100))
+    assert layer._text_window is not window
+
+    # selected points are displayed first
+    layer.text.max_count = 2
+    layer.selected_data = {50}
+    np.testing.assert_array_equal(layer._view_text, ['6', '1'])
+
+
+def test_text_positions_found_once_per_refresh(monkeypatch):
+    """Test that the text values, coordinates and colors share the positions
+    of the displayed text while it is refreshed."""
+    data = np.stack([np.arange(100), np.arange(100)], axis=1)
+    layer = Points(
+        data,
+        features={'score': np.arange(100)},
+        text={'string': '{score}', 'max_count': 3},
+    )
+    layer._update_draw(1, np.array([[10, 10], [19, 19]]), (100, 100))
+    calls = []
+    displayed_positions = TextManager._displayed_positions
+    monkeypatch.setattr(
+        TextManager,
+        '_displayed_positions',
+        lambda *args: calls.append(args) or displayed_positions(*args),
+    )
+
+    with layer._text_positions_cached():
+        assert len(layer._view_text) == 3
+        assert len(layer._view_text_coords[0]) == 3
+        layer._view_text_color
+    assert len(calls) == 1
+    assert layer._text_positions is None
+
+
 def test_points_errors():
     shape = (3, 2)
     np.random.seed(0)
@@ -2703,3 +2763,96 @@ def test_as_layer_data_tuple_read_deprecated_attr(key: str):
     _, attrs, _ = Points().as_layer_data_tuple()
     with pytest.warns(FutureWarning, match='is deprecated since'):
         attrs[key]
+
+
+@pytest.mark.parametrize('out_of_slice_display', [False, True])
+def test_spatial_index_matches_unindexed_slicing(out_of_slice_display):
+    rng = np.random.default_rng(0)
+    data = rng.uniform(0, 20, size=(200, 3))
+    size = rng.uniform(1, 4, size=200)
+    layer = Points(data, size=size, out_of_slice_display=out_of_slice_display)
+    expected = []
+    for z in (0, 5, 10.5, 19):
+        layer._slice_dims(Dims(ndim=3, point=(z, 0, 0)))
+        expected.append(
+            (layer._indices_view.copy(), np.copy(layer._view_size_scale))
+        )
+
+    get_settings().experimental.points_spatial_index = True
+    layer = Points(data, size=size, out_of_slice_display=out_of_slice_display)
+    for z, (indices, scale) in zip((0, 5, 10.5, 19), expected, strict=True):
+        layer._slice_dims(Dims(ndim=3, point=(z, 0, 0)))
+        np.testing.assert_array_equal(layer._indices_view, indices)
+        np.testing.assert_allclose(layer._view_size_scale, scale)
+
+
+def test_spatial_index_value_and_drag_box():
+    get_settings().experimental.points_spatial_index = True
+    data = np.array([[0, 1, 1], [0, 5, 5], [0, 5.5, 5.5], [1, 5, 5]])
+    layer = Points(data, size=2)
+    assert layer.get_value((0, 5, 5)) == 2
+    assert layer.get_value((0, 10, 10)) is None
+
+    layer._drag_box = np.array([[4, 4], [6, 6]])
+    np.testing.assert_array_equal(layer._points_in_drag_box(), [1, 2])
+
+
+def test_max_size_updated_on_size_add_and_remove():
+    layer = Points(np.array([[0, 1, 1], [1, 2, 2]]), size=[2, 4])
+    assert layer._max_size == 4
+
+    layer.size = [2, 3]
+    assert layer._max_size == 3
+    layer.current_size = 6
+    layer.add([0, 3, 3])
+    assert layer._max_size == 6
+    layer.selected_data = {2}
+    layer.current_size = 1
+    assert layer._max_size == 3
+    layer.selected_data = {1}
+    layer.remove_selected()
+    assert layer._max_size == 2
+    layer.data = np.empty((0, 3))
+    assert layer._max_size == 0
+
+
+def test_max_size_updated_on_refresh_after_in_place_edit():
+    layer = Points(np.array([[0, 1, 1], [1, 2, 2]]), size=[2, 4])
+    assert layer._max_size == 4
+    layer.size[0] = 8
+    layer.refresh()
+    assert layer._max_size == 8
+
+
+def test_move_does_not_edit_data_in_place():
+    data = np.array([[0, 1, 1], [0, 2, 2]], dtype=float)
+    layer = Points(data.copy())
+    old_data = layer.data
+    layer.selected_data = {1}
+    layer._move([1], [0, 3, 3])
+    layer._move([1], [0, 6, 6])
+    np.testing.assert_array_equal(old_data, data)
+    np.testing.assert_array_equal(layer.data[0], data[0])
+    assert not np.array_equal(layer.data[1], data[1])
+
+
+def test_spatial_index_updated_on_add_remove_and_move():
+    get_settings().experimental.points_spatial_index = True
+    layer = Points(np.array([[0, 1, 1], [1, 2, 2]]))
+    index = layer._get_points_index()
+    layer.add([0, 3, 3])
+    assert layer._points_index is not index
+    assert layer._points_index.data is layer.data
+    np.testing.assert_array_equal(layer._indices_view, [0, 2])
+
+    layer.selected_data = {0}
+    layer.remove_selected()
+    assert layer._points_index.data is layer.data
+    np.testing.assert_array_equal(layer._indices_view, [1])
+
+    layer.selected_data = {1}
+    layer._move([1], [0, 3, 3])
+    layer._move([1], [0, 6, 6])
+    np.testing.assert_array_equal(
+        layer._points_index.query_box([1, 2], [6, 6], [6, 6]), [1]
+    )
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from napari.layers.points._points_index import _PointsIndex
+
+
+def _brute_force_box(data, axes, low, high):
+    coords = data[:, axes]
+    inside = np.all((coords >= low) & (coords <= high), axis=1)
+    return np.where(inside)[0]
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 20, size=(500, 3)).astype(float)
+
+
+@pytest.mark.parametrize(
+    ('axes', 'low', 'high'),
+    [
+        ([0], [3], [3]),
+        ([0], [2.5], [5.5]),
+        ([1, 2], [4, 0], [10, 2]),
+        ([0, 1, 2], [0, 5, 5], [19, 6, 7]),
+        ([], [], []),
+    ],
+)
+def test_query_box(data, axes, low, high):
+    index = _PointsIndex(data)
+    np.testing.assert_array_equal(
+        index.query_box(axes, low, high),
+        _brute_force_box(data, axes, low, high),
+    )
+
+
+def test_inserted(data):
+    index = _PointsIndex(data[:400])
+    # sort along queried axes before inserting to update them incrementally
+    index.query_box([0, 2], [0, 0], [1, 1])
+    index = index.inserted(data)
+    assert index.data is data
+    assert set(index._sorted) == {0, 2}
+    np.testing.assert_array_equal(
+        index.query_box([0, 2], [5, 5], [8, 9]),
+        _brute_force_box(data, [0, 2], [5, 5], [8, 9]),
+    )
+
+
+def test_removed(data):
+    index = _PointsIndex(data)
+    index.query_box([0, 1], [0, 0], [1, 1])
+    removed = [0, 17, 18, 250, 499]
+    remaining = np.delete(data, removed, axis=0)
+    index = index.removed(removed, remaining)
+    np.testing.assert_array_equal(
+        index.query_box([0, 1], [5, 5], [8, 9]),
+        _brute_force_box(remaining, [0, 1], [5, 5], [8, 9]),
+    )
+
+
+def test_updated(data):
+    index = _PointsIndex(data)
+    index.query_box([1], [0], [1])
+    moved = [3, 4, 100]
+    data[moved, 1] += 7.5
+    index = index.updated(moved, data)
+    np.testing.assert_array_equal(
+        index.query_box([1], [7.5], [14]),
+        _brute_force_box(data, [1], [7.5], [14]),
+    )
@@ -1,6 +1,7 @@
 import numbers
 import warnings
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
 from copy import copy, deepcopy
 from itertools import cycle
 from typing import (
@@ -22,22 +23,26 @@ from napari.layers.base._base_mouse_bindings import (
     highlight_box_handles,
     transform_with_box,
 )
+from napari.layers.base._slice_cache import call_cached
 from napari.layers.points._points_constants import (
     Mode,
     PointsProjectionMode,
     Shading,
 )
+from napari.layers.points._points_index import _PointsIndex
 from napari.layers.points._points_mouse_bindings import add, highlight, select
 from napari.layers.points._points_utils import (
     _create_box_from_corners_3d,
     coerce_symbols,
     create_box,
     fix_data_points,
+    points_in_box,
     points_to_squares,
 )
 from napari.layers.points._slice import _PointSliceRequest, _PointSliceResponse
 from napari.layers.utils._color_manager_constants import ColorMode
 from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
+from napari.layers.utils._text_utils import get_text_window
 from napari.layers.utils.color_manager import ColorManager
 from napari.layers.utils.color_transformations import ColorType
 from napari.layers.utils.interactivity_utils import (
@@ -49,6 +54,7 @@ from napari.layers.utils.layer_utils import (
     _unique_element,
 )
 from napari.layers.utils.text_manager import TextManager
+from napari.settings import get_settings
 from napari.utils.colormaps import Colormap, ValidColormapArg
 from napari.utils.colormaps.standardize_color import hex_to_name, rgb_to_hex
 from napari.utils.events import Event
@@ -458,6 +464,10 @@ class Points(Layer):
         # initialize view data
         self.__indices_view = np.empty(0, int)
         self._view_size_scale = []
+        # window of data coordinates in which text is displayed in 2D
+        self._text_window: np.ndarray | None = None
+        # positions of the displayed text, while a text refresh reads it
+        self._text_positions: np.ndarray | None = None
 
         self._drag_box = None
         self._drag_box_stored = None
@@ -501,6 +511,7 @@ class Points(Layer):
             out_of_slice_display=Event,
             n_dimensional=Event,
             highlight=Event,
+            _view_text=Event,
             shading=Event,
             antialiasing=Event,
             canvas_size_limits=Event,
@@ -532,6 +543,8 @@ class Points(Layer):
 
         # Save the point coordinates
         self._data = np.asarray(data)
+        # Spatial index of the coordinates, see _get_points_index.
+        self._points_index: _PointsIndex | None = None
 
         self._feature_table = _FeatureTable.from_layer(
             features=features,
@@ -548,6 +561,8 @@ class Points(Layer):
 
         self._border_width_is_relative = False
         self._shown = np.empty(0).astype(bool)
+        # Data version and largest point size at that version, see _max_size.
+        self._max_size_cache: tuple[int, float] | None = None
 
         # Indices of selected points
         self._selected_data: Selection[int] = Selection()
@@ -666,6 +681,8 @@ class Points(Layer):
             kwargs['action'] = ActionType.REMOVING
 
         self.events.data(**kwargs)
+        # the data may have been modified in place, so always reindex it
+        self._points_index = None
         self._set_data(data)
         kwargs['data_indices'] = tuple(i for i in range(len(self.data)))
         kwargs['value'] = self.data
@@ -692,7 +709,7 @@ class Points(Layer):
             self._face.events.blocker_all(),
         ):
             self._feature_table.resize(len(data))
-            self.text.apply(self.features)
+            self.text.apply(self._feature_table.view)
             if len(data) < cur_npoints:
                 # If there are now fewer points, remove the size and colors of the
                 # extra ones
@@ -706,6 +723,7 @@ class Points(Layer):
                     )
                 self._shown = self._shown[: len(data)]
                 self._size = self._size[: len(data)]
+                self._max_size_cache = None
                 self._border_width = self._border_width[: len(data)]
                 self._symbol = self._symbol[: len(data)]
 
@@ -915,7 +933,7 @@ class Points(Layer):
         if len(self.size) == 0:
             return extent
 
-        max_point_size = np.max(self.size)
+        max_point_size = self._max_size
         extent[0] -= max_point_size / 2
         extent[1] += max_point_size / 2
         return extent
@@ -1015,9 +1033,25 @@ class Points(Layer):
                     category=DeprecationWarning,
                     stacklevel=2,
                 )
+        self._max_size_cache = None
         # TODO: technically not needed to cleat the non-augmented extent... maybe it's fine like this to avoid complexity
         self.refresh(highlight=False)
 
+    @property
+    def _max_size(self) -> float:
+        """Size of the largest point, or 0 if there are none.
+
+        This is cached until the sizes are set, points are added or removed,
+        or the layer is refreshed, since it is used on every mouse move. Like
+        the displayed sizes, in-place edits of ``size`` are taken into account
+        once the layer is refreshed.
+        """
+        cache = self._max_size_cache
+        if cache is None or cache[0] != self._data_version:
+            max_size = float(np.max(self._size)) if len(self._size) else 0.0
+            cache = self._max_size_cache = (self._data_version, max_size)
+        return cache[1]
+
     @property
     def current_size(self) -> int | float:
         """float: size of marker for the next added point."""
@@ -1055,6 +1089,7 @@ class Points(Layer):
         if self._update_properties and len(self.selected_data) > 0:
             idx = np.fromiter(self.selected_data, dtype=int)
             self.size[idx] = size
+            self._max_size_cache = None
             # TODO: also here technically no need to clear base extent
             self.refresh(highlight=False)
             self.events.size()
@@ -1504,6 +1539,9 @@ class Points(Layer):
                 return_indices=True,
             )[2]
         )
+        if self.text.max_count is not None:
+            # the text of the selected points is displayed first
+            self.events._view_text()
 
         # Update properties based on selected points
         if not len(self._selected_data):
@@ -1637,8 +1675,48 @@ class Points(Layer):
         """
         # This may be triggered when the string encoding instance changed,
         # in which case it has no cached values, so generate them here.
-        self.text.string._apply(self.features)
-        return self.text.view_text(self._indices_view)
+        self.text.string._apply(self._feature_table.view)
+        return self.text.view_text(
+            self._indices_view[self._view_text_positions]
+        )
+
+    @contextmanager
+    def _text_positions_cached(self) -> Iterator[None]:
+        """Find the positions of the displayed text once, while its values,
+        coordinates and colors are read to refresh it.
+        """
+        self._text_positions = self._view_text_positions
+        try:
+            yield
+        finally:
+            self._text_positions = None
+
+    @property
+    def _view_text_positions(self) -> np.ndarray:
+        """Positions in the view of the points whose text is displayed.
+
+        In 2D, only the text of the points in the text window is displayed,
+        and the text manager may limit the number of displayed text elements.
+        """
+        if self._text_positions is not None:
+            return self._text_positions
+        in_window = None
+        if self._text_window is not None:
+            displayed = list(self._slice_input.displayed)
+            low, high = self._text_window[:, displayed]
+            in_window = self._view_indices_near(low, high)
+            coords = self.data[
+                np.ix_(self._indices_view[in_window], displayed)
+            ]
+            in_window = in_window[
+                np.all((coords >= low) & (coords <= high), axis=1)
+            ]
+        return self.text._displayed_positions(
+            self._indices_view,
+            in_window,
+            self.selected_data,
+            self._feature_table.view,
+        )
 
     @property
     def _view_text_coords(self) -> tuple[np.ndarray, str, str]:
@@ -1654,7 +1732,7 @@ class Points(Layer):
             The vispy text anchor for the y axis
         """
         return self.text.compute_text_coords(
-            self._view_data,
+            self._view_data[self._view_text_positions],
             self._slice_input.ndisplay,
             self._slice_input.order,
         )
@@ -1662,8 +1740,10 @@ class Points(Layer):
     @property
     def _view_text_color(self) -> np.ndarray:
         """Get the colors of the text elements at the given indices."""
-        self.text.color._apply(self.features)
-        return self.text._view_color(self._indices_view)
+        self.text.color._apply(self._feature_table.view)
+        return self.text._view_color(
+            self._indices_view[self._view_text_positions]
+        )
 
     @property
     def _view_size(self) -> np.ndarray:
@@ -1747,6 +1827,20 @@ class Points(Layer):
         )
         # update highlight only if scale has changed, otherwise causes a cycle
         self._set_highlight(force=(prev_scale != self.scale_factor))
+        self._update_text_window()
+
+    def _update_text_window(self) -> None:
+        """Update the window in which text is displayed as the camera moves."""
+        window = None
+        if self._slice_input.ndisplay == 2 and self.text.visible:
+            window = get_text_window(
+                self._text_window,
+                self.corner_pixels,
+                list(self._slice_input.displayed),
+            )
+        if window is not self._text_window:
+            self._text_window = window
+            self.events._view_text()
 
     def _get_value(self, position) -> int | None:
         """Index of the point at a given 2D position in data coordinates.
@@ -1762,23 +1856,28 @@ class Points(Layer):
             Index of point that is at the current coordinate if any.
         """
         # Display points if there are any in this slice
-        view_data = self._view_data
         selection = None
-        if len(view_data) > 0:
-            displayed_position = [
-                position[i] for i in self._slice_input.displayed
-            ]
+        if len(self._indices_view) > 0:
+            displayed = list(self._slice_input.displayed)
+            displayed_position = np.array([position[i] for i in displayed])
             # positions are scaled anisotropically by scale, but sizes are not,
             # so we need to calculate the ratio to correctly map to screen coordinates
-            scale_ratio = (
-                self.scale[self._slice_input.displayed] / self.scale[-1]
+            scale_ratio = self.scale[displayed] / self.scale[-1]
+            # Only check the points in view near the position when indexed
+            view_indices = self._view_indices_near(
+                displayed_position - self._max_size / scale_ratio / 2,
+                displayed_position + self._max_size / scale_ratio / 2,
             )
+            view_data = self.data[
+                np.ix_(self._indices_view[view_indices], displayed)
+            ]
             # Get the point sizes
             # TODO: calculate distance in canvas space to account for canvas_size_limits.
             # Without this implementation, point hover and selection (and anything depending
             # on self.get_value()) won't be aware of the real extent of points, causing
             # unexpected behaviour. See #3734 for details.
-            sizes = np.expand_dims(self._view_size, axis=1) / scale_ratio / 2
+            view_size = self._view_size_at(view_indices)
+            sizes = np.expand_dims(view_size, axis=1) / scale_ratio / 2
             distances = abs(view_data - displayed_position)
             in_slice_matches = np.all(
                 distances <= sizes,
@@ -1786,10 +1885,76 @@ class Points(Layer):
             )
             indices = np.where(in_slice_matches)[0]
             if len(indices) > 0:
-                selection = self._indices_view[indices[-1]]
+                selection = self._indices_view[view_indices[indices[-1]]]
 
         return selection
 
+    def _get_points_index(self) -> _PointsIndex | None:
+        """Get the spatial index of the data, or None if it is disabled.
+
+        The index is only used when the ``points_spatial_index`` experimental
+        setting is enabled. It is created lazily for the current data array
+        and updated incrementally when points are added, removed or moved.
+        """
+        if not get_settings().experimental.points_spatial_index:
+            return None
+        if (
+            self._points_index is None
+            or self._points_index.data is not self._data
+        ):
+            self._points_index = _PointsIndex(self._data)
+        return self._points_index
+
+    def _view_indices_near(
+        self, low: npt.ArrayLike, high: npt.ArrayLike
+    ) -> npt.NDArray:
+        """Positions in the view of the points that may be inside a 2D box.
+
+        When the data is indexed, these are the points in view within the
+        given bounds along the displayed dimensions. Otherwise, these are all
+        the points in view.
+        """
+        points_index = self._get_points_index()
+        if points_index is None:
+            return np.arange(len(self._indices_view))
+        candidates = points_index.query_box(
+            self._slice_input.displayed, low, high
+        )
+        # both are sorted, so the candidates can be found in the view by
+        # binary search
+        positions = np.searchsorted(self._indices_view, candidates)
+        found = positions < len(self._indices_view)
+        positions, candidates = positions[found], candidates[found]
+        return positions[self._indices_view[positions] == candidates]
+
+    def _view_size_at(self, view_indices: npt.NDArray) -> npt.NDArray:
+        """Sizes of the points at the given positions in the view."""
+        scale = self._view_size_scale
+        if isinstance(scale, np.ndarray):
+            scale = scale[view_indices]
+        return self.size[self._indices_view[view_indices]] * scale
+
+    def _points_in_drag_box(self) -> npt.NDArray:
+        """Positions in the view of the points in the 2D drag box."""
+        if self._drag_box is None or len(self._indices_view) == 0:
+            return np.empty(0, dtype=int)
+        # points are inside when a corner of their square is in the box
+        pad = self._max_size / 2
+        view_indices = self._view_indices_near(
+            np.min(self._drag_box, axis=0) - pad,
+            np.max(self._drag_box, axis=0) + pad,
+        )
+        view_data = self.data[
+            np.ix_(
+                self._indices_view[view_indices],
+                self._slice_input.displayed,
+            )
+        ]
+        inside = points_in_box(
+            self._drag_box, view_data, self._view_size_at(view_indices)
+        )
+        return view_indices[np.asarray(inside, dtype=int)]
+
     def _get_value_3d(
         self,
         start_point: np.ndarray,
@@ -1925,7 +2090,7 @@ class Points(Layer):
         request = self._make_slice_request_internal(
             self._slice_input, self._data_slice
         )
-        response = request()
+        response = call_cached(self, request)
         self._update_slice_response(response)
 
     def _make_slice_request(self, dims: 'Dims') -> _PointSliceRequest:
@@ -1946,6 +2111,8 @@ class Points(Layer):
             projection_mode=self.projection_mode,
             out_of_slice_display=self.out_of_slice_display,
             size=self.size,
+            max_size=self._max_size,
+            points_index=self._get_points_index(),
         )
 
     def _update_slice_response(self, response: _PointSliceResponse) -> None:
@@ -2105,7 +2272,10 @@ class Points(Layer):
             data_indices=(-1,),
             vertex_indices=((),),
         )
-        self._set_data(np.append(self.data, np.atleast_2d(coords), axis=0))
+        data = np.append(self.data, np.atleast_2d(coords), axis=0)
+        if self._points_index is not None:
+            self._points_index = self._points_index.inserted(data)
+        self._set_data(data)
         self.events.data(
             value=self.data,
             action=ActionType.ADDED,
@@ -2129,6 +2299,7 @@ class Points(Layer):
             )
             self._shown = np.delete(self._shown, index, axis=0)
             self._size = np.delete(self._size, index, axis=0)
+            self._max_size_cache = None
             self._symbol = np.delete(self._symbol, index, axis=0)
             self._border_width = np.delete(self._border_width, index, axis=0)
             with self._border.events.blocker_all():
@@ -2148,7 +2319,10 @@ class Points(Layer):
                     self._value -= offset
                     self._value_stored -= offset
 
-            self._set_data(np.delete(self.data, index, axis=0))
+            data = np.delete(self.data, index, axis=0)
+            if self._points_index is not None:
+                self._points_index = self._points_index.removed(index, data)
+            self._set_data(data)
             self.events.data(
                 value=self.data,
                 action=ActionType.REMOVED,
@@ -2179,9 +2353,17 @@ class Points(Layer):
             self._set_drag_start(selection_indices, position)
             center = self.data[np.ix_(selection_indices, disp)].mean(axis=0)
             shift = np.array(position)[disp] - center - self._drag_start
-            self.data[np.ix_(selection_indices, disp)] = (
-                self.data[np.ix_(selection_indices, disp)] + shift
+            # the data may be shared with slice requests that are in flight,
+            # so the moved points are written to a copy
+            data = self._data.copy()
+            data[np.ix_(selection_indices, disp)] = (
+                data[np.ix_(selection_indices, disp)] + shift
             )
+            if self._points_index is not None:
+                self._points_index = self._points_index.updated(
+                    selection_indices, data
+                )
+            self._data = data
             self.refresh()
             self.events.data(
                 value=self.data,
@@ -2232,12 +2414,15 @@ class Points(Layer):
             ]
             data[:, not_disp] = data[:, not_disp] + np.array(offset)
             self._data = np.append(self.data, data, axis=0)
+            if self._points_index is not None:
+                self._points_index = self._points_index.inserted(self._data)
             self._shown = np.append(
                 self.shown, deepcopy(self._clipboard['shown']), axis=0
             )
             self._size = np.append(
                 self.size, deepcopy(self._clipboard['size']), axis=0
             )
+            self._max_size_cache = None
             self._symbol = np.append(
                 self.symbol, deepcopy(self._clipboard['symbol']), axis=0
             )
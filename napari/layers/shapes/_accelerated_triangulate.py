@@ -461,8 +461,9 @@ def _cut_end_if_repetition(path: np.ndarray) -> np.ndarray:
     return path_
 
 
-# Note: removing this decorator will double execution time.
-@njit(cache=True)
+# Note: removing this decorator will double execution time. Releasing the
+# GIL lets shapes be triangulated concurrently by several threads.
+@njit(cache=True, nogil=True)
 def generate_2D_edge_meshes(
     path: np.ndarray,
     closed: bool = False,
@@ -553,7 +554,7 @@ def generate_2D_edge_meshes(
     return centers, offsets, triangles
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def remove_path_duplicates(path: np.ndarray, closed: bool) -> np.ndarray:
     """Remove consecutive duplicates from a path.
 
@@ -601,7 +602,7 @@ def remove_path_duplicates(path: np.ndarray, closed: bool) -> np.ndarray:
     return new_path
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def create_box_from_bounding(bounding_box: np.ndarray) -> np.ndarray:
     """Creates the axis aligned interaction box of a bounding box
 
@@ -9,8 +9,10 @@ import numpy.typing as npt
 
 from napari.layers.shapes._mesh import Mesh
 from napari.layers.shapes._shapes_constants import ShapeType, shape_classes
+from napari.layers.shapes._shapes_index import _ShapesIndex
 from napari.layers.shapes._shapes_models import Line, Path, Shape
 from napari.layers.shapes._shapes_utils import triangles_intersect_box
+from napari.layers.shapes._slice import _ShapeListArrays, _ShapesView
 from napari.utils.geometry import (
     inside_triangles,
     intersect_line_with_triangles,
@@ -19,6 +21,147 @@ from napari.utils.geometry import (
 from napari.utils.translations import trans
 
 
+def _append_rows(array: npt.NDArray, rows: npt.NDArray) -> npt.NDArray:
+    """Append rows to a per-shape array, whose trailing shape may be unknown
+    while it is empty."""
+    if len(array) == 0:
+        return np.array(rows, dtype=float)
+    return np.concatenate((array, rows), axis=0)
+
+
+class _MeshBlocks(typing.NamedTuple):
+    """Mesh and displayed vertices of consecutive shapes.
+
+    The mesh of each shape is made of two blocks, its face followed by its
+    edge, so block 2 * i + 1 is the edge of the i-th shape.
+    """
+
+    vertices: npt.NDArray
+    centers: npt.NDArray
+    offsets: npt.NDArray
+    # relative to the first vertex of the first block
+    triangles: npt.NDArray
+    block_n_vertices: npt.NDArray
+    block_n_triangles: npt.NDArray
+    block_colors: npt.NDArray
+    data: npt.NDArray
+    n_data: npt.NDArray
+
+
+def _mesh_blocks(
+    shapes: Sequence[Shape],
+    face_colors: npt.NDArray,
+    edge_colors: npt.NDArray,
+    ndisplay: int,
+) -> _MeshBlocks:
+    """Assemble the mesh blocks of shapes in arrays allocated once."""
+    n_shapes = len(shapes)
+    # Block sizes give the rows of every mesh array up front, which are
+    # then allocated once and filled in place.
+    block_n_vertices = np.empty(2 * n_shapes, dtype=np.intp)
+    block_n_vertices[0::2] = [len(s._face_vertices) for s in shapes]
+    block_n_vertices[1::2] = [len(s._edge_vertices) for s in shapes]
+    block_n_triangles = np.empty(2 * n_shapes, dtype=np.intp)
+    block_n_triangles[0::2] = [len(s._face_triangles) for s in shapes]
+    block_n_triangles[1::2] = [len(s._edge_triangles) for s in shapes]
+    vertex_stops = np.cumsum(block_n_vertices)
+    vertex_starts = vertex_stops - block_n_vertices
+    triangle_stops = np.cumsum(block_n_triangles)
+    triangle_starts = triangle_stops - block_n_triangles
+
+    n_vertices = int(block_n_vertices.sum())
+    centers = np.empty((n_vertices, ndisplay))
+    offsets = np.zeros((n_vertices, ndisplay))
+    triangles = np.empty(
+        (int(block_n_triangles.sum()), 3),
+        dtype=np.result_type(
+            np.uint32,
+            *{s._face_triangles.dtype for s in shapes},
+            *{s._edge_triangles.dtype for s in shapes},
+        ),
+    )
+    for i, shape in enumerate(shapes):
+        face, edge = 2 * i, 2 * i + 1
+        centers[vertex_starts[face] : vertex_stops[face]] = (
+            shape._face_vertices
+        )
+        centers[vertex_starts[edge] : vertex_stops[edge]] = (
+            shape._edge_vertices
+        )
+        offsets[vertex_starts[edge] : vertex_stops[edge]] = shape._edge_offsets
+        triangles[triangle_starts[face] : triangle_stops[face]] = (
+            shape._face_triangles
+        )
+        triangles[triangle_starts[edge] : triangle_stops[edge]] = (
+            shape._edge_triangles
+        )
+
+    # Shift the triangles of each block to the position of its vertices.
+    triangles += np.repeat(vertex_starts, block_n_triangles)[
+        :, np.newaxis
+    ].astype(triangles.dtype)
+
+    edge_widths = np.zeros(2 * n_shapes)
+    edge_widths[1::2] = [s.edge_width for s in shapes]
+    vertices = centers + (
+        np.repeat(edge_widths, block_n_vertices)[:, np.newaxis] * offsets
+    )
+    block_colors = np.empty((2 * n_shapes, 4))
+    block_colors[0::2] = face_colors
+    block_colors[1::2] = edge_colors
+    if n_shapes:
+        data = np.concatenate([s.data_displayed for s in shapes])
+    else:
+        data = np.empty((0, ndisplay))
+    return _MeshBlocks(
+        vertices=vertices,
+        centers=centers,
+        offsets=offsets,
+        triangles=triangles,
+        block_n_vertices=block_n_vertices,
+        block_n_triangles=block_n_triangles,
+        block_colors=block_colors,
+        data=data,
+        n_data=np.array([len(s.data) for s in shapes], dtype=np.intp),
+    )
+
+
+def _empty_mesh_blocks(n_shapes: int, ndisplay: int) -> _MeshBlocks:
+    """Mesh blocks of shapes without any vertex or triangle."""
+    return _MeshBlocks(
+        vertices=np.empty((0, ndisplay)),
+        centers=np.empty((0, ndisplay)),
+        offsets=np.empty((0, ndisplay)),
+        triangles=np.empty((0, 3), dtype=np.uint32),
+        block_n_vertices=np.zeros(2 * n_shapes, dtype=np.intp),
+        block_n_triangles=np.zeros(2 * n_shapes, dtype=np.intp),
+        block_colors=np.zeros((2 * n_shapes, 4)),
+        data=np.empty((0, ndisplay)),
+        n_data=np.zeros(n_shapes, dtype=np.intp),
+    )
+
+
+def _splice_rows(
+    array: npt.NDArray, start: int, stop: int, rows: npt.NDArray
+) -> npt.NDArray:
+    """Replace rows start to stop of an array, returning a new array."""
+    return np.concatenate((array[:start], rows, array[stop:]), axis=0)
+
+
+def _offsets(counts: npt.NDArray) -> npt.NDArray:
+    """Start offsets of consecutive ranges of given sizes, and their end."""
+    offsets = np.zeros(len(counts) + 1, dtype=np.intp)
+    np.cumsum(counts, out=offsets[1:])
+    return offsets
+
+
+def _ranges(starts: npt.NDArray, stops: npt.NDArray) -> npt.NDArray:
+    """Concatenation of the ranges from starts to stops."""
+    counts = stops - starts
+    first = np.cumsum(counts) - counts
+    return np.repeat(starts - first, counts) + np.arange(counts.sum())
+
+
 def _batch_dec(meth):
     """
     Decorator to apply `self.batched_updates` to the current method.
@@ -74,14 +217,35 @@ class ShapeList:
     _index : np.ndarray
         Length M array with the index (0, ..., N-1) of each shape that each
         vertex corresponds to
+    _vertex_offsets : np.ndarray
+        Length N+1 array such that the vertices of shape i are the rows
+        ``_vertex_offsets[i]`` to ``_vertex_offsets[i + 1]`` of `_vertices`.
+    _mesh_vertex_offsets, _mesh_triangle_offsets : np.ndarray
+        Length 2N+1 arrays giving the rows of the mesh vertices and triangles
+        of each mesh block in the same way. The mesh of shape i is made of
+        block 2i for its face followed by block 2i+1 for its edge, so editing
+        or removing a shape only replaces its own rows.
     _z_index : np.ndarray
         Length N array with z_index of each shape
     _z_order : np.ndarray
         Length N array with z_order of each shape. This must be a permutation
         of (0, ..., N-1).
+    _slice_keys : np.ndarray
+        (N, 2, P) array with the slice key of each shape, kept in sync with
+        the shapes so that slicing does not visit every shape object.
+    _bboxes : np.ndarray
+        (N, 2, ndisplay) array with the displayed bounding box of each shape,
+        including its edge width.
+    _shared : set of str
+        Names of the arrays shared with slice requests, which are copied
+        before they are next edited in place.
     _mesh : Mesh
         Mesh object containing all the mesh information that will ultimately
         be rendered.
+    version : int
+        Incremented whenever the shapes or their mesh change, but not when
+        only the slice changes, so that slices computed from their arrays
+        off the main thread can be checked to still apply.
     """
 
     def __init__(
@@ -95,8 +259,15 @@ class ShapeList:
         self.displayed_index = np.array([])
         self._vertices = np.empty((0, self.ndisplay))
         self._index = np.empty((0), dtype=int)
+        self._vertex_offsets = np.zeros(1, dtype=np.intp)
+        self._mesh_vertex_offsets = np.zeros(1, dtype=np.intp)
+        self._mesh_triangle_offsets = np.zeros(1, dtype=np.intp)
         self._z_index = np.empty((0), dtype=int)
         self._z_order = np.empty((0), dtype=int)
+        self._slice_keys = np.empty((0, 2, 0))
+        self._bboxes = np.empty((0, 2, self.ndisplay))
+        self.version = 0
+        self._shared: set[str] = set()
 
         self._mesh = Mesh(ndisplay=self.ndisplay)
 
@@ -166,19 +337,15 @@ class ShapeList:
 
         self._ndisplay = ndisplay
         self._mesh.ndisplay = self.ndisplay
-        self._vertices = np.empty((0, self.ndisplay))
-        self._index = np.empty((0), dtype=int)
-        for index in range(len(self.shapes)):
-            shape = self.shapes[index]
+        for shape in self.shapes:
             shape.ndisplay = self.ndisplay
-            self.remove(index, renumber=False)
-            self.add(shape, shape_index=index)
+        self._rebuild()
         self._update_z_order()
 
     @property
     def slice_keys(self) -> npt.NDArray:
         """(N, 2, P) array: slice key for each shape."""
-        return np.array([s.slice_key for s in self.shapes])
+        return self._slice_keys
 
     @property
     def shape_types(self) -> list[str]:
@@ -242,7 +409,7 @@ class ShapeList:
     @property
     def z_indices(self) -> list[int]:
         """list of int: z-index for each shape."""
-        return [s.z_index for s in self.shapes]
+        return self._z_index.tolist()
 
     @property
     def slice_key(self):
@@ -271,37 +438,59 @@ class ShapeList:
             self.__update_displayed_called += 1
             return
 
-        # The list slice key is repeated to check against both the min and
-        # max values stored in the shapes slice key.
-        slice_key = np.array([self.slice_key, self.slice_key])
+        self._set_displayed(
+            self._slice_arrays().slice(np.asarray(self.slice_key))
+        )
 
-        # Slice key must exactly match mins and maxs of shape as then the
-        # shape is entirely contained within the current slice.
-        if len(self.shapes) > 0:
-            self._displayed = np.all(
-                np.abs(self.slice_keys - slice_key) < 0.5, axis=(1, 2)
-            )
-        else:
-            self._displayed = np.array([])
-        disp_indices = np.where(self._displayed)[0]
+    def _slice_arrays(self, share: bool = False) -> _ShapeListArrays:
+        """The arrays needed to slice this list.
 
-        z_order = self._mesh.triangles_z_order
-        disp_tri = np.isin(
-            self._mesh.triangles_index[z_order, 0], disp_indices
+        Parameters
+        ----------
+        share : bool
+            If True, the arrays are to be used off the main thread, so the
+            ones this list edits in place are copied before their next edit.
+        """
+        if share:
+            self._shared.update(
+                ('_slice_keys', '_vertices', 'triangles_colors')
+            )
+        return _ShapeListArrays(
+            slice_keys=self._slice_keys,
+            triangles=self._mesh.triangles,
+            triangles_index=self._mesh.triangles_index,
+            triangles_colors=self._mesh.triangles_colors,
+            triangles_z_order=self._mesh.triangles_z_order,
+            vertices=self._vertices,
+            vertices_index=self._index,
         )
-        self._mesh.displayed_triangles = self._mesh.triangles[z_order][
-            disp_tri
-        ]
-        self._mesh.displayed_triangles_index = self._mesh.triangles_index[
-            z_order
-        ][disp_tri]
-        self._mesh.displayed_triangles_colors = self._mesh.triangles_colors[
-            z_order
-        ][disp_tri]
 
-        disp_vert = np.isin(self._index, disp_indices)
-        self.displayed_vertices = self._vertices[disp_vert]
-        self.displayed_index = self._index[disp_vert]
+    def _unshare(self, name: str) -> None:
+        """Copy an array shared with slice requests before editing it."""
+        if name in self._shared:
+            self._shared.discard(name)
+            owner = self._mesh if name == 'triangles_colors' else self
+            setattr(owner, name, getattr(owner, name).copy())
+
+    def _set_displayed(self, view: _ShapesView) -> None:
+        """Set the displayed data from the shapes, triangles and vertices
+        in the current slice.
+        """
+        self._displayed = view.displayed
+        self.__dict__.pop('_displayed_index', None)
+        self._mesh.displayed_triangles = view.displayed_triangles
+        self._mesh.displayed_triangles_index = view.displayed_triangles_index
+        self._mesh.displayed_triangles_colors = view.displayed_triangles_colors
+        self.displayed_vertices = view.displayed_vertices
+        self.displayed_index = view.displayed_index
+
+    def _set_sliced(self, slice_key: npt.NDArray, view: _ShapesView) -> None:
+        """Set the slice key along with its displayed data, as found from
+        the arrays of this list with its current `version`.
+        """
+        self._slice_key = list(slice_key)
+        self._clear_cache()
+        self._set_displayed(view)
 
     def add(
         self,
@@ -401,102 +590,38 @@ class ShapeList:
             )
 
         if shape_index is None:
-            shape_index = len(self.shapes)
-            self.shapes.append(shape)
-            self._z_index = np.append(self._z_index, shape.z_index)
-
             if face_color is None:
                 face_color = np.array([1, 1, 1, 1])
-            self._face_color = np.vstack([self._face_color, face_color])
             if edge_color is None:
                 edge_color = np.array([0, 0, 0, 1])
-            self._edge_color = np.vstack([self._edge_color, edge_color])
-        else:
-            z_refresh = False
-            self.shapes[shape_index] = shape
-            self._z_index[shape_index] = shape.z_index
-
-            if face_color is None:
-                face_color = self._face_color[shape_index]
-            else:
-                self._face_color[shape_index, :] = face_color
-            if edge_color is None:
-                edge_color = self._edge_color[shape_index]
-            else:
-                self._edge_color[shape_index, :] = edge_color
-
-        self._vertices = np.append(
-            self._vertices, shape.data_displayed, axis=0
-        )
-        index = np.repeat(shape_index, len(shape.data))
-        self._index = np.append(self._index, index, axis=0)
-
-        # Add faces to mesh
-        m = len(self._mesh.vertices)
-        vertices = shape._face_vertices
-        self._mesh.vertices = np.append(self._mesh.vertices, vertices, axis=0)
-        vertices = shape._face_vertices
-        self._mesh.vertices_centers = np.append(
-            self._mesh.vertices_centers, vertices, axis=0
-        )
-        vertices = np.zeros(shape._face_vertices.shape)
-        self._mesh.vertices_offsets = np.append(
-            self._mesh.vertices_offsets, vertices, axis=0
-        )
-        index = np.repeat([[shape_index, 0]], len(vertices), axis=0)
-        self._mesh.vertices_index = np.append(
-            self._mesh.vertices_index, index, axis=0
-        )
-
-        triangles = shape._face_triangles + m
-        self._mesh.triangles = np.append(
-            self._mesh.triangles, triangles, axis=0
-        )
-        index = np.repeat([[shape_index, 0]], len(triangles), axis=0)
-        self._mesh.triangles_index = np.append(
-            self._mesh.triangles_index, index, axis=0
-        )
-        color_array = np.repeat([face_color], len(triangles), axis=0)
-        self._mesh.triangles_colors = np.append(
-            self._mesh.triangles_colors, color_array, axis=0
-        )
-
-        # Add edges to mesh
-        m = len(self._mesh.vertices)
-        vertices = (
-            shape._edge_vertices + shape.edge_width * shape._edge_offsets
-        )
-        self._mesh.vertices = np.append(self._mesh.vertices, vertices, axis=0)
-        vertices = shape._edge_vertices
-        self._mesh.vertices_centers = np.append(
-            self._mesh.vertices_centers, vertices, axis=0
-        )
-        vertices = shape._edge_offsets
-        self._mesh.vertices_offsets = np.append(
-            self._mesh.vertices_offsets, vertices, axis=0
-        )
-        index = np.repeat([[shape_index, 1]], len(vertices), axis=0)
-        self._mesh.vertices_index = np.append(
-            self._mesh.vertices_index, index, axis=0
-        )
+            self._add_multiple_shapes(
+                [shape], [face_color], [edge_color], z_refresh=z_refresh
+            )
+            return
 
-        triangles = shape._edge_triangles + m
-        self._mesh.triangles = np.append(
-            self._mesh.triangles, triangles, axis=0
-        )
-        index = np.repeat([[shape_index, 1]], len(triangles), axis=0)
-        self._mesh.triangles_index = np.append(
-            self._mesh.triangles_index, index, axis=0
-        )
-        color_array = np.repeat([edge_color], len(triangles), axis=0)
-        self._mesh.triangles_colors = np.append(
-            self._mesh.triangles_colors, color_array, axis=0
+        self.shapes[shape_index] = shape
+        self._z_index[shape_index] = shape.z_index
+        self._unshare('_slice_keys')
+        self._slice_keys[shape_index] = shape.slice_key
+        self._bboxes[shape_index] = shape.bounding_box
+        if face_color is not None:
+            self._face_color[shape_index, :] = face_color
+        if edge_color is not None:
+            self._edge_color[shape_index, :] = edge_color
+
+        # z_refresh is ignored, the triangles z order is updated by the
+        # caller once it is done replacing shapes.
+        self._splice(
+            shape_index,
+            shape_index + 1,
+            _mesh_blocks(
+                [shape],
+                self._face_color[shape_index],
+                self._edge_color[shape_index],
+                self.ndisplay,
+            ),
         )
-
-        if z_refresh:
-            # Set z_order
-            self._update_z_order()
-        self._clear_cache()
+        self._data_changed()
 
     def _add_multiple_shapes(
         self,
@@ -520,43 +645,21 @@ class ShapeList:
             as the z indices will not change.
             When adding a batch of shapes, set to false  and then call
             ShapesList._update_z_order() once at the end.
-
-        TODO: Currently shares a lot of code with `add()`, with the
-        difference being that `add()` supports inserting shapes at a specific
-        `shape_index`, whereas `add_multiple` will append them as a full batch
         """
-
-        def _make_index(length, shape_index, cval=0):
-            """Same but faster than `np.repeat([[shape_index, cval]], length, axis=0)`"""
-            index = np.empty((length, 2), np.int32)
-            index.fill(cval)
-            index[:, 0] = shape_index
-            return index
-
-        all_z_index = []
-        all_vertices = []
-        all_index = []
-        all_mesh_vertices = []
-        all_mesh_vertices_centers = []
-        all_mesh_vertices_offsets = []
-        all_mesh_vertices_index = []
-        all_mesh_triangles = []
-        all_mesh_triangles_index = []
-        all_mesh_triangles_colors = []
-
-        m_mesh_vertices_count = len(self._mesh.vertices)
+        shapes = list(shapes)
+        n_shapes = len(shapes)
 
         if face_colors is None:
-            face_colors = np.tile(np.array([1, 1, 1, 1]), (len(shapes), 1))
+            face_colors = np.tile(np.array([1, 1, 1, 1]), (n_shapes, 1))
         else:
             face_colors = np.asarray(face_colors)
 
         if edge_colors is None:
-            edge_colors = np.tile(np.array([0, 0, 0, 1]), (len(shapes), 1))
+            edge_colors = np.tile(np.array([0, 0, 0, 1]), (n_shapes, 1))
         else:
             edge_colors = np.asarray(edge_colors)
 
-        if not len(face_colors) == len(edge_colors) == len(shapes):
+        if not len(face_colors) == len(edge_colors) == n_shapes:
             raise ValueError(
                 trans._(
                     'shapes, face_colors, and edge_colors must be the same length',
@@ -572,95 +675,167 @@ class ShapeList:
                 )
             )
 
-        for shape, face_color, edge_color in zip(
-            shapes, face_colors, edge_colors, strict=False
-        ):
-            shape_index = len(self.shapes)
-            self.shapes.append(shape)
-            all_z_index.append(shape.z_index)
-            all_vertices.append(shape.data_displayed)
-            all_index.append([shape_index] * len(shape.data))
-
-            # Add faces to mesh
-            m_tmp = m_mesh_vertices_count
-            all_mesh_vertices.append(shape._face_vertices)
-            m_mesh_vertices_count += len(shape._face_vertices)
-            all_mesh_vertices_centers.append(shape._face_vertices)
-            vertices = np.zeros(shape._face_vertices.shape)
-            all_mesh_vertices_offsets.append(vertices)
-            all_mesh_vertices_index.append(
-                _make_index(len(vertices), shape_index, cval=0)
-            )
-
-            triangles = shape._face_triangles + m_tmp
-            all_mesh_triangles.append(triangles)
-            all_mesh_triangles_index.append(
-                _make_index(len(triangles), shape_index, cval=0)
-            )
+        if n_shapes == 0:
+            return
 
-            color_array = np.repeat([face_color], len(triangles), axis=0)
-            all_mesh_triangles_colors.append(color_array)
+        first_index = len(self.shapes)
+        self.shapes.extend(shapes)
 
-            # Add edges to mesh
-            m_tmp = m_mesh_vertices_count
+        # assemble properties
+        self._z_index = np.append(
+            self._z_index, np.array([s.z_index for s in shapes]), axis=0
+        )
+        self._slice_keys = _append_rows(
+            self._slice_keys, np.array([s.slice_key for s in shapes])
+        )
+        self._bboxes = _append_rows(
+            self._bboxes, np.array([s.bounding_box for s in shapes])
+        )
+        self._face_color = np.vstack((self._face_color, face_colors))
+        self._edge_color = np.vstack((self._edge_color, edge_colors))
+        self._splice(
+            first_index,
+            first_index,
+            _mesh_blocks(shapes, face_colors, edge_colors, self.ndisplay),
+        )
 
-            vertices = (
-                shape._edge_vertices + shape.edge_width * shape._edge_offsets
-            )
-            all_mesh_vertices.append(vertices)
-            m_mesh_vertices_count += len(vertices)
+        if z_refresh:
+            # Set z_order
+            self._update_z_order()
+        self._data_changed()
 
-            all_mesh_vertices_centers.append(shape._edge_vertices)
+    def _splice(self, start: int, stop: int, blocks: _MeshBlocks) -> None:
+        """Replace the vertices and mesh of shapes start to stop.
 
-            all_mesh_vertices_offsets.append(shape._edge_offsets)
+        The vertices and mesh blocks of the shapes are kept in shape order,
+        so this only copies the rows around them once, and shifts the
+        indices of the rows after them.
 
-            all_mesh_vertices_index.append(
-                _make_index(len(shape._edge_offsets), shape_index, cval=1)
+        Parameters
+        ----------
+        start, stop : int
+            The shapes to replace. Shapes are inserted when they are equal.
+        blocks : _MeshBlocks
+            The vertices and mesh of the shapes replacing them, which are
+            given the indices from start on.
+        """
+        mesh = self._mesh
+        n_shapes = len(blocks.n_data)
+        shift = n_shapes - (stop - start)
+        v_start = self._mesh_vertex_offsets[2 * start]
+        v_stop = self._mesh_vertex_offsets[2 * stop]
+        t_start = self._mesh_triangle_offsets[2 * start]
+        t_stop = self._mesh_triangle_offsets[2 * stop]
+        d_start = self._vertex_offsets[start]
+        d_stop = self._vertex_offsets[stop]
+        v_shift = len(blocks.vertices) - (v_stop - v_start)
+
+        shape_ids = np.arange(start, start + n_shapes)
+        block_index = np.empty((2 * n_shapes, 2), dtype=int)
+        block_index[:, 0] = np.repeat(shape_ids, 2)
+        block_index[:, 1] = np.tile([0, 1], n_shapes)
+        tail_vertices_index = mesh.vertices_index[v_stop:].copy()
+        tail_vertices_index[:, 0] += shift
+        tail_triangles_index = mesh.triangles_index[t_stop:].copy()
+        tail_triangles_index[:, 0] += shift
+
+        self._vertices = _splice_rows(
+            self._vertices, d_start, d_stop, blocks.data
+        )
+        self._index = np.concatenate(
+            (
+                self._index[:d_start],
+                np.repeat(shape_ids, blocks.n_data),
+                self._index[d_stop:] + shift,
             )
-
-            triangles = shape._edge_triangles + m_tmp
-            all_mesh_triangles.append(triangles)
-            all_mesh_triangles_index.append(
-                _make_index(len(triangles), shape_index, cval=1)
+        )
+        mesh.vertices = _splice_rows(
+            mesh.vertices, v_start, v_stop, blocks.vertices
+        )
+        mesh.vertices_centers = _splice_rows(
+            mesh.vertices_centers, v_start, v_stop, blocks.centers
+        )
+        mesh.vertices_offsets = _splice_rows(
+            mesh.vertices_offsets, v_start, v_stop, blocks.offsets
+        )
+        mesh.vertices_index = np.concatenate(
+            (
+                mesh.vertices_index[:v_start],
+                np.repeat(block_index, blocks.block_n_vertices, axis=0),
+                tail_vertices_index,
             )
-
-            color_array = np.repeat([edge_color], len(triangles), axis=0)
-            all_mesh_triangles_colors.append(color_array)
-
-        # assemble properties
-        self._z_index = np.append(self._z_index, np.array(all_z_index), axis=0)
-        self._face_color = np.vstack((self._face_color, face_colors))
-        self._edge_color = np.vstack((self._edge_color, edge_colors))
-        self._vertices = np.vstack((self._vertices, np.vstack(all_vertices)))
-        self._index = np.append(self._index, np.concatenate(all_index), axis=0)
-
-        self._mesh.vertices = np.vstack(
-            (self._mesh.vertices, np.vstack(all_mesh_vertices))
         )
-        self._mesh.vertices_centers = np.vstack(
-            (self._mesh.vertices_centers, np.vstack(all_mesh_vertices_centers))
+        mesh.triangles = np.concatenate(
+            (
+                mesh.triangles[:t_start],
+                blocks.triangles + np.intp(v_start),
+                mesh.triangles[t_stop:] + np.intp(v_shift),
+            )
         )
-        self._mesh.vertices_offsets = np.vstack(
-            (self._mesh.vertices_offsets, np.vstack(all_mesh_vertices_offsets))
+        mesh.triangles_index = np.concatenate(
+            (
+                mesh.triangles_index[:t_start],
+                np.repeat(block_index, blocks.block_n_triangles, axis=0),
+                tail_triangles_index,
+            )
         )
-        self._mesh.vertices_index = np.vstack(
-            (self._mesh.vertices_index, np.vstack(all_mesh_vertices_index))
+        mesh.triangles_colors = _splice_rows(
+            mesh.triangles_colors,
+            t_start,
+            t_stop,
+            np.repeat(blocks.block_colors, blocks.block_n_triangles, axis=0),
         )
 
-        self._mesh.triangles = np.vstack(
-            (self._mesh.triangles, np.vstack(all_mesh_triangles))
+        self._vertex_offsets = np.concatenate(
+            (
+                self._vertex_offsets[:start],
+                d_start + _offsets(blocks.n_data),
+                self._vertex_offsets[stop + 1 :]
+                + (len(blocks.data) - (d_stop - d_start)),
+            )
         )
-        self._mesh.triangles_index = np.vstack(
-            (self._mesh.triangles_index, np.vstack(all_mesh_triangles_index))
+        self._mesh_vertex_offsets = np.concatenate(
+            (
+                self._mesh_vertex_offsets[: 2 * start],
+                v_start + _offsets(blocks.block_n_vertices),
+                self._mesh_vertex_offsets[2 * stop + 1 :] + v_shift,
+            )
         )
-        self._mesh.triangles_colors = np.vstack(
-            (self._mesh.triangles_colors, np.vstack(all_mesh_triangles_colors))
+        self._mesh_triangle_offsets = np.concatenate(
+            (
+                self._mesh_triangle_offsets[: 2 * start],
+                t_start + _offsets(blocks.block_n_triangles),
+                self._mesh_triangle_offsets[2 * stop + 1 :]
+                + (len(blocks.triangles) - (t_stop - t_start)),
+            )
         )
 
-        if z_refresh:
-            # Set z_order
-            self._update_z_order()
-        self._clear_cache()
+    def _rebuild(self) -> None:
+        """Rebuild the vertices and mesh of all the shapes at once."""
+        self._mesh.clear()
+        self._vertices = np.empty((0, self.ndisplay))
+        self._index = np.empty((0), dtype=int)
+        self._vertex_offsets = np.zeros(1, dtype=np.intp)
+        self._mesh_vertex_offsets = np.zeros(1, dtype=np.intp)
+        self._mesh_triangle_offsets = np.zeros(1, dtype=np.intp)
+        # the number of displayed and non-displayed dimensions may change
+        if self.shapes:
+            self._slice_keys = np.array([s.slice_key for s in self.shapes])
+            self._bboxes = np.array([s.bounding_box for s in self.shapes])
+        else:
+            self._bboxes = np.empty((0, 2, self.ndisplay))
+        n_shapes = len(self.shapes)
+        self._splice(
+            0,
+            0,
+            _mesh_blocks(
+                self.shapes,
+                self._face_color[:n_shapes],
+                self._edge_color[:n_shapes],
+                self.ndisplay,
+            ),
+        )
+        self._data_changed()
 
     @_batch_dec
     def remove_all(self):
@@ -668,9 +843,15 @@ class ShapeList:
         self.shapes = []
         self._vertices = np.empty((0, self.ndisplay))
         self._index = np.empty((0), dtype=int)
+        self._vertex_offsets = np.zeros(1, dtype=np.intp)
+        self._mesh_vertex_offsets = np.zeros(1, dtype=np.intp)
+        self._mesh_triangle_offsets = np.zeros(1, dtype=np.intp)
         self._z_index = np.empty((0), dtype=int)
         self._z_order = np.empty((0), dtype=int)
+        self._slice_keys = np.empty((0, 2, 0))
+        self._bboxes = np.empty((0, 2, self.ndisplay))
         self._mesh.clear()
+        self._data_changed()
         self._update_displayed()
 
     def remove(self, index, renumber=True):
@@ -685,45 +866,21 @@ class ShapeList:
             expectation is that this shape is being immediately added back to the
             list using `add_shape`.
         """
-        indices = self._index != index
-        self._vertices = self._vertices[indices]
-        self._index = self._index[indices]
-
-        # Remove triangles
-        indices = self._mesh.triangles_index[:, 0] != index
-        self._mesh.triangles = self._mesh.triangles[indices]
-        self._mesh.triangles_colors = self._mesh.triangles_colors[indices]
-        self._mesh.triangles_index = self._mesh.triangles_index[indices]
-
-        # Remove vertices
-        indices = self._mesh.vertices_index[:, 0] != index
-        self._mesh.vertices = self._mesh.vertices[indices]
-        self._mesh.vertices_centers = self._mesh.vertices_centers[indices]
-        self._mesh.vertices_offsets = self._mesh.vertices_offsets[indices]
-        self._mesh.vertices_index = self._mesh.vertices_index[indices]
-        indices = np.where(np.invert(indices))[0]
-        num_indices = len(indices)
-        if num_indices > 0:
-            indices = self._mesh.triangles > indices[0]
-            self._mesh.triangles[indices] = (
-                self._mesh.triangles[indices] - num_indices
-            )
-
         if renumber:
+            self._splice(
+                index, index + 1, _empty_mesh_blocks(0, self.ndisplay)
+            )
             del self.shapes[index]
-            indices = self._index > index
-            self._index[indices] = self._index[indices] - 1
             self._z_index = np.delete(self._z_index, index)
-            indices = self._mesh.triangles_index[:, 0] > index
-            self._mesh.triangles_index[indices, 0] = (
-                self._mesh.triangles_index[indices, 0] - 1
-            )
-            indices = self._mesh.vertices_index[:, 0] > index
-            self._mesh.vertices_index[indices, 0] = (
-                self._mesh.vertices_index[indices, 0] - 1
-            )
+            self._slice_keys = np.delete(self._slice_keys, index, axis=0)
+            self._bboxes = np.delete(self._bboxes, index, axis=0)
             self._update_z_order()
-        self._clear_cache()
+        else:
+            # Keep an empty slot for the shape to be added back.
+            self._splice(
+                index, index + 1, _empty_mesh_blocks(1, self.ndisplay)
+            )
+        self._data_changed()
 
     @_batch_dec
     def _update_mesh_vertices(self, index, edge=False, face=False):
@@ -742,23 +899,28 @@ class ShapeList:
             faces and to update the underlying shape vertices
         """
         shape = self.shapes[index]
+        self._bboxes[index] = shape.bounding_box
+        face_start, edge_start, edge_stop = self._mesh_vertex_offsets[
+            2 * index : 2 * index + 3
+        ]
         if edge:
-            indices = np.all(self._mesh.vertices_index == [index, 1], axis=1)
-            self._mesh.vertices[indices] = (
+            rows = slice(edge_start, edge_stop)
+            self._mesh.vertices[rows] = (
                 shape._edge_vertices + shape.edge_width * shape._edge_offsets
             )
-            self._mesh.vertices_centers[indices] = shape._edge_vertices
-            self._mesh.vertices_offsets[indices] = shape._edge_offsets
+            self._mesh.vertices_centers[rows] = shape._edge_vertices
+            self._mesh.vertices_offsets[rows] = shape._edge_offsets
             self._update_displayed()
 
         if face:
-            indices = np.all(self._mesh.vertices_index == [index, 0], axis=1)
-            self._mesh.vertices[indices] = shape._face_vertices
-            self._mesh.vertices_centers[indices] = shape._face_vertices
-            indices = self._index == index
-            self._vertices[indices] = shape.data_displayed
+            rows = slice(face_start, edge_start)
+            self._mesh.vertices[rows] = shape._face_vertices
+            self._mesh.vertices_centers[rows] = shape._face_vertices
+            start, stop = self._vertex_offsets[index : index + 2]
+            self._unshare('_vertices')
+            self._vertices[start:stop] = shape.data_displayed
             self._update_displayed()
-        self._clear_cache()
+        self._data_changed()
 
     @_batch_dec
     def _update_z_order(self):
@@ -767,15 +929,15 @@ class ShapeList:
         if len(self._z_order) == 0:
             self._mesh.triangles_z_order = np.empty((0), dtype=int)
         else:
-            _, idx, counts = np.unique(
-                self._mesh.triangles_index[:, 0],
-                return_index=True,
-                return_counts=True,
+            # The triangles of each shape are contiguous, so stably sorting
+            # them by the rank of their shape in the z order groups them
+            # by shape in that order, keeping their order within each shape.
+            z_rank = np.empty(len(self._z_order), dtype=int)
+            z_rank[self._z_order] = np.arange(len(self._z_order))
+            self._mesh.triangles_z_order = np.argsort(
+                z_rank[self._mesh.triangles_index[:, 0]], kind='stable'
             )
-            triangles_z_order = [
-                np.arange(idx[z], idx[z] + counts[z]) for z in self._z_order
-            ]
-            self._mesh.triangles_z_order = np.concatenate(triangles_z_order)
+        self.version += 1
         self._update_displayed()
 
     def edit(
@@ -821,13 +983,12 @@ class ShapeList:
             shape = self.shapes[index]
             shape.data = data
 
-        if face_color is not None:
-            self._face_color[index] = face_color
-        if edge_color is not None:
-            self._edge_color[index] = edge_color
-
-        self.remove(index, renumber=False)
-        self.add(shape, shape_index=index)
+        self.add(
+            shape,
+            face_color=face_color,
+            edge_color=edge_color,
+            shape_index=index,
+        )
         self._update_z_order()
 
     def update_edge_width(self, index, edge_width):
@@ -860,8 +1021,11 @@ class ShapeList:
             repeated updates when modifying multiple shapes. Default is True.
         """
         self._edge_color[index] = edge_color
-        indices = np.all(self._mesh.triangles_index == [index, 1], axis=1)
-        self._mesh.triangles_colors[indices] = self._edge_color[index]
+        block = 2 * index + 1
+        start, stop = self._mesh_triangle_offsets[block : block + 2]
+        self._unshare('triangles_colors')
+        self._mesh.triangles_colors[start:stop] = self._edge_color[index]
+        self.version += 1
         if update:
             self._update_displayed()
 
@@ -869,13 +1033,8 @@ class ShapeList:
     def update_edge_colors(self, indices, edge_colors, update=True):
         """same as update_edge_color() but for multiple indices/edgecolors at once"""
         self._edge_color[indices] = edge_colors
-        all_indices = np.bitwise_and(
-            np.isin(self._mesh.triangles_index[:, 0], indices),
-            self._mesh.triangles_index[:, 1] == 1,
-        )
-        self._mesh.triangles_colors[all_indices] = self._edge_color[
-            self._mesh.triangles_index[all_indices, 0]
-        ]
+        self._set_triangles_colors(indices, self._edge_color, 1)
+        self.version += 1
         if update:
             self._update_displayed()
 
@@ -896,8 +1055,11 @@ class ShapeList:
             repeated updates when modifying multiple shapes. Default is True.
         """
         self._face_color[index] = face_color
-        indices = np.all(self._mesh.triangles_index == [index, 0], axis=1)
-        self._mesh.triangles_colors[indices] = self._face_color[index]
+        block = 2 * index + 0
+        start, stop = self._mesh_triangle_offsets[block : block + 2]
+        self._unshare('triangles_colors')
+        self._mesh.triangles_colors[start:stop] = self._face_color[index]
+        self.version += 1
         if update:
             self._update_displayed()
 
@@ -905,16 +1067,24 @@ class ShapeList:
     def update_face_colors(self, indices, face_colors, update=True):
         """same as update_face_color() but for multiple indices/facecolors at once"""
         self._face_color[indices] = face_colors
-        all_indices = np.bitwise_and(
-            np.isin(self._mesh.triangles_index[:, 0], indices),
-            self._mesh.triangles_index[:, 1] == 0,
-        )
-        self._mesh.triangles_colors[all_indices] = self._face_color[
-            self._mesh.triangles_index[all_indices, 0]
-        ]
+        self._set_triangles_colors(indices, self._face_color, 0)
+        self.version += 1
         if update:
             self._update_displayed()
 
+    def _set_triangles_colors(
+        self, indices: npt.ArrayLike, colors: npt.NDArray, mesh_type: int
+    ) -> None:
+        """Set the color of the face (0) or edge (1) triangles of shapes."""
+        indices = np.arange(len(self.shapes))[indices]
+        blocks = 2 * indices + mesh_type
+        starts = self._mesh_triangle_offsets[blocks]
+        stops = self._mesh_triangle_offsets[blocks + 1]
+        self._unshare('triangles_colors')
+        self._mesh.triangles_colors[_ranges(starts, stops)] = np.repeat(
+            colors[indices], stops - starts, axis=0
+        )
+
     def update_dims_order(self, dims_order):
         """Updates dimensions order for all shapes.
 
@@ -923,12 +1093,13 @@ class ShapeList:
         dims_order : (D,) list
             Order that the dimensions are rendered in.
         """
-        for index in range(len(self.shapes)):
-            if self.shapes[index].dims_order != dims_order:
-                shape = self.shapes[index]
+        changed = False
+        for shape in self.shapes:
+            if shape.dims_order != dims_order:
                 shape.dims_order = dims_order
-                self.remove(index, renumber=False)
-                self.add(shape, shape_index=index)
+                changed = True
+        if changed:
+            self._rebuild()
         self._update_z_order()
 
     def update_z_index(self, index, z_index):
@@ -972,9 +1143,7 @@ class ShapeList:
             length 2 list specifying coordinate of center of scaling.
         """
         self.shapes[index].scale(scale, center=center)
-        shape = self.shapes[index]
-        self.remove(index, renumber=False)
-        self.add(shape, shape_index=index)
+        self.add(self.shapes[index], shape_index=index)
         self._update_z_order()
 
     def rotate(self, index, angle, center=None):
@@ -1019,11 +1188,9 @@ class ShapeList:
             2x2 array specifying linear transform.
         """
         self.shapes[index].transform(transform)
-        shape = self.shapes[index]
-        self.remove(index, renumber=False)
-        self.add(shape, shape_index=index)
+        self.add(self.shapes[index], shape_index=index)
         self._update_z_order()
-        self._clear_cache()
+        self._data_changed()
 
     def outline(
         self, indices: int | Sequence[int]
@@ -1107,30 +1274,68 @@ class ShapeList:
             List of shapes that are inside the box.
         """
 
-        triangles = self._mesh.vertices[self._mesh.displayed_triangles]
+        # Only test the triangles of shapes whose mesh is near the box.
+        corners = np.asarray(corners)
+        near = np.zeros(len(self.shapes), dtype=bool)
+        near[
+            self._displayed_index.query_box(
+                corners.min(axis=0), corners.max(axis=0)
+            )
+        ] = True
+        triangles_index = self._mesh.displayed_triangles_index[:, 0]
+        near_triangles = near[triangles_index]
+        triangles = self._mesh.vertices[
+            self._mesh.displayed_triangles[near_triangles]
+        ]
         intersects = triangles_intersect_box(triangles, corners)
-        shapes = self._mesh.displayed_triangles_index[intersects, 0]
+        shapes = triangles_index[near_triangles][intersects]
         shapes = np.unique(shapes).tolist()
 
         return shapes
 
     @cached_property
-    def _visible_shapes(self):
-        slice_key = self.slice_key
-        if len(slice_key):
-            return [
-                (i, s)
-                for i, s in enumerate(self.shapes)
-                if s.slice_key[0] <= slice_key <= s.slice_key[1]
-            ]
-        return list(enumerate(self.shapes))
+    def _visible_indices(self) -> npt.NDArray:
+        """Indices of the shapes whose extent contains the slice key."""
+        slice_key = np.asarray(self.slice_key, dtype=float)
+        if len(slice_key) and len(self.shapes):
+            visible = np.all(
+                (self._slice_keys[:, 0] <= slice_key)
+                & (slice_key <= self._slice_keys[:, 1]),
+                axis=1,
+            )
+            return np.flatnonzero(visible)
+        return np.arange(len(self.shapes))
+
+    @property
+    def _bounding_boxes(self) -> tuple[npt.NDArray, npt.NDArray]:
+        """(M, ndisplay) arrays of the bounding box corners of visible shapes."""
+        bboxes = self._bboxes[self._visible_indices]
+        return bboxes[:, 0], bboxes[:, 1]
+
+    @cached_property
+    def _visible_index(self) -> _ShapesIndex:
+        """Spatial index of the bounding boxes of the visible shapes."""
+        visible = self._visible_indices
+        return _ShapesIndex(visible, self._bboxes[visible])
 
     @cached_property
-    def _bounding_boxes(self):
-        data = np.array([s[1].bounding_box for s in self._visible_shapes])
-        if data.size == 0:
-            return np.empty((0, self.ndisplay)), np.empty((0, self.ndisplay))
-        return data[:, 0], data[:, 1]
+    def _displayed_index(self) -> _ShapesIndex:
+        """Spatial index of the mesh bounds of the displayed shapes."""
+        displayed = np.flatnonzero(self._displayed)
+        if len(displayed) == 0:
+            return _ShapesIndex(displayed, np.empty((0, 2, self.ndisplay)))
+        # The mesh rows of each shape are contiguous, so its bounds are
+        # reduced over them, skipping shapes without mesh vertices.
+        starts = self._mesh_vertex_offsets[2 * displayed]
+        stops = self._mesh_vertex_offsets[2 * displayed + 2]
+        meshed = stops > starts
+        bounds = np.empty((meshed.sum(), 2, self.ndisplay))
+        if len(bounds):
+            vertices = self._mesh.vertices[_ranges(starts, stops)]
+            firsts = _offsets(stops - starts)[:-1][meshed]
+            bounds[:, 0] = np.minimum.reduceat(vertices, firsts, axis=0)
+            bounds[:, 1] = np.maximum.reduceat(vertices, firsts, axis=0)
+        return _ShapesIndex(displayed[meshed], bounds)
 
     def inside(self, coord):
         """Determines if any shape at given coord by looking inside triangle
@@ -1149,35 +1354,16 @@ class ShapeList:
         """
         if not self.shapes:
             return None
-        bounding_boxes = self._bounding_boxes
-        in_bbox = np.all(
-            (bounding_boxes[0] <= coord) * (bounding_boxes[1] >= coord),
-            axis=1,
-        )
-        inside_indices = np.flatnonzero(in_bbox)
+        inside_indices = self._visible_index.query_point(coord)
         if inside_indices.size == 0:
             return None
-        try:
-            z_index = [
-                self._visible_shapes[i][1].z_index for i in inside_indices
-            ]
-            pos = np.argsort(z_index)
-            return self._visible_shapes[
-                next(
-                    inside_indices[p]
-                    for p in pos[::-1]
-                    if np.any(
-                        inside_triangles(
-                            self._visible_shapes[inside_indices[p]][
-                                1
-                            ]._all_triangles()
-                            - coord
-                        )
-                    )
-                )
-            ][0]
-        except StopIteration:
-            return None
+        pos = np.argsort(self._z_index[inside_indices])
+        for p in pos[::-1]:
+            index = int(inside_indices[p])
+            triangles = self.shapes[index]._all_triangles()
+            if np.any(inside_triangles(triangles - coord)):
+                return index
+        return None
 
     def _inside_3d(self, ray_position: np.ndarray, ray_direction: np.ndarray):
         """Determines if any shape is intersected by a ray by looking inside triangle
@@ -1390,6 +1576,12 @@ class ShapeList:
 
         return colors
 
+    def _data_changed(self):
+        """Invalidate what was computed from the shapes or their mesh."""
+        self.version += 1
+        self._clear_cache()
+
     def _clear_cache(self):
-        self.__dict__.pop('_bounding_boxes', None)
-        self.__dict__.pop('_visible_shapes', None)
+        self.__dict__.pop('_visible_indices', None)
+        self.__dict__.pop('_visible_index', None)
+        self.__dict__.pop('_displayed_index', None)
@@ -0,0 +1,152 @@
+"""A spatial index over the bounding boxes of the displayed shapes.
+
+Hover picking and box selection of a shapes layer only concern the shapes
+whose bounding box contains the cursor or intersects the drag box, which is
+typically a small fraction of all the shapes in the slice. ``_ShapesIndex``
+buckets the bounding boxes into a uniform grid over their extent, so that
+such a query only visits the shapes registered in the grid cells it
+overlaps.
+
+Indices are immutable: they are built for a given set of bounding boxes and
+must be rebuilt when the shapes or the slice change.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import numpy.typing as npt
+
+# Bounding boxes spanning more cells than this are not bucketed but checked
+# by every query, so that a few large shapes cannot blow up the grid.
+_MAX_CELLS_PER_BOX = 64
+# Upper bound on the number of cells along each axis.
+_MAX_CELLS_PER_AXIS = 1024
+
+
+class _ShapesIndex:
+    """Uniform grid index of shape bounding boxes.
+
+    The grid has about as many cells as there are boxes, so that each cell
+    holds a few boxes on average. The cells are stored in compressed form:
+    the ids of the boxes overlapping each cell are sorted by cell, with
+    ``_cell_starts`` giving where the ids of each cell start.
+
+    Parameters
+    ----------
+    ids : (N,) array of int
+        The shape index of each bounding box.
+    bboxes : (N, 2, D) array
+        The min and max corners of each bounding box.
+    """
+
+    def __init__(self, ids: npt.NDArray, bboxes: npt.NDArray) -> None:
+        self._ids = np.asarray(ids, dtype=np.intp)
+        self._bboxes = np.asarray(bboxes, dtype=float)
+        n_boxes, _, ndim = self._bboxes.shape
+        if n_boxes == 0:
+            self._origin = np.zeros(ndim)
+            self._cell_size = np.ones(ndim)
+            self._grid_shape = (1,) * ndim
+            self._cell_starts = np.zeros(2, dtype=np.intp)
+            self._cell_boxes = np.empty(0, dtype=np.intp)
+            self._large = np.empty(0, dtype=np.intp)
+            return
+
+        low = self._bboxes[:, 0].min(axis=0)
+        high = self._bboxes[:, 1].max(axis=0)
+        n_per_axis = int(
+            min(np.ceil(n_boxes ** (1 / ndim)), _MAX_CELLS_PER_AXIS)
+        )
+        extent = high - low
+        self._origin = low
+        self._cell_size = np.where(extent > 0, extent / n_per_axis, 1.0)
+        self._grid_shape = tuple(np.where(extent > 0, n_per_axis, 1))
+
+        lo = self._cells(self._bboxes[:, 0])
+        hi = self._cells(self._bboxes[:, 1])
+        spans = hi - lo + 1
+        n_cells = np.prod(spans, axis=1)
+        large = n_cells > _MAX_CELLS_PER_BOX
+        self._large = np.flatnonzero(large)
+
+        # Expand each small box into the flat ids of the cells it overlaps.
+        boxes = np.flatnonzero(~large)
+        lo, spans, n_cells = lo[boxes], spans[boxes], n_cells[boxes]
+        starts = np.cumsum(n_cells) - n_cells
+        box_of_cell = np.repeat(np.arange(len(boxes)), n_cells)
+        local = np.arange(n_cells.sum()) - starts[box_of_cell]
+        cell_coords = []
+        for axis in range(ndim - 1, -1, -1):
+            span = spans[box_of_cell, axis]
+            cell_coords.append(lo[box_of_cell, axis] + local % span)
+            local = local // span
+        cells = np.ravel_multi_index(cell_coords[::-1], self._grid_shape)
+
+        order = np.argsort(cells, kind='stable')
+        self._cell_boxes = boxes[box_of_cell[order]]
+        self._cell_starts = np.searchsorted(
+            cells[order], np.arange(np.prod(self._grid_shape) + 1)
+        )
+
+    def _cells(self, coords: npt.NDArray) -> npt.NDArray:
+        """Grid cell of each coordinate, clipped to the grid."""
+        cells = np.floor((coords - self._origin) / self._cell_size)
+        return np.clip(cells, 0, np.array(self._grid_shape) - 1).astype(
+            np.intp
+        )
+
+    def _candidates(self, low: npt.NDArray, high: npt.NDArray) -> npt.NDArray:
+        """Boxes registered in the cells overlapping the given box."""
+        lo = self._cells(low)
+        hi = self._cells(high)
+        ranges = [np.arange(a, b + 1) for a, b in zip(lo, hi, strict=True)]
+        cells = np.ravel_multi_index(
+            np.meshgrid(*ranges, indexing='ij'), self._grid_shape
+        ).ravel()
+        starts = self._cell_starts[cells]
+        counts = self._cell_starts[cells + 1] - starts
+        rows = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        rows += np.arange(len(rows))
+        return np.unique(np.concatenate([self._large, self._cell_boxes[rows]]))
+
+    def query_point(self, coord: npt.ArrayLike) -> npt.NDArray:
+        """Find the shapes whose bounding box contains a point.
+
+        Parameters
+        ----------
+        coord : array-like
+            The (D,) coordinate of the point.
+
+        Returns
+        -------
+        (M,) array of int
+            The ids of the shapes whose bounding box contains the point, in
+            the order they were given.
+        """
+        coord = np.asarray(coord, dtype=float)
+        return self.query_box(coord, coord)
+
+    def query_box(
+        self, low: npt.ArrayLike, high: npt.ArrayLike
+    ) -> npt.NDArray:
+        """Find the shapes whose bounding box intersects a box.
+
+        Parameters
+        ----------
+        low, high : array-like
+            The (D,) inclusive lower and upper corners of the box.
+
+        Returns
+        -------
+        (M,) array of int
+            The ids of the shapes whose bounding box intersects the box, in
+            the order they were given.
+        """
+        low = np.asarray(low, dtype=float)
+        high = np.asarray(high, dtype=float)
+        if len(self._ids) == 0 or np.any(low > high):
+            return np.empty(0, dtype=np.intp)
+        boxes = self._candidates(low, high)
+        bboxes = self._bboxes[boxes]
+        hits = np.all((bboxes[:, 0] <= high) & (bboxes[:, 1] >= low), axis=1)
+        return self._ids[boxes[hits]]
@@ -0,0 +1,294 @@
+from collections.abc import Sequence
+from copy import copy
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+
+from napari.layers.base._slice import _next_request_id
+from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
+
+if TYPE_CHECKING:
+    from napari.layers.shapes._shape_list import ShapeList
+    from napari.layers.shapes._shapes_models import Shape
+
+
+def _get_displayed(
+    slice_keys: npt.NDArray,
+    slice_key: npt.NDArray,
+    triangles_index: npt.NDArray,
+    triangles_z_order: npt.NDArray,
+    vertices_index: npt.NDArray,
+) -> tuple[npt.NDArray, npt.NDArray, npt.NDArray]:
+    """Find the shapes, mesh triangles and vertices in a slice.
+
+    Parameters
+    ----------
+    slice_keys : (N, 2, P) array
+        Slice key of each shape.
+    slice_key : (P,) array
+        Slice key of the slice, i.e. the point in the non-displayed dimensions.
+    triangles_index : (T, 2) array
+        Index of the shape of each mesh triangle, and whether it belongs to
+        the face (0) or edge (1) of that shape.
+    triangles_z_order : (T,) array
+        Order in which the mesh triangles are drawn.
+    vertices_index : (M,) array
+        Index of the shape of each shape vertex.
+
+    Returns
+    -------
+    displayed : (N,) array of bool
+        Whether each shape is in the slice.
+    triangles : array of int
+        Indices of the mesh triangles in the slice, in z order.
+    vertices : array of int
+        Indices of the shape vertices in the slice.
+    """
+    if len(slice_keys) > 0:
+        # The slice key is repeated to check against both the min and max
+        # values stored in the shapes slice key, which must exactly match as
+        # then the shape is entirely contained within the slice.
+        slice_key = np.array([slice_key, slice_key])
+        displayed = np.all(np.abs(slice_keys - slice_key) < 0.5, axis=(1, 2))
+    else:
+        displayed = np.array([])
+    disp_indices = np.where(displayed)[0]
+    disp_tri = np.isin(triangles_index[triangles_z_order, 0], disp_indices)
+    triangles = triangles_z_order[disp_tri]
+    vertices = np.flatnonzero(np.isin(vertices_index, disp_indices))
+    return displayed, triangles, vertices
+
+
+@dataclass(frozen=True)
+class _ShapesView:
+    """The shapes, mesh triangles and vertices of a shape list in a slice.
+
+    Attributes
+    ----------
+    displayed : (N,) array of bool
+        Whether each shape is in the slice.
+    triangles : array of int
+        Indices of the mesh triangles in the slice, in z order.
+    displayed_triangles : (T, 3) array
+        Vertex indices of the mesh triangles in the slice, in z order.
+    displayed_triangles_index : (T, 2) array
+        Shape index and mesh type of the mesh triangles in the slice.
+    displayed_triangles_colors : (T, 4) array
+        Colors of the mesh triangles in the slice.
+    displayed_vertices : (M, ndisplay) array
+        The shape vertices in the slice.
+    displayed_index : (M,) array
+        Shape index of the shape vertices in the slice.
+    """
+
+    displayed: np.ndarray = field(repr=False)
+    triangles: np.ndarray = field(repr=False)
+    displayed_triangles: np.ndarray = field(repr=False)
+    displayed_triangles_index: np.ndarray = field(repr=False)
+    displayed_triangles_colors: np.ndarray = field(repr=False)
+    displayed_vertices: np.ndarray = field(repr=False)
+    displayed_index: np.ndarray = field(repr=False)
+
+
+@dataclass(frozen=True)
+class _ShapeListArrays:
+    """The arrays of a shape list needed to slice it.
+
+    The arrays are shared with the shape list, which copies them before it
+    next edits them in place, so they do not change while a request uses
+    them on another thread.
+
+    Attributes
+    ----------
+    slice_keys : (N, 2, P) array
+        Slice key of each shape.
+    triangles, triangles_index, triangles_colors : array
+        Vertex indices, shape index and mesh type, and color of each mesh
+        triangle.
+    triangles_z_order : array
+        Order in which the mesh triangles are drawn.
+    vertices, vertices_index : array
+        The displayed shape vertices and the shape index of each of them.
+    """
+
+    slice_keys: np.ndarray = field(repr=False)
+    triangles: np.ndarray = field(repr=False)
+    triangles_index: np.ndarray = field(repr=False)
+    triangles_colors: np.ndarray = field(repr=False)
+    triangles_z_order: np.ndarray = field(repr=False)
+    vertices: np.ndarray = field(repr=False)
+    vertices_index: np.ndarray = field(repr=False)
+
+    def slice(self, slice_key: npt.NDArray) -> _ShapesView:
+        """Find the shapes, mesh triangles and vertices in a slice."""
+        displayed, triangles, vertices = _get_displayed(
+            self.slice_keys,
+            slice_key,
+            self.triangles_index,
+            self.triangles_z_order,
+            self.vertices_index,
+        )
+        return _ShapesView(
+            displayed=displayed,
+            triangles=triangles,
+            displayed_triangles=self.triangles[triangles],
+            displayed_triangles_index=self.triangles_index[triangles],
+            displayed_triangles_colors=self.triangles_colors[triangles],
+            displayed_vertices=self.vertices[vertices],
+            displayed_index=self.vertices_index[vertices],
+        )
+
+
+@dataclass(frozen=True)
+class _ShapeListRebuild:
+    """What is needed to rebuild a shape list for other displayed dimensions.
+
+    Attributes
+    ----------
+    shapes : sequence of Shape
+        The shapes of the shape list. They are copied before their displayed
+        data are computed again, so they are not modified.
+    face_color, edge_color : (N, 4) array
+        The face and edge color of each shape.
+    ndisplay : int
+        The number of displayed dimensions.
+    dims_order : sequence of int
+        The order of the dimensions, the displayed ones being last.
+    """
+
+    shapes: Sequence['Shape'] = field(repr=False)
+    face_color: np.ndarray = field(repr=False)
+    edge_color: np.ndarray = field(repr=False)
+    ndisplay: int
+    dims_order: Sequence[int]
+
+    def __call__(self) -> 'ShapeList':
+        # imported here, as the shape list slices itself with this module
+        from napari.layers.shapes._shape_list import ShapeList
+
+        shapes = []
+        for shape in self.shapes:
+            # Shapes replace their displayed data rather than editing them
+            # in place, so a shallow copy leaves the original untouched.
+            shape = copy(shape)
+            shape._ndisplay = self.ndisplay
+            shape._dims_order = list(self.dims_order)
+            shape._update_displayed_data()
+            shapes.append(shape)
+        data_view = ShapeList(ndisplay=self.ndisplay)
+        data_view.add(
+            shapes, face_color=self.face_color, edge_color=self.edge_color
+        )
+        return data_view
+
+
+@dataclass(frozen=True)
+class _ShapeSliceResponse:
+    """Contains all the output data of slicing a Shapes layer.
+
+    Attributes
+    ----------
+    slice_key : array like
+        The point in the non-displayed dimensions of the slice.
+    view : _ShapesView
+        The shapes, mesh triangles and vertices in the slice.
+    version : int
+        The version of the shape list from which this was generated. The
+        other results only apply to the shape list while it has that version,
+        and never if this is -1.
+    data_view : ShapeList or None
+        If the displayed dimensions changed, the shape list rebuilt for them
+        and already sliced, to replace the shape list of that version.
+    slice_input : _SliceInput
+        Describes the slicing plane or bounding box in the layer's dimensions.
+    request_id : int
+        The identifier of the request from which this was generated.
+    """
+
+    slice_key: np.ndarray
+    view: _ShapesView = field(repr=False)
+    version: int
+    data_view: 'ShapeList | None' = field(repr=False)
+    slice_input: _SliceInput
+    request_id: int
+
+
+@dataclass(frozen=True)
+class _ShapeSliceRequest:
+    """A callable that stores all the input data needed to slice a Shapes layer.
+
+    This should be treated a deeply immutable structure, even though some
+    fields can be modified in place. It is like a function that has captured
+    all its inputs already.
+
+    In general, the calling an instance of this may take a long time, so you may
+    want to run it off the main thread.
+
+    Attributes
+    ----------
+    slice_input : _SliceInput
+        Describes the slicing plane or bounding box in the layer's dimensions.
+    data_slice : _ThickNDSlice
+        The slicing coordinates and margins in data space.
+    arrays : _ShapeListArrays
+        The arrays of the shape list to slice.
+    rebuild : _ShapeListRebuild or None
+        If the displayed dimensions changed, how to rebuild the shape list for
+        them before slicing it.
+    version : int
+        The version of the shape list these arrays were taken from. If the
+        shapes change before the response is applied, the version of the
+        shape list changes and the response is discarded.
+    """
+
+    slice_input: _SliceInput
+    data_slice: _ThickNDSlice = field(repr=False)
+    arrays: _ShapeListArrays = field(repr=False)
+    rebuild: _ShapeListRebuild | None = field(repr=False)
+    version: int
+    id: int = field(default_factory=_next_request_id)
+
+    def __call__(self) -> _ShapeSliceResponse:
+        slice_key = np.array(self.data_slice.point)[
+            list(self.slice_input.not_displayed)
+        ]
+        data_view = None
+        arrays = self.arrays
+        if self.rebuild is not None:
+            data_view = self.rebuild()
+            arrays = data_view._slice_arrays()
+        elif arrays.slice_keys.shape[-1] != len(slice_key):
+            # The number of displayed dimensions changed, so the shape list
+            # must be rebuilt on the main thread before it can be sliced.
+            empty = np.empty(0, dtype=int)
+            return _ShapeSliceResponse(
+                slice_key=slice_key,
+                view=_ShapesView(
+                    displayed=np.array([]),
+                    triangles=empty,
+                    displayed_triangles=np.empty((0, 3), dtype=int),
+                    displayed_triangles_index=np.empty((0, 2), dtype=int),
+                    displayed_triangles_colors=np.empty((0, 4)),
+                    displayed_vertices=np.empty(
+                        (0, self.slice_input.ndisplay)
+                    ),
+                    displayed_index=empty,
+                ),
+                version=-1,
+                data_view=None,
+                slice_input=self.slice_input,
+                request_id=self.id,
+            )
+        view = arrays.slice(slice_key)
+        if data_view is not None:
+            data_view._set_sliced(slice_key, view)
+        return _ShapeSliceResponse(
+            slice_key=slice_key,
+            view=view,
+            version=self.version,
+            data_view=data_view,
+            slice_input=self.slice_input,
+            request_id=self.id,
+        )
@@ -173,3 +173,203 @@ def test_inside():
     shape_list.add([shape1, shape2, shape3])
     shape_list.slice_key = (1,)
     assert shape_list.inside((0.5, 0.5)) == 1
+
+
+def _assert_columns_match_shapes(shape_list):
+    npt.assert_array_equal(
+        shape_list.slice_keys, [s.slice_key for s in shape_list.shapes]
+    )
+    npt.assert_array_equal(
+        shape_list._bboxes, [s.bounding_box for s in shape_list.shapes]
+    )
+    assert shape_list.z_indices == [s.z_index for s in shape_list.shapes]
+    # the flat buffers hold the vertices and mesh of each shape in order
+    mesh = shape_list._mesh
+    vertex_offsets = shape_list._vertex_offsets
+    mesh_vertex_offsets = shape_list._mesh_vertex_offsets
+    mesh_triangle_offsets = shape_list._mesh_triangle_offsets
+    for i, shape in enumerate(shape_list.shapes):
+        start, stop = vertex_offsets[i : i + 2]
+        npt.assert_array_equal(
+            shape_list._vertices[start:stop], shape.data_displayed
+        )
+        assert np.all(shape_list._index[start:stop] == i)
+        blocks = (
+            (shape._face_vertices, shape._face_triangles),
+            (shape._edge_vertices, shape._edge_triangles),
+        )
+        for mesh_type, (vertices, triangles) in enumerate(blocks):
+            block = 2 * i + mesh_type
+            v_start, v_stop = mesh_vertex_offsets[block : block + 2]
+            t_start, t_stop = mesh_triangle_offsets[block : block + 2]
+            npt.assert_array_equal(
+                mesh.vertices_centers[v_start:v_stop], vertices
+            )
+            npt.assert_array_equal(
+                mesh.triangles[t_start:t_stop] - v_start, triangles
+            )
+            assert np.all(
+                mesh.triangles_index[t_start:t_stop] == [i, mesh_type]
+            )
+    assert vertex_offsets[-1] == len(shape_list._vertices)
+    assert mesh_vertex_offsets[-1] == len(mesh.vertices)
+    assert mesh_triangle_offsets[-1] == len(mesh.triangles)
+
+
+def test_columns_follow_shape_changes():
+    np.random.seed(0)
+    shapes = []
+    for z in range(4):
+        data = 20 * np.random.random((4, 3))
+        data[:, 0] = z
+        shapes.append(Polygon(data, z_index=z % 2))
+    shape_list = ShapeList()
+    shape_list.add(shapes[:2])
+    shape_list.add(shapes[2])
+    shape_list.add(shapes[3])
+    _assert_columns_match_shapes(shape_list)
+
+    shape_list.shift(1, np.array([5, 5]))
+    shape_list.update_edge_width(2, 3)
+    shape_list.edit(3, 20 * np.random.random((5, 3)), new_type='path')
+    _assert_columns_match_shapes(shape_list)
+
+    # a shape in the middle gets more vertices
+    shape_list.edit(1, 20 * np.random.random((6, 3)))
+    _assert_columns_match_shapes(shape_list)
+
+    shape_list.remove(0)
+    _assert_columns_match_shapes(shape_list)
+
+    shape_list.ndisplay = 3
+    assert shape_list.slice_keys.shape == (3, 2, 0)
+    assert shape_list._bboxes.shape == (3, 2, 3)
+    _assert_columns_match_shapes(shape_list)
+
+
+def test_triangles_z_order_groups_shapes_by_z_index():
+    shape_list = ShapeList()
+    rectangles = [
+        Rectangle(np.array([[0, 0], [10, 10]]), z_index=z) for z in (2, 0, 1)
+    ]
+    shape_list.add(rectangles)
+    triangles_index = shape_list._mesh.triangles_index[:, 0]
+    ordered = triangles_index[shape_list._mesh.triangles_z_order]
+    assert list(dict.fromkeys(ordered.tolist())) == [1, 2, 0]
+    # the triangles of each shape keep their order
+    for shape_index in range(3):
+        z_order = shape_list._mesh.triangles_z_order
+        own = z_order[triangles_index[z_order] == shape_index]
+        npt.assert_array_equal(own, np.sort(own))
+
+
+def test_inside_picks_highest_z_index():
+    shape_list = ShapeList()
+    shape_list.add(
+        [
+            Rectangle(np.array([[0, 0], [10, 10]]), z_index=1),
+            Rectangle(np.array([[5, 5], [15, 15]]), z_index=3),
+            Rectangle(np.array([[6, 6], [8, 8]]), z_index=2),
+        ]
+    )
+    assert shape_list.inside((7, 7)) == 1
+    assert shape_list.inside((2, 2)) == 0
+    assert shape_list.inside((20, 20)) is None
+
+
+def test_shapes_in_box():
+    shape_list = ShapeList()
+    shape_list.add(
+        [
+            Rectangle(np.array([[0, 0], [10, 10]])),
+            Path(np.array([[20, 20], [30, 30]]), edge_width=4),
+            Rectangle(np.array([[50, 50], [60, 60]])),
+        ]
+    )
+    shape_list.slice_key = ()
+    assert shape_list.shapes_in_box(np.array([[5, 5], [25, 25]])) == [0, 1]
+    # the thick edge of the path reaches outside its vertices
+    assert shape_list.shapes_in_box(np.array([[31, 27], [40, 29]])) == [1]
+    assert shape_list.shapes_in_box(np.array([[70, 70], [80, 80]])) == []
+
+
+def test_add_multiple_shapes_matches_single_adds():
+    """Test adding shapes as a batch builds the same mesh as one by one."""
+    rng = np.random.default_rng(0)
+    shapes = [
+        Polygon(20 * rng.random((5, 2)), edge_width=2),
+        Path(20 * rng.random((4, 2))),
+        Rectangle(np.array([[0, 0], [10, 10]]), edge_width=0.5, z_index=2),
+        Polygon(np.array([[0, 0], [1, 1], [2, 2]])),
+    ]
+    face_colors = rng.random((len(shapes), 4))
+    edge_colors = rng.random((len(shapes), 4))
+
+    single = ShapeList()
+    single.add(shapes[0], face_color=face_colors[0], edge_color=edge_colors[0])
+    batch = ShapeList()
+    batch.add(shapes[0], face_color=face_colors[0], edge_color=edge_colors[0])
+    for shape, face_color, edge_color in zip(
+        shapes[1:], face_colors[1:], edge_colors[1:], strict=True
+    ):
+        single.add(shape, face_color=face_color, edge_color=edge_color)
+    batch.add(
+        shapes[1:], face_color=face_colors[1:], edge_color=edge_colors[1:]
+    )
+
+    for attr in (
+        'vertices',
+        'vertices_centers',
+        'vertices_offsets',
+        'vertices_index',
+        'triangles',
+        'triangles_index',
+        'triangles_colors',
+        'triangles_z_order',
+    ):
+        npt.assert_allclose(
+            getattr(batch._mesh, attr), getattr(single._mesh, attr)
+        )
+    npt.assert_array_equal(batch._vertices, single._vertices)
+    npt.assert_array_equal(batch._index, single._index)
+    npt.assert_array_equal(batch.slice_keys, single.slice_keys)
+    npt.assert_array_equal(batch._bboxes, single._bboxes)
+
+
+def test_inside_and_shapes_in_box_match_brute_force():
+    np.random.seed(0)
+    corners = 100 * np.random.random((200, 1, 2))
+    rectangles = [
+        Rectangle(
+            np.concatenate([c, c + 1 + 5 * np.random.random((1, 2))]),
+            z_index=z,
+        )
+        for z, c in enumerate(corners)
+    ]
+    # a large shape spanning most of the grid
+    rectangles.append(Rectangle(np.array([[0, 0], [90, 90]]), z_index=-1))
+    shape_list = ShapeList()
+    shape_list.add(rectangles)
+    shape_list.slice_key = []
+
+    box = np.array([[20, 30], [45, 50]])
+    expected = [
+        i
+        for i, shape in enumerate(shape_list.shapes)
+        if np.all(shape.bounding_box[0] <= box[1])
+        and np.all(shape.bounding_box[1] >= box[0])
+    ]
+    assert shape_list.shapes_in_box(box) == expected
+
+    for coord in 100 * np.random.random((20, 2)):
+        hits = [
+            i
+            for i, shape in enumerate(shape_list.shapes)
+            if np.all(shape.bounding_box[0] <= coord)
+            and np.all(shape.bounding_box[1] >= coord)
+        ]
+        # the topmost shape is picked
+        expected = max(
+            hits, key=lambda i: shape_list._z_index[i], default=None
+        )
+        assert shape_list.inside(coord) == expected
@@ -17,6 +17,7 @@ from napari.layers import Shapes
 from napari.layers.base._base_constants import ActionType
 from napari.layers.utils._text_constants import Anchor
 from napari.layers.utils.color_encoding import ConstantColorEncoding
+from napari.settings import get_settings
 from napari.utils._test_utils import (
     validate_all_params_in_docstring,
     validate_kwargs_sorted,
@@ -391,6 +392,24 @@ def test_refresh_text():
     np.testing.assert_equal(layer.text.values, new_properties['shape_type'])
 
 
+def test_text_culled_to_canvas():
+    """Test that only the text of the shapes near the canvas is displayed"""
+    data = [np.array([[i, i], [i, i + 1], [i + 1, i]]) for i in range(100)]
+    layer = Shapes(data, shape_type='polygon', text='{index}')
+
+    layer._update_draw(1, np.array([[40, 40], [49, 49]]), (100, 100))
+
+    # the bounding boxes include half the edge width
+    np.testing.assert_array_equal(
+        layer._view_text, [str(i) for i in range(34, 55)]
+    )
+    assert len(layer._view_text_coords[0]) == 21
+
+    layer.text.max_count = 2
+    layer.selected_data = {50}
+    np.testing.assert_array_equal(layer._view_text, ['34', '50'])
+
+
 @pytest.mark.parametrize('prepend', [(), (7,), (8, 9)])
 def test_nd_text(prepend):
     """Test slicing of text coords with nD shapes
@@ -2496,3 +2515,149 @@ def test_clean_selection_on_set_data():
 def test_docstring():
     validate_all_params_in_docstring(Shapes)
     validate_kwargs_sorted(Shapes)
+
+
+def test_add_shapes_with_triangulation_workers(monkeypatch):
+    """Test triangulating shapes in threads builds the same mesh."""
+    monkeypatch.setattr(
+        'napari.layers.shapes.shapes._PARALLEL_TRIANGULATION_MIN', 2
+    )
+    rng = np.random.default_rng(0)
+    angles = np.linspace(0, 2 * np.pi, 6, endpoint=False)
+    hexagon = np.stack([np.cos(angles), np.sin(angles)], axis=1)
+    data = [hexagon * r + c for r, c in rng.random((20, 2)) * 20]
+    serial = Shapes(data, shape_type='polygon')
+
+    get_settings().experimental.triangulation_workers = 3
+    threaded = Shapes(data, shape_type='polygon')
+
+    assert len(threaded.data) == len(data)
+    for attr in ('vertices', 'triangles', 'triangles_index'):
+        np.testing.assert_array_equal(
+            getattr(threaded._data_view._mesh, attr),
+            getattr(serial._data_view._mesh, attr),
+        )
+
+
+def test_slice_request_response():
+    """Slicing in a request should give the same view as slicing in place."""
+    square = np.array([[0, 0], [0, 2], [2, 2], [2, 0]])
+    layer = Shapes(
+        [np.insert(square, 0, z, axis=1) for z in (0, 1, 1)],
+        shape_type='polygon',
+    )
+    request = layer._make_slice_request(Dims(ndim=3, point=(1, 0, 0)))
+    response = request()
+    np.testing.assert_array_equal(response.view.displayed, [False, True, True])
+
+    layer._update_slice_response(response)
+
+    expected = Shapes(
+        [np.insert(square, 0, z, axis=1) for z in (0, 1, 1)],
+        shape_type='polygon',
+    )
+    expected._slice_dims(Dims(ndim=3, point=(1, 0, 0)))
+    np.testing.assert_array_equal(
+        layer._data_view._mesh.displayed_triangles,
+        expected._data_view._mesh.displayed_triangles,
+    )
+    np.testing.assert_array_equal(
+        layer._data_view.displayed_vertices,
+        expected._data_view.displayed_vertices,
+    )
+
+
+def test_stale_slice_response_is_recomputed():
+    """A response made before the shapes changed should not be applied."""
+    square = np.array([[0, 0], [0, 2], [2, 2], [2, 0]])
+    layer = Shapes(
+        [np.insert(square, 0, z, axis=1) for z in (0, 1)],
+        shape_type='polygon',
+    )
+    request = layer._make_slice_request(Dims(ndim=3, point=(1, 0, 0)))
+    response = request()
+
+    layer.add_polygons([np.insert(square, 0, 1, axis=1)])
+    layer._update_slice_response(response)
+
+    np.testing.assert_array_equal(
+        layer._data_view._displayed, [False, True, True]
+    )
+    np.testing.assert_array_equal(
+        np.unique(layer._data_view.displayed_index), [1, 2]
+    )
+
+
+def test_slice_responses_apply_after_slice_change():
+    """Applying a response only changes the slice, so responses requested
+    at the same time are not stale."""
+    square = np.array([[0, 0], [0, 2], [2, 2], [2, 0]])
+    layer = Shapes(
+        [np.insert(square, 0, z, axis=1) for z in (0, 1, 2)],
+        shape_type='polygon',
+    )
+    version = layer._data_view.version
+    first = layer._make_slice_request(Dims(ndim=3, point=(1, 0, 0)))
+    second = layer._make_slice_request(Dims(ndim=3, point=(2, 0, 0)))
+
+    layer._update_slice_response(first())
+    assert layer._data_view.version == version
+
+    response = second()
+    assert response.version == layer._data_view.version
+    layer._update_slice_response(response)
+    np.testing.assert_array_equal(
+        layer._data_view._displayed, [False, False, True]
+    )
+
+
+def test_slice_request_arrays_are_copied_on_write():
+    """Requests share the arrays of the shape list, which copies them before
+    editing them in place."""
+    square = np.array([[0, 0], [0, 2], [2, 2], [2, 0]])
+    layer = Shapes(
+        [np.insert(square, 0, z, axis=1) for z in (0, 1)],
+        shape_type='polygon',
+    )
+    data_view = layer._data_view
+    request = layer._make_slice_request(Dims(ndim=3, point=(1, 0, 0)))
+    assert request.arrays.triangles_colors is data_view._mesh.triangles_colors
+    colors = request.arrays.triangles_colors.copy()
+    vertices = request.arrays.vertices.copy()
+
+    layer.face_color = 'red'
+    layer._data_view.edit(1, np.insert(square + 1, 0, 1, axis=1))
+
+    np.testing.assert_array_equal(request.arrays.triangles_colors, colors)
+    np.testing.assert_array_equal(request.arrays.vertices, vertices)
+    assert request.arrays.vertices is not data_view._vertices
+    response = request()
+    assert response.version != layer._data_view.version
+
+
+def test_slice_request_rebuilds_shapes_for_ndisplay():
+    """A request for other displayed dimensions rebuilds the shape list
+    without changing the shapes of the layer until it is applied."""
+    data = 10 * np.random.random((4, 4, 3))
+    layer = Shapes(data, shape_type='polygon')
+    shapes = list(layer._data_view.shapes)
+    request = layer._make_slice_request(Dims(ndim=3, ndisplay=3))
+    response = request()
+
+    assert response.data_view is not None
+    assert all(shape.ndisplay == 2 for shape in shapes)
+    layer._update_slice_response(response)
+    assert layer._data_view is response.data_view
+    assert layer._data_view.ndisplay == 3
+
+    expected = Shapes(data, shape_type='polygon')
+    expected._slice_dims(Dims(ndim=3, ndisplay=3))
+    for attr in ('vertices', 'triangles', 'displayed_triangles'):
+        np.testing.assert_array_equal(
+            getattr(layer._data_view._mesh, attr),
+            getattr(expected._data_view._mesh, attr),
+        )
+    np.testing.assert_array_equal(
+        layer._data_view.displayed_vertices,
+        expected._data_view.displayed_vertices,
+    )
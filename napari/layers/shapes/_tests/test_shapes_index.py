@@ -0,0 +1,49 @@
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from napari.layers.shapes._shapes_index import _ShapesIndex
+
+
+def _brute_force(bboxes, ids, low, high):
+    hits = np.all((bboxes[:, 0] <= high) & (bboxes[:, 1] >= low), axis=1)
+    return ids[hits]
+
+
+@pytest.mark.parametrize('ndim', [2, 3])
+def test_query_box_matches_brute_force(ndim):
+    rng = np.random.default_rng(0)
+    low = 100 * rng.random((500, ndim))
+    high = low + 10 * rng.random((500, ndim))
+    # a few boxes spanning most of the extent
+    high[:3] = low[:3] + 90
+    bboxes = np.stack([low, high], axis=1)
+    ids = rng.permutation(1000)[:500]
+    index = _ShapesIndex(ids, bboxes)
+
+    for _ in range(20):
+        corner = 100 * rng.random(ndim)
+        box_low, box_high = corner, corner + 20 * rng.random(ndim)
+        npt.assert_array_equal(
+            np.sort(index.query_box(box_low, box_high)),
+            np.sort(_brute_force(bboxes, ids, box_low, box_high)),
+        )
+        npt.assert_array_equal(
+            np.sort(index.query_point(corner)),
+            np.sort(_brute_force(bboxes, ids, corner, corner)),
+        )
+
+
+def test_query_outside_and_degenerate_extent():
+    # all the boxes are in a plane so the grid is flat along the first axis
+    bboxes = np.array([[[0, 0, 0], [0, 1, 1]], [[0, 2, 2], [0, 3, 3]]])
+    index = _ShapesIndex(np.array([4, 7]), bboxes)
+    npt.assert_array_equal(index.query_point([0, 2.5, 2.5]), [7])
+    npt.assert_array_equal(index.query_point([1, 2.5, 2.5]), [])
+    npt.assert_array_equal(index.query_box([-1, -1, -1], [5, 5, 5]), [4, 7])
+
+
+def test_empty_index():
+    index = _ShapesIndex(np.empty(0, dtype=int), np.empty((0, 2, 2)))
+    assert index.query_point([0, 0]).size == 0
+    assert index.query_box([0, 0], [1, 1]).size == 0
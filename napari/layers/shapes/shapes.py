@@ -1,9 +1,11 @@
 import warnings
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from copy import copy, deepcopy
-from itertools import cycle
+from itertools import chain, cycle
 from typing import (
+    TYPE_CHECKING,
     Any,
     ClassVar,
 )
@@ -53,6 +55,13 @@ from napari.layers.shapes._shapes_utils import (
     rdp,
     validate_num_vertices,
 )
+from napari.layers.shapes._slice import (
+    _ShapeListRebuild,
+    _ShapeSliceRequest,
+    _ShapeSliceResponse,
+)
+from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
+from napari.layers.utils._text_utils import get_text_window
 from napari.layers.utils.color_manager_utils import (
     guess_continuous,
     map_property,
@@ -80,7 +89,13 @@ from napari.utils.events.custom_types import Array
 from napari.utils.misc import ensure_iterable
 from napari.utils.translations import trans
 
+if TYPE_CHECKING:
+    from napari.components.dims import Dims
+
 DEFAULT_COLOR_CYCLE = np.array([[1, 0, 1, 1], [0, 1, 0, 1]])
+# Smallest number of shapes added at once for which triangulating them in a
+# pool of threads is worth its overhead.
+_PARALLEL_TRIANGULATION_MIN = 1000
 
 
 class Shapes(Layer):
@@ -517,6 +532,7 @@ class Shapes(Layer):
             current_face_color=Event,
             current_properties=Event,
             highlight=Event,
+            _view_text=Event,
             features=Event,
             feature_defaults=Event,
         )
@@ -525,6 +541,10 @@ class Shapes(Layer):
         self._allow_thumbnail_update = True
 
         self._display_order_stored = []
+        # window of data coordinates in which text is displayed in 2D
+        self._text_window: np.ndarray | None = None
+        # positions of the displayed text, while a text refresh reads it
+        self._text_positions: np.ndarray | None = None
         self._ndisplay_stored = self._slice_input.ndisplay
 
         self._feature_table = _FeatureTable.from_layer(
@@ -1301,6 +1321,9 @@ class Shapes(Layer):
                 with self.block_update_properties():
                     self.current_properties = unique_properties
 
+        if self.text.max_count is not None:
+            # the text of the selected shapes is displayed first
+            self.events._view_text()
         self._set_highlight()
 
     @property
@@ -1651,8 +1674,46 @@ class Shapes(Layer):
         """
         # This may be triggered when the string encoding instance changed,
         # in which case it has no cached values, so generate them here.
-        self.text.string._apply(self.features)
-        return self.text.view_text(self._indices_view)
+        self.text.string._apply(self._feature_table.view)
+        return self.text.view_text(
+            self._indices_view[self._view_text_positions]
+        )
+
+    @contextmanager
+    def _text_positions_cached(self) -> Iterator[None]:
+        """Find the positions of the displayed text once, while its values,
+        coordinates and colors are read to refresh it.
+        """
+        self._text_positions = self._view_text_positions
+        try:
+            yield
+        finally:
+            self._text_positions = None
+
+    @property
+    def _view_text_positions(self) -> np.ndarray:
+        """Positions in the view of the shapes whose text is displayed.
+
+        In 2D, only the text of the shapes whose bounding box intersects the
+        text window is displayed, and the text manager may limit the number
+        of displayed text elements.
+        """
+        if self._text_positions is not None:
+            return self._text_positions
+        in_window = None
+        if self._text_window is not None:
+            displayed = list(self._slice_input.displayed)
+            low, high = self._text_window[:, displayed]
+            bboxes = self._data_view._bboxes[self._indices_view]
+            in_window = np.flatnonzero(
+                np.all((bboxes[:, 1] >= low) & (bboxes[:, 0] <= high), axis=1)
+            )
+        return self.text._displayed_positions(
+            self._indices_view,
+            in_window,
+            self.selected_data,
+            self._feature_table.view,
+        )
 
     @property
     def _view_text_coords(self) -> tuple[np.ndarray, str, str]:
@@ -1672,7 +1733,8 @@ class Shapes(Layer):
 
         # get the coordinates of the vertices for the shapes in view
         in_view_shapes_coords = [
-            self._data_view.data[i] for i in self._indices_view
+            self._data_view.data[i]
+            for i in self._indices_view[self._view_text_positions]
         ]
 
         # get the coordinates for the dimensions being displayed
@@ -1689,8 +1751,10 @@ class Shapes(Layer):
     @property
     def _view_text_color(self) -> np.ndarray:
         """Get the colors of the text elements at the given indices."""
-        self.text.color._apply(self.features)
-        return self.text._view_color(self._indices_view)
+        self.text.color._apply(self._feature_table.view)
+        return self.text._view_color(
+            self._indices_view[self._view_text_positions]
+        )
 
     @property
     def mode(self):
@@ -2262,7 +2326,7 @@ class Shapes(Layer):
             total_shapes = n_new_shapes + self.nshapes
             self._feature_table.resize(total_shapes)
             if hasattr(self, 'text'):
-                self.text.apply(self.features)
+                self.text.apply(self._feature_table.view)
 
         if edge_color is None:
             edge_color = self._get_new_shape_color(
@@ -2330,24 +2394,40 @@ class Shapes(Layer):
         """Build new shapes and add them to the _data_view"""
 
         shape_inputs = tuple(shape_inputs)
+        dims_order = self._slice_input.order
+        ndisplay = self._slice_input.ndisplay
 
-        # build all shapes
-        sh_inp = tuple(
-            (
+        def _build_shapes(inputs):
+            return [
                 shape_classes[st](
                     d,
                     edge_width=ew,
                     z_index=z,
-                    dims_order=self._slice_input.order,
-                    ndisplay=self._slice_input.ndisplay,
-                ),
-                ec,
-                fc,
-            )
-            for d, st, ew, ec, fc, z in shape_inputs
-        )
+                    dims_order=dims_order,
+                    ndisplay=ndisplay,
+                )
+                for d, st, ew, _, _, z in inputs
+            ]
 
-        shapes, edge_colors, face_colors = tuple(zip(*sh_inp, strict=False))
+        # build all shapes, which triangulates them. Large batches are split
+        # in chunks triangulated by a pool of threads.
+        n_workers = get_settings().experimental.triangulation_workers
+        if n_workers > 1 and len(shape_inputs) >= _PARALLEL_TRIANGULATION_MIN:
+            n_chunks = 4 * n_workers
+            chunk_size = -(-len(shape_inputs) // n_chunks)
+            chunks = [
+                shape_inputs[i : i + chunk_size]
+                for i in range(0, len(shape_inputs), chunk_size)
+            ]
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                shapes = list(
+                    chain.from_iterable(executor.map(_build_shapes, chunks))
+                )
+        else:
+            shapes = _build_shapes(shape_inputs)
+
+        edge_colors = [inp[3] for inp in shape_inputs]
+        face_colors = [inp[4] for inp in shape_inputs]
 
         # Add all shapes at once (faster than adding them one by one)
         data_view.add(
@@ -2392,29 +2472,101 @@ class Shapes(Layer):
         """Vertex radius normalized to screen space."""
         return self._vertex_size * self._normalized_scale_factor / 2
 
-    def _set_view_slice(self):
+    def _set_view_slice(self) -> None:
         """Set the view given the slicing indices."""
+        request = self._make_slice_request_internal(
+            self._slice_input, self._data_slice
+        )
+        response = request()
+        self._update_slice_response(response)
+
+    def _make_slice_request(self, dims: 'Dims') -> _ShapeSliceRequest:
+        """Make a Shapes slice request based on the given dims and these data."""
+        slice_input = self._make_slice_input(dims)
+        # See Image._make_slice_request to understand why we evaluate this here
+        # instead of using `self._data_slice`.
+        data_slice = slice_input.data_slice(self._data_to_world.inverse)
+        # The request may be called on another thread while the shape list
+        # is edited, so the shape list copies the arrays it shares with the
+        # request before editing them in place.
+        return self._make_slice_request_internal(
+            slice_input, data_slice, share=True
+        )
+
+    def _make_slice_request_internal(
+        self,
+        slice_input: _SliceInput,
+        data_slice: _ThickNDSlice,
+        share: bool = False,
+    ) -> _ShapeSliceRequest:
+        data_view = self._data_view
+        rebuild = None
+        if share and (
+            slice_input.ndisplay != self._ndisplay_stored
+            or slice_input.order != self._display_order_stored
+        ):
+            # Rebuilding the shape list for other displayed dimensions
+            # triangulates every shape again, so it is done by the request.
+            rebuild = _ShapeListRebuild(
+                shapes=tuple(data_view.shapes),
+                face_color=data_view._face_color.copy(),
+                edge_color=data_view._edge_color.copy(),
+                ndisplay=min(self.ndim, slice_input.ndisplay),
+                dims_order=slice_input.order,
+            )
+        return _ShapeSliceRequest(
+            slice_input=slice_input,
+            data_slice=data_slice,
+            arrays=data_view._slice_arrays(share=share),
+            rebuild=rebuild,
+            version=data_view.version,
+        )
+
+    def _update_slice_response(self, response: _ShapeSliceResponse) -> None:
+        """Handle a slicing response."""
+        self._slice_input = response.slice_input
+        ndisplay = self._slice_input.ndisplay
+        order = self._slice_input.order
+        if (
+            response.data_view is not None
+            and response.version == self._data_view.version
+        ):
+            # The shape list was rebuilt for the displayed dimensions by the
+            # request, and the shapes have not changed since.
+            self.selected_data = set()
+            self._clipboard = {}
+            response.data_view.version = self._data_view.version + 1
+            self._data_view = response.data_view
+            self._ndisplay_stored = ndisplay
+            self._display_order_stored = copy(order)
+            return
+
         with self._data_view.batched_updates():
-            ndisplay = self._slice_input.ndisplay
             if ndisplay != self._ndisplay_stored:
                 self.selected_data = set()
                 self._data_view.ndisplay = min(self.ndim, ndisplay)
                 self._ndisplay_stored = ndisplay
                 self._clipboard = {}
 
-            if self._slice_input.order != self._display_order_stored:
+            if order != self._display_order_stored:
                 self.selected_data = set()
-                self._data_view.update_dims_order(self._slice_input.order)
-                self._display_order_stored = copy(self._slice_input.order)
+                self._data_view.update_dims_order(order)
+                self._display_order_stored = copy(order)
                 # Clear clipboard if dimensions swap
                 self._clipboard = {}
 
-            slice_key = np.array(self._data_slice.point)[
-                self._slice_input.not_displayed
-            ]
+            slice_key = response.slice_key
             if not np.array_equal(slice_key, self._data_view.slice_key):
                 self.selected_data = set()
-            self._data_view.slice_key = slice_key
+            if (
+                response.data_view is None
+                and response.version == self._data_view.version
+            ):
+                self._data_view._set_sliced(slice_key, response.view)
+            else:
+                # The shapes changed since the request was made, so their
+                # slice is computed again here.
+                self._data_view.slice_key = slice_key
 
     def interaction_box(self, index):
         """Create the interaction box around a shape or list of shapes.
@@ -2596,6 +2748,27 @@ class Shapes(Layer):
 
         return vertices, face_color, edge_color, pos, width
 
+    def _update_draw(
+        self, scale_factor, corner_pixels_displayed, shape_threshold
+    ):
+        super()._update_draw(
+            scale_factor, corner_pixels_displayed, shape_threshold
+        )
+        self._update_text_window()
+
+    def _update_text_window(self) -> None:
+        """Update the window in which text is displayed as the camera moves."""
+        window = None
+        if self._slice_input.ndisplay == 2 and self.text.visible:
+            window = get_text_window(
+                self._text_window,
+                self.corner_pixels,
+                list(self._slice_input.displayed),
+            )
+        if window is not self._text_window:
+            self._text_window = window
+            self.events._view_text()
+
     def _set_highlight(self, force=False) -> None:
         """Render highlights of shapes.
 
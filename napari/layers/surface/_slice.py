@@ -0,0 +1,169 @@
+import warnings
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from napari.layers.base._slice import _next_request_id
+from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
+from napari.utils.translations import trans
+
+
+@dataclass(frozen=True)
+class _SurfaceSliceResponse:
+    """Contains all the output data of slicing a Surface layer.
+
+    Attributes
+    ----------
+    vertices : array like
+        The displayed coordinates of all the vertices.
+    faces : array like
+        The faces in the slice.
+    vertex_values : array like or list
+        The vertex values in the slice, or an empty list if there are none.
+    vertex_colors : array like or list
+        The vertex colors in the slice, or an empty list if there are none.
+    slice_input : _SliceInput
+        Describes the slicing plane or bounding box in the layer's dimensions.
+    request_id : int
+        The identifier of the request from which this was generated.
+    """
+
+    vertices: np.ndarray = field(repr=False)
+    faces: np.ndarray = field(repr=False)
+    vertex_values: np.ndarray | list = field(repr=False)
+    vertex_colors: np.ndarray | list = field(repr=False)
+    slice_input: _SliceInput
+    request_id: int
+
+
+@dataclass(frozen=True)
+class _SurfaceSliceRequest:
+    """A callable that stores all the input data needed to slice a Surface layer.
+
+    This should be treated a deeply immutable structure, even though some
+    fields can be modified in place. It is like a function that has captured
+    all its inputs already.
+
+    In general, the calling an instance of this may take a long time, so you may
+    want to run it off the main thread.
+
+    Attributes
+    ----------
+    slice_input : _SliceInput
+        Describes the slicing plane or bounding box in the layer's dimensions.
+    data_slice : _ThickNDSlice
+        The slicing coordinates and margins in data space.
+    others
+        See the corresponding attributes in `Surface`.
+    """
+
+    slice_input: _SliceInput
+    data_slice: _ThickNDSlice = field(repr=False)
+    vertices: np.ndarray = field(repr=False)
+    faces: np.ndarray = field(repr=False)
+    vertex_values: np.ndarray = field(repr=False)
+    vertex_colors: np.ndarray | None = field(repr=False)
+    id: int = field(default_factory=_next_request_id)
+
+    def __call__(self) -> _SurfaceSliceResponse:
+        vertex_ndim = self.vertices.shape[1]
+        values_ndim = self.vertex_values.ndim - 1
+
+        vertex_values = self._slice_associated_data(
+            self.vertex_values,
+            vertex_ndim,
+        )
+        vertex_colors = self._slice_associated_data(
+            self.vertex_colors,
+            vertex_ndim,
+            dims=2,
+        )
+
+        if len(vertex_values) == 0:
+            return _SurfaceSliceResponse(
+                vertices=np.zeros((0, self.slice_input.ndisplay)),
+                faces=np.zeros((0, 3), dtype=int),
+                vertex_values=vertex_values,
+                vertex_colors=vertex_colors,
+                slice_input=self.slice_input,
+                request_id=self.id,
+            )
+
+        if values_ndim > 0:
+            indices = np.array(self.data_slice.point[-vertex_ndim:])
+            disp = [
+                d
+                for d in np.subtract(self.slice_input.displayed, values_ndim)
+                if d >= 0
+            ]
+            not_disp = [
+                d
+                for d in np.subtract(
+                    self.slice_input.not_displayed, values_ndim
+                )
+                if d >= 0
+            ]
+        else:
+            indices = np.array(self.data_slice.point)
+            not_disp = list(self.slice_input.not_displayed)
+            disp = list(self.slice_input.displayed)
+
+        vertices = self.vertices[:, disp]
+        if len(self.vertices) == 0:
+            faces = np.zeros((0, 3), dtype=int)
+        elif vertex_ndim > self.slice_input.ndisplay:
+            not_disp_vertices = self.vertices[:, not_disp].astype('int')
+            triangles = not_disp_vertices[self.faces]
+            matches = np.all(triangles == indices[not_disp], axis=(1, 2))
+            matches = np.where(matches)[0]
+            if len(matches) == 0:
+                faces = np.zeros((0, 3), dtype=int)
+            else:
+                faces = self.faces[matches]
+        else:
+            faces = self.faces
+
+        return _SurfaceSliceResponse(
+            vertices=vertices,
+            faces=faces,
+            vertex_values=vertex_values,
+            vertex_colors=vertex_colors,
+            slice_input=self.slice_input,
+            request_id=self.id,
+        )
+
+    def _slice_associated_data(
+        self,
+        data: np.ndarray | None,
+        vertex_ndim: int,
+        dims: int = 1,
+    ) -> list[Any] | np.ndarray:
+        """Return associated layer data (e.g. vertex values, colors) within
+        the current slice.
+        """
+        if data is None:
+            return []
+
+        data_ndim = data.ndim - 1
+        if data_ndim >= dims:
+            # Get indices for axes corresponding to data dimensions
+            data_indices: tuple[int | slice, ...] = tuple(
+                slice(None) if np.isnan(idx) else int(np.round(idx))
+                for idx in self.data_slice.point[:-vertex_ndim]
+            )
+            data = data[data_indices]
+            if data.ndim > dims:
+                warnings.warn(
+                    trans._(
+                        'Assigning multiple data per vertex after slicing '
+                        'is not allowed. All dimensions corresponding to '
+                        'vertex data must be non-displayed dimensions. Data '
+                        'may not be visible.',
+                        deferred=True,
+                    ),
+                    category=UserWarning,
+                    stacklevel=2,
+                )
+                return []
+        return data
@@ -545,3 +545,21 @@ def test_surface_with_no_visible_faces():
 def test_docstring():
     validate_all_params_in_docstring(Surface)
     validate_kwargs_sorted(Surface)
+
+
+def test_slice_request_response():
+    """Test slicing a time-varying surface with a slice request."""
+    vertices = np.random.random((10, 3))
+    faces = np.random.randint(10, size=(6, 3))
+    values = np.random.random((5, 10))
+    layer = Surface((vertices, faces, values))
+
+    request = layer._make_slice_request(Dims(ndim=4, point=(2, 0, 0, 0)))
+    response = request()
+    np.testing.assert_array_equal(response.vertex_values, values[2])
+    np.testing.assert_array_equal(response.faces, faces)
+    np.testing.assert_array_equal(response.vertices, vertices[:, 1:])
+
+    layer._update_slice_response(response)
+    np.testing.assert_array_equal(layer._view_vertex_values, values[2])
+    np.testing.assert_array_equal(layer._view_faces, faces)
@@ -1,18 +1,22 @@
 import copy
-import warnings
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import pandas as pd
 
 from napari.layers.base import Layer
 from napari.layers.intensity_mixin import IntensityVisualizationMixin
+from napari.layers.surface._slice import (
+    _SurfaceSliceRequest,
+    _SurfaceSliceResponse,
+)
 from napari.layers.surface._surface_constants import Shading
 from napari.layers.surface._surface_utils import (
     calculate_barycentric_coordinates,
 )
 from napari.layers.surface.normals import SurfaceNormals
 from napari.layers.surface.wireframe import SurfaceWireframe
+from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
 from napari.layers.utils.interactivity_utils import (
     nd_line_segment_to_displayed_data_ray,
 )
@@ -23,6 +27,9 @@ from napari.utils.events.event_utils import connect_no_arg
 from napari.utils.geometry import find_nearest_triangle_intersection
 from napari.utils.translations import trans
 
+if TYPE_CHECKING:
+    from napari.components.dims import Dims
+
 
 # Mixin must come before Layer
 class Surface(IntensityVisualizationMixin, Layer):
@@ -617,97 +624,43 @@ class Surface(IntensityVisualizationMixin, Layer):
         )
         return state
 
-    def _slice_associated_data(
-        self,
-        data: np.ndarray,
-        vertex_ndim: int,
-        dims: int = 1,
-    ) -> list[Any] | np.ndarray:
-        """Return associated layer data (e.g. vertex values, colors) within
-        the current slice.
-        """
-        if data is None:
-            return []
-
-        data_ndim = data.ndim - 1
-        if data_ndim >= dims:
-            # Get indices for axes corresponding to data dimensions
-            data_indices: tuple[int | slice, ...] = tuple(
-                slice(None) if np.isnan(idx) else int(np.round(idx))
-                for idx in self._data_slice.point[:-vertex_ndim]
-            )
-            data = data[data_indices]
-            if data.ndim > dims:
-                warnings.warn(
-                    trans._(
-                        'Assigning multiple data per vertex after slicing '
-                        'is not allowed. All dimensions corresponding to '
-                        'vertex data must be non-displayed dimensions. Data '
-                        'may not be visible.',
-                        deferred=True,
-                    ),
-                    category=UserWarning,
-                    stacklevel=2,
-                )
-                return []
-        return data
-
-    def _set_view_slice(self):
+    def _set_view_slice(self) -> None:
         """Sets the view given the indices to slice with."""
-        N, vertex_ndim = self.vertices.shape
-        values_ndim = self.vertex_values.ndim - 1
-
-        self._view_vertex_values = self._slice_associated_data(
-            self.vertex_values,
-            vertex_ndim,
+        request = self._make_slice_request_internal(
+            self._slice_input, self._data_slice
         )
-
-        self._view_vertex_colors = self._slice_associated_data(
-            self.vertex_colors,
-            vertex_ndim,
-            dims=2,
+        response = request()
+        self._update_slice_response(response)
+
+    def _make_slice_request(self, dims: 'Dims') -> _SurfaceSliceRequest:
+        """Make a Surface slice request based on the given dims and these data."""
+        slice_input = self._make_slice_input(dims)
+        # See Image._make_slice_request to understand why we evaluate this here
+        # instead of using `self._data_slice`.
+        data_slice = slice_input.data_slice(self._data_to_world.inverse)
+        return self._make_slice_request_internal(slice_input, data_slice)
+
+    def _make_slice_request_internal(
+        self, slice_input: _SliceInput, data_slice: _ThickNDSlice
+    ) -> _SurfaceSliceRequest:
+        return _SurfaceSliceRequest(
+            slice_input=slice_input,
+            data_slice=data_slice,
+            vertices=self.vertices,
+            faces=self.faces,
+            vertex_values=self.vertex_values,
+            vertex_colors=self.vertex_colors,
         )
 
-        if len(self._view_vertex_values) == 0:
-            self._data_view = np.zeros((0, self._slice_input.ndisplay))
-            self._view_faces = np.zeros((0, 3), dtype=int)
-            return
-
-        if values_ndim > 0:
-            indices = np.array(self._data_slice.point[-vertex_ndim:])
-            disp = [
-                d
-                for d in np.subtract(self._slice_input.displayed, values_ndim)
-                if d >= 0
-            ]
-            not_disp = [
-                d
-                for d in np.subtract(
-                    self._slice_input.not_displayed, values_ndim
-                )
-                if d >= 0
-            ]
-        else:
-            indices = np.array(self._data_slice.point)
-            not_disp = list(self._slice_input.not_displayed)
-            disp = list(self._slice_input.displayed)
+    def _update_slice_response(self, response: _SurfaceSliceResponse) -> None:
+        """Handle a slicing response."""
+        self._slice_input = response.slice_input
+        self._data_view = response.vertices
+        self._view_faces = response.faces
+        self._view_vertex_values = response.vertex_values
+        self._view_vertex_colors = response.vertex_colors
 
-        self._data_view = self.vertices[:, disp]
-        if len(self.vertices) == 0:
-            self._view_faces = np.zeros((0, 3), dtype=int)
-        elif vertex_ndim > self._slice_input.ndisplay:
-            vertices = self.vertices[:, not_disp].astype('int')
-            triangles = vertices[self.faces]
-            matches = np.all(triangles == indices[not_disp], axis=(1, 2))
-            matches = np.where(matches)[0]
-            if len(matches) == 0:
-                self._view_faces = np.zeros((0, 3), dtype=int)
-            else:
-                self._view_faces = self.faces[matches]
-        else:
-            self._view_faces = self.faces
-
-        if self._keep_auto_contrast:
+        if len(self._view_vertex_values) > 0 and self._keep_auto_contrast:
             self.reset_contrast_limits()
 
     def _update_thumbnail(self) -> None:
@@ -0,0 +1,220 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+import numpy.typing as npt
+
+from napari.layers.base._slice import _next_request_id
+from napari.layers.tracks._track_utils import TrackManager
+from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
+
+
+def _pad_display_data(
+    vertices: npt.NDArray | None, slice_input: _SliceInput
+) -> npt.NDArray | None:
+    """Pad display data when moving between 2d and 3d."""
+    if vertices is None:
+        return None
+
+    data = vertices[:, slice_input.displayed]
+    # if we're only displaying two dimensions, then pad the display dim
+    # with zeros
+    if slice_input.ndisplay == 2:
+        data = np.pad(data, ((0, 0), (0, 1)), 'constant')
+        return data[:, (1, 0, 2)]  # y, x, z -> x, y, z
+
+    return data[:, (2, 1, 0)]  # z, y, x -> x, y, z
+
+
+@dataclass(frozen=True)
+class _TrackWindow:
+    """The track vertices sent to the visual for the current time.
+
+    Attributes
+    ----------
+    window : tuple of float or None
+        First and last time of the vertices, or None if all of them are sent.
+    indices : array (K,) or None
+        Indices of the vertices in the track vertices of the `TrackManager`.
+    connex : array (K,) or None
+        Connection array for drawing the track lines of these vertices.
+    track_vertices : array or None
+        The track vertices of the `TrackManager` this was found for.
+    tail_length, head_length : float
+        The tail and head length this was found for.
+    """
+
+    window: tuple[float, float] | None
+    indices: np.ndarray | None = field(repr=False)
+    connex: np.ndarray | None = field(repr=False)
+    track_vertices: np.ndarray | None = field(repr=False)
+    tail_length: float
+    head_length: float
+
+
+def _find_track_window(
+    manager: TrackManager,
+    current_time: float | None,
+    tail_length: float,
+    head_length: float,
+    window: tuple[float, float] | None,
+    force: bool = False,
+) -> _TrackWindow | None:
+    """Find the track vertices to send to the visual for the current time.
+
+    When the tails of the tracks fade, only the vertices within the tail
+    and head length of the current time are visible, so only those are
+    sent to the visual. Some margin is added to the window, so that the
+    vertices only need to be sent again once the time moves past it.
+
+    Parameters
+    ----------
+    manager : TrackManager
+        The manager of the track vertices.
+    current_time : float or None
+        The current time, or None if the tails of the tracks do not fade.
+    tail_length, head_length : float
+        The tail and head length of the tracks.
+    window : tuple of float or None
+        The window of the vertices currently sent to the visual.
+    force : bool
+        Whether to find the vertices in the window even if the current
+        window still contains the visible times, e.g. as the data changed.
+
+    Returns
+    -------
+    _TrackWindow or None
+        The vertices to send to the visual, or None if those currently sent
+        do not need to change.
+    """
+    if manager.track_vertices is None:
+        return None
+    if current_time is not None:
+        low = current_time - tail_length
+        high = current_time + head_length
+        if (
+            not force
+            and window is not None
+            and window[0] <= low
+            and high <= window[1]
+        ):
+            return None
+        margin = (tail_length + head_length) / 2 + 1
+        window = (low - margin, high + margin)
+    elif not force and window is None:
+        return None
+    else:
+        window = None
+
+    indices, connex = None, None
+    if window is not None:
+        indices, connex = manager.vertices_in_time_window(*window)
+        if len(indices) == 0:
+            # a single unconnected vertex draws nothing
+            indices = np.zeros(1, dtype=int)
+            connex = np.zeros(1, dtype=bool)
+    return _TrackWindow(
+        window=window,
+        indices=indices,
+        connex=connex,
+        track_vertices=manager.track_vertices,
+        tail_length=tail_length,
+        head_length=head_length,
+    )
+
+
+@dataclass(frozen=True)
+class _TrackSliceResponse:
+    """Contains all the output data of slicing a Tracks layer.
+
+    Attributes
+    ----------
+    labels : list of str or None
+        The labels of the tracks at the current time, or None if there are none.
+    label_positions : array like or None
+        The displayed positions of the labels, padded to 3D.
+    track_window : _TrackWindow or None
+        The track vertices to send to the visual for the current time, or
+        None if those sent when the request was made do not need to change.
+    slice_input : _SliceInput
+        Describes the slicing plane or bounding box in the layer's dimensions.
+    request_id : int
+        The identifier of the request from which this was generated.
+    """
+
+    labels: list[str] | None = field(repr=False)
+    label_positions: np.ndarray | None = field(repr=False)
+    track_window: _TrackWindow | None = field(repr=False)
+    slice_input: _SliceInput
+    request_id: int
+
+
+@dataclass(frozen=True)
+class _TrackSliceRequest:
+    """A callable that stores all the input data needed to slice a Tracks layer.
+
+    This should be treated a deeply immutable structure, even though some
+    fields can be modified in place. It is like a function that has captured
+    all its inputs already.
+
+    In general, the calling an instance of this may take a long time, so you may
+    want to run it off the main thread.
+
+    Attributes
+    ----------
+    slice_input : _SliceInput
+        Describes the slicing plane or bounding box in the layer's dimensions.
+    data_slice : _ThickNDSlice
+        The slicing coordinates and margins in data space.
+    manager : TrackManager
+        A shallow copy of the manager of the tracks. The manager replaces its
+        arrays rather than editing them in place, so the copy is unaffected
+        by later changes to the tracks.
+    tail_length, head_length : float
+        The tail and head length of the tracks.
+    track_window : tuple of float or None
+        The window of the vertices sent to the visual when the request was
+        made.
+    """
+
+    slice_input: _SliceInput
+    data_slice: _ThickNDSlice = field(repr=False)
+    manager: TrackManager = field(repr=False)
+    tail_length: float
+    head_length: float
+    track_window: tuple[float, float] | None
+    id: int = field(default_factory=_next_request_id)
+
+    def __call__(self) -> _TrackSliceResponse:
+        current_time = self.data_slice.point[0]
+        points = self.manager._points
+        points_id = self.manager._points_id
+        points_lookup = self.manager._points_lookup
+        if (
+            points is None
+            or points_id is None
+            or current_time not in points_lookup
+        ):
+            labels, positions = None, None
+        else:
+            lookup = points_lookup[current_time]
+            labels = [f'ID:{i}' for i in points_id[lookup]]
+            positions = _pad_display_data(
+                points[lookup, ...], self.slice_input
+            )
+            if not labels:
+                labels, positions = None, None
+        use_fade = 0 in self.slice_input.not_displayed
+        track_window = _find_track_window(
+            self.manager,
+            current_time if use_fade else None,
+            self.tail_length,
+            self.head_length,
+            self.track_window,
+        )
+        return _TrackSliceResponse(
+            labels=labels,
+            label_positions=positions,
+            track_window=track_window,
+            slice_input=self.slice_input,
+            request_id=self.id,
+        )
@@ -2,6 +2,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from napari.components.dims import Dims
 from napari.layers import Tracks
 from napari.layers.tracks._track_utils import TrackManager
 from napari.utils._test_utils import (
@@ -147,6 +148,35 @@ def test_track_layer_graph():
     assert layer.graph == graph
 
 
+def test_track_layer_graph_edges():
+    """Test track layer graph given as an array of edges."""
+    data = np.zeros((6, 4))
+    data[:, 0] = [0, 0, 1, 1, 2, 2]
+    data[:, 1] = [0, 1, 2, 3, 2, 3]
+    data[:, 2] = np.arange(6)
+    layer = Tracks(data, graph=np.array([[1, 0], [2, 0]]))
+    assert layer.graph == {1: [0], 2: [0]}
+
+    # each edge joins the first vertex of a track to the last of its parent
+    np.testing.assert_array_equal(
+        layer._manager.graph_vertices[:, :2],
+        [[2, 2], [1, 1], [2, 4], [1, 1]],
+    )
+    np.testing.assert_array_equal(
+        layer.graph_connex, [True, False, True, False]
+    )
+
+    layer.graph = {2: 1}
+    np.testing.assert_array_equal(
+        layer._manager.graph_vertices[:, :2], [[2, 4], [3, 3]]
+    )
+
+    with pytest.raises(ValueError, match='node 2 not found'):
+        layer.graph = np.array([[2, 5]])
+    with pytest.raises(ValueError, match='Kx2 array'):
+        layer.graph = np.array([1, 0, 2])
+
+
 def test_track_layer_reset_data():
     """Test changing data once layer is instantiated."""
     data = np.zeros((100, 4))
@@ -299,3 +329,105 @@ def test_track_connex_validity() -> None:
 def test_docstring():
     validate_all_params_in_docstring(Tracks)
     validate_kwargs_sorted(Tracks)
+
+
+def test_slice_request_response():
+    """Test slicing the track labels with a slice request."""
+    data = np.array([[0, 0, 0, 0], [0, 1, 1, 1], [1, 1, 2, 3]])
+    layer = Tracks(data)
+
+    request = layer._make_slice_request(Dims(ndim=3, point=(1, 0, 0)))
+    response = request()
+    assert response.labels == ['ID:0', 'ID:1']
+
+    layer._update_slice_response(response)
+    labels, positions = layer.track_labels
+    assert labels == ['ID:0', 'ID:1']
+    # positions are padded and ordered as x, y, z
+    np.testing.assert_array_equal(positions, [[1, 1, 0], [3, 2, 0]])
+
+    layer._update_slice_response(
+        layer._make_slice_request(Dims(ndim=3, point=(5, 0, 0)))()
+    )
+    assert layer.track_labels == (None, (None, None))
+
+
+def test_vertices_in_time_window():
+    """Test finding the track vertices in a time window."""
+    data = np.zeros((9, 4))
+    data[:, 0] = [0, 0, 0, 0, 0, 1, 1, 2, 2]
+    data[:, 1] = [0, 1, 2, 3, 4, 3, 4, 8, 9]
+    manager = TrackManager(data)
+    manager.build_tracks()
+
+    indices, connex = manager.vertices_in_time_window(2, 2)
+    # track 0 keeps the vertices around the window, track 1 only has a
+    # vertex after it, which does not draw any line
+    np.testing.assert_array_equal(indices, [1, 2, 3])
+    np.testing.assert_array_equal(connex, [True, True, False])
+
+    indices, connex = manager.vertices_in_time_window(3.5, 8)
+    np.testing.assert_array_equal(indices, [3, 4, 5, 6, 7, 8])
+    np.testing.assert_array_equal(
+        connex, [True, False, True, False, True, False]
+    )
+
+    indices, _ = manager.vertices_in_time_window(20, 30)
+    assert len(indices) == 0
+
+
+def test_track_window_follows_current_time():
+    """Test that only the vertices near the current time are sent."""
+    data = np.zeros((100, 4))
+    data[:, 1] = np.arange(100)
+    layer = Tracks(data, tail_length=4, head_length=0)
+    ranges = ((0, 99, 1), (0, 1, 1), (0, 1, 1))
+
+    layer._slice_dims(Dims(ndim=3, range=ranges, point=(50, 0, 0)))
+    low, high = layer._track_window
+    assert low <= 46
+    assert high >= 50
+    times = layer._view_track_times
+    assert times.min() < 46
+    assert times.max() > 50
+    assert len(times) < len(data)
+    assert len(layer._view_track_vertices) == len(times)
+    assert len(layer._view_track_colors) == len(times)
+    assert not layer._view_track_connex[-1]
+
+    # the window only changes once the time moves past its margin
+    layer._slice_dims(Dims(ndim=3, range=ranges, point=(51, 0, 0)))
+    assert layer._track_window == (low, high)
+    layer._slice_dims(Dims(ndim=3, range=ranges, point=(80, 0, 0)))
+    assert layer._track_window[1] >= 80
+
+    # all vertices are sent when the time is displayed
+    layer._slice_dims(Dims(ndim=3, ndisplay=3, range=ranges, point=(80, 0, 0)))
+    assert layer._track_window is None
+    assert len(layer._view_track_vertices) == len(data)
+
+
+def test_track_window_found_by_slice_request():
+    """Test that slice requests find the track window, unless the tracks
+    changed before their response is applied."""
+    data = np.zeros((100, 4))
+    data[:, 1] = np.arange(100)
+    layer = Tracks(data, tail_length=4, head_length=0)
+    ranges = ((0, 99, 1), (0, 1, 1), (0, 1, 1))
+
+    request = layer._make_slice_request(
+        Dims(ndim=3, range=ranges, point=(80, 0, 0))
+    )
+    response = request()
+    assert response.track_window is not None
+    layer._update_slice_response(response)
+    assert layer._track_window == response.track_window.window
+    assert layer._window_indices is response.track_window.indices
+
+    response = layer._make_slice_request(
+        Dims(ndim=3, range=ranges, point=(20, 0, 0))
+    )()
+    layer.data = data[:50]
+    layer._update_slice_response(response)
+    assert layer._window_indices is not response.track_window.indices
+    assert layer._window_indices.max() < 50
@@ -56,8 +56,25 @@ class TrackManager:
         Timestamp for each vertex in graph_vertices.
     track_ids : array (N,)
         Track ID for each vertex in track_vertices.
+
+    Notes
+    -----
+    _track_starts : array (M,)
+        Index in track_vertices of the first vertex of each of the M tracks.
+    _track_stops : array (M,)
+        Index in track_vertices after the last vertex of each track.
+    _time_keys : array (N,)
+        Increasing key of each vertex in track_vertices, combining the index
+        of its track and its time, to find vertices in a time window.
+    _bucket_offsets : array (B+1,)
+        Start of the tracks of each of the B time buckets in _bucket_tracks.
+    _bucket_tracks : array
+        Indices of the tracks that overlap each time bucket.
     """
 
+    # Maximum number of time buckets of the index of tracks by time.
+    _max_time_buckets = 256
+
     def __init__(self, data: np.ndarray) -> None:
         # store the raw data here
         self.data = data
@@ -67,14 +84,24 @@ class TrackManager:
         self._order: list[int]
         self._kdtree: cKDTree
         self._points: npt.NDArray
-        self._points_id: npt.NDArray
+        self._points_id: npt.NDArray | None = None
         self._points_lookup: dict[int, slice]
         self._ordered_points_idx: npt.NDArray
 
         self._track_vertices: npt.NDArray | None = None
         self._track_connex: npt.NDArray | None = None
 
+        self._track_starts: npt.NDArray
+        self._track_stops: npt.NDArray
+        self._time_keys: npt.NDArray = np.empty(0)
+        self._time_origin: float = 0
+        self._time_span: float = 1
+        self._bucket_size: float = 1
+        self._bucket_offsets: npt.NDArray = np.zeros(1, dtype=int)
+        self._bucket_tracks: npt.NDArray = np.empty(0, dtype=int)
+
         self._graph: dict[int, list[int]] | None = None
+        self._graph_edges: npt.NDArray | None = None
         self._graph_vertices = None
         self._graph_connex: npt.NDArray | None = None
 
@@ -116,6 +143,11 @@ class TrackManager:
         self._order = np.lexsort((data[:, 1], data[:, 0]))
         self._data = data[self._order]
 
+        # the vertices of each track are now contiguous, store their bounds
+        ids = self._data[:, 0]
+        self._track_starts = np.flatnonzero(np.diff(ids, prepend=ids[:1] - 1))
+        self._track_stops = np.append(self._track_starts[1:], len(ids))
+
         # build the indices for sorting points by time
         self._ordered_points_idx = np.argsort(self._data[:, 1])
         self._points = self._data[self._ordered_points_idx, 1:]
@@ -181,12 +213,29 @@ class TrackManager:
     @property
     def graph(self) -> dict[int, list[int]] | None:
         """dict {int: list}: Graph representing associations between tracks."""
+        if self._graph is None and self._graph_edges is not None:
+            graph: dict[int, list[int]] = {}
+            for node_idx, parent_idx in self._graph_edges.tolist():
+                graph.setdefault(node_idx, []).append(parent_idx)
+            self._graph = graph
         return self._graph
 
     @graph.setter
-    def graph(self, graph: dict[int, int | list[int]]) -> None:
-        """set the track graph"""
-        self._graph = self._normalize_track_graph(graph)
+    def graph(self, graph: dict[int, int | list[int]] | npt.ArrayLike) -> None:
+        """set the track graph, as a dictionary or an array of edges"""
+        self._graph_edges = self._normalize_track_graph(graph)
+        if isinstance(graph, dict):
+            self._graph = {
+                node_idx: (
+                    parents_idx
+                    if isinstance(parents_idx, list)
+                    else [parents_idx]
+                )
+                for node_idx, parents_idx in graph.items()
+            }
+        else:
+            # the dictionary is only built if requested
+            self._graph = None
 
     @property
     def track_ids(self) -> npt.NDArray[np.uint32]:
@@ -196,7 +245,7 @@ class TrackManager:
     @property
     def unique_track_ids(self) -> npt.NDArray[np.uint32]:
         """return the unique track identifiers"""
-        return np.unique(self.track_ids)
+        return self.data[self._track_starts, 0].astype(np.uint32)
 
     def __len__(self) -> int:
         """return the number of tracks"""
@@ -239,35 +288,51 @@ class TrackManager:
         return data
 
     def _normalize_track_graph(
-        self, graph: dict[int, int | list[int]]
-    ) -> dict[int, list[int]]:
-        """validate the track graph"""
-        new_graph: dict[int, list[int]] = {}
-
-        # check that graph nodes are of correct format
-        for node_idx, parents_idx in graph.items():
-            # make sure parents are always a list
-            if isinstance(parents_idx, list):
-                new_graph[node_idx] = parents_idx
-            else:
-                new_graph[node_idx] = [parents_idx]
-
-        unique_track_ids = set(self.unique_track_ids)
+        self, graph: dict[int, int | list[int]] | npt.ArrayLike
+    ) -> npt.NDArray:
+        """validate the track graph and return its (node, parent) edges"""
+        if isinstance(graph, dict):
+            nodes: list[int] = []
+            parents: list[int] = []
+            for node_idx, parents_idx in graph.items():
+                # make sure parents are always a list
+                if not isinstance(parents_idx, list):
+                    parents_idx = [parents_idx]
+                nodes.extend([node_idx] * len(parents_idx))
+                parents.extend(parents_idx)
+            edges = np.column_stack(
+                (np.asarray(nodes, dtype=int), np.asarray(parents, dtype=int))
+            )
+        else:
+            edges = np.asarray(graph)
+            if edges.size == 0:
+                edges = edges.reshape(0, 2)
+            if edges.ndim != 2 or edges.shape[1] != 2:
+                raise ValueError(
+                    trans._(
+                        'graph edges should be a Kx2 array of track IDs',
+                        deferred=True,
+                    )
+                )
+            if not np.array_equal(np.floor(edges), edges):
+                raise ValueError(
+                    trans._('track id must be an integer', deferred=True)
+                )
+            edges = edges.astype(int)
 
         # check that graph nodes exist in the track id lookup
-        for node_idx, parents_idx in new_graph.items():
-            nodes = [node_idx, *parents_idx]
-            for node in nodes:
-                if node not in unique_track_ids:
-                    raise ValueError(
-                        trans._(
-                            'graph node {node_idx} not found',
-                            deferred=True,
-                            node_idx=node_idx,
-                        )
-                    )
+        unique_track_ids = self.unique_track_ids
+        found = np.isin(edges, unique_track_ids).all(axis=1)
+        if not np.all(found):
+            raise ValueError(
+                trans._(
+                    'graph node {node_idx} not found',
+                    deferred=True,
+                    node_idx=edges[np.argmin(found), 0],
+                )
+            )
 
-        return new_graph
+        return edges
 
     def build_tracks(self) -> None:
         """build the tracks"""
@@ -290,35 +355,119 @@ class TrackManager:
         self._points_id = points_id
         self._track_vertices = track_vertices
         self._track_connex = track_connex
+        self._build_time_index()
+
+    def _build_time_index(self) -> None:
+        """build the index of the track vertices by time"""
+        assert self._track_vertices is not None
+        n_vertices = len(self._track_vertices)
+        if n_vertices == 0:
+            self._time_keys = np.empty(0)
+            self._bucket_offsets = np.zeros(1, dtype=int)
+            self._bucket_tracks = np.empty(0, dtype=int)
+            return
+
+        starts = self._track_starts
+        stops = self._track_stops
+        times = self._track_vertices[:, 0]
+        self._time_origin = float(np.min(times))
+        self._time_span = float(np.max(times)) - self._time_origin + 1
+        track_index = np.repeat(np.arange(len(starts)), stops - starts)
+        self._time_keys = track_index * self._time_span + (
+            times - self._time_origin
+        )
+
+        # list the tracks overlapping each bucket of time
+        self._bucket_size = max(self._time_span / self._max_time_buckets, 1)
+        first = self._time_bucket(times[starts])
+        last = self._time_bucket(times[stops - 1])
+        counts = last - first + 1
+        tracks = np.repeat(np.arange(len(starts)), counts)
+        offsets = np.repeat(np.cumsum(counts) - counts, counts)
+        buckets = first[tracks] + np.arange(len(tracks)) - offsets
+        order = np.argsort(buckets, kind='stable')
+        self._bucket_tracks = tracks[order]
+        self._bucket_offsets = np.searchsorted(
+            buckets[order], np.arange(last.max() + 2)
+        )
+
+    def _time_bucket(self, times: npt.ArrayLike) -> npt.NDArray:
+        """return the index of the time bucket of each time"""
+        return np.floor(
+            (np.asarray(times) - self._time_origin) / self._bucket_size
+        ).astype(int)
+
+    def vertices_in_time_window(
+        self, start: float, stop: float
+    ) -> tuple[npt.NDArray, npt.NDArray]:
+        """return the track vertices in a time window, and their connexions
+
+        To draw the tracks exactly as if all vertices were drawn, each track
+        also keeps the vertex just before and the vertex just after the
+        window, which the lines to the vertices in the window end at.
+
+        Parameters
+        ----------
+        start, stop : float
+            First and last time of the window.
+
+        Returns
+        -------
+        indices : array (K,)
+            Indices of the vertices in track_vertices, in the same order.
+        connex : array (K,)
+            Connection array for drawing the track lines of these vertices.
+        """
+        n_buckets = len(self._bucket_offsets) - 1
+        first, last = np.clip(self._time_bucket([start, stop]), 0, n_buckets)
+        tracks = np.unique(
+            self._bucket_tracks[
+                self._bucket_offsets[first] : self._bucket_offsets[
+                    min(last + 1, n_buckets)
+                ]
+            ]
+        )
+        keys = tracks * self._time_span - self._time_origin
+        lows = np.searchsorted(self._time_keys, keys + start, side='left')
+        highs = np.searchsorted(self._time_keys, keys + stop, side='right')
+        lows = np.maximum(lows - 1, self._track_starts[tracks])
+        highs = np.minimum(highs + 1, self._track_stops[tracks])
+        counts = np.maximum(highs - lows, 0)
+        counts[highs - lows <= 1] = 0
+        ends = np.cumsum(counts)
+        indices = np.repeat(lows - ends + counts, counts) + np.arange(
+            ends[-1] if len(ends) else 0
+        )
+        connex = np.ones(len(indices), dtype=bool)
+        connex[ends[counts > 0] - 1] = False
+        return indices, connex
 
     def build_graph(self) -> None:
         """build the track graph"""
+        assert self._graph_edges is not None
 
-        graph_vertices = []
-        graph_connex = []
-
-        assert self.graph is not None
-        for node_idx, parents_idx in self.graph.items():
-            # we join from the first observation of the node, to the last
-            # observation of the parent
-            node_start = self._vertex_indices_from_id(node_idx)[0]
-            node = self.data[node_start, 1:]
-
-            for parent_idx in parents_idx:
-                parent_stop = self._vertex_indices_from_id(parent_idx)[-1]
-                parent = self.data[parent_stop, 1:]
-
-                graph_vertices.append([node, parent])
-                graph_connex.append([True, False])
-
-        # if there is a graph, store the vertices and connection arrays,
-        # otherwise, clear the vertex arrays
-        if graph_vertices:
-            self._graph_vertices = np.concatenate(graph_vertices, axis=0)
-            self._graph_connex = np.concatenate(graph_connex, axis=0)
-        else:
+        # if there is no graph, clear the vertex arrays
+        if len(self._graph_edges) == 0:
             self._graph_vertices = None
             self._graph_connex = None
+            return
+
+        # we join from the first observation of the node, to the last
+        # observation of the parent, found from the bounds of the tracks
+        track_ids = self.data[self._track_starts, 0]
+        node_start = self._track_starts[
+            np.searchsorted(track_ids, self._graph_edges[:, 0])
+        ]
+        parent_stop = (
+            self._track_stops[
+                np.searchsorted(track_ids, self._graph_edges[:, 1])
+            ]
+            - 1
+        )
+        vertices = np.column_stack((node_start, parent_stop)).ravel()
+
+        self._graph_vertices = self.data[vertices, 1:]
+        self._graph_connex = np.tile([True, False], len(self._graph_edges))
 
     def vertex_properties(self, color_by: str) -> np.ndarray:
         """return the properties of tracks by vertex"""
@@ -396,20 +545,3 @@ class TrackManager:
         if self.graph_vertices is not None:
             return self.graph_vertices[:, 0]
         return None
-
-    def track_labels(
-        self, current_time: int
-    ) -> tuple[None, None] | tuple[list[str], np.ndarray]:
-        """return track labels at the current time"""
-        if self._points_id is None:
-            return None, None
-        # this is the slice into the time ordered points array
-        if current_time not in self._points_lookup:
-            lbl = []
-            pos = np.array([])
-        else:
-            lookup = self._points_lookup[current_time]
-            pos = self._points[lookup, ...]
-            lbl = [f'ID:{i}' for i in self._points_id[lookup]]
-
-        return lbl, pos
@@ -2,18 +2,31 @@
 # from napari.utils.events import Event
 # from napari.utils.colormaps import AVAILABLE_COLORMAPS
 
-from typing import Any
+from copy import copy
+from typing import TYPE_CHECKING, Any
 from warnings import warn
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
 from napari.layers.base import Layer
+from napari.layers.tracks._slice import (
+    _find_track_window,
+    _pad_display_data,
+    _TrackSliceRequest,
+    _TrackSliceResponse,
+    _TrackWindow,
+)
 from napari.layers.tracks._track_utils import TrackManager
+from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
 from napari.utils.colormaps import AVAILABLE_COLORMAPS, Colormap
 from napari.utils.events import Event
 from napari.utils.translations import trans
 
+if TYPE_CHECKING:
+    from napari.components.dims import Dims
+
 
 class Tracks(Layer):
     """Tracks layer.
@@ -57,12 +70,14 @@ class Tracks(Layer):
     features : Dataframe-like
         Features table where each row corresponds to a point and each column
         is a feature.
-    graph : dict {int: list}
+    graph : dict {int: list} or array (K, 2)
         Graph representing associations between tracks. Dictionary defines the
         mapping between a track ID and the parents of the track. This can be
         one (the track has one parent, and the parent has >=1 child) in the
         case of track splitting, or more than one (the track has multiple
         parents, but only one child) in the case of track merging.
+        The graph can also be given as an array of K edges, each row holding
+        the ID of a track and the ID of one of its parents.
         See examples/tracks_3d_with_graph.py
     head_length : float
         Length of the positive (forward in time) tails in units of time.
@@ -187,6 +202,16 @@ class Tracks(Layer):
         # use this to update shaders when the displayed dims change
         self._current_displayed_dims = None
 
+        # track labels at the current time, set when slicing
+        self._view_labels: list[str] | None = None
+        self._view_label_positions: np.ndarray | None = None
+
+        # time window of the track vertices sent to the visual, and the
+        # indices and connexions of those vertices, or None for all of them
+        self._track_window: tuple[float, float] | None = None
+        self._window_indices: np.ndarray | None = None
+        self._window_connex: np.ndarray | None = None
+
         # track display default limits
         self._max_length = 300
         self._max_width = 20
@@ -205,7 +230,7 @@ class Tracks(Layer):
             self.properties = properties
         else:
             self.features = features
-        self.graph = graph or {}
+        self.graph = {} if graph is None else graph
 
         self.color_by = color_by
         self.colormap = colormap
@@ -262,6 +287,37 @@ class Tracks(Layer):
 
     def _set_view_slice(self) -> None:
         """Sets the view given the indices to slice with."""
+        request = self._make_slice_request_internal(
+            self._slice_input, self._data_slice
+        )
+        response = request()
+        self._update_slice_response(response)
+
+    def _make_slice_request(self, dims: 'Dims') -> _TrackSliceRequest:
+        """Make a Tracks slice request based on the given dims and these data."""
+        slice_input = self._make_slice_input(dims)
+        # See Image._make_slice_request to understand why we evaluate this here
+        # instead of using `self._data_slice`.
+        data_slice = slice_input.data_slice(self._data_to_world.inverse)
+        return self._make_slice_request_internal(slice_input, data_slice)
+
+    def _make_slice_request_internal(
+        self, slice_input: _SliceInput, data_slice: _ThickNDSlice
+    ) -> _TrackSliceRequest:
+        return _TrackSliceRequest(
+            slice_input=slice_input,
+            data_slice=data_slice,
+            manager=copy(self._manager),
+            tail_length=self.tail_length,
+            head_length=self.head_length,
+            track_window=self._track_window,
+        )
+
+    def _update_slice_response(self, response: _TrackSliceResponse) -> None:
+        """Handle a slicing response."""
+        self._slice_input = response.slice_input
+        self._view_labels = response.labels
+        self._view_label_positions = response.label_positions
 
         # if the displayed dims have changed, update the shader data
         dims_displayed = self._slice_input.displayed
@@ -272,7 +328,47 @@ class Tracks(Layer):
             self.events.rebuild_tracks()
             self.events.rebuild_graph()
 
-        return
+        track_window = response.track_window
+        if (
+            track_window is not None
+            and track_window.track_vertices is self._manager.track_vertices
+            and track_window.tail_length == self.tail_length
+            and track_window.head_length == self.head_length
+        ):
+            self._set_track_window(track_window)
+        else:
+            # The window did not need to change when the request was made,
+            # or the tracks changed since, so it is checked again here.
+            self._update_track_window()
+
+    def _update_track_window(self, force: bool = False) -> None:
+        """Update the track vertices sent to the visual for the current time.
+
+        Parameters
+        ----------
+        force : bool
+            Whether to find the vertices in the window even if the current
+            window still contains the visible times, e.g. as the data changed.
+        """
+        if self._manager.track_vertices is None:
+            return
+        track_window = _find_track_window(
+            self._manager,
+            self.current_time if self.use_fade else None,
+            self.tail_length,
+            self.head_length,
+            self._track_window,
+            force=force,
+        )
+        if track_window is not None:
+            self._set_track_window(track_window)
+
+    def _set_track_window(self, track_window: _TrackWindow) -> None:
+        """Send the track vertices in a window to the visual."""
+        self._track_window = track_window.window
+        self._window_indices = track_window.indices
+        self._window_connex = track_window.connex
+        self.events.rebuild_tracks()
 
     def _get_value(self, position) -> int | None:
         """Value of the data at a position in data coordinates.
@@ -346,6 +442,37 @@ class Tracks(Layer):
         """return a view of the data"""
         return self._pad_display_data(self._manager.track_vertices)
 
+    @property
+    def _view_track_vertices(self) -> np.ndarray | None:
+        """the displayed track vertices sent to the visual"""
+        if self._window_indices is None:
+            return self._view_data
+        vertices = self._manager.track_vertices
+        assert vertices is not None
+        return self._pad_display_data(vertices[self._window_indices])
+
+    @property
+    def _view_track_colors(self) -> np.ndarray | None:
+        """the colors of the track vertices sent to the visual"""
+        if self._window_indices is None or self._track_colors is None:
+            return self._track_colors
+        return self._track_colors[self._window_indices]
+
+    @property
+    def _view_track_times(self) -> np.ndarray | None:
+        """the times of the track vertices sent to the visual"""
+        times = self.track_times
+        if self._window_indices is None or times is None:
+            return times
+        return times[self._window_indices]
+
+    @property
+    def _view_track_connex(self) -> np.ndarray | None:
+        """the connexions of the track vertices sent to the visual"""
+        if self._window_indices is None:
+            return self.track_connex
+        return self._window_connex
+
     @property
     def _view_graph(self):
         """return a view of the graph"""
@@ -353,17 +480,7 @@ class Tracks(Layer):
 
     def _pad_display_data(self, vertices):
         """pad display data when moving between 2d and 3d"""
-        if vertices is None:
-            return None
-
-        data = vertices[:, self._slice_input.displayed]
-        # if we're only displaying two dimensions, then pad the display dim
-        # with zeros
-        if self._slice_input.ndisplay == 2:
-            data = np.pad(data, ((0, 0), (0, 1)), 'constant')
-            return data[:, (1, 0, 2)]  # y, x, z -> x, y, z
-
-        return data[:, (2, 1, 0)]  # z, y, x -> x, y, z
+        return _pad_display_data(vertices, self._slice_input)
 
     @property
     def current_time(self) -> int | None:
@@ -405,6 +522,7 @@ class Tracks(Layer):
         self._manager.build_graph()
 
         # fire events to update shaders
+        self._update_track_window(force=True)
         self._update_dims()
         self.events.rebuild_tracks()
         self.events.rebuild_graph()
@@ -459,8 +577,8 @@ class Tracks(Layer):
         return self._manager.graph
 
     @graph.setter
-    def graph(self, graph: dict[int, int | list[int]]) -> None:
-        """Set the track graph."""
+    def graph(self, graph: dict[int, int | list[int]] | npt.ArrayLike) -> None:
+        """Set the track graph, as a dictionary or an array of edges."""
         # Ignored type, because mypy can't handle different signatures
         # on getters and setters; see https://github.com/python/mypy/issues/3004
         self._manager.graph = graph  # type: ignore[assignment]
@@ -487,6 +605,7 @@ class Tracks(Layer):
         if tail_length > self._max_length:
             self._max_length = tail_length
         self._tail_length: int = tail_length
+        self._update_track_window()
         self.events.tail_length()
 
     @property
@@ -498,6 +617,7 @@ class Tracks(Layer):
         if head_length > self._max_length:
             self._max_length = head_length
         self._head_length: int = head_length
+        self._update_track_window()
         self.events.head_length()
 
     @property
@@ -637,15 +757,10 @@ class Tracks(Layer):
     @property
     def track_labels(self) -> tuple:
         """return track labels at the current time"""
-        assert self.current_time is not None
-        labels, positions = self._manager.track_labels(self.current_time)
-
         # if there are no labels, return empty for vispy
-        if not labels:
+        if self._view_labels is None:
             return None, (None, None)
-
-        padded_positions = self._pad_display_data(positions)
-        return labels, padded_positions
+        return self._view_labels, self._view_label_positions
 
     def _check_color_by_in_features(self) -> None:
         if self._color_by not in self.features.columns:
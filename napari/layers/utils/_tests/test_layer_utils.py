@@ -5,12 +5,14 @@ import pandas as pd
 import pytest
 from dask import array as da
 
+from napari.layers.utils import layer_utils
 from napari.layers.utils.layer_utils import (
     _FeatureTable,
     calc_data_range,
     coerce_current_properties,
     dataframe_to_properties,
     dims_displayed_world_to_layer,
+    estimate_data_range,
     get_current_properties,
     register_layer_attr_action,
     segment_normal,
@@ -90,6 +92,46 @@ def test_calc_data_range_fast(data):
     assert elapsed < 5, 'test took too long, computation was likely not lazy'
 
 
+def test_estimate_data_range():
+    data = np.ones((100, 64, 64), dtype=np.float32)
+    data *= np.arange(100)[:, np.newaxis, np.newaxis]
+    data[50, 1, 1] = 1e6
+    data[50, 2, 2] = np.nan
+
+    # the first, middle and last planes are always sampled
+    assert estimate_data_range(data, n_regions=3) == (0, 1e6)
+    assert estimate_data_range(data, n_regions=100) == (0, 1e6)
+
+
+def test_estimate_data_range_samples_chunks():
+    data = da.zeros((1000, 10, 10), chunks=(1, 10, 10))
+    reads = []
+
+    def _read(block, block_info=None):
+        reads.append(block_info[0]['chunk-location'])
+        return block
+
+    low, high = estimate_data_range(
+        data.map_blocks(_read, dtype=data.dtype), n_regions=20
+    )
+
+    assert (low, high) == (0, 1)
+    assert len(reads) == 20
+    assert {(0, 0, 0), (500, 0, 0), (999, 0, 0)} <= set(reads)
+
+
+def test_calc_data_range_caches_lazy_estimates(monkeypatch):
+    data = da.ones((200, 250, 250), chunks=(1, 250, 250)) * 3
+    assert calc_data_range(data) == (0, 3)
+
+    def _fail(*args, **kwargs):
+        raise AssertionError('range of the same data estimated again')
+
+    monkeypatch.setattr(layer_utils, 'estimate_data_range', _fail)
+    same_data = da.ones((200, 250, 250), chunks=(1, 250, 250)) * 3
+    assert calc_data_range(same_data) == (0, 3)
+
+
 def test_segment_normal_2d():
     a = np.array([1, 1])
     b = np.array([1, 10])
@@ -407,6 +449,71 @@ def test_feature_table_remove(feature_table: _FeatureTable):
     np.testing.assert_array_equal(features['confidence'], [0.2, 1])
 
 
+def test_feature_table_resize_grows_columns(feature_table: _FeatureTable):
+    expected_dtypes = feature_table.values.dtypes
+
+    for size in range(5, 12):
+        feature_table.resize(size)
+
+    # the values are not copied to a DataFrame until they are read
+    assert feature_table._values is None
+    assert feature_table._capacity == 16
+    features = feature_table.values
+    assert features.shape == (11, 2)
+    np.testing.assert_array_equal(features['class'][3:], ['person'] * 8)
+    np.testing.assert_array_equal(features.dtypes, expected_dtypes)
+
+
+def test_feature_table_default_columns_cached_by_value():
+    feature_table = _FeatureTable(
+        {'confidence': [0.2, 0.5], 'count': [1, 2]}, num_data=2
+    )
+    feature_table.resize(3)
+    columns = feature_table._default_columns()
+
+    feature_table.set_currents(feature_table.currents())
+    assert feature_table._default_columns() is columns
+
+    feature_table.set_currents({'confidence': 0.7, 'count': 3})
+    assert feature_table._default_columns() is not columns
+    feature_table.resize(4)
+    np.testing.assert_array_equal(feature_table.values.iloc[-1], [0.7, 3])
+
+
+def test_feature_table_view(feature_table: _FeatureTable):
+    feature_table.resize(6)
+    feature_table.remove([0])
+
+    view = feature_table.view
+    assert feature_table._values is None
+    assert view.shape == (5, 2)
+    assert 'class' in view
+    tail = view.iloc[3:]
+    assert tail.shape == (2, 2)
+    np.testing.assert_array_equal(tail.index, [3, 4])
+    np.testing.assert_array_equal(tail['confidence'], [0.8, 0.8])
+    pd.testing.assert_series_equal(
+        view['class'], feature_table.values['class'], check_index=False
+    )
+
+
+def test_feature_table_append_after_values_changed(
+    feature_table: _FeatureTable,
+):
+    feature_table.resize(5)
+    feature_table.values.loc[4, 'confidence'] = 0.1
+
+    feature_table.append(TEST_FEATURES.iloc[:1])
+    feature_table.reorder([4, 0, 1, 2, 3, 5])
+
+    np.testing.assert_array_equal(
+        feature_table.values['confidence'], [0.1, 0.2, 0.5, 1, 0.8, 0.2]
+    )
+    np.testing.assert_array_equal(
+        feature_table.values['class'].cat.codes, [1, 2, 1, 0, 1, 2]
+    )
+
+
 def test_feature_table_from_layer_with_custom_index():
     features = pd.DataFrame({'a': [1, 3], 'b': [7.5, -2.1]}, index=[1, 2])
     feature_table = _FeatureTable.from_layer(features=features)
@@ -212,3 +212,37 @@ def test_validate_from_format_dict():
     actual = StringEncoding.validate(argument)
 
     assert actual == expected
+
+
+def test_format_columns_matches_format_rows():
+    features = pd.DataFrame(
+        {
+            'class': pd.Categorical(['a', None, 'c', 'a']),
+            'confidence': np.array([0.1, 1, np.nan, 2.5], dtype=np.float32),
+            'label': [1, 2, 3, 4],
+        },
+        index=[3, 5, 7, 9],
+    )
+    encoding = FormatStringEncoding(
+        format='{index}: {class!r:>5} {confidence} {label:03d}%'
+    )
+
+    values = encoding(features)
+
+    expected = encoding._format_rows(
+        features, ['index', *features.columns], True
+    )
+    np.testing.assert_array_equal(values, expected)
+    assert values[1] == '5:   nan 1.0 002%'
+
+
+def test_format_with_attribute_field(features):
+    encoding = FormatStringEncoding(format='{class.upper}')
+    values = encoding(features)
+    assert values[0].startswith('<built-in method upper')
+
+
+def test_format_with_nested_spec(numeric_features):
+    encoding = FormatStringEncoding(format='{confidence:.{label}f}')
+    values = encoding(numeric_features)
+    np.testing.assert_array_equal(values, ['0.5', '1.00', '0.250'])
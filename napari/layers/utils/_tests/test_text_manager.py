@@ -776,3 +776,25 @@ def test_compute_text_coords_with_3D_data_2D_display(order):
 
     expected_coords = coords + translation[slice_input.displayed]
     np.testing.assert_equal(text_coords, expected_coords)
+
+
+def test_displayed_positions_with_max_count():
+    features = pd.DataFrame({'score': [1.0, np.nan, 3.0, 2.0, 0.0]})
+    text_manager = TextManager(max_count=2, priority='score')
+    indices_view = np.array([0, 1, 2, 3, 4])
+
+    positions = text_manager._displayed_positions(
+        indices_view, None, set(), features
+    )
+    np.testing.assert_array_equal(positions, [2, 3])
+
+    positions = text_manager._displayed_positions(
+        indices_view, np.array([0, 1, 4]), {1}, features
+    )
+    np.testing.assert_array_equal(positions, [0, 1])
+
+    text_manager.max_count = None
+    positions = text_manager._displayed_positions(
+        indices_view, np.array([1, 4]), {1}, features
+    )
+    np.testing.assert_array_equal(positions, [1, 4])
@@ -166,6 +166,47 @@ def _calculate_bbox_extents(
     return bbox_min, bbox_max
 
 
+def get_text_window(
+    window: npt.NDArray | None,
+    corner_pixels: npt.NDArray,
+    displayed: list[int],
+) -> npt.NDArray:
+    """Get the window of data coordinates in which text is displayed.
+
+    The window contains the visible region along the displayed dimensions,
+    with a margin of half its size on each side, so that it only needs to
+    change once the camera moves past the margin or zooms in a lot.
+
+    Parameters
+    ----------
+    window : (2, D) np.ndarray or None
+        The current window, with NaN along the dimensions that are not
+        displayed, or None if there is none.
+    corner_pixels : (2, D) np.ndarray
+        The corners of the visible region in data coordinates.
+    displayed : list of int
+        The displayed dimensions.
+
+    Returns
+    -------
+    window : (2, D) np.ndarray
+        The given window if it still fits the visible region, or a new one.
+    """
+    low, high = corner_pixels[:, displayed]
+    size = high - low + 1
+    if (
+        window is not None
+        and np.all(window[0, displayed] <= low)
+        and np.all(high <= window[1, displayed])
+        and np.all(window[1, displayed] - window[0, displayed] <= 4 * size)
+    ):
+        return window
+    new_window = np.full((2, corner_pixels.shape[1]), np.nan)
+    new_window[0, displayed] = low - size / 2
+    new_window[1, displayed] = high + size / 2
+    return new_window
+
+
 TEXT_ANCHOR_CALCULATION = {
     Anchor.CENTER: _calculate_anchor_center,
     Anchor.UPPER_LEFT: _calculate_anchor_upper_left,
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import atexit
 import functools
 import inspect
+import threading
 import warnings
 from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -201,6 +204,211 @@ def _nanmax(array):
     return max_value
 
 
+class _RunningRange:
+    """Minimum and maximum of values seen block by block, ignoring NaN and
+    infinite values."""
+
+    def __init__(self) -> None:
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def update(self, block: npt.ArrayLike) -> None:
+        block = np.asarray(block).ravel()
+        if not np.issubdtype(block.dtype, np.integer):
+            block = block[np.isfinite(block)]
+        if block.size == 0:
+            return
+        low, high = block.min(), block.max()
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+
+
+def _sample_regions(
+    data: LayerDataProtocol,
+    rgb: bool,
+    n_regions: int,
+    max_region_size: int,
+    rng: np.random.Generator,
+) -> list[tuple[slice, ...]]:
+    """Pick regions spread at random over an array, aligned to its chunks.
+
+    The first, middle and last chunks are always picked. Arrays that are not
+    chunked are split in planes of 1024x1024 tiles (or 4096 elements if 1D).
+    Regions larger than ``max_region_size`` are cropped around their center.
+    """
+    # imported here, as the labels layer depends on this module
+    from napari.layers.labels._labels_utils import get_chunk_boundaries
+
+    boundaries = get_chunk_boundaries(data)
+    if boundaries is None:
+        ndim = len(data.shape)
+        n_plane_axes = 1 if ndim == 1 else 2
+        chunks = [1] * ndim
+        for axis in range(ndim - n_plane_axes - int(rgb), ndim):
+            chunks[axis] = 4096 if ndim == 1 else 1024
+        if rgb:
+            chunks[-1] = data.shape[-1]
+        boundaries = [
+            np.append(np.arange(0, size, chunk), size)
+            for size, chunk in zip(data.shape, chunks, strict=True)
+        ]
+    n_chunks = [len(b) - 1 for b in boundaries]
+    picks = {
+        tuple(0 for _ in n_chunks),
+        tuple(n // 2 for n in n_chunks),
+        tuple(n - 1 for n in n_chunks),
+    }
+    n_regions = min(n_regions, int(np.prod(n_chunks, dtype=float)))
+    while len(picks) < n_regions:
+        picks.add(tuple(int(rng.integers(n)) for n in n_chunks))
+
+    regions = []
+    for pick in sorted(picks):
+        starts = [int(b[i]) for b, i in zip(boundaries, pick, strict=True)]
+        sizes = [
+            int(b[i + 1] - b[i]) for b, i in zip(boundaries, pick, strict=True)
+        ]
+        while np.prod(sizes, dtype=float) > max_region_size:
+            axis = int(np.argmax(sizes))
+            starts[axis] += sizes[axis] // 4
+            sizes[axis] -= sizes[axis] // 2
+        regions.append(
+            tuple(
+                slice(start, start + size)
+                for start, size in zip(starts, sizes, strict=True)
+            )
+        )
+    return regions
+
+
+def estimate_data_range(
+    data: LayerDataProtocol,
+    rgb: bool = False,
+    n_regions: int = 16,
+    max_region_size: int = 2**18,
+    seed: int = 0,
+) -> tuple[float, float]:
+    """Estimate the range of data values from regions sampled at random.
+
+    Regions aligned with the chunks of the data (or tiles of its planes if it
+    is not chunked) are read in turn, and the range is updated from each of
+    them, so that the estimate costs about ``n_regions * max_region_size``
+    elements whatever the size of the data.
+
+    Parameters
+    ----------
+    data : array
+        Data to estimate the range of values of.
+    rgb : bool
+        Flag if data is rgb.
+    n_regions : int
+        Number of regions to sample.
+    max_region_size : int
+        Maximum number of elements read from each region.
+    seed : int
+        Seed of the random choice of regions, so that estimates of the same
+        data are reproducible.
+
+    Returns
+    -------
+    values : pair of floats
+        Estimated minimum and maximum values in that order. If all sampled
+        values are equal, [0, 1] is extended to include them.
+    """
+    regions = _sample_regions(
+        data, rgb, n_regions, max_region_size, np.random.default_rng(seed)
+    )
+    running = _RunningRange()
+    if hasattr(data, 'dask'):
+        # let dask schedule the reads of all regions together
+        blocks = dask.compute(*(data[region] for region in regions))
+    else:
+        blocks = (data[region] for region in regions)
+    for block in blocks:
+        running.update(block)
+
+    min_val = 0 if running.min is None else running.min
+    max_val = 1 if running.max is None else running.max
+    if min_val == max_val:
+        min_val = min(min_val, 0)
+        max_val = max(max_val, 1)
+    return float(min_val), float(max_val)
+
+
+_DATA_RANGE_CACHE_SIZE = 64
+_DATA_RANGE_CACHE: dict[Any, tuple[float, float]] = {}
+_DATA_RANGE_CACHE_LOCK = threading.Lock()
+
+
+def _data_range_cache_key(data: LayerDataProtocol) -> Any | None:
+    """Key identifying the content of lazy data across layers, if any.
+
+    Dask arrays are identified by their deterministic name, and zarr arrays
+    by their path in a persistent store. Other data may be modified in place,
+    so their range is not cached.
+    """
+    if hasattr(data, 'dask') and hasattr(data, 'name'):
+        return ('dask', data.name, data.shape, str(data.dtype))
+    store_path = str(getattr(data, 'store_path', ''))
+    if store_path and not store_path.startswith('memory'):
+        return ('zarr', store_path, data.shape, str(data.dtype))
+    return None
+
+
+def _cached_estimate_data_range(
+    data: LayerDataProtocol, rgb: bool = False
+) -> tuple[float, float]:
+    """Estimate the range of data values, reusing previous estimates."""
+    key = _data_range_cache_key(data)
+    if key is None:
+        return estimate_data_range(data, rgb=rgb)
+    key = (*key, rgb)
+    # estimates are made both on the main thread and in the background
+    with _DATA_RANGE_CACHE_LOCK:
+        if key in _DATA_RANGE_CACHE:
+            # move to the end, as the most recently used
+            _DATA_RANGE_CACHE[key] = _DATA_RANGE_CACHE.pop(key)
+            return _DATA_RANGE_CACHE[key]
+    data_range = estimate_data_range(data, rgb=rgb)
+    with _DATA_RANGE_CACHE_LOCK:
+        _DATA_RANGE_CACHE[key] = data_range
+        while len(_DATA_RANGE_CACHE) > _DATA_RANGE_CACHE_SIZE:
+            del _DATA_RANGE_CACHE[next(iter(_DATA_RANGE_CACHE))]
+    return data_range
+
+
+_DATA_RANGE_EXECUTOR: ThreadPoolExecutor | None = None
+
+
+def submit_data_range_estimate(
+    data: LayerDataProtocol, rgb: bool = False
+) -> Future[tuple[float, float]]:
+    """Estimate the range of data values on a background thread.
+
+    Parameters
+    ----------
+    data : array
+        Data to estimate the range of values of.
+    rgb : bool
+        Flag if data is rgb.
+
+    Returns
+    -------
+    future : Future of pair of floats
+        The future estimate, as given by `calc_data_range`.
+    """
+    global _DATA_RANGE_EXECUTOR
+    if _DATA_RANGE_EXECUTOR is None:
+        _DATA_RANGE_EXECUTOR = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='napari_data_range'
+        )
+        # do not wait at exit for estimates that were not started
+        atexit.register(
+            _DATA_RANGE_EXECUTOR.shutdown, wait=False, cancel_futures=True
+        )
+    return _DATA_RANGE_EXECUTOR.submit(calc_data_range, data, rgb)
+
+
 def calc_data_range(
     data: LayerDataProtocol, rgb: bool = False
 ) -> tuple[float, float]:
@@ -221,7 +429,9 @@ def calc_data_range(
     Notes
     -----
     If the data type is uint8, no calculation is performed, and 0-255 is
-    returned.
+    returned. If the data has more than 1e7 elements, the range is estimated
+    from regions sampled across it, see `estimate_data_range`, and estimates
+    of lazy data are cached so that opening the same data again is instant.
     """
     if data.dtype == np.uint8:
         return (0, 255)
@@ -234,53 +444,12 @@ def calc_data_range(
             max_val = max(max_val, 1)
         return float(min_val), float(max_val)
 
-    center: int | list[int]
-    reduced_data: list | LayerDataProtocol
-    if data.size > 1e7 and (data.ndim == 1 or (rgb and data.ndim == 2)):
-        # If data is very large take the average of start, middle and end.
-        center = int(data.shape[0] // 2)
-        slices = [
-            slice(0, 4096),
-            slice(center - 2048, center + 2048),
-            slice(-4096, None),
-        ]
-        reduced_data = [
-            [_nanmax(data[sl]) for sl in slices],
-            [_nanmin(data[sl]) for sl in slices],
-        ]
-    elif data.size > 1e7:
-        # If data is very large take the average of the top, bottom, and
-        # middle slices
-        offset = 2 + int(rgb)
-        bottom_plane_idx = (0,) * (data.ndim - offset)
-        middle_plane_idx = tuple(s // 2 for s in data.shape[:-offset])
-        top_plane_idx = tuple(s - 1 for s in data.shape[:-offset])
-        idxs = [bottom_plane_idx, middle_plane_idx, top_plane_idx]
-        # If each plane is also very large, look only at a subset of the image
-        if (
-            np.prod(data.shape[-offset:]) > 1e7
-            and data.shape[-offset] > 64
-            and data.shape[-offset + 1] > 64
-        ):
-            # Find a central patch of the image to take
-            center = [int(s // 2) for s in data.shape[-offset:]]
-            central_slice = tuple(slice(c - 31, c + 31) for c in center[:2])
-            reduced_data = [
-                [_nanmax(data[idx + central_slice]) for idx in idxs],
-                [_nanmin(data[idx + central_slice]) for idx in idxs],
-            ]
-        else:
-            reduced_data = [
-                [_nanmax(data[idx]) for idx in idxs],
-                [_nanmin(data[idx]) for idx in idxs],
-            ]
-        # compute everything in one go
-        reduced_data = dask.compute(*reduced_data)
-    else:
-        reduced_data = data
+    if data.size > 1e7:
+        # If data is very large, only look at regions sampled across it.
+        return _cached_estimate_data_range(data, rgb=rgb)
 
-    min_val = _nanmin(reduced_data)
-    max_val = _nanmax(reduced_data)
+    min_val = _nanmin(data)
+    max_val = _nanmax(data)
 
     if min_val == max_val:
         min_val = min(min_val, 0)
@@ -753,6 +922,14 @@ def features_to_pandas_dataframe(features: Any) -> pd.DataFrame:
 class _FeatureTable:
     """Stores feature values and their defaults.
 
+    The values are stored either as a pandas DataFrame, or as NumPy columns
+    that grow by doubling their capacity, with categorical columns stored
+    as their codes. Appending, removing and reordering rows switch to the
+    columns, so that adding rows one at a time takes amortized constant
+    time. Reading `values` builds the DataFrame from the columns, which is
+    then used until the next change of the rows, so that it can be
+    modified in place.
+
     Parameters
     ----------
     values : Optional[Union[Dict[str, np.ndarray], pd.DataFrame]]
@@ -776,17 +953,48 @@ class _FeatureTable:
         num_data: int | None = None,
         defaults: dict[str, Any] | pd.DataFrame | None = None,
     ) -> None:
-        self._values = _validate_features(values, num_data=num_data)
+        self._values: pd.DataFrame | None = _validate_features(
+            values, num_data=num_data
+        )
         self._defaults = _validate_feature_defaults(defaults, self._values)
+        # The columns, only used while _values is None.
+        self._columns: dict[Any, np.ndarray] = {}
+        self._dtypes: dict[Any, Any] = {}
+        self._size = 0
+        self._capacity = 0
+        self._default_columns_cache: tuple | None = None
 
     @property
     def values(self) -> pd.DataFrame:
         """The feature values table."""
+        if self._values is None:
+            self._values = self.view._frame()
+            self._columns = {}
         return self._values
 
+    @property
+    def view(self) -> pd.DataFrame | _FeatureColumns:
+        """A read-only, dataframe-like view of the feature values.
+
+        Unlike `values`, this does not build a DataFrame from the columns, so
+        it should be used to read features when they may have just been
+        appended. The view is only valid until the rows change or `values`
+        is read.
+        """
+        if self._values is not None:
+            return self._values
+        return _FeatureColumns(self, 0, self._size)
+
+    @property
+    def _num_rows(self) -> int:
+        if self._values is not None:
+            return self._values.shape[0]
+        return self._size
+
     def set_values(self, values, *, num_data=None) -> None:
         """Sets the feature values table."""
         self._values = _validate_features(values, num_data=num_data)
+        self._columns = {}
         self._defaults = _validate_feature_defaults(None, self._values)
 
     @property
@@ -796,7 +1004,7 @@ class _FeatureTable:
 
     def set_defaults(self, defaults: dict[str, Any] | pd.DataFrame) -> None:
         """Sets the feature default values."""
-        self._defaults = _validate_feature_defaults(defaults, self._values)
+        self._defaults = _validate_feature_defaults(defaults, self.view)
 
     def properties(self) -> dict[str, np.ndarray]:
         """Converts this to a deprecated properties dictionary.
@@ -809,7 +1017,7 @@ class _FeatureTable:
         Dict[str, np.ndarray]
             The properties dictionary equivalent to the given features.
         """
-        return _features_to_properties(self._values)
+        return _features_to_properties(self.view)
 
     def choices(self) -> dict[str, np.ndarray]:
         """Converts this to a deprecated property choices dictionary.
@@ -821,10 +1029,11 @@ class _FeatureTable:
         Dict[str, np.ndarray]
             The property choices dictionary equivalent to this.
         """
+        dtypes = self._dtypes if self._values is None else self._values.dtypes
         return {
-            name: series.dtype.categories.to_numpy()
-            for name, series in self._values.items()
-            if isinstance(series.dtype, pd.CategoricalDtype)
+            name: dtype.categories.to_numpy()
+            for name, dtype in dtypes.items()
+            if isinstance(dtype, pd.CategoricalDtype)
         }
 
     def currents(self) -> dict[str, np.ndarray]:
@@ -852,8 +1061,9 @@ class _FeatureTable:
         currents = coerce_current_properties(currents)
         self._defaults = _validate_features(currents, num_data=1)
         if update_indices is not None:
+            values = self.values
             for k in self._defaults:
-                self._values.loc[update_indices, k] = self._defaults[k][0]
+                values.loc[update_indices, k] = self._defaults[k][0]
 
     def resize(
         self,
@@ -866,12 +1076,15 @@ class _FeatureTable:
         size : int
             The new size (number of rows) of the features table.
         """
-        current_size = self._values.shape[0]
+        current_size = self._num_rows
         if size < current_size:
             self.remove(range(size, current_size))
         elif size > current_size:
-            to_append = self._defaults.iloc[np.zeros(size - current_size)]
-            self.append(to_append)
+            n_rows = size - current_size
+            if (defaults := self._default_columns()) is not None:
+                self._append_columns(defaults, n_rows, repeat=True)
+            else:
+                self.append(self._defaults.iloc[np.zeros(n_rows)])
 
     def append(self, to_append: pd.DataFrame) -> None:
         """Append new feature rows to this.
@@ -881,7 +1094,15 @@ class _FeatureTable:
         to_append : pd.DataFrame
             The features to append.
         """
-        self._values = pd.concat([self._values, to_append], ignore_index=True)
+        if self._to_columns(to_append):
+            self._append_columns(
+                _frame_to_columns(to_append), to_append.shape[0]
+            )
+        else:
+            self._values = pd.concat(
+                [self.values, to_append], ignore_index=True
+            )
+            self._columns = {}
 
     def remove(self, indices: Any) -> None:
         """Remove rows from this by index.
@@ -892,13 +1113,97 @@ class _FeatureTable:
             The indices of the rows to remove. Must be usable as the labels parameter
             to pandas.DataFrame.drop.
         """
-        self._values = self._values.drop(labels=indices, axis=0).reset_index(
-            drop=True
-        )
+        if not self._to_columns():
+            self._values = self.values.drop(
+                labels=indices, axis=0
+            ).reset_index(drop=True)
+            return
+        keep = np.ones(self._size, dtype=bool)
+        keep[np.asarray(indices, dtype=np.intp)] = False
+        size = int(np.count_nonzero(keep))
+        for column in self._columns.values():
+            column[:size] = column[: self._size][keep]
+        self._size = size
 
     def reorder(self, order: Sequence[int]) -> None:
         """Reorders the rows of the feature values table."""
-        self._values = self._values.iloc[order].reset_index(drop=True)
+        if not self._to_columns():
+            self._values = self.values.iloc[order].reset_index(drop=True)
+            return
+        order = np.asarray(order, dtype=np.intp)
+        self._columns = {
+            name: column[: self._size][order]
+            for name, column in self._columns.items()
+        }
+        self._size = self._capacity = len(order)
+
+    def _default_columns(self) -> dict[Any, np.ndarray] | None:
+        """The columns of the defaults, if they can be appended to the columns.
+
+        They are cached for the current default values and column dtypes, as
+        setting the current properties replaces the defaults by equal ones.
+        """
+        if not self._to_columns():
+            return None
+        cache = self._default_columns_cache
+        if (
+            cache is None
+            or cache[1] is not self._dtypes
+            or not cache[0].equals(self._defaults)
+        ):
+            columns = None
+            if self._to_columns(self._defaults):
+                columns = _frame_to_columns(self._defaults)
+            cache = self._default_columns_cache = (
+                self._defaults.copy(),
+                self._dtypes,
+                columns,
+            )
+        return cache[2]
+
+    def _to_columns(self, other: pd.DataFrame | None = None) -> bool:
+        """Switch to storing the values as columns, if they can be.
+
+        Returns False if the values cannot be stored as columns, or if the
+        columns of ``other`` do not have the same names and dtypes, in which
+        case rows of ``other`` cannot be appended to the columns.
+        """
+        values = self._values
+        if values is not None and not values.columns.is_unique:
+            return False
+        dtypes = self._dtypes if values is None else dict(values.dtypes)
+        if other is not None and (
+            list(other.columns) != list(dtypes)
+            or any(other.dtypes[name] != dt for name, dt in dtypes.items())
+        ):
+            return False
+        if values is not None:
+            self._dtypes = dtypes
+            self._columns = _frame_to_columns(values)
+            self._size = self._capacity = values.shape[0]
+            self._values = None
+        return True
+
+    def _append_columns(
+        self, columns: dict[Any, np.ndarray], n_rows: int, repeat=False
+    ) -> None:
+        """Append rows to the columns, doubling their capacity if needed.
+
+        If ``repeat`` is True, the only row of each given column is repeated
+        ``n_rows`` times.
+        """
+        size = self._size + n_rows
+        if size > self._capacity:
+            self._capacity = max(size, 2 * self._capacity)
+            for name, column in self._columns.items():
+                grown = np.empty(self._capacity, dtype=column.dtype)
+                grown[: self._size] = column[: self._size]
+                self._columns[name] = grown
+        for name, column in columns.items():
+            self._columns[name][self._size : size] = (
+                column[0] if repeat else column
+            )
+        self._size = size
 
     @classmethod
     def from_layer(
@@ -944,6 +1249,112 @@ class _FeatureTable:
         return cls(features, defaults=feature_defaults, num_data=num_data)
 
 
+class _FeatureColumns:
+    """A read-only, dataframe-like view of rows of a `_FeatureTable`.
+
+    This supports the part of the DataFrame interface used by the style
+    encodings to read feature values, such as getting a column as a Series
+    or a slice of rows with ``iloc``, without building a DataFrame of all
+    the columns.
+    """
+
+    def __init__(self, table: _FeatureTable, start: int, stop: int) -> None:
+        self._table = table
+        self._start = start
+        self._stop = stop
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self._stop - self._start, len(self._table._dtypes)
+
+    @property
+    def columns(self) -> pd.Index:
+        return pd.Index(list(self._table._dtypes))
+
+    @property
+    def dtypes(self) -> pd.Series:
+        return pd.Series(self._table._dtypes, dtype=object)
+
+    @property
+    def index(self) -> pd.RangeIndex:
+        return pd.RangeIndex(self._start, self._stop)
+
+    @property
+    def iloc(self) -> _FeatureColumnsIndexer:
+        return _FeatureColumnsIndexer(self)
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __iter__(self):
+        return iter(self._table._dtypes)
+
+    def __contains__(self, name: Any) -> bool:
+        return name in self._table._dtypes
+
+    def __getitem__(self, name: Any) -> pd.Series:
+        column = self._table._columns[name][self._start : self._stop]
+        column.flags.writeable = False
+        dtype = self._table._dtypes[name]
+        if isinstance(dtype, pd.CategoricalDtype):
+            values = pd.Categorical.from_codes(column, dtype=dtype)
+        elif isinstance(dtype, np.dtype):
+            values = column
+        else:
+            values = pd.array(column, dtype=dtype)
+        return pd.Series(values, index=self.index, name=name, copy=False)
+
+    def keys(self) -> pd.Index:
+        return self.columns
+
+    def items(self):
+        for name in self._table._dtypes:
+            yield name, self[name]
+
+    def itertuples(self, index: bool = True, name: str | None = 'Pandas'):
+        return self._frame().itertuples(index=index, name=name)
+
+    def _frame(self) -> pd.DataFrame:
+        """Build a DataFrame of the viewed rows."""
+        return pd.DataFrame(
+            {name: column.copy() for name, column in self.items()},
+            index=pd.RangeIndex(self._stop - self._start),
+        )
+
+
+class _FeatureColumnsIndexer:
+    """Position-based indexer of the rows of a `_FeatureColumns` view."""
+
+    def __init__(self, view: _FeatureColumns) -> None:
+        self._view = view
+
+    def __getitem__(self, key: Any) -> _FeatureColumns | pd.DataFrame:
+        view = self._view
+        if isinstance(key, slice) and key.step in (None, 1):
+            start, stop, _ = key.indices(len(view))
+            stop = max(start, stop)
+            return _FeatureColumns(
+                view._table, view._start + start, view._start + stop
+            )
+        return view._frame().set_axis(view.index).iloc[key]
+
+
+def _frame_to_columns(frame: pd.DataFrame) -> dict[Any, np.ndarray]:
+    """Copy the columns of a DataFrame to arrays that can be stored in a
+    `_FeatureTable`, with categorical columns stored as their codes.
+    """
+    columns = {}
+    for name, series in frame.items():
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            column = series.cat.codes.to_numpy()
+        elif isinstance(series.dtype, np.dtype):
+            column = series.to_numpy()
+        else:
+            column = series.to_numpy(dtype=object)
+        columns[name] = np.array(column, copy=True)
+    return columns
+
+
 def _get_default_column(column: pd.Series) -> pd.Series:
     """Get the default column of length 1 from a data column."""
     value = None
@@ -1,8 +1,11 @@
 from collections.abc import Sequence
+from functools import lru_cache
+from itertools import repeat
 from string import Formatter
 from typing import Any, Literal, Protocol, Union, runtime_checkable
 
 import numpy as np
+import pandas as pd
 
 from napari._pydantic_compat import parse_obj_as
 from napari.layers.utils.style_encoding import (
@@ -166,20 +169,89 @@ class FormatStringEncoding(_DerivedStyleEncoding[StringValue, StringArray]):
     encoding_type: Literal['FormatStringEncoding'] = 'FormatStringEncoding'
 
     def __call__(self, features: Any) -> StringArray:
+        if features.shape[0] == 0:
+            return np.array([], dtype=str)
         feature_names = features.columns.to_list()
         # Expose the dataframe index to the format string keys
         # unless a column exists with the name "index", which takes precedence.
-        with_index = False
-        if 'index' not in feature_names:
-            feature_names = ['index'] + feature_names
-            with_index = True
+        with_index = 'index' not in feature_names
+        field_names = (
+            ['index', *feature_names] if with_index else feature_names
+        )
+        segments = _parse_format(self.format)
+        if not all(
+            field is None or _is_simple_field(field, spec, field_names)
+            for _, field, spec, _ in segments
+        ):
+            return self._format_rows(features, field_names, with_index)
+
+        # Format each referenced column once, then join the columns with the
+        # literal text in between.
+        values = np.full(features.shape[0], '', dtype=object)
+        for literal, field, spec, conversion in segments:
+            if literal:
+                values += literal
+            if field is None:
+                continue
+            column = (
+                features[field] if field in feature_names else features.index
+            )
+            values += _format_column(column, spec, conversion)
+        return np.array(values, dtype=str)
+
+    def _format_rows(
+        self, features: Any, field_names: list[str], with_index: bool
+    ) -> StringArray:
+        """Formats the string of each row of the features separately.
+
+        This supports all the fields of str.format, like attribute or item
+        access, which are not supported when formatting whole columns.
+        """
         values = [
-            self.format.format(**dict(zip(feature_names, row, strict=False)))
+            self.format.format(**dict(zip(field_names, row, strict=False)))
             for row in features.itertuples(index=with_index, name=None)
         ]
         return np.array(values, dtype=str)
 
 
+@lru_cache(maxsize=64)
+def _parse_format(
+    string: str,
+) -> tuple[tuple[str, str | None, str, str | None], ...]:
+    """Returns the literal text and replacement fields of a format string."""
+    return tuple(
+        (literal, field, spec or '', conversion)
+        for literal, field, spec, conversion in Formatter().parse(string)
+    )
+
+
+def _is_simple_field(field: str, spec: str, field_names: list[str]) -> bool:
+    """Returns True if a whole column can be formatted for a field, i.e. it
+    only names a column and its format spec does not contain nested fields."""
+    return field in field_names and '{' not in spec
+
+
+def _format_column(
+    column: pd.Series | pd.Index, spec: str, conversion: str | None
+) -> np.ndarray:
+    """Formats each value of a column, like a replacement field of str.format.
+
+    Categorical columns only format their categories.
+    """
+
+    def format_values(values: list) -> np.ndarray:
+        if conversion is not None:
+            convert_field = Formatter().convert_field
+            values = [convert_field(value, conversion) for value in values]
+        return np.array(list(map(format, values, repeat(spec))), dtype=object)
+
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        formatted = format_values([*column.cat.categories.to_list(), np.nan])
+        # missing values have code -1, so take the formatted NaN
+        return formatted[column.cat.codes.to_numpy()]
+    return format_values(column.to_list())
+
+
 def _is_format_string(string: str) -> bool:
     """Returns True if a string is a valid format string with at least one field, False otherwise."""
     try:
@@ -1,5 +1,5 @@
 import warnings
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 from copy import deepcopy
 from typing import Any, Union
 
@@ -79,6 +79,15 @@ class TextManager(EventedModel):
         Offset from the anchor point in data coordinates.
     rotation : float
         Angle of the text elements around the anchor point. Default value is 0.
+    max_count : int or None
+        Maximum number of text elements displayed at once. When more elements
+        are in view, the text of the selected elements is displayed first,
+        followed by the elements with the highest values of the priority
+        feature. If None, the text of all elements in view is displayed.
+    priority : str or None
+        Name of the feature whose highest values are displayed first when
+        there are more than max_count text elements in view. If None, the
+        elements are displayed in order.
     """
 
     string: StringEncoding = ConstantStringEncoding(constant='')
@@ -90,6 +99,8 @@ class TextManager(EventedModel):
     # Use a scalar default translation to broadcast to any dimensionality.
     translation: Array[float] = 0
     rotation: float = 0
+    max_count: PositiveInt | None = None
+    priority: str | None = None
 
     def __init__(
         self, text=None, properties=None, n_text=None, features=None, **kwargs
@@ -291,6 +302,50 @@ class TextManager(EventedModel):
             else values
         )
 
+    def _displayed_positions(
+        self,
+        indices_view: np.ndarray,
+        in_window: np.ndarray | None,
+        selected: Collection[int],
+        features: Any,
+    ) -> np.ndarray:
+        """Get the positions in the view of the text elements to display.
+
+        Parameters
+        ----------
+        indices_view : (N,) np.ndarray
+            Indices of the elements in view.
+        in_window : (M,) np.ndarray or None
+            Sorted positions in the view of the elements in the visible window
+            of the canvas, or None if the text of all of them may be displayed.
+        selected : collection of int
+            Indices of the selected elements, whose text is displayed first
+            when there are more than max_count text elements.
+        features : Any
+            The features table of the layer.
+
+        Returns
+        -------
+        positions : (K,) np.ndarray
+            Sorted positions in the view of the text elements to display.
+        """
+        positions = (
+            np.arange(len(indices_view)) if in_window is None else in_window
+        )
+        if self.max_count is None or len(positions) <= self.max_count:
+            return positions
+
+        indices = indices_view[positions]
+        if self.priority is not None and self.priority in features:
+            # sorted codes rank any comparable values, with missing ones last
+            values = features[self.priority].to_numpy()[indices]
+            rank = -pd.factorize(values, sort=True)[0]
+        else:
+            rank = np.zeros(len(indices), dtype=int)
+        unselected = ~np.isin(indices, list(selected))
+        order = np.lexsort((rank, unselected))
+        return np.sort(positions[order[: self.max_count]])
+
     def _view_color(self, indices_view: np.ndarray) -> np.ndarray:
         """Get the colors of the text elements at the given indices."""
         return _get_style_values(self.color, indices_view, value_ndim=1)
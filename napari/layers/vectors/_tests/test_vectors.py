@@ -695,6 +695,81 @@ def test_out_of_slice_display():
     assert layer.out_of_slice_display is True
 
 
+def test_decimation_level_follows_zoom():
+    """Test that the decimation level changes with the canvas scale."""
+    data = np.zeros((8, 8, 2))
+    layer = Vectors(data, scale=(2, 2))
+    assert layer.decimation == 'none'
+    assert layer._decimation_level is None
+
+    levels = []
+    layer.events._decimation_level.connect(
+        lambda e: levels.append(layer._decimation_level)
+    )
+    layer.decimation = 'subsample'
+    # 4 canvas pixels of 1 world unit are 2 data units
+    assert layer._decimation_level == 1
+
+    corners = np.array([[0, 0], [16, 16]])
+    layer._update_draw(4, corners, (100, 100))
+    assert layer._decimation_level == 3
+    # the level only changes when zooming by a factor of 2
+    layer._update_draw(3, corners, (100, 100))
+    assert layer._decimation_level == 3
+    layer._update_draw(1, corners, (100, 100))
+    assert layer._decimation_level == 1
+    assert levels == [1, 3, 1]
+
+    layer.decimation = 'none'
+    assert layer._decimation_level is None
+
+
+def test_decimation_level_stops_at_vector_spacing():
+    """Test that vectors are not decimated on grids finer than their spacing."""
+    projections = np.zeros((4, 4, 2))
+    layer = Vectors(projections, decimation='subsample')
+    assert layer._view_spacing == 1
+
+    corners = np.array([[0, 0], [4, 4]])
+    layer._update_draw(0.5, corners, (100, 100))
+    assert layer._decimation_level == 1
+    layer._update_draw(0.25, corners, (100, 100))
+    assert layer._decimation_level == 0
+    # zooming in further shows the same undecimated vectors
+    layer._update_draw(0.125, corners, (100, 100))
+    assert layer._decimation_level is None
+    layer._update_draw(0.01, corners, (100, 100))
+    assert layer._decimation_level is None
+
+
+@pytest.mark.parametrize('decimation', ['subsample', 'average'])
+def test_decimated_view(decimation):
+    """Test that vectors are decimated to one per grid cell."""
+    projections = np.zeros((4, 4, 2))
+    projections[..., 0] = np.arange(16).reshape(4, 4)
+    layer = Vectors(projections, decimation=decimation, edge_color='red')
+
+    view_data, colors = layer._decimated_view(None)
+    assert len(view_data) == 16
+    view_data, colors = layer._decimated_view(1)
+    assert len(view_data) == 4
+    np.testing.assert_array_equal(colors, [[1, 0, 0, 1]] * 4)
+    if decimation == 'subsample':
+        np.testing.assert_array_equal(
+            view_data[:, 0], [[0, 0], [2, 0], [0, 2], [2, 2]]
+        )
+        np.testing.assert_array_equal(view_data[:, 1, 0], [0, 2, 8, 10])
+    else:
+        np.testing.assert_array_equal(
+            view_data[:, 0], [[0.5, 0.5], [2.5, 0.5], [0.5, 2.5], [2.5, 2.5]]
+        )
+        np.testing.assert_array_equal(
+            view_data[:, 1, 0], [2.5, 4.5, 10.5, 12.5]
+        )
+    view_data, _ = layer._decimated_view(5)
+    assert len(view_data) == 1
+
+
 def test_empty_data_from_tuple():
     """Test that empty data raises an error."""
     layer = Vectors(name='vector', ndim=3)
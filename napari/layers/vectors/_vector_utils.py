@@ -107,3 +107,83 @@ def fix_data_vectors(
             )
         )
     return vectors, data_ndim
+
+
+def decimate_vectors(
+    vectors: npt.NDArray,
+    colors: npt.NDArray,
+    cell_size: float,
+    average: bool = False,
+) -> tuple[npt.NDArray, npt.NDArray]:
+    """Reduce vectors to one per cell of a regular grid.
+
+    Parameters
+    ----------
+    vectors : (N, 2, D) array
+        Start points and projections of the vectors.
+    colors : (N, 4) array
+        Colors of the vectors.
+    cell_size : float
+        Size of the grid cells along each dimension, in the same units as
+        the start points of the vectors.
+    average : bool
+        If True, each cell gets the average start point, projection and
+        color of its vectors. Otherwise, each cell keeps its first vector.
+
+    Returns
+    -------
+    vectors : (M, 2, D) array
+        The decimated vectors, in the order of the first vector of each cell.
+    colors : (M, 4) array
+        Colors of the decimated vectors.
+    """
+    if len(vectors) == 0:
+        return vectors, colors
+    cells = np.floor(vectors[:, 0] / cell_size).astype(np.int64)
+    cells -= cells.min(axis=0)
+    shape = cells.max(axis=0) + 1
+    n_cells = int(np.prod(shape.astype(float)))
+    if n_cells <= 4 * len(vectors):
+        # With few enough cells, grouping by cell is linear in the number
+        # of vectors rather than needing a sort.
+        keys = np.ravel_multi_index(tuple(cells.T), tuple(shape))
+        first = np.full(n_cells, len(vectors))
+        # Reversed so that the first vector of each cell is assigned last.
+        first[keys[::-1]] = np.arange(len(vectors) - 1, -1, -1)
+        occupied = np.flatnonzero(first < len(vectors))
+        order = np.argsort(first[occupied])
+        if not average:
+            kept = first[occupied][order]
+            return vectors[kept], colors[kept]
+        groups = np.full(n_cells, -1)
+        groups[occupied[order]] = np.arange(len(occupied))
+        inverse = groups[keys]
+        n_groups = len(occupied)
+    else:
+        _, kept, inverse = np.unique(
+            cells, axis=0, return_index=True, return_inverse=True
+        )
+        order = np.argsort(kept)
+        if not average:
+            kept = kept[order]
+            return vectors[kept], colors[kept]
+        groups = np.empty_like(order)
+        groups[order] = np.arange(len(order))
+        inverse = groups[inverse.ravel()]
+        n_groups = len(order)
+
+    counts = np.bincount(inverse, minlength=n_groups)[:, np.newaxis]
+    flat = np.concatenate([vectors.reshape(len(vectors), -1), colors], axis=1)
+    sums = np.stack(
+        [
+            np.bincount(inverse, weights=column, minlength=n_groups)
+            for column in flat.T
+        ],
+        axis=1,
+    )
+    averages = sums / counts
+    n_columns = vectors.shape[1] * vectors.shape[2]
+    return (
+        averages[:, :n_columns].reshape(n_groups, *vectors.shape[1:]),
+        averages[:, n_columns:],
+    )
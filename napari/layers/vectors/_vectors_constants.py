@@ -42,3 +42,17 @@ class VectorsProjectionMode(StringEnum):
 
     NONE = auto()
     ALL = auto()
+
+
+class VectorsDecimation(StringEnum):
+    """Decimation mode of dense vector fields when zoomed out.
+
+    * NONE: draw all the vectors in the slice
+    * SUBSAMPLE: draw one vector in each cell of a grid whose spacing on
+      the canvas is constant
+    * AVERAGE: draw the average vector of each cell of that grid
+    """
+
+    NONE = auto()
+    SUBSAMPLE = auto()
+    AVERAGE = auto()
@@ -15,8 +15,12 @@ from napari.layers.vectors._slice import (
     _VectorSliceRequest,
     _VectorSliceResponse,
 )
-from napari.layers.vectors._vector_utils import fix_data_vectors
+from napari.layers.vectors._vector_utils import (
+    decimate_vectors,
+    fix_data_vectors,
+)
 from napari.layers.vectors._vectors_constants import (
+    VectorsDecimation,
     VectorsProjectionMode,
     VectorStyle,
 )
@@ -54,6 +58,9 @@ class Vectors(Layer):
     cache : bool
         Whether slices of out-of-core datasets should be cached upon retrieval.
         Currently, this only applies to dask arrays.
+    decimation : str
+        How vectors are decimated in 2D when there are more of them than can
+        be told apart on the canvas. One of {'none', 'subsample', 'average'}.
     edge_color : str
         Color of all of the vectors.
     edge_color_cycle : np.ndarray, list
@@ -164,6 +171,16 @@ class Vectors(Layer):
     out_of_slice_display : bool
         If True, renders vectors not just in central plane but also slightly out of slice
         according to specified point marker size.
+    decimation : VectorsDecimation
+        Determines how dense vectors are decimated when zoomed out in 2D.
+
+        * ``VectorsDecimation.NONE``:
+            All vectors are displayed.
+        * ``VectorsDecimation.SUBSAMPLE``:
+            One vector is displayed in each cell of a grid whose spacing on
+            the canvas is constant.
+        * ``VectorsDecimation.AVERAGE``:
+            The average vector of each cell of that grid is displayed.
     units: tuple of pint.Unit
         Units of the layer data in world coordinates.
 
@@ -184,6 +201,12 @@ class Vectors(Layer):
         The maximum number of vectors that will ever be used to render the
         thumbnail. If more vectors are present then they are randomly
         subsampled.
+    _decimation_spacing : float
+        Minimum spacing in canvas pixels of the grid on which vectors are
+        decimated.
+    _decimation_level : int or None
+        Vectors are decimated on a grid with a spacing of 2 to this power in
+        data units, or not decimated if this is None.
     """
 
     _projectionclass = VectorsProjectionMode
@@ -191,6 +214,9 @@ class Vectors(Layer):
     # The max number of vectors that will ever be used to render the thumbnail
     # If more vectors are present then they are randomly subsampled
     _max_vectors_thumbnail = 1024
+    # The grid on which vectors are decimated is at least this many canvas
+    # pixels wide
+    _decimation_spacing = 4
 
     def __init__(
         self,
@@ -200,6 +226,7 @@ class Vectors(Layer):
         axis_labels=None,
         blending='translucent',
         cache=True,
+        decimation='none',
         edge_color='red',
         edge_color_cycle=None,
         edge_colormap='viridis',
@@ -261,12 +288,18 @@ class Vectors(Layer):
             out_of_slice_display=Event,
             features=Event,
             feature_defaults=Event,
+            decimation=Event,
+            _decimation_level=Event,
         )
 
         # Save the vector style params
         self._vector_style = VectorStyle(vector_style)
         self._edge_width = edge_width
         self._out_of_slice_display = out_of_slice_display
+        self._decimation = VectorsDecimation(decimation)
+        self._decimation_level: int | None = None
+        # Spacing of the vectors in view, see _view_spacing.
+        self._view_spacing_cache: float | None = None
 
         self._length = float(length)
 
@@ -441,6 +474,7 @@ class Vectors(Layer):
                 'features': self.features,
                 'feature_defaults': self.feature_defaults,
                 'out_of_slice_display': self.out_of_slice_display,
+                'decimation': self.decimation,
             }
         )
         return state
@@ -512,6 +546,29 @@ class Vectors(Layer):
             self.events.vector_style()
             self.refresh(extent=False, thumbnail=False)
 
+    @property
+    def decimation(self) -> str:
+        """Decimation mode of dense vectors when zoomed out in 2D.
+
+        VectorsDecimation.NONE
+            Displays all vectors.
+        VectorsDecimation.SUBSAMPLE
+            Displays one vector in each cell of a grid whose spacing on the
+            canvas is constant.
+        VectorsDecimation.AVERAGE
+            Displays the average vector of each cell of that grid.
+        """
+        return str(self._decimation)
+
+    @decimation.setter
+    def decimation(self, decimation: str) -> None:
+        old_decimation = self._decimation
+        self._decimation = VectorsDecimation(decimation)
+        if self._decimation != old_decimation:
+            self._update_decimation_level()
+            self.events.decimation()
+            self.refresh(extent=False, thumbnail=False)
+
     @property
     def length(self) -> float:
         """float: Multiplicative factor for length of all vectors."""
@@ -662,14 +719,21 @@ class Vectors(Layer):
     @property
     def _view_face_color(self) -> np.ndarray:
         """(Mx4) np.ndarray : colors for the M in view triangles"""
+        return self._triangle_colors(self._view_vector_color)
 
+    @property
+    def _view_vector_color(self) -> np.ndarray:
+        """(Mx4) np.ndarray : colors for the M in view vectors"""
         # Create as many colors as there are visible vectors.
         # Using fancy array indexing implicitly creates a new
         # array rather than creating a view of the original one
         # in ColorManager
         face_color = self.edge_color[self._view_indices]
         face_color[:, -1] *= self._view_alphas
+        return face_color
 
+    def _triangle_colors(self, face_color: np.ndarray) -> np.ndarray:
+        """Repeat the colors of vectors for each of their triangles."""
         # Generally, several triangles are drawn for each vector,
         # so we need to duplicate the colors accordingly
         if self.vector_style == 'line':
@@ -737,6 +801,93 @@ class Vectors(Layer):
         self._view_indices = indices
         self._view_alphas = alphas
         self._view_data = self.data[np.ix_(list(indices), [0, 1], disp)]
+        self._view_spacing_cache = None
+        self._update_decimation_level()
+
+    def _update_draw(
+        self, scale_factor, corner_pixels_displayed, shape_threshold
+    ):
+        super()._update_draw(
+            scale_factor, corner_pixels_displayed, shape_threshold
+        )
+        self._update_decimation_level()
+
+    def _update_decimation_level(self) -> None:
+        """Update the decimation level for the current canvas scale.
+
+        The level only changes when the zoom changes by a factor of 2, so
+        that the decimated vectors of each level can be cached.
+        """
+        level = None
+        if (
+            self._decimation != VectorsDecimation.NONE
+            and self._slice_input.ndisplay == 2
+        ):
+            displayed = list(self._slice_input.displayed)
+            data_scale = np.min(np.abs(self._data_to_world.scale[displayed]))
+            # scale_factor is the size of a canvas pixel in world units
+            spacing = self._decimation_spacing * self.scale_factor / data_scale
+            level = int(np.ceil(np.log2(spacing)))
+            # cells smaller than the spacing of the vectors each hold at
+            # most one of them, so all finer levels show all the vectors
+            if 2.0**level < self._view_spacing:
+                level = None
+        if level != self._decimation_level:
+            self._decimation_level = level
+            self.events._decimation_level()
+
+    @property
+    def _view_spacing(self) -> float:
+        """Smallest distance between the start points of the vectors in
+        view along a displayed dimension, or 0 if they all start at the same
+        point.
+
+        Two vectors can only be in the same cell of a decimation grid finer
+        than this if they start at the same point. This is cached until the
+        vectors in view change.
+        """
+        if self._view_spacing_cache is None:
+            spacing = np.inf
+            for coords in self._view_data[:, 0].T:
+                gaps = np.diff(np.unique(coords))
+                if len(gaps):
+                    spacing = min(spacing, gaps.min())
+            self._view_spacing_cache = (
+                float(spacing) if np.isfinite(spacing) else 0.0
+            )
+        return self._view_spacing_cache
+
+    def _decimated_view(
+        self, level: int | None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get the vectors in view and their colors, decimated at a level.
+
+        Parameters
+        ----------
+        level : int or None
+            The vectors are decimated on a grid with a spacing of 2 to this
+            power in data units, or not decimated if this is None.
+
+        Returns
+        -------
+        view_data : (M, 2, D) array
+            The start point and projections of the displayed vectors.
+        view_vector_color : (M, 4) array
+            The colors of the displayed vectors.
+        """
+        colors = self._view_vector_color
+        if (
+            level is None
+            or self._decimation == VectorsDecimation.NONE
+            or self._slice_input.ndisplay != 2
+        ):
+            return self._view_data, colors
+        return decimate_vectors(
+            self._view_data,
+            colors,
+            2.0**level,
+            average=self._decimation == VectorsDecimation.AVERAGE,
+        )
 
     def _update_thumbnail(self):
         """Update thumbnail with current vectors and colors."""
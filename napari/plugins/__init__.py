@@ -5,6 +5,7 @@ from npe2 import (
 )
 
 from napari.plugins import _npe2
+from napari.plugins._manifest_cache import discover_plugins
 from napari.plugins._plugin_manager import NapariPluginManager
 from napari.settings import get_settings
 
@@ -38,7 +39,7 @@ def _initialize_plugins() -> None:
         _npe2.on_plugin_enablement_change
     )
     _npe2pm.events.plugins_registered.connect(_npe2.on_plugins_registered)
-    _npe2pm.discover(include_npe1=settings.plugins.use_npe2_adaptor)
+    discover_plugins(_npe2pm, include_npe1=settings.plugins.use_npe2_adaptor)
 
     # Disable plugins listed as disabled in settings, or detected in npe2
     _from_npe2 = {m.name for m in _npe2pm.iter_manifests()}
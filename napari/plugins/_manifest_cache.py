@@ -0,0 +1,162 @@
+"""Persistent cache of the npe2 plugin manifests discovered at startup.
+
+Discovering plugins means reading the entry points of every installed
+distribution, then reading and validating the manifest of each plugin.
+The validated manifests are stored in the user cache directory, and
+they are reused on the next launch as long as the installed
+distributions have not changed.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from importlib import metadata
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from npe2 import PluginManager, PluginManifest
+
+from napari.utils._appdirs import user_cache_dir
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+__all__ = ('discover_plugins', 'manifest_cache_path')
+
+#: Bump to invalidate the caches written by earlier versions of napari.
+_CACHE_VERSION = 1
+
+
+def manifest_cache_path() -> Path:
+    """Path of the file in which the discovered manifests are cached."""
+    return Path(user_cache_dir()) / 'plugin_manifests.json'
+
+
+def _mtime(path: str | os.PathLike) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _distribution_key(dist: metadata.Distribution) -> list:
+    # the name of the metadata directory holds the name and version
+    path = getattr(dist, '_path', None)
+    if path is None:
+        return [dist.metadata['Name'], dist.version, None]
+    return [os.path.abspath(path), None, _mtime(path)]
+
+
+def _environment_key() -> dict[str, Any]:
+    """Key of the installed distributions in which plugins are discovered."""
+    import npe2
+
+    from napari import __version__
+
+    return {
+        'version': _CACHE_VERSION,
+        'napari': __version__,
+        'npe2': npe2.__version__,
+        'distributions': [
+            _distribution_key(dist) for dist in metadata.distributions()
+        ],
+    }
+
+
+def _manifest_key(mf: PluginManifest) -> dict[str, Any]:
+    """Key of the file a manifest was read from."""
+    source = mf._source_file
+    return {
+        'source': str(source) if source else None,
+        'mtime': _mtime(source) if source else None,
+    }
+
+
+def _load(path: Path, key: dict[str, Any]) -> list[PluginManifest] | None:
+    """Load the cached manifests, or None if the cache is missing or stale."""
+    try:
+        cache = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict) or cache.get('key') != key:
+        return None
+
+    manifests = []
+    try:
+        for entry in cache['manifests']:
+            mf = PluginManifest.model_validate(entry['manifest'])
+            source = entry['key']['source']
+            if source is not None:
+                mf._source_file = Path(source)
+            if _manifest_key(mf) != entry['key']:
+                return None
+            manifests.append(mf)
+    except (KeyError, TypeError, ValueError):
+        return None
+    return manifests
+
+
+def _save(
+    path: Path, key: dict[str, Any], manifests: Iterable[PluginManifest]
+) -> None:
+    cache = {
+        'key': key,
+        'manifests': [
+            {
+                'key': _manifest_key(mf),
+                'manifest': mf.model_dump(mode='json', exclude_unset=True),
+            }
+            for mf in manifests
+            # npe1 adapters are only indexed when they are imported
+            if type(mf) is PluginManifest
+        ],
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(cache), encoding='utf-8')
+        tmp.replace(path)
+    except OSError:
+        # a read-only cache directory only costs a full discovery
+        pass
+
+
+def discover_plugins(pm: PluginManager, include_npe1: bool = False) -> None:
+    """Register the plugins of the environment with ``pm``.
+
+    The manifests are read from the cache when the installed
+    distributions have not changed since they were last discovered.
+    Otherwise, the plugins are discovered as by
+    :meth:`npe2.PluginManager.discover` and the cache is updated.
+
+    Parameters
+    ----------
+    pm : npe2.PluginManager
+        Plugin manager with which to register the plugins.
+    include_npe1 : bool
+        Whether to also discover npe1 plugins as npe1 adapters. Their
+        manifests are only known once the plugins are imported, so the
+        cache is not used when they are included.
+    """
+    # subclasses (e.g. for tests) may restrict discovery
+    if include_npe1 or type(pm).discover is not PluginManager.discover:
+        pm.discover(include_npe1=include_npe1)
+        return
+
+    path = manifest_cache_path()
+    key = _environment_key()
+    manifests = _load(path, key)
+    if manifests is None:
+        registered = set(pm._manifests)
+        pm.discover()
+        discovered = (
+            mf for mf in pm.iter_manifests() if mf.name not in registered
+        )
+        _save(path, key, discovered)
+        return
+
+    with pm.events.plugins_registered.paused(lambda a, b: (a[0] | b[0],)):
+        for mf in manifests:
+            if mf.name not in pm._manifests:
+                pm.register(mf, warn_disabled=False)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from collections.abc import Iterator, Sequence
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     cast,
@@ -319,8 +320,9 @@ def on_plugin_enablement_change(enabled: set[str], disabled: set[str]):
         # currently registered/available.  So we check to make sure this is
         # actually a registered plugin.
         if plugin_name in pm.instance():
-            _register_manifest_actions(pm.get_manifest(plugin_name))
-            _safe_register_qt_actions(pm.get_manifest(plugin_name))
+            _defer_plugin_actions(plugin_name)
+    for plugin_name in disabled:
+        _cancel_plugin_actions(plugin_name)
 
 
 def on_plugins_registered(manifests: set[PluginManifest]):
@@ -334,8 +336,35 @@ def on_plugins_registered(manifests: set[PluginManifest]):
     )
     for mf in sorted_manifests:
         if not pm.is_disabled(mf.name):
-            _register_manifest_actions(mf)
-            _safe_register_qt_actions(mf)
+            _defer_plugin_actions(mf.name)
+
+
+def _defer_plugin_actions(plugin_name: str) -> None:
+    """Register the actions of a plugin once the app model is first read.
+
+    Building the actions of every plugin is a large part of the startup
+    time, so this is deferred until a menu or command is needed.
+    """
+    from napari._app_model import get_app_model
+
+    get_app_model().defer_registration(
+        ('plugin', plugin_name),
+        partial(_register_plugin_actions, plugin_name),
+    )
+
+
+def _cancel_plugin_actions(plugin_name: str) -> None:
+    from napari._app_model import get_app_model
+
+    get_app_model().cancel_registration(('plugin', plugin_name))
+
+
+def _register_plugin_actions(plugin_name: str) -> None:
+    # the plugin may have been unregistered since its actions were deferred
+    if plugin_name in pm.instance() and not pm.is_disabled(plugin_name):
+        mf = pm.get_manifest(plugin_name)
+        _register_manifest_actions(mf)
+        _safe_register_qt_actions(mf)
 
 
 def _register_manifest_actions(mf: PluginManifest) -> None:
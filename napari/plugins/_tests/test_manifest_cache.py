@@ -0,0 +1,62 @@
+import os
+
+from npe2 import PluginManager, PluginManifest
+
+from napari.plugins import _manifest_cache
+
+
+def test_discover_plugins_cache(tmp_path, monkeypatch):
+    cache_path = tmp_path / 'cache' / 'plugin_manifests.json'
+    monkeypatch.setattr(
+        _manifest_cache, 'manifest_cache_path', lambda: cache_path
+    )
+    source = tmp_path / 'napari.yaml'
+    source.write_text('name: cached-plugin\ndisplay_name: Cached Plugin\n')
+    mf = PluginManifest.from_file(source)
+
+    # cold: the plugins are discovered and cached
+    pm = PluginManager()
+    discovered = []
+    monkeypatch.setattr(pm, 'discover', lambda **_: discovered.append(1))
+    _manifest_cache.discover_plugins(pm)
+    assert discovered == [1]
+    assert cache_path.exists()
+
+    key = _manifest_cache._environment_key()
+    _manifest_cache._save(cache_path, key, [mf])
+
+    # warm: the cached manifests are registered without discovery
+    registered = []
+    pm.events.plugins_registered.connect(registered.append)
+    _manifest_cache.discover_plugins(pm)
+    assert discovered == [1]
+    assert 'cached-plugin' in pm
+    cached = pm.get_manifest('cached-plugin')
+    assert cached.display_name == 'Cached Plugin'
+    assert cached._source_file == mf._source_file
+    assert len(registered) == 1
+
+    # editing a manifest invalidates the cache
+    mtime = os.stat(source).st_mtime_ns
+    os.utime(source, ns=(mtime + 10**9, mtime + 10**9))
+    assert _manifest_cache._load(cache_path, key) is None
+
+    # so does a change of the installed distributions
+    _manifest_cache._save(cache_path, key, [mf])
+    assert _manifest_cache._load(cache_path, key) is not None
+    assert _manifest_cache._load(cache_path, {**key, 'npe2': ''}) is None
+
+
+def test_discover_plugins_npe1_bypasses_cache(tmp_path, monkeypatch):
+    cache_path = tmp_path / 'plugin_manifests.json'
+    monkeypatch.setattr(
+        _manifest_cache, 'manifest_cache_path', lambda: cache_path
+    )
+    pm = PluginManager()
+    calls = []
+    monkeypatch.setattr(pm, 'discover', lambda **kwargs: calls.append(kwargs))
+
+    _manifest_cache.discover_plugins(pm, include_npe1=True)
+
+    assert calls == [{'include_npe1': True}]
+    assert not cache_path.exists()
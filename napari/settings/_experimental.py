@@ -25,6 +25,66 @@ class ExperimentalSettings(EventedSettings):
         env='napari_async',
         requires_restart=False,
     )
+    async_slicing_workers: int = Field(
+        1,
+        title=trans._('Number of asynchronous slicing threads'),
+        description=trans._(
+            'Number of threads used to slice layers asynchronously.\nWith more than one thread, layers are sliced concurrently.'
+        ),
+        env='napari_async_slicing_workers',
+        ge=1,
+        le=32,
+        requires_restart=True,
+    )
+    slice_prefetch_steps: int = Field(
+        0,
+        title=trans._('Number of steps to prefetch'),
+        description=trans._(
+            'When rendering asynchronously, the number of steps ahead to slice while playing or scrubbing a dimension slider.\nPrefetched slices are kept in the slice cache, so prefetching also requires a slice cache size above 0, which is not the default.\nSet to 0 to disable prefetching.'
+        ),
+        env='napari_slice_prefetch_steps',
+        ge=0,
+        le=64,
+        requires_restart=False,
+    )
+    slice_cache_size: int = Field(
+        0,
+        title=trans._('Slice cache size (MB)'),
+        description=trans._(
+            'Maximum memory used to keep the slices of layers, so that revisiting a slice (e.g. toggling between two time points) does not read the data again. Slices prefetched while playing are also kept there, so prefetching requires a cache.\nCached slices are not updated when the data is written to in place (e.g. a zarr array edited by another program) until the layer is refreshed.\nSet to 0 to disable caching.'
+        ),
+        env='napari_slice_cache_size',
+        ge=0,
+        requires_restart=False,
+    )
+    points_spatial_index: bool = Field(
+        False,
+        title=trans._('Spatial index for points layers'),
+        description=trans._(
+            'Index the coordinates of points layers, so that slicing, hovering and box selection only visit nearby points.\nThis speeds up layers with millions of points. After modifying layer.data in place, set it again (layer.data = layer.data) to update the index.'
+        ),
+        env='napari_points_spatial_index',
+        requires_restart=False,
+    )
+    labels_history_size: int = Field(
+        256,
+        title=trans._('Labels undo history size (MB)'),
+        description=trans._(
+            'Maximum memory used by the undo and by the redo history of each labels layer. When exceeded, the oldest edits can no longer be undone.\nThe most recent edit can always be undone.'
+        ),
+        env='napari_labels_history_size',
+        ge=0,
+        requires_restart=False,
+    )
+    tiled_multiscale: bool = Field(
+        False,
+        title=trans._('Tiled multiscale rendering'),
+        description=trans._(
+            'Read multiscale images in tiles aligned to their chunks, keeping loaded tiles in memory.\nPanning and zooming then only read the tiles that newly come into view.'
+        ),
+        env='napari_tiled_multiscale',
+        requires_restart=False,
+    )
     autoswap_buffers: bool = Field(
         False,
         title=trans._('Enable autoswapping rendering buffers.'),
@@ -86,6 +146,17 @@ class ExperimentalSettings(EventedSettings):
             'it at https://github.com/napari/napari/issues.'
         ),
     )
+    triangulation_workers: int = Field(
+        1,
+        title=trans._('Number of triangulation threads'),
+        description=trans._(
+            'Number of threads used to triangulate shapes when many of them are added to a Shapes layer at once.\nMore than one thread only speeds this up when the triangulation code releases the GIL, e.g. when numba is installed.'
+        ),
+        env='napari_triangulation_workers',
+        ge=1,
+        le=32,
+        requires_restart=False,
+    )
 
     class NapariConfig:
         # Napari specific configuration
@@ -0,0 +1,195 @@
+"""Measure the time spent importing napari, grouped by package.
+
+The import time is measured in a new interpreter with ``python -X
+importtime``, and attributed to each subpackage of napari and to some of
+its heavy dependencies.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from typing import NamedTuple
+
+__all__ = (
+    'DEPENDENCIES',
+    'IMPORT_TARGETS',
+    'ImportCost',
+    'exceeded_budgets',
+    'format_import_profile',
+    'parse_budgets',
+    'parse_importtime',
+    'profile_import',
+)
+
+#: Third-party packages whose import time is reported.
+DEPENDENCIES = ('pandas', 'scipy', 'dask', 'vispy', 'qtpy')
+
+#: Statements whose import time is profiled, by name.
+IMPORT_TARGETS = {
+    'napari': 'import napari',
+    'Viewer': 'from napari import Viewer',
+    **{
+        name: f'from napari.layers import {name}'
+        for name in (
+            'Image',
+            'Labels',
+            'Points',
+            'Shapes',
+            'Surface',
+            'Tracks',
+            'Vectors',
+        )
+    },
+}
+
+#: Environment variable with budgets, e.g. ``napari.layers=0.5,pandas=0.3``
+BUDGETS_ENV = 'NAPARI_IMPORT_BUDGETS'
+
+_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)$')
+
+
+class ImportCost(NamedTuple):
+    """Time, in seconds, spent importing the modules of a package.
+
+    ``own`` is the time spent in the modules of the package, and
+    ``cumulative`` also includes the modules they import, e.g. from other
+    packages.
+    """
+
+    own: float
+    cumulative: float
+
+
+def _group(module: str) -> str | None:
+    """Subpackage of napari or dependency to which a module belongs."""
+    parts = module.split('.')
+    if parts[0] == 'napari':
+        return '.'.join(parts[:2])
+    if parts[0] in DEPENDENCIES:
+        return parts[0]
+    return None
+
+
+def parse_importtime(output: str) -> dict[str, ImportCost]:
+    """Group the output of ``python -X importtime`` by package.
+
+    Parameters
+    ----------
+    output : str
+        The stderr of an interpreter run with ``-X importtime``.
+
+    Returns
+    -------
+    dict[str, ImportCost]
+        The import cost of each subpackage of napari (e.g.
+        ``napari.layers``) and of each of :data:`DEPENDENCIES` that was
+        imported.
+    """
+    records = []
+    for line in output.splitlines():
+        match = _LINE.match(line)
+        if match is not None:
+            own, cumulative, indent, module = match.groups()
+            # nested imports are indented by two spaces per level
+            depth = len(indent) // 2
+            records.append((depth, module, int(own), int(cumulative)))
+
+    own_us: defaultdict[str, int] = defaultdict(int)
+    cumulative_us: defaultdict[str, int] = defaultdict(int)
+    # groups of the modules being imported, by depth: imports are listed
+    # once done, so the importing module comes after the modules it imports
+    ancestors: list[str | None] = []
+    for depth, module, own, cumulative in reversed(records):
+        del ancestors[depth:]
+        group = _group(module)
+        if group is not None:
+            own_us[group] += own
+            # imports nested in the same package are already included
+            if group not in ancestors:
+                cumulative_us[group] += cumulative
+        ancestors.append(group)
+
+    return {
+        group: ImportCost(own_us[group] / 1e6, cumulative_us[group] / 1e6)
+        for group in sorted(own_us)
+    }
+
+
+def profile_import(
+    statement: str, executable: str = sys.executable
+) -> dict[str, ImportCost]:
+    """Import cost of each package when running ``statement``.
+
+    The statement is run in a new interpreter, so that nothing has
+    already been imported.
+    """
+    result = subprocess.run(
+        [executable, '-X', 'importtime', '-c', statement],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=False,
+    )
+    if result.returncode:
+        raise RuntimeError(
+            f'{statement!r} failed with exit code {result.returncode}:\n'
+            f'{result.stderr[-2000:]}'
+        )
+    return parse_importtime(result.stderr)
+
+
+def parse_budgets(text: str | None = None) -> dict[str, float]:
+    """Parse import budgets, in seconds, of the form ``group=seconds,...``.
+
+    By default, the budgets are read from the ``NAPARI_IMPORT_BUDGETS``
+    environment variable.
+    """
+    if text is None:
+        text = os.environ.get(BUDGETS_ENV, '')
+    budgets = {}
+    for item in text.split(','):
+        if not item.strip():
+            continue
+        group, sep, seconds = item.partition('=')
+        if not sep:
+            raise ValueError(f'invalid import budget {item!r}')
+        budgets[group.strip()] = float(seconds)
+    return budgets
+
+
+def exceeded_budgets(
+    costs: dict[str, ImportCost], budgets: dict[str, float]
+) -> dict[str, float]:
+    """Cumulative import time of the groups exceeding their budget."""
+    return {
+        group: costs[group].cumulative
+        for group, budget in budgets.items()
+        if group in costs and costs[group].cumulative > budget
+    }
+
+
+def format_import_profile(
+    profiles: dict[str, dict[str, ImportCost]],
+    budgets: dict[str, float] | None = None,
+) -> str:
+    """Format the import costs of each target as a table, in ms."""
+    budgets = budgets or {}
+    lines = []
+    for target, costs in profiles.items():
+        lines.append(f'{target}:')
+        lines.append(f'  {"package":<28}{"own":>10}{"cumulative":>12}')
+        for group, cost in sorted(
+            costs.items(), key=lambda item: -item[1].cumulative
+        ):
+            line = (
+                f'  {group:<28}{cost.own * 1e3:>10.1f}'
+                f'{cost.cumulative * 1e3:>12.1f}'
+            )
+            if group in exceeded_budgets(costs, budgets):
+                line += f'  > budget of {budgets[group] * 1e3:.1f}'
+            lines.append(line)
+    return '\n'.join(lines)
@@ -0,0 +1,111 @@
+"""A least recently used cache bounded by the size of its values."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from threading import RLock
+from typing import Any, Generic, TypeVar
+
+_K = TypeVar('_K', bound=Hashable)
+_V = TypeVar('_V')
+
+
+def _nbytes(value: Any) -> int:
+    return value.nbytes
+
+
+class SizedLRUCache(Generic[_K, _V]):
+    """A thread-safe LRU cache bounded by the total number of bytes of its values.
+
+    Parameters
+    ----------
+    max_bytes : int
+        The maximum total size of the values kept in the cache. Values larger
+        than this are never cached.
+    nbytes : callable
+        Returns the size in bytes of a value. By default, this reads the
+        ``nbytes`` attribute of the value, as for numpy arrays.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        nbytes: Callable[[_V], int] = _nbytes,
+    ) -> None:
+        self._max_bytes = max_bytes
+        self._get_nbytes = nbytes
+        self._items: OrderedDict[_K, tuple[_V, int]] = OrderedDict()
+        self._nbytes = 0
+        self._lock = RLock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: _K) -> bool:
+        return key in self._items
+
+    def __iter__(self) -> Iterator[_K]:
+        """Iterate over a snapshot of the keys, from least to most recently used."""
+        with self._lock:
+            return iter(list(self._items))
+
+    def keys(self) -> Iterator[_K]:
+        """Iterate over a snapshot of the keys, from least to most recently used."""
+        return iter(self)
+
+    @property
+    def nbytes(self) -> int:
+        """The total number of bytes of the cached values."""
+        return self._nbytes
+
+    @property
+    def max_bytes(self) -> int:
+        """The maximum total number of bytes of the cached values."""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes: int) -> None:
+        with self._lock:
+            self._max_bytes = max_bytes
+            self._evict()
+
+    def get(self, key: _K) -> _V | None:
+        """Get a value and mark it as most recently used, or None if absent."""
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            self._items.move_to_end(key)
+            return item[0]
+
+    def put(self, key: _K, value: _V) -> None:
+        """Add a value, evicting the least recently used ones over budget."""
+        size = self._get_nbytes(value)
+        with self._lock:
+            self.pop(key)
+            if size > self._max_bytes:
+                return
+            self._items[key] = (value, size)
+            self._nbytes += size
+            self._evict()
+
+    def pop(self, key: _K) -> _V | None:
+        """Remove a value and return it, or None if absent."""
+        with self._lock:
+            item = self._items.pop(key, None)
+            if item is None:
+                return None
+            self._nbytes -= item[1]
+            return item[0]
+
+    def clear(self) -> None:
+        """Remove all values."""
+        with self._lock:
+            self._items.clear()
+            self._nbytes = 0
+
+    def _evict(self) -> None:
+        while self._nbytes > self._max_bytes:
+            _, (_, size) = self._items.popitem(last=False)
+            self._nbytes -= size
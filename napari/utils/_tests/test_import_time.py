@@ -0,0 +1,76 @@
+import sys
+
+import pytest
+
+from napari.utils._import_time import (
+    ImportCost,
+    exceeded_budgets,
+    format_import_profile,
+    parse_budgets,
+    parse_importtime,
+    profile_import,
+)
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 | _io
+import time:        50 |         50 |       pandas.core
+import time:       200 |        250 |     pandas
+import time:       300 |        550 |   napari.layers.image
+import time:        30 |         30 |     napari.layers.base
+import time:        20 |        600 | napari.layers
+import time:       400 |        400 |   pandas.io
+import time:        10 |        410 | napari
+"""
+
+
+def test_parse_importtime():
+    costs = parse_importtime(IMPORTTIME_OUTPUT)
+
+    assert set(costs) == {'napari', 'napari.layers', 'pandas'}
+    # pandas is imported by napari.layers, which includes it cumulatively
+    assert costs['napari.layers'] == pytest.approx(ImportCost(3.5e-4, 6e-4))
+    # imports of pandas nested in pandas are only counted once
+    assert costs['pandas'] == pytest.approx(ImportCost(6.5e-4, 6.5e-4))
+    assert costs['napari'] == pytest.approx(ImportCost(1e-5, 4.1e-4))
+
+
+def test_parse_importtime_direct_child_of_same_package():
+    output = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     napari.layers.points
+import time:         5 |        105 |   napari.layers
+import time:        10 |        115 | napari
+"""
+    costs = parse_importtime(output)
+
+    assert costs['napari.layers'] == pytest.approx(
+        ImportCost(1.05e-4, 1.05e-4)
+    )
+    assert costs['napari'] == pytest.approx(ImportCost(1e-5, 1.15e-4))
+
+
+def test_budgets():
+    costs = parse_importtime(IMPORTTIME_OUTPUT)
+    assert parse_budgets('') == {}
+    budgets = parse_budgets('napari.layers=0.0005, pandas=1,scipy=0')
+    assert budgets == {'napari.layers': 0.0005, 'pandas': 1, 'scipy': 0}
+
+    assert exceeded_budgets(costs, budgets) == {'napari.layers': 6e-4}
+    assert 'budget of 0.5' in format_import_profile({'napari': costs}, budgets)
+
+    with pytest.raises(ValueError, match='invalid import budget'):
+        parse_budgets('pandas')
+
+
+def test_parse_budgets_from_env(monkeypatch):
+    monkeypatch.setenv('NAPARI_IMPORT_BUDGETS', 'pandas=0.25')
+    assert parse_budgets() == {'pandas': 0.25}
+
+
+def test_profile_import():
+    costs = profile_import('import napari.utils.misc')
+    assert costs['napari.utils'].cumulative > 0
+
+    with pytest.raises(RuntimeError, match='failed'):
+        profile_import('import napari.does_not_exist', sys.executable)
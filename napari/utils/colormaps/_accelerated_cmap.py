@@ -6,11 +6,9 @@ testing, which can break instance/class relationships when done dynamically.
 See https://github.com/napari/napari/pull/7025#issuecomment-2186190719.
 """
 
-from importlib.metadata import version
 from typing import TYPE_CHECKING
 
 import numpy as np
-from packaging.version import parse
 
 if TYPE_CHECKING:
     from numba import typed
@@ -20,6 +18,7 @@ if TYPE_CHECKING:
 
 __all__ = (
     'labels_raw_to_texture_direct',
+    'map_sorted_keys',
     'minimum_dtype_for_labels',
     'zero_preserving_modulo',
     'zero_preserving_modulo_numpy',
@@ -152,20 +151,35 @@ def _zero_preserving_modulo_inner_loop(
     return out
 
 
-if parse('2.0') <= parse(version('numpy')) < parse('2.1'):
+def map_sorted_keys(
+    data: np.ndarray, keys: np.ndarray, values: np.ndarray
+) -> np.ndarray:
+    """Map data to the values of the matching keys, in one vectorized pass.
 
-    def clip(data: np.ndarray, min_val: int, max_val: int) -> np.ndarray:
-        """
-        Clip data to the given range.
-        """
-        dtype_info = np.iinfo(data.dtype)
-        min_val = max(min_val, dtype_info.min)
-        max_val = min(max_val, dtype_info.max)
-        return np.clip(data, min_val, max_val)
-else:
+    Values not in ``keys`` are mapped to ``MAPPING_OF_UNKNOWN_VALUE``.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        The input data array.
+    keys : np.ndarray
+        The sorted keys, of the same dtype as the data.
+    values : np.ndarray
+        The value of each key.
 
-    def clip(data: np.ndarray, min_val: int, max_val: int) -> np.ndarray:
-        return np.clip(data, min_val, max_val)
+    Returns
+    -------
+    np.ndarray
+        The mapped data array, of the dtype of the values.
+    """
+    if keys.size == 0:
+        return np.full(
+            data.shape, MAPPING_OF_UNKNOWN_VALUE, dtype=values.dtype
+        )
+    idx = np.searchsorted(keys, data)
+    np.minimum(idx, keys.size - 1, out=idx)
+    unknown = values.dtype.type(MAPPING_OF_UNKNOWN_VALUE)
+    return np.where(keys[idx] == data, values[idx], unknown)
 
 
 def _labels_raw_to_texture_direct_numpy(
@@ -173,20 +187,16 @@ def _labels_raw_to_texture_direct_numpy(
 ) -> np.ndarray:
     """Convert labels data to the data type used in the texture.
 
-    This implementation uses numpy vectorized operations.
+    This implementation uses numpy vectorized operations, with a sorted
+    table of the labels of the colormap, so that it works with any label
+    values, such as sparse 64-bit ids.
 
     See `_cast_labels_data_to_texture_dtype_direct` for more details.
     """
     if direct_colormap.use_selection:
         return (data == direct_colormap.selection).astype(np.uint8)
-    mapper = direct_colormap._array_map
-    if any(x < 0 for x in direct_colormap.color_dict if x is not None):
-        half_shape = mapper.shape[0] // 2 - 1
-        data = clip(data, -half_shape, half_shape)
-    else:
-        data = clip(data, 0, mapper.shape[0] - 1)
-
-    return mapper[data]
+    keys, values = direct_colormap._get_sorted_mapping(data.dtype)
+    return map_sorted_keys(data, keys, values)
 
 
 def _labels_raw_to_texture_direct_loop(
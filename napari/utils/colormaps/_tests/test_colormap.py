@@ -35,6 +35,22 @@ def test_linear_colormap():
     np.testing.assert_almost_equal(cmap.map([0.75]), [[0, 0.5, 0.5, 1]])
 
 
+@pytest.mark.parametrize(
+    'dtype', [np.uint8, np.int8, np.uint16, np.int16, np.int32, np.float64]
+)
+def test_intensity_lut(dtype):
+    """Test that lookup tables map intensities like the colormap."""
+    cmap = Colormap(['black', 'red', 'white'])
+    values = np.array([0, 3, 17, 64, 100, 127], dtype=dtype)
+    lut, contrast_limits = cmap._intensity_lut((0, 100), 0.5, values.dtype)
+    if np.dtype(dtype).itemsize <= 2 and np.dtype(dtype).kind != 'f':
+        assert len(lut) == 2 ** (8 * np.dtype(dtype).itemsize)
+    expected = cmap.map((np.clip(values, 0, 100) / 100) ** 0.5)
+    mapped = colormap._map_with_lut(values, lut, contrast_limits)
+    assert mapped.dtype == np.uint8
+    npt.assert_allclose(mapped, np.rint(expected * 255), atol=1)
+
+
 def test_linear_colormap_with_control_points():
     """Test a linear colormap with control points."""
     colors = np.array([[0, 0, 0, 1], [0, 1, 0, 1], [0, 0, 1, 1]])
@@ -551,3 +567,51 @@ def test_normalize_label_colormap(colormap_like):
     else:
         with pytest.raises(ValueError, match='Unable to interpret'):
             _normalize_label_colormap(colormap_like)
+
+
+@pytest.mark.parametrize('dtype', [np.uint64, np.int64])
+def test_direct_colormap_sparse_64_bit_labels_numpy(dtype):
+    iinfo = np.iinfo(dtype)
+    labels = [iinfo.max, iinfo.max - 1, 2**40 + 3, 5]
+    cmap = DirectLabelColormap(
+        color_dict={
+            None: 'black',
+            labels[0]: 'red',
+            labels[1]: 'blue',
+            labels[2]: 'red',
+            labels[3]: 'lime',
+        }
+    )
+    data = np.array(labels + [0, 2**40], dtype=dtype).reshape(2, 3)
+
+    res = _labels_raw_to_texture_direct_numpy(data, cmap)
+    # the background label 0 is transparent, and 2**40 is unknown
+    npt.assert_array_equal(res, [[1, 2, 1], [3, 4, 0]])
+    assert res.dtype == np.uint8
+
+    mapped = cmap._map_precast(res, apply_selection=False)
+    npt.assert_array_equal(mapped[0, 0], [1, 0, 0, 1])
+    npt.assert_array_equal(mapped[1, 1], [0, 0, 0, 0])
+    npt.assert_array_equal(mapped[1, 2], [0, 0, 0, 1])
+
+
+def test_direct_colormap_sorted_mapping_updated_with_new_labels():
+    cmap = DirectLabelColormap(
+        color_dict={None: 'black', 2**40: 'red', 7: 'blue'}
+    )
+    data = np.array([7, 2**40, 2**41, 9], dtype=np.uint64)
+    npt.assert_array_equal(
+        _labels_raw_to_texture_direct_numpy(data, cmap), [2, 1, 0, 0]
+    )
+    keys, _ = cmap._get_sorted_mapping(data.dtype)
+
+    cmap.color_dict[2**41] = np.array([0, 1, 0, 1])
+    cmap.color_dict[9] = np.array([1, 0, 0, 1])
+    npt.assert_array_equal(cmap._data_to_texture(data), [2, 1, 4, 1])
+    new_keys, _ = cmap._get_sorted_mapping(data.dtype)
+    npt.assert_array_equal(new_keys, [0, 7, 9, 2**40, 2**41])
+    assert new_keys is not keys
+    npt.assert_array_equal(cmap.map(data)[2], [0, 1, 0, 1])
+
+    del cmap.color_dict[9]
+    npt.assert_array_equal(cmap.map(data)[3], [0, 0, 0, 1])
@@ -1,6 +1,7 @@
 from collections import defaultdict
-from collections.abc import MutableMapping, Sequence
+from collections.abc import Iterable, MutableMapping, Sequence
 from functools import cached_property
+from itertools import islice
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -28,6 +29,11 @@ if TYPE_CHECKING:
     from numba import typed
 
 
+# Number of intensities sampled by the colormap lookup tables of dtypes
+# that have too many values to have a color for each one.
+_INTENSITY_LUT_SIZE = 4096
+
+
 class ColormapInterpolationMode(StrEnum):
     """INTERPOLATION: Interpolation mode for colormaps.
 
@@ -160,11 +166,136 @@ class Colormap(EventedModel):
 
         return cols
 
+    def _intensity_lut(
+        self,
+        contrast_limits: tuple[float, float],
+        gamma: float,
+        dtype: np.dtype,
+    ) -> tuple[np.ndarray, tuple[float, float]]:
+        """Precompute the uint8 RGBA colors of the intensities of a dtype.
+
+        For (u)int8 and (u)int16 data, the table has the color of each
+        possible value, in the order of the values viewed as unsigned. For
+        other dtypes, it has the colors of ``_INTENSITY_LUT_SIZE`` values
+        evenly spaced between the contrast limits.
+
+        Parameters
+        ----------
+        contrast_limits : tuple of float
+            The intensities mapped to the first and last colors.
+        gamma : float
+            The gamma applied to the normalized intensities.
+        dtype : np.dtype
+            The dtype of the intensities.
+
+        Returns
+        -------
+        lut : np.ndarray of shape (N, 4) and dtype uint8
+            The colors of the intensities.
+        contrast_limits : tuple of float
+            The contrast limits, clipped to the range of integer dtypes.
+        """
+        dtype = np.dtype(dtype)
+        low, high = _dtype_contrast_limits(contrast_limits, dtype)
+        if dtype.kind in 'iu' and dtype.itemsize <= 2:
+            values = np.arange(
+                _intensity_lut_size(dtype), dtype=f'u{dtype.itemsize}'
+            ).view(dtype)
+        else:
+            values = np.linspace(low, high, _INTENSITY_LUT_SIZE)
+        return self._map_intensities(values, (low, high), gamma), (low, high)
+
+    def _map_intensities(
+        self,
+        values: np.ndarray,
+        contrast_limits: tuple[float, float],
+        gamma: float,
+    ) -> np.ndarray:
+        """Map intensities to uint8 RGBA colors without a lookup table.
+
+        The colors are those of `_intensity_lut`, except that values of
+        dtypes that are binned by the table are mapped exactly. This is
+        faster than building a table to map fewer values than it has.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The intensities.
+        contrast_limits : tuple of float
+            The intensities mapped to the first and last colors.
+        gamma : float
+            The gamma applied to the normalized intensities.
+
+        Returns
+        -------
+        np.ndarray of same shape as values, but with last dimension of size 4
+            Mapped colors.
+        """
+        low, high = _dtype_contrast_limits(contrast_limits, values.dtype)
+        values = np.clip(np.asarray(values, dtype=np.float64), low, high)
+        # NaN get the color of the lower limit, as with the lookup tables
+        np.nan_to_num(values, copy=False, nan=low)
+        if high != low:
+            values = (values - low) / (high - low)
+        colors = self.map((values**gamma).ravel())
+        colors = np.clip(np.rint(colors * 255), 0, 255).astype(np.uint8)
+        return colors.reshape((*values.shape, 4))
+
     @property
     def colorbar(self):
         return make_colorbar(self)
 
 
+def _dtype_contrast_limits(
+    contrast_limits: tuple[float, float], dtype: np.dtype
+) -> tuple[float, float]:
+    """Clip contrast limits to the range of integer dtypes."""
+    low, high = contrast_limits
+    if dtype.kind in 'iu':
+        low = max(low, np.iinfo(dtype).min)
+        high = min(high, np.iinfo(dtype).max)
+    return low, high
+
+
+def _intensity_lut_size(dtype: np.dtype) -> int:
+    """Number of colors in the lookup table of the intensities of a dtype."""
+    if dtype.kind in 'iu' and dtype.itemsize <= 2:
+        return 2 ** (8 * dtype.itemsize)
+    return _INTENSITY_LUT_SIZE
+
+
+def _map_with_lut(
+    values: np.ndarray, lut: np.ndarray, contrast_limits: tuple[float, float]
+) -> np.ndarray:
+    """Map intensities to colors with a table of `Colormap._intensity_lut`.
+
+    (u)int8 and (u)int16 values are gathered directly from the table, other
+    values are binned to the nearest value of the table.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The intensities, of the dtype of the table.
+    lut : np.ndarray of shape (N, 4) and dtype uint8
+        The colors of the intensities.
+    contrast_limits : tuple of float
+        The contrast limits of the table.
+
+    Returns
+    -------
+    np.ndarray of same shape as values, but with last dimension of size 4
+        Mapped colors.
+    """
+    if values.dtype.kind in 'iu' and values.dtype.itemsize <= 2:
+        return lut[values.view(f'u{values.dtype.itemsize}')]
+    low, high = contrast_limits
+    scale = (len(lut) - 1) / (high - low) if high > low else 0
+    indices = (np.asarray(values, dtype=np.float64) - low) * scale
+    np.clip(indices, 0, len(lut) - 1, out=indices)
+    np.rint(indices, out=indices)
+    return lut[np.nan_to_num(indices, copy=False).astype(np.intp)]
+
+
 class LabelColormapBase(Colormap):
     use_selection: bool = False
     selection: int = 0
@@ -467,6 +598,7 @@ class DirectLabelColormap(LabelColormapBase):
         self, values: np.ndarray | np.integer
     ) -> np.ndarray | np.integer:
         """Map input values to values for send to GPU."""
+        self._sync_color_dict()
         return _cast_labels_data_to_texture_dtype_direct(values, self)
 
     def map(self, values: np.ndarray | np.integer | int) -> np.ndarray:
@@ -492,6 +624,7 @@ class DirectLabelColormap(LabelColormapBase):
             values = np.array(values)
         if not isinstance(values, np.ndarray) or values.dtype.kind in 'fU':
             raise TypeError('DirectLabelColormap can only be used with int')
+        self._sync_color_dict()
         mapper = self._get_mapping_from_cache(values.dtype)
         if mapper is not None:
             mapped = mapper[values]
@@ -529,12 +662,10 @@ class DirectLabelColormap(LabelColormapBase):
         it is implemented for thumbnail labels,
         where we already have cast values
         """
-        mapped = np.zeros(values.shape + (4,), dtype=np.float32)
         colors = self._values_mapping_to_minimum_values_set(apply_selection)[1]
-        for idx in np.ndindex(values.shape):
-            value = values[idx]
-            mapped[idx] = colors[value]
-        return mapped
+        # the texture values are consecutive, starting at 0
+        color_array = np.array(list(colors.values()), dtype=np.float32)
+        return color_array[values.astype(np.intp, copy=False)]
 
     @cached_property
     def _num_unique_colors(self) -> int:
@@ -551,8 +682,59 @@ class DirectLabelColormap(LabelColormapBase):
             del self.__dict__['_num_unique_colors']
         if '_label_mapping_and_color_dict' in self.__dict__:
             del self.__dict__['_label_mapping_and_color_dict']
-        if '_array_map' in self.__dict__:
-            del self.__dict__['_array_map']
+
+    def _sync_color_dict(self) -> None:
+        """Update the cached mappings with the labels added to color_dict.
+
+        Labels can be added to ``color_dict`` in place, for example when
+        painting new labels. Instead of rebuilding the mappings from all the
+        labels, only the added labels are mapped and merged into the sorted
+        tables. If labels were removed, the caches are cleared.
+        """
+        if '_label_mapping_and_color_dict' not in self.__dict__:
+            return
+        labels_to_new_labels, new_color_dict = self.__dict__[
+            '_label_mapping_and_color_dict'
+        ]
+        n_labels = len(self.color_dict) - (None in self.color_dict)
+        n_added = n_labels - (len(labels_to_new_labels) - 1)
+        if n_added == 0:
+            return
+        if n_added < 0 or not np.array_equal(
+            new_color_dict[_accel_cmap.MAPPING_OF_UNKNOWN_VALUE],
+            self.default_color,
+        ):
+            self._clear_cache()
+            return
+        # labels are appended to the dict, so they are at its end. One more
+        # item is processed in case the default color was added with them,
+        # mapping an already mapped label again is harmless.
+        added = islice(
+            self.color_dict.items(), len(self.color_dict) - n_added - 1, None
+        )
+        new_labels = _extend_label_mapping(
+            labels_to_new_labels, new_color_dict, added
+        )
+        self._cache_mapping = {}
+        if '_num_unique_colors' in self.__dict__:
+            del self.__dict__['_num_unique_colors']
+        target_dtype = _accel_cmap.minimum_dtype_for_labels(
+            self._num_unique_colors + 2
+        )
+        for key in list(self._cache_other):
+            if not key.endswith('_sorted_mapping'):
+                del self._cache_other[key]
+                continue
+            keys, values = self._cache_other[key]
+            if values.dtype != target_dtype:
+                del self._cache_other[key]
+                continue
+            new_keys, new_values = _sorted_mapping(
+                new_labels, labels_to_new_labels, keys.dtype, target_dtype
+            )
+            self._cache_other[key] = _merge_sorted_mapping(
+                keys, values, new_keys, new_values
+            )
 
     def _values_mapping_to_minimum_values_set(
         self, apply_selection=True
@@ -583,28 +765,15 @@ class DirectLabelColormap(LabelColormapBase):
     def _label_mapping_and_color_dict(
         self,
     ) -> tuple[dict[int | None, int], dict[int, np.ndarray]]:
-        color_to_labels: dict[tuple[int, ...], list[int | None]] = {}
         labels_to_new_labels: dict[int | None, int] = {
             None: _accel_cmap.MAPPING_OF_UNKNOWN_VALUE
         }
         new_color_dict: dict[int, np.ndarray] = {
             _accel_cmap.MAPPING_OF_UNKNOWN_VALUE: self.default_color,
         }
-
-        for label, color in self.color_dict.items():
-            if label is None:
-                continue
-            color_tup = tuple(color)
-            if color_tup not in color_to_labels:
-                color_to_labels[color_tup] = [label]
-                labels_to_new_labels[label] = len(new_color_dict)
-                new_color_dict[labels_to_new_labels[label]] = color
-            else:
-                color_to_labels[color_tup].append(label)
-                labels_to_new_labels[label] = labels_to_new_labels[
-                    color_to_labels[color_tup][0]
-                ]
-
+        _extend_label_mapping(
+            labels_to_new_labels, new_color_dict, self.color_dict.items()
+        )
         return labels_to_new_labels, new_color_dict
 
     def _get_typed_dict_mapping(self, data_dtype: np.dtype) -> 'typed.Dict':
@@ -655,37 +824,35 @@ class DirectLabelColormap(LabelColormapBase):
 
         return dkt
 
-    @cached_property
-    def _array_map(self):
-        """Create an array to map labels to texture values of smaller dtype."""
+    def _get_sorted_mapping(
+        self, data_dtype: np.dtype
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Create sorted tables mapping label values to texture values.
 
-        max_value = max(
-            (abs(x) for x in self.color_dict if x is not None), default=0
-        )
-        if any(x < 0 for x in self.color_dict if x is not None):
-            max_value *= 2
-        if max_value > 2**16:
-            raise RuntimeError(  # pragma: no cover
-                'Cannot use numpy implementation for large values of labels '
-                'direct colormap. Please install numba.'
-            )
-        dtype = _accel_cmap.minimum_dtype_for_labels(
+        This is the NumPy counterpart of `_get_typed_dict_mapping`: the label
+        values of the colormap are sorted, so that data of any integer dtype
+        can be mapped with `np.searchsorted`, whatever the range of the
+        labels.
+
+        Returns
+        -------
+        keys : np.ndarray
+            The sorted label values, of dtype ``data_dtype``.
+        values : np.ndarray
+            The texture value of each label, of the minimal texture dtype.
+        """
+        key = f'_{data_dtype}_sorted_mapping'
+        if key in self._cache_other:
+            return self._cache_other[key]
+
+        target_dtype = _accel_cmap.minimum_dtype_for_labels(
             self._num_unique_colors + 2
         )
-        label_mapping = self._values_mapping_to_minimum_values_set()[0]
-
-        # We need 2 + the max value: one because we will be indexing with the
-        # max value, and an extra one so that higher values get clipped to
-        # that index and map to the default value, rather than to the max
-        # value in the map.
-        mapper = np.full(
-            (max_value + 2), _accel_cmap.MAPPING_OF_UNKNOWN_VALUE, dtype=dtype
+        mapping = self._label_mapping_and_color_dict[0]
+        self._cache_other[key] = _sorted_mapping(
+            mapping, mapping, data_dtype, target_dtype
         )
-        for key, val in label_mapping.items():
-            if key is None:
-                continue
-            mapper[key] = val
-        return mapper
+        return self._cache_other[key]
 
     @property
     def default_color(self) -> np.ndarray:
@@ -694,6 +861,86 @@ class DirectLabelColormap(LabelColormapBase):
         # if someone is using DirectLabelColormap directly, not through Label layer
 
 
+def _extend_label_mapping(
+    labels_to_new_labels: dict[int | None, int],
+    new_color_dict: dict[int, np.ndarray],
+    items: Iterable[tuple[int | None, np.ndarray]],
+) -> list[int]:
+    """Map labels to the minimum values set of their colors, in place.
+
+    Labels of the same color are mapped to the same value, and each new
+    color gets the next value.
+
+    Returns
+    -------
+    list of int
+        The mapped labels.
+    """
+    color_to_new_label = {
+        tuple(color): new_label
+        for new_label, color in new_color_dict.items()
+        if new_label != _accel_cmap.MAPPING_OF_UNKNOWN_VALUE
+    }
+    labels = []
+    for label, color in items:
+        if label is None:
+            continue
+        color_tup = tuple(color)
+        if color_tup not in color_to_new_label:
+            color_to_new_label[color_tup] = len(new_color_dict)
+            new_color_dict[len(new_color_dict)] = color
+        labels_to_new_labels[label] = color_to_new_label[color_tup]
+        labels.append(label)
+    return labels
+
+
+def _sorted_mapping(
+    labels: Iterable[int | None],
+    labels_to_new_labels: dict[int | None, int],
+    data_dtype: np.dtype,
+    target_dtype: np.dtype,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Build the sorted keys and values mapping labels of a data dtype.
+
+    Labels outside the data dtype are ignored, since they will never need
+    to be colormapped from that dtype.
+    """
+    iinfo = np.iinfo(data_dtype)
+    labels = [
+        label
+        for label in labels
+        if label is not None and iinfo.min <= label <= iinfo.max
+    ]
+    keys = np.array(labels, dtype=data_dtype)
+    values = np.array(
+        [labels_to_new_labels[label] for label in labels], dtype=target_dtype
+    )
+    order = np.argsort(keys, kind='stable')
+    return keys[order], values[order]
+
+
+def _merge_sorted_mapping(
+    keys: np.ndarray,
+    values: np.ndarray,
+    new_keys: np.ndarray,
+    new_values: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Merge sorted keys and values into a sorted mapping, without sorting.
+
+    The values of keys already in the mapping are replaced.
+    """
+    idx = np.searchsorted(keys, new_keys)
+    present = idx < keys.size
+    present[present] = keys[idx[present]] == new_keys[present]
+    values = values.copy()
+    values[idx[present]] = new_values[present]
+    missing = ~present
+    return (
+        np.insert(keys, idx[missing], new_keys[missing]),
+        np.insert(values, idx[missing], new_values[missing]),
+    )
+
+
 @overload
 def _convert_small_ints_to_unsigned(
     data: np.ndarray,
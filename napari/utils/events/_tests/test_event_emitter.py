@@ -351,3 +351,73 @@ def test_none_disconnect():
     e.connect(fun2)
     e()
     assert count_list == [1, 2]
+
+
+def test_event_batch_delivers_last_state():
+    """Test that batching only delivers the last state of each emitter."""
+    a = EventEmitter(type_name='a')
+    b = EventEmitter(type_name='b')
+    received = []
+    a.connect(lambda e: received.append(('a', e.value)))
+    b.connect(lambda e: received.append(('b', e.index)))
+
+    with a.batch():
+        a(value=1)
+        with b.batch():
+            a(value=2)
+        assert received == []
+        # events with other arguments are not batched
+        b(index=0)
+        b(index=1)
+        assert received == [('b', 0), ('b', 1)]
+        a(value=3)
+    assert received == [('b', 0), ('b', 1), ('a', 3)]
+
+    # blocked emitters are not delivered
+    received.clear()
+    with a.batch(), a.blocker():
+        a(value=4)
+    assert received == []
+
+
+def test_event_batch_honors_callback_blockers():
+    """Test that callbacks blocked while batching are not delivered to."""
+    emitter = EventEmitter(type_name='a')
+    received = []
+
+    def on_a(event):
+        received.append(event.value)
+
+    emitter.connect(on_a)
+
+    with emitter.batch():
+        with emitter.blocker(on_a):
+            emitter(value=1)
+    assert received == []
+
+    # a callback blocked only for some emissions gets the last state
+    with emitter.batch():
+        emitter(value=2)
+        with emitter.blocker(on_a):
+            emitter(value=3)
+    assert received == [3]
+
+
+def test_callback_cache_invalidated_on_connect():
+    """Test that the cached callbacks follow connections."""
+    e = EventEmitter(type_name='test')
+    calls = []
+
+    def first():
+        calls.append(1)
+
+    def second():
+        calls.append(2)
+
+    e.connect(first)
+    e()
+    e.connect(second)
+    e()
+    e.disconnect(first)
+    e()
+    assert calls == [1, 1, 2, 2]
@@ -52,6 +52,7 @@ For more information see http://github.com/vispy/vispy/wiki/API_Events
 import contextlib
 import inspect
 import os
+import threading
 import warnings
 import weakref
 from collections.abc import Callable, Iterable, Iterator, Sequence
@@ -246,6 +247,24 @@ class _WeakCounter(Generic[_T]):
         return self._counter.get(key, default)
 
 
+class _EventBatch(threading.local):
+    """The events emitted in the current thread while batching events."""
+
+    # number of nested batches that are open
+    depth = 0
+
+    def __init__(self) -> None:
+        # last event of each emitter, in the order of their last emission,
+        # with the callbacks that were blocked for all of its coalesced
+        # emissions
+        self.pending: dict[
+            EventEmitter, tuple[Event, frozenset[Callback]]
+        ] = {}
+
+
+_event_batch = _EventBatch()
+
+
 class EventEmitter:
     """Encapsulates a list of event callbacks.
 
@@ -295,6 +314,11 @@ class EventEmitter:
         # used when connecting new callbacks at specific positions
         self._callback_refs: list[str | None] = []
         self._callback_pass_event: list[bool] = []
+        # callbacks and whether to pass them the event, as iterated when
+        # emitting; cleared whenever callbacks are connected or disconnected
+        self._callback_cache: (
+            tuple[tuple[Callback | CallbackRef, bool], ...] | None
+        ) = None
 
         # count number of times this emitter is blocked for each callback.
         self._blocked: dict[Callback | None, int] = {None: 0}
@@ -572,6 +596,7 @@ class EventEmitter:
         self._callbacks.insert(idx, callback)
         self._callback_refs.insert(idx, _ref)
         self._callback_pass_event.insert(idx, pass_event)
+        self._callback_cache = None
 
         if until is not None:
             until.connect(partial(self.disconnect, callback))
@@ -614,6 +639,7 @@ class EventEmitter:
                 self._callbacks.pop(idx)
                 self._callback_refs.pop(idx)
                 self._callback_pass_event.pop(idx)
+        self._callback_cache = None
 
     @staticmethod
     def _get_proper_name(callback):
@@ -717,6 +743,24 @@ class EventEmitter:
         # create / massage event as needed
         event = self._prepare_event(*args, **kwargs)
 
+        # While batching, only keep the last event of emitters that report
+        # a new state, i.e. that are emitted with at most a value.
+        if (
+            _event_batch.depth > 0
+            and not args
+            and (not kwargs or kwargs.keys() == {'value'})
+            and blocked.get(None, 0) == 0
+        ):
+            pending = _event_batch.pending
+            # callbacks blocked now are skipped when the event is delivered
+            skipped = frozenset(
+                cb for cb, count in blocked.items() if cb is not None and count
+            )
+            if (previous := pending.pop(self, None)) is not None:
+                skipped &= previous[1]
+            pending[self] = (event, skipped)
+            return event
+
         # Add our source to the event; remove it after all callbacks have been
         # invoked.
         event._push_source(self.source)
@@ -728,10 +772,20 @@ class EventEmitter:
 
             _log_event_stack(event)
 
+            callbacks = self._callback_cache
+            if callbacks is None:
+                # a tuple, so that callbacks can be (dis)connected while
+                # iterating over it
+                callbacks = self._callback_cache = tuple(
+                    zip(
+                        self._callbacks,
+                        self._callback_pass_event,
+                        strict=False,
+                    )
+                )
+
             rem: list[CallbackRef] = []
-            for cb, pass_event in zip(
-                self._callbacks[:], self._callback_pass_event[:], strict=False
-            ):
+            for cb, pass_event in callbacks:
                 if isinstance(cb, tuple):
                     obj = cb[0]()
                     if obj is None:
@@ -874,6 +928,26 @@ class EventEmitter:
         """
         return EventBlocker(self, callback)
 
+    def batch(self) -> 'EventBatcher':
+        """Return an EventBatcher to be used in 'with' statements
+
+        While the context is open, the events of all emitters that only
+        report a new state (emitted without arguments or with a value) are
+        not delivered. When it closes, only the last of these events of each
+        emitter is delivered. Other events, like the insertion of items in
+        a list, are delivered immediately.
+
+        Notes
+        -----
+        For example, one could do::
+
+            with viewer.events.batch():
+                for layer in viewer.layers:
+                    layer.opacity = 0.5
+                    layer.blending = 'additive'
+        """
+        return EventBatcher()
+
 
 class WarningEmitter(EventEmitter):
     """
@@ -1193,6 +1267,35 @@ class EventBlocker:
         self.target.unblock(self.callback)
 
 
+class EventBatcher:
+    """Represents a batch of events of all emitters to be used in a context
+    manager (i.e. 'with' statement).
+
+    Batches can be nested, in which case the events are delivered when the
+    outermost batch closes.
+    """
+
+    def __enter__(self):
+        _event_batch.depth += 1
+        return self
+
+    def __exit__(self, *args):
+        _event_batch.depth -= 1
+        if _event_batch.depth > 0:
+            return
+        # events emitted by the callbacks are delivered right away
+        pending = _event_batch.pending
+        _event_batch.pending = {}
+        for emitter, (event, skipped) in pending.items():
+            for callback in skipped:
+                emitter.block(callback)
+            try:
+                emitter(event)
+            finally:
+                for callback in skipped:
+                    emitter.unblock(callback)
+
+
 class EventBlockerAll:
     """Represents a block_all for an EmitterGroup to be used in a context
     manager (i.e. 'with' statement).